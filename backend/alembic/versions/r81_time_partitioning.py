@@ -0,0 +1,311 @@
+"""Optional monthly range partitioning for time-ordered tables.
+
+Only runs when the DB_PARTITIONING_ENABLED environment variable is true at
+migration time; otherwise it is a recorded no-op.  To enable on a deployment
+that is already past this revision, set the flag and run the conversion on
+its own:
+
+    python scripts/enable_partitioning.py
+
+Do not downgrade to r80_holding_goal_idx and upgrade again for this: that
+replays every later revision too (search vector rewrite, counter and
+merchant backfills, snapshot re-encoding).  The conversion skips tables that
+are already partitioned, so running it twice is harmless.
+
+For each table the migration:
+  1. Renames the table aside and creates a ``PARTITION BY RANGE (<key>)``
+     parent with the same columns, defaults and CHECK constraints.
+  2. Creates one child per month from the oldest row through 3 months ahead,
+     plus ``<table>_default``.
+  3. Copies the rows, hands any serial sequence to the new table and drops
+     the old one.
+  4. Recreates the primary key as (id, <key>) and every index / outbound FK.
+     Unique indexes that don't include the key get it appended (PostgreSQL
+     requires the partition key in every unique index).  For transactions,
+     ix_transactions_dedup becomes (account_id, deduplication_hash, date);
+     every dedup hash already includes the date, so this is equivalent.
+  5. Recreates the table's triggers (e.g. the transaction_counts trigger
+     when converting after r84) on the new parent.
+
+FKs *into* transactions.id (labels, splits, attachments, merges) cannot
+reference a partitioned parent by id alone and are dropped.  Their ON DELETE
+CASCADE is replaced by an AFTER DELETE row trigger on the parent, so plain
+deletes (sync removals, account deletion) still remove the child rows.
+Dropping or detaching a whole partition fires no row triggers; partition
+retention clears those rows explicitly (see PartitionMaintenanceService).
+
+Revision ID: r81_time_partitioning
+Revises: r80_holding_goal_idx
+Create Date: 2026-10-18
+"""
+
+import os
+import re
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "r81_time_partitioning"
+down_revision = "r80_holding_goal_idx"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of app.services.partition_service.PARTITIONED_TABLES.
+_TABLES = {
+    "transactions": "date",
+    "net_worth_snapshots": "snapshot_date",
+    "portfolio_snapshots": "snapshot_date",
+    "audit_logs": "created_at",
+    "notifications": "created_at",
+}
+
+# (child table, column) pairs whose FK to transactions.id is dropped/restored.
+_TRANSACTION_CHILD_FKS = [
+    ("transaction_labels", "transaction_id"),
+    ("transaction_splits", "parent_transaction_id"),
+    ("transaction_attachments", "transaction_id"),
+    ("transaction_merges", "primary_transaction_id"),
+]
+
+# Unique indexes that upgrade() widens with the partition key; downgrade()
+# narrows them back.  Every other unique index already contains its key.
+_KEY_APPENDED_INDEXES = {"ix_transactions_dedup"}
+
+_MONTHS_AHEAD = 3
+
+
+def _enabled() -> bool:
+    # Read from the environment rather than app.config so this revision does
+    # not change with the application's settings module.
+    flag = os.environ.get("DB_PARTITIONING_ENABLED", "")
+    return flag.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _add_months(d: date, months: int) -> date:
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _is_partitioned(conn, table: str) -> bool:
+    return (
+        conn.execute(
+            sa.text(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :t"
+            ),
+            {"t": table},
+        ).scalar()
+        is not None
+    )
+
+
+def _capture(conn, table: str):
+    """Return (pk_name, index defs, outbound FK defs, trigger defs) for *table*."""
+    pk_name = conn.execute(
+        sa.text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = CAST(:t AS regclass) AND contype = 'p'"
+        ),
+        {"t": table},
+    ).scalar()
+    indexes = conn.execute(
+        sa.text(
+            "SELECT i.relname, pg_get_indexdef(ix.indexrelid), ix.indisunique "
+            "FROM pg_index ix JOIN pg_class i ON i.oid = ix.indexrelid "
+            "WHERE ix.indrelid = CAST(:t AS regclass) AND NOT ix.indisprimary"
+        ),
+        {"t": table},
+    ).all()
+    fks = conn.execute(
+        sa.text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = CAST(:t AS regclass) AND contype = 'f'"
+        ),
+        {"t": table},
+    ).all()
+    triggers = (
+        conn.execute(
+            sa.text(
+                "SELECT pg_get_triggerdef(oid) FROM pg_trigger "
+                "WHERE tgrelid = CAST(:t AS regclass) AND NOT tgisinternal"
+            ),
+            {"t": table},
+        )
+        .scalars()
+        .all()
+    )
+    return pk_name or f"{table}_pkey", indexes, fks, triggers
+
+
+def _partitioned_index_def(indexdef: str, is_unique: bool, key: str) -> str:
+    """Adapt an index definition so it is valid on a partitioned parent."""
+    # pg_get_indexdef renders parent indexes as ON ONLY; recreate on the hierarchy.
+    indexdef = indexdef.replace(" ON ONLY ", " ON ")
+    if not is_unique:
+        return indexdef
+    match = re.search(r"USING \w+ \((.*?)\)", indexdef)
+    if match is None:
+        return indexdef
+    columns = [c.strip().strip('"') for c in match.group(1).split(",")]
+    if key in columns:
+        return indexdef
+    return indexdef[: match.end(1)] + f", {key}" + indexdef[match.end(1) :]
+
+
+def _create_monthly_partitions(conn, table: str, key: str) -> None:
+    oldest = conn.execute(sa.text(f"SELECT min({key}) FROM {table}_unpartitioned")).scalar()
+    today = date.today().replace(day=1)
+    start = date(oldest.year, oldest.month, 1) if oldest is not None else today
+    end = _add_months(today, _MONTHS_AHEAD)
+
+    month = start
+    while month <= end:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month.year:04d}_{month.month:02d} "
+            f"PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def _partition_table(conn, table: str, key: str) -> None:
+    pk_name, indexes, fks, triggers = _capture(conn, table)
+    legacy = f"{table}_unpartitioned"
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS "
+        f"INCLUDING GENERATED INCLUDING STORAGE INCLUDING COMMENTS) "
+        f"PARTITION BY RANGE ({key})"
+    )
+    _create_monthly_partitions(conn, table, key)
+    op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+
+    sequence = conn.execute(
+        sa.text("SELECT pg_get_serial_sequence(:t, 'id')"), {"t": legacy}
+    ).scalar()
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+    op.execute(f"DROP TABLE {legacy}")
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {pk_name} PRIMARY KEY (id, {key})")
+    for _name, indexdef, is_unique in indexes:
+        op.execute(_partitioned_index_def(indexdef.replace(legacy, table), is_unique, key))
+    for name, definition in fks:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+    # Captured before the rename, so the definitions already name *table*
+    for triggerdef in triggers:
+        op.execute(triggerdef)
+
+
+def _unpartition_table(conn, table: str, key: str) -> None:
+    pk_name, indexes, fks, triggers = _capture(conn, table)
+    legacy = f"{table}_partitioned"
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS "
+        f"INCLUDING GENERATED INCLUDING STORAGE INCLUDING COMMENTS)"
+    )
+    op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+
+    sequence = conn.execute(
+        sa.text("SELECT pg_get_serial_sequence(:t, 'id')"), {"t": legacy}
+    ).scalar()
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+    op.execute(f"DROP TABLE {legacy} CASCADE")
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {pk_name} PRIMARY KEY (id)")
+    for name, indexdef, _is_unique in indexes:
+        indexdef = indexdef.replace(" ON ONLY ", " ON ").replace(legacy, table)
+        if name in _KEY_APPENDED_INDEXES:
+            indexdef = indexdef.replace(f", {key})", ")", 1)
+        op.execute(indexdef)
+    for name, definition in fks:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+    for triggerdef in triggers:
+        op.execute(triggerdef)
+
+
+def _create_child_delete_trigger() -> None:
+    """Replace the dropped ON DELETE CASCADE FKs with a row trigger."""
+    deletes = "\n".join(
+        f"            DELETE FROM {child} WHERE {column} = OLD.id;"
+        for child, column in _TRANSACTION_CHILD_FKS
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION transactions_delete_children() RETURNS trigger AS $$
+        BEGIN
+{deletes}
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_transactions_delete_children ON transactions")
+    op.execute(
+        """
+        CREATE TRIGGER trg_transactions_delete_children
+        AFTER DELETE ON transactions
+        FOR EACH ROW EXECUTE FUNCTION transactions_delete_children()
+        """
+    )
+
+
+def partition_tables(conn) -> None:
+    """Convert every table in _TABLES that is not partitioned yet.
+
+    Called by upgrade() and by scripts/enable_partitioning.py, which runs it
+    on its own for deployments that enable partitioning after this revision.
+    """
+    for child, column in _TRANSACTION_CHILD_FKS:
+        op.execute(f"ALTER TABLE {child} DROP CONSTRAINT IF EXISTS {child}_{column}_fkey")
+
+    for table, key in _TABLES.items():
+        if not _is_partitioned(conn, table):
+            _partition_table(conn, table, key)
+
+    _create_child_delete_trigger()
+
+
+def upgrade() -> None:
+    if not _enabled():
+        return
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+    partition_tables(conn)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    # Dropped before unpartitioning so it is not carried over; the restored
+    # FKs cascade again below.
+    op.execute("DROP TRIGGER IF EXISTS trg_transactions_delete_children ON transactions")
+    op.execute("DROP FUNCTION IF EXISTS transactions_delete_children()")
+
+    converted = [t for t in _TABLES if _is_partitioned(conn, t)]
+    for table in converted:
+        _unpartition_table(conn, table, _TABLES[table])
+
+    if "transactions" in converted:
+        for child, column in _TRANSACTION_CHILD_FKS:
+            # Rows whose parent month was dropped by retention would block the FK.
+            op.execute(f"DELETE FROM {child} WHERE {column} NOT IN (SELECT id FROM transactions)")
+            op.create_foreign_key(
+                f"{child}_{column}_fkey",
+                child,
+                "transactions",
+                [column],
+                ["id"],
+                ondelete="CASCADE",
+            )
@@ -0,0 +1,35 @@
+"""Add security_classifications, the per-symbol portfolio bucketing cache.
+
+Filled by enrich_holdings_metadata_task; holdings join it on upper(ticker).
+
+Revision ID: r82_security_classifications
+Revises: r81_time_partitioning
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "r82_security_classifications"
+down_revision = "r81_time_partitioning"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "security_classifications",
+        sa.Column("ticker", sa.String(20), primary_key=True),
+        sa.Column("asset_type", sa.String(50), nullable=True),
+        sa.Column("bucket", sa.String(20), nullable=False),
+        sa.Column("cap_size", sa.String(20), nullable=True),
+        sa.Column("region", sa.String(20), nullable=True),
+        sa.Column("style", sa.String(10), nullable=True),
+        sa.Column("index_category", sa.String(100), nullable=True),
+        sa.Column("is_estimated", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("security_classifications")
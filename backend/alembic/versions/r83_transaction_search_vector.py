@@ -0,0 +1,42 @@
+"""Add transactions.search_vector, a GIN-indexed full-text search column.
+
+A stored generated tsvector over merchant_name (weight A), description (B)
+and notes (C) using the 'simple' configuration; PostgreSQL keeps it current
+on every insert/update.  Adding a stored generated column rewrites the
+table once.  Substring search keeps using the pg_trgm indexes from
+b2c3d4e5f6a7_add_trgm_indexes_for_transaction_search.py.  See
+app/services/transaction_search_service.py.
+
+Revision ID: r83_transaction_search_vector
+Revises: r82_security_classifications
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "r83_transaction_search_vector"
+down_revision = "r82_security_classifications"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE transactions ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple'::regconfig, coalesce(merchant_name, '')), 'A')
+            || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')
+            || setweight(to_tsvector('simple'::regconfig, coalesce(notes, '')), 'C')
+        ) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_transactions_search_vector "
+        "ON transactions USING GIN (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_transactions_search_vector")
+    op.execute("ALTER TABLE transactions DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,100 @@
+"""Add transaction_counts, per-account monthly counters for list totals.
+
+A row-level trigger on transactions keeps (account_id, month) counts
+current on insert, delete and any update that moves a row to another
+account or month; the table is backfilled here in one aggregate pass.
+Partition drops bypass the trigger, so retiring a transactions partition
+clears the matching months (PartitionMaintenanceService).  See
+app/services/transaction_totals_service.py.
+
+Revision ID: r84_transaction_counts
+Revises: r83_transaction_search_vector
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "r84_transaction_counts"
+down_revision = "r83_transaction_search_vector"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transaction_counts",
+        sa.Column(
+            "account_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("accounts.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column(
+            "organization_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_transaction_counts_organization_id", "transaction_counts", ["organization_id"]
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION transaction_counts_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE'
+               AND OLD.account_id = NEW.account_id
+               AND date_trunc('month', OLD.date) = date_trunc('month', NEW.date) THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE transaction_counts SET count = count - 1
+                 WHERE account_id = OLD.account_id
+                   AND month = date_trunc('month', OLD.date)::date;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO transaction_counts (account_id, month, organization_id, count)
+                VALUES (NEW.account_id, date_trunc('month', NEW.date)::date, NEW.organization_id, 1)
+                ON CONFLICT (account_id, month)
+                DO UPDATE SET count = transaction_counts.count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_transaction_counts
+        AFTER INSERT OR DELETE OR UPDATE OF account_id, date ON transactions
+        FOR EACH ROW EXECUTE FUNCTION transaction_counts_apply()
+        """
+    )
+
+    # Backfill after the trigger exists: a concurrent insert is either in this
+    # snapshot (whose total overwrites the trigger's row) or counted on top.
+    op.execute(
+        """
+        INSERT INTO transaction_counts (account_id, month, organization_id, count)
+        SELECT account_id, date_trunc('month', date)::date, min(organization_id::text)::uuid,
+               count(*)
+        FROM transactions
+        GROUP BY account_id, date_trunc('month', date)
+        ON CONFLICT (account_id, month)
+        DO UPDATE SET count = EXCLUDED.count
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_transaction_counts ON transactions")
+    op.execute("DROP FUNCTION IF EXISTS transaction_counts_apply()")
+    op.drop_index("ix_transaction_counts_organization_id", table_name="transaction_counts")
+    op.drop_table("transaction_counts")
@@ -0,0 +1,173 @@
+"""Add the merchant dimension: merchants, merchant_aliases, merchant_id.
+
+Each organization's raw ``transactions.merchant_name`` spellings are grouped
+by ``_merchant_key`` into one merchant each; transactions
+and recurring patterns reference it by ``merchant_id``.  Existing rows are
+backfilled here, one aggregate read per spelling rather than per row.  See
+app/services/merchant_service.py; the key function is copied below as it
+stood at this revision, so later changes to the service never alter what
+this migration writes.
+
+Revision ID: r85_merchants
+Revises: r84_transaction_counts
+Create Date: 2026-10-19
+"""
+
+import re
+import uuid
+from collections import defaultdict
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "r85_merchants"
+down_revision = "r84_transaction_counts"
+branch_labels = None
+depends_on = None
+
+_BATCH = 1000
+
+_PROCESSOR_PREFIX_RE = re.compile(r"^(?:sq|tst|sp|pp|paypal|pos|py|dd|ddr|in)\s*\*\s*")
+_STORE_NUMBER_RE = re.compile(r"\s*#\s*\d.*$")
+_TOKEN_RE = re.compile(r"[a-z0-9&']+")
+
+
+def _merchant_key(name):
+    """Frozen copy of merchant_service.merchant_key at r85."""
+    if not name:
+        return ""
+    text = _PROCESSOR_PREFIX_RE.sub("", name.strip().lower())
+    text = _STORE_NUMBER_RE.sub("", text)
+    tokens = _TOKEN_RE.findall(text)
+    words = [t for t in tokens if not any(c.isdigit() for c in t)]
+    return " ".join(words or tokens)[:255]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "merchants",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "organization_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("normalized_name", sa.String(255), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_seen_date", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_merchants_org_normalized",
+        "merchants",
+        ["organization_id", "normalized_name"],
+        unique=True,
+    )
+    op.create_table(
+        "merchant_aliases",
+        sa.Column(
+            "organization_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("name", sa.String(255), primary_key=True),
+        sa.Column(
+            "merchant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("merchants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_merchant_aliases_merchant_id", "merchant_aliases", ["merchant_id"])
+
+    for table in ("transactions", "recurring_transactions"):
+        op.add_column(
+            table,
+            sa.Column(
+                "merchant_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("merchants.id", ondelete="SET NULL"),
+                nullable=True,
+            ),
+        )
+        op.create_index(f"ix_{table}_merchant_id", table, ["merchant_id"])
+
+    # Backfill: one merchant per (org, key), named after its most used spelling
+    bind = op.get_bind()
+    spellings = bind.execute(
+        sa.text(
+            "SELECT organization_id, merchant_name, count(*) AS n, max(date) AS last_seen "
+            "FROM transactions WHERE merchant_name IS NOT NULL "
+            "GROUP BY organization_id, merchant_name ORDER BY n DESC"
+        )
+    ).all()
+
+    merchants: dict = {}
+    aliases = []
+    usage: dict = defaultdict(lambda: [0, None])
+    for org_id, name, n, last_seen in spellings:
+        key = _merchant_key(name)
+        if not key:
+            continue
+        if (org_id, key) not in merchants:
+            merchants[(org_id, key)] = {
+                "id": uuid.uuid4(),
+                "organization_id": org_id,
+                "name": " ".join(name.split())[:255],
+                "normalized_name": key,
+            }
+        merchant = merchants[(org_id, key)]
+        aliases.append({"organization_id": org_id, "name": name, "merchant_id": merchant["id"]})
+        stats = usage[merchant["id"]]
+        stats[0] += n
+        if last_seen is not None and (stats[1] is None or last_seen > stats[1]):
+            stats[1] = last_seen
+
+    merchant_rows = [
+        {**m, "transaction_count": usage[m["id"]][0], "last_seen_date": usage[m["id"]][1]}
+        for m in merchants.values()
+    ]
+    insert_merchant = sa.text(
+        "INSERT INTO merchants (id, organization_id, name, normalized_name, "
+        "transaction_count, last_seen_date) VALUES (:id, :organization_id, :name, "
+        ":normalized_name, :transaction_count, :last_seen_date)"
+    )
+    insert_alias = sa.text(
+        "INSERT INTO merchant_aliases (organization_id, name, merchant_id) "
+        "VALUES (:organization_id, :name, :merchant_id)"
+    )
+    for i in range(0, len(merchant_rows), _BATCH):
+        bind.execute(insert_merchant, merchant_rows[i : i + _BATCH])
+    for i in range(0, len(aliases), _BATCH):
+        bind.execute(insert_alias, aliases[i : i + _BATCH])
+
+    op.execute(
+        """
+        UPDATE transactions t SET merchant_id = a.merchant_id
+        FROM merchant_aliases a
+        WHERE a.organization_id = t.organization_id AND a.name = t.merchant_name
+        """
+    )
+    op.execute(
+        """
+        UPDATE recurring_transactions r SET merchant_id = a.merchant_id
+        FROM merchant_aliases a
+        WHERE a.organization_id = r.organization_id AND a.name = r.merchant_name
+        """
+    )
+
+
+def downgrade() -> None:
+    for table in ("recurring_transactions", "transactions"):
+        op.drop_index(f"ix_{table}_merchant_id", table_name=table)
+        op.drop_column(table, "merchant_id")
+    op.drop_index("ix_merchant_aliases_merchant_id", table_name="merchant_aliases")
+    op.drop_table("merchant_aliases")
+    op.drop_index("ix_merchants_org_normalized", table_name="merchants")
+    op.drop_table("merchants")
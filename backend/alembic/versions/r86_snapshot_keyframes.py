@@ -0,0 +1,221 @@
+"""Store portfolio snapshot documents as compressed keyframes and deltas.
+
+Adds ``portfolio_snapshots.snapshot_blob`` / ``keyframe_date`` and re-encodes
+existing ``snapshot_data`` into them, one (organization, user) series at a
+time in date order, then clears ``snapshot_data``.  See
+app/services/snapshot_codec.py; the codec is copied below as it stood at
+this revision, so later changes to it never alter what this migration
+writes or how its downgrade reads those blobs back.
+
+Revision ID: r86_snapshot_keyframes
+Revises: r85_merchants
+Create Date: 2026-10-19
+"""
+
+import json
+import zlib
+
+import orjson
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "r86_snapshot_keyframes"
+down_revision = "r85_merchants"
+branch_labels = None
+depends_on = None
+
+_BATCH = 500
+
+# Frozen copy of app/services/snapshot_codec.py at r86
+_MAX_DELTA_RATIO = 0.75
+_LIST_KEYS = ("id", "account_id", "ticker", "sector")
+
+
+def _pack(value):
+    return zlib.compress(orjson.dumps(value), 6)
+
+
+def _unpack(blob):
+    return orjson.loads(zlib.decompress(blob))
+
+
+def _record_key(base, new):
+    records = base + new
+    if not records or not all(isinstance(r, dict) for r in records):
+        return None
+    for field in _LIST_KEYS:
+        for items in (base, new):
+            ids = [r.get(field) for r in items]
+            if not all(isinstance(i, str) for i in ids) or len(set(ids)) != len(ids):
+                break
+        else:
+            return field
+    return None
+
+
+def _split(patches):
+    delta = {}
+    for key, sub in patches.items():
+        if "=" in sub:
+            delta.setdefault("+", {})[key] = sub["="]
+        else:
+            delta.setdefault("~", {})[key] = sub
+    return delta
+
+
+def _diff(base, new):
+    if base == new:
+        return None
+    if isinstance(base, dict) and isinstance(new, dict):
+        patches = {}
+        for key, value in new.items():
+            sub = _diff(base[key], value) if key in base else {"=": value}
+            if sub is not None:
+                patches[key] = sub
+        delta = _split(patches)
+        removed = [key for key in base if key not in new]
+        if removed:
+            delta["-"] = removed
+        return delta
+    if isinstance(base, list) and isinstance(new, list):
+        field = _record_key(base, new)
+        if field is not None:
+            old = {r[field]: r for r in base}
+            patches = {}
+            for record in new:
+                record_id = record[field]
+                sub = _diff(old[record_id], record) if record_id in old else {"=": record}
+                if sub is not None:
+                    patches[record_id] = sub
+            delta = {"#": field, **_split(patches)}
+            ids = [r[field] for r in new]
+            if ids != [r[field] for r in base]:
+                delta["ids"] = ids
+            return delta
+    return {"=": new}
+
+
+def _apply(base, delta):
+    if delta is None:
+        return base
+    if "=" in delta:
+        return delta["="]
+    assigned = delta.get("+", {})
+    patched = delta.get("~", {})
+    if "#" in delta:
+        field = delta["#"]
+        old = {r[field]: r for r in base}
+        ids = delta["ids"] if "ids" in delta else list(old)
+        return [
+            assigned[record_id]
+            if record_id in assigned
+            else _apply(old[record_id], patched.get(record_id))
+            for record_id in ids
+        ]
+    result = {key: value for key, value in base.items() if key not in delta.get("-", ())}
+    result.update(assigned)
+    for key, sub in patched.items():
+        result[key] = _apply(base[key], sub)
+    return result
+
+
+def _encode(document, keyframe=None):
+    full = _pack(document)
+    if keyframe is None:
+        return full, False
+    delta = _pack(_diff(keyframe, document) or {})
+    if len(delta) > len(full) * _MAX_DELTA_RATIO:
+        return full, False
+    return delta, True
+
+
+def _decode(blob, keyframe_blob=None):
+    if keyframe_blob is None:
+        return _unpack(blob)
+    return _apply(_unpack(keyframe_blob), _unpack(blob))
+
+
+def _same_month(a, b):
+    return (a.year, a.month) == (b.year, b.month)
+
+
+def _encode_series(days):
+    """Yield (snapshot_date, snapshot_blob, keyframe_date) per day, in date order."""
+    keyframe = keyframe_date = None
+    for day, document in days:
+        base = None
+        if keyframe_date is not None and _same_month(keyframe_date, day):
+            base = keyframe
+        blob, is_delta = _encode(document, base)
+        if is_delta:
+            yield day, blob, keyframe_date
+        else:
+            keyframe, keyframe_date = document, day
+            yield day, blob, None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "portfolio_snapshots", sa.Column("snapshot_blob", sa.LargeBinary(), nullable=True)
+    )
+    op.add_column("portfolio_snapshots", sa.Column("keyframe_date", sa.Date(), nullable=True))
+
+    bind = op.get_bind()
+    scopes = bind.execute(
+        sa.text(
+            "SELECT DISTINCT organization_id, user_id FROM portfolio_snapshots "
+            "WHERE snapshot_data IS NOT NULL"
+        )
+    ).all()
+    update = sa.text(
+        "UPDATE portfolio_snapshots SET snapshot_blob = :blob, keyframe_date = :keyframe_date, "
+        "snapshot_data = NULL WHERE id = :id"
+    )
+    # One (organization, user) series at a time keeps memory bounded
+    for organization_id, user_id in scopes:
+        series = bind.execute(
+            sa.text(
+                "SELECT id, snapshot_date, snapshot_data FROM portfolio_snapshots "
+                "WHERE organization_id = :org AND user_id IS NOT DISTINCT FROM :user "
+                "AND snapshot_data IS NOT NULL ORDER BY snapshot_date"
+            ).columns(snapshot_data=sa.JSON),
+            {"org": organization_id, "user": user_id},
+        ).all()
+        ids = {row.snapshot_date: row.id for row in series}
+        encoded = [
+            {"id": ids[day], "blob": blob, "keyframe_date": keyframe_date}
+            for day, blob, keyframe_date in _encode_series(
+                (row.snapshot_date, row.snapshot_data) for row in series
+            )
+        ]
+        for i in range(0, len(encoded), _BATCH):
+            bind.execute(update, encoded[i : i + _BATCH])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT s.id, s.snapshot_blob, k.snapshot_blob AS keyframe_blob "
+            "FROM portfolio_snapshots s "
+            "LEFT JOIN portfolio_snapshots k ON k.organization_id = s.organization_id "
+            "AND k.user_id IS NOT DISTINCT FROM s.user_id "
+            "AND k.snapshot_date = s.keyframe_date "
+            "WHERE s.snapshot_blob IS NOT NULL"
+        )
+    ).all()
+    update = sa.text(
+        "UPDATE portfolio_snapshots SET snapshot_data = CAST(:data AS json) WHERE id = :id"
+    )
+    for i in range(0, len(rows), _BATCH):
+        bind.execute(
+            update,
+            [
+                {"id": row.id, "data": json.dumps(_decode(row.snapshot_blob, row.keyframe_blob))}
+                for row in rows[i : i + _BATCH]
+            ],
+        )
+
+    op.drop_column("portfolio_snapshots", "keyframe_date")
+    op.drop_column("portfolio_snapshots", "snapshot_blob")
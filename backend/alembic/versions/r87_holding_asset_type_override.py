@@ -0,0 +1,33 @@
+"""Add holdings.asset_type_overridden, marking asset types a user chose.
+
+Enrichment fills asset_type, asset_class and country on nearly every
+holding, so their presence no longer says anything about user intent.
+Holdings with the flag set keep their asset_type through enrichment and
+Plaid sync, and it is layered over the stored per-symbol classification.
+Existing rows start unflagged: there is no record of which asset types
+users entered.
+
+Revision ID: r87_holding_asset_type_override
+Revises: r86_snapshot_keyframes
+Create Date: 2026-10-19
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "r87_holding_asset_type_override"
+down_revision = "r86_snapshot_keyframes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "holdings",
+        sa.Column("asset_type_overridden", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("holdings", "asset_type_overridden")
@@ -78,6 +78,28 @@ async def list_budgets(
     return budgets
 
 
+# Defined before /{budget_id} to avoid route shadowing
+@router.get("/spending", response_model=Dict[str, BudgetSpendingResponse])
+async def list_budget_spending(
+    is_active: Optional[bool] = None,
+    user_id: Optional[UUID] = Query(None, description="Filter by user"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get current-period spending for every listed budget, keyed by budget id."""
+    if user_id:
+        await verify_household_member(db, user_id, current_user.organization_id)
+    budgets = await budget_service.get_budgets(
+        db=db,
+        user=current_user,
+        is_active=is_active,
+        user_id=user_id,
+        visible_only=True,
+    )
+    spending = await budget_service.get_budgets_spending(db=db, budgets=budgets, user=current_user)
+    return {str(budget_id): values for budget_id, values in spending.items()}
+
+
 # CSV Export must be defined before /{budget_id} to avoid route shadowing
 @router.get("/export/csv")
 async def export_budgets_csv(
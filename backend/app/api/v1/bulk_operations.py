@@ -6,15 +6,16 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from pydantic import BaseModel
-from sqlalchemy import select, update
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.dependencies import get_current_user
 from app.services.rate_limit_service import rate_limit_service
 from app.models.bulk_operation_log import BulkOperationLog
-from app.models.transaction import Transaction
 from app.models.user import User
+from app.services import bulk_operation_service
+from app.services.bulk_operation_service import decode_state
 from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,15 @@ class UndoResponse(BaseModel):
     restored_count: int
 
 
+class RedoResponse(BaseModel):
+    """Response schema for a redo operation."""
+
+    id: UUID
+    operation_type: str
+    is_undone: bool
+    applied_count: int
+
+
 # --- Endpoints ---
 
 
@@ -169,15 +179,80 @@ async def undo_bulk_operation(
     )
 
 
-# Mutable transaction fields that can be restored from previous_state.
-_RESTORABLE_FIELDS = {
-    "category_id",
-    "notes",
-    "merchant_name",
-    "flagged_for_review",
-    "is_transfer",
-    "is_hidden",
-}
+@router.post("/{operation_id}/redo", response_model=RedoResponse)
+async def redo_bulk_operation(
+    operation_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-apply an undone bulk operation from its recorded new_state.
+
+    Refused with 409 when any affected transaction was edited after the undo.
+    """
+    result = await db.execute(
+        select(BulkOperationLog).where(
+            BulkOperationLog.id == operation_id,
+            BulkOperationLog.organization_id == current_user.organization_id,
+            BulkOperationLog.user_id == current_user.id,
+        )
+    )
+    operation = result.scalar_one_or_none()
+
+    if not operation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Bulk operation not found",
+        )
+
+    if not operation.is_undone:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Only an undone operation can be redone",
+        )
+
+    new_state = decode_state(operation.new_state, operation.affected_ids)
+    if new_state is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This operation did not record the values it applied",
+        )
+
+    # After an undo the rows should hold previous_state again
+    previous_state = decode_state(operation.previous_state, operation.affected_ids)
+    conflicts = (
+        await bulk_operation_service.find_conflicts(
+            db, operation.organization_id, previous_state
+        )
+        if previous_state is not None
+        else []
+    )
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Cannot redo: {len(conflicts)} transaction(s) have been manually "
+                f"edited since this operation was undone. "
+                f"Affected IDs: {', '.join(conflicts[:5])}"
+                + (" …" if len(conflicts) > 5 else "")
+            ),
+        )
+
+    applied_count = await bulk_operation_service.apply_state(
+        db, operation.organization_id, new_state
+    )
+
+    operation.is_undone = False
+    operation.undone_at = None
+
+    await db.commit()
+    await db.refresh(operation)
+
+    return RedoResponse(
+        id=operation.id,
+        operation_type=operation.operation_type,
+        is_undone=False,
+        applied_count=applied_count,
+    )
 
 
 async def _detect_undo_conflicts(
@@ -186,55 +261,15 @@ async def _detect_undo_conflicts(
 ) -> list[str]:
     """Return IDs of transactions whose current values differ from new_state.
 
-    When new_state is a dict, we compare the current field values for all
-    affected rows against what the bulk operation set them to. Any row that no
-    longer matches has been manually edited and would be silently overwritten by
-    an undo — we surface these as conflicts instead.
-
-    Only fields in _RESTORABLE_FIELDS are checked (the same ones we'd restore).
-    Returns an empty list when new_state is a list (per-row state) or missing,
-    since verifying list-format conflicts would require per-row queries.
+    Any row that no longer matches what the bulk operation set has been
+    manually edited and would be silently overwritten by an undo — we surface
+    these as conflicts instead.  Compared in SQL a batch at a time, for both
+    uniform (dict) and per-row (list / column) snapshots.
     """
-    new_state = operation.new_state
-    affected_ids = operation.affected_ids or []
-
-    if not new_state or not isinstance(new_state, dict) or not affected_ids:
-        return []
-
-    check_fields = [k for k in _RESTORABLE_FIELDS if k in new_state]
-    if not check_fields:
+    expected = decode_state(operation.new_state, operation.affected_ids)
+    if expected is None:
         return []
-
-    org_id = operation.organization_id
-    columns = [getattr(Transaction, f) for f in check_fields]
-    result = await db.execute(
-        select(Transaction.id, *columns).where(
-            Transaction.id.in_(affected_ids),
-            Transaction.organization_id == org_id,
-        )
-    )
-    rows = result.all()
-
-    conflicts: list[str] = []
-    for row in rows:
-        row_dict = dict(zip(["id"] + check_fields, row))
-        for field in check_fields:
-            expected = new_state.get(field)
-            actual = row_dict.get(field)
-            # Normalise UUID objects to str for comparison
-            if hasattr(actual, "hex"):
-                actual = str(actual)
-            if hasattr(expected, "hex"):
-                expected = str(expected)
-            if actual is not None and expected is not None:
-                is_conflict = str(actual) != str(expected)
-            else:
-                is_conflict = actual != expected
-            if is_conflict:
-                conflicts.append(str(row_dict["id"]))
-                break
-
-    return conflicts
+    return await bulk_operation_service.find_conflicts(db, operation.organization_id, expected)
 
 
 async def _restore_previous_state(
@@ -244,58 +279,15 @@ async def _restore_previous_state(
 ) -> int:
     """Apply previous_state back to the affected rows.
 
-    Supports any operation whose previous_state is a list of per-transaction
-    dicts (e.g. bulk_categorize, bulk_update) or a plain dict with a single
-    set of values applied to all affected_ids (e.g. bulk_delete stub).
-
-    Returns the number of transactions restored.
+    previous_state may be a single dict applied to every affected id, a list
+    of per-transaction dicts, or the column-array form written by
+    ``encode_state``.  Returns the number of transactions restored.
     """
-    previous_state = operation.previous_state
-    affected_ids = operation.affected_ids or []
-
-    if not previous_state or not affected_ids:
+    state = decode_state(operation.previous_state, operation.affected_ids)
+    if state is None:
         logger.warning(
             "undo_skipped_no_state",
             extra={"operation_id": str(operation.id), "type": operation.operation_type},
         )
         return 0
-
-    org_id = operation.organization_id
-
-    # previous_state may be a list (one entry per transaction) or a dict
-    # (single set of values applied to all affected_ids).
-    if isinstance(previous_state, list):
-        # Each entry: {"id": "<uuid>", "category_id": ..., ...}
-        restore_map = {str(entry["id"]): entry for entry in previous_state if "id" in entry}
-        restored = 0
-        for txn_id_str, prev in restore_map.items():
-            patch = {k: prev.get(k) for k in _RESTORABLE_FIELDS if k in prev}
-            if not patch:
-                continue
-            result = await db.execute(
-                update(Transaction)
-                .where(
-                    Transaction.id == txn_id_str,
-                    Transaction.organization_id == org_id,
-                )
-                .values(**patch)
-            )
-            restored += result.rowcount
-        return restored
-
-    if isinstance(previous_state, dict):
-        # Single dict applied to all affected_ids
-        patch = {k: previous_state.get(k) for k in _RESTORABLE_FIELDS if k in previous_state}
-        if not patch:
-            return 0
-        result = await db.execute(
-            update(Transaction)
-            .where(
-                Transaction.id.in_(affected_ids),
-                Transaction.organization_id == org_id,
-            )
-            .values(**patch)
-        )
-        return result.rowcount
-
-    return 0
+    return await bulk_operation_service.apply_state(db, operation.organization_id, state)
@@ -1,23 +1,21 @@
 """Cost basis aging API endpoint — open lot analysis with holding-period buckets."""
 
-import datetime
 import logging
+import uuid as _uuid
 from typing import List, Optional
 
+import numpy as np
 from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.constants.financial import SMART_INSIGHTS
 from app.core.database import get_db
 from app.dependencies import get_current_user
-from app.models.account import Account
 from app.models.holding import Holding
-from app.models.tax_lot import TaxLot
 from app.models.user import User
 from app.services.rate_limit_service import rate_limit_service
+from app.services.tax_lot_valuation_service import load_open_lots
 
 logger = logging.getLogger(__name__)
 
@@ -83,114 +81,52 @@ async def get_cost_basis_aging(
     Buckets:
     - ``approaching``: short-term lots within 30 days of the 1-year mark
     - ``short_term``:  short-term lots with > 30 days remaining
-    - ``long_term``:   lots held >= 365 days
+    - ``long_term``:   lots held more than one year
     """
-    today = datetime.date.today()
-
-    # Fetch all accounts for this organisation (for name lookup)
-    acct_result = await db.execute(
-        select(Account).where(
-            Account.organization_id == current_user.organization_id,
-        )
-    )
-    accounts = {str(a.id): a for a in acct_result.scalars().all()}
-
-    # Fetch open lots for this organisation
-    lot_query = (
-        select(TaxLot)
-        .where(
-            TaxLot.organization_id == current_user.organization_id,
-            TaxLot.is_closed.is_(False),
-        )
-        .options(selectinload(TaxLot.holding))
+    account_filter = _uuid.UUID(account_id) if account_id else None
+    valuations = await load_open_lots(
+        db, current_user.organization_id, account_id=account_filter
     )
-    if account_id:
-        import uuid as _uuid
-        lot_query = lot_query.where(TaxLot.account_id == _uuid.UUID(account_id))
 
-    lot_result = await db.execute(lot_query)
-    open_lots = lot_result.scalars().all()
+    # Holding-period buckets and summary totals, computed column-wise
+    long_term = valuations.is_long_term
+    approaching = ~long_term & (
+        valuations.days_to_long_term <= SMART_INSIGHTS.DAYS_TO_LONG_TERM_WARNING
+    )
+    buckets = np.where(long_term, "long_term", np.where(approaching, "approaching", "short_term"))
 
-    lots: List[TaxLotItem] = []
-    approaching_count = 0
-    approaching_value = 0.0
-    st_gain = 0.0
-    lt_gain = 0.0
-    st_loss = 0.0
-    lt_loss = 0.0
-
-    for lot in open_lots:
-        acq_date = lot.acquisition_date
-        days_held = (today - acq_date).days
-        is_long_term = days_held >= 365
-        holding_period = "long_term" if is_long_term else "short_term"
-        days_to_long_term = 0 if is_long_term else max(0, 365 - days_held)
-
-        # Bucket assignment
-        if is_long_term:
-            bucket = "long_term"
-        elif days_to_long_term <= SMART_INSIGHTS.DAYS_TO_LONG_TERM_WARNING:
-            bucket = "approaching"
-        else:
-            bucket = "short_term"
-
-        quantity = float(lot.remaining_quantity)
-        cbps = float(lot.cost_basis_per_share)
-        cost_total = float(lot.total_cost_basis)
-
-        # Current value from associated holding if available
-        current_value: Optional[float] = None
-        unrealized_gain: Optional[float] = None
-        unrealized_gain_pct: Optional[float] = None
-
-        holding: Optional[Holding] = lot.holding
-        if holding and holding.current_price_per_share is not None:
-            current_price = float(holding.current_price_per_share)
-            current_value = round(current_price * quantity, 2)
-            unrealized_gain = round(current_value - cost_total, 2)
-            unrealized_gain_pct = (
-                round((unrealized_gain / cost_total) * 100, 2) if cost_total != 0 else 0.0
-            )
+    priced = valuations.has_price
+    gain = np.where(priced, valuations.unrealized_gain, 0.0)
+    cost = valuations.cost_basis
+    gain_pct = np.round(np.divide(gain * 100, cost, out=np.zeros_like(gain), where=cost != 0), 2)
 
-        account = accounts.get(str(lot.account_id))
-        account_name = account.name if account else str(lot.account_id)
-        ticker = holding.ticker if holding else None
-
-        # Accumulate summary stats
-        if bucket == "approaching":
-            approaching_count += 1
-            if current_value is not None:
-                approaching_value += current_value
-
-        if unrealized_gain is not None:
-            if holding_period == "short_term":
-                if unrealized_gain >= 0:
-                    st_gain += unrealized_gain
-                else:
-                    st_loss += unrealized_gain
-            else:
-                if unrealized_gain >= 0:
-                    lt_gain += unrealized_gain
-                else:
-                    lt_loss += unrealized_gain
+    approaching_count = int(approaching.sum())
+    approaching_value = float(valuations.current_value[approaching & priced].sum())
+    st_gain = float(gain[~long_term & (gain >= 0)].sum())
+    st_loss = float(gain[~long_term & (gain < 0)].sum())
+    lt_gain = float(gain[long_term & (gain >= 0)].sum())
+    lt_loss = float(gain[long_term & (gain < 0)].sum())
 
+    lots: List[TaxLotItem] = []
+    for i, lot in enumerate(valuations.lots):
+        holding: Optional[Holding] = valuations.holdings[i]
         lots.append(
             TaxLotItem(
                 lot_id=str(lot.id),
                 account_id=str(lot.account_id),
-                account_name=account_name,
-                ticker=ticker,
-                quantity=quantity,
-                cost_basis_per_share=cbps,
-                cost_basis_total=round(cost_total, 2),
-                current_value=current_value,
-                unrealized_gain=unrealized_gain,
-                unrealized_gain_pct=unrealized_gain_pct,
-                acquisition_date=acq_date.isoformat(),
-                days_held=days_held,
-                holding_period=holding_period,
-                days_to_long_term=days_to_long_term,
-                bucket=bucket,
+                account_name=valuations.account_names[i] or str(lot.account_id),
+                ticker=holding.ticker if holding else None,
+                quantity=float(valuations.quantity[i]),
+                cost_basis_per_share=float(lot.cost_basis_per_share),
+                cost_basis_total=float(cost[i]),
+                current_value=float(valuations.current_value[i]) if priced[i] else None,
+                unrealized_gain=float(gain[i]) if priced[i] else None,
+                unrealized_gain_pct=float(gain_pct[i]) if priced[i] else None,
+                acquisition_date=lot.acquisition_date.isoformat(),
+                days_held=int(valuations.days_held[i]),
+                holding_period="long_term" if long_term[i] else "short_term",
+                days_to_long_term=int(valuations.days_to_long_term[i]),
+                bucket=str(buckets[i]),
             )
         )
 
@@ -11,12 +11,13 @@ from uuid import UUID
 from dateutil.relativedelta import relativedelta
 from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
-from sqlalchemy import and_, asc, extract, func, select
+from sqlalchemy import and_, extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.cache import get as cache_get
 from app.core.cache import setex as cache_setex
 from app.core.database import get_db
+from app.core.session_fanout import SessionFanOut
 from app.dependencies import (
     get_all_household_accounts,
     get_current_user,
@@ -35,6 +36,7 @@ from app.services.dashboard_service import DashboardService
 from app.services.deduplication_service import DeduplicationService
 from app.services.financial_health_service import FinancialHealthService
 from app.services.forecast_service import ForecastService
+from app.services.history_downsampling import Resolution, load_series
 from app.services.insights_service import InsightsService
 from app.services.milestone_service import get_milestone_summary
 from app.services.net_worth_benchmark_service import compute_benchmark, get_all_age_group_medians
@@ -331,21 +333,26 @@ async def get_dashboard_data(
     total_debts = service.compute_total_debts(accounts)
     account_balances = service.compute_account_balances(accounts)
 
-    # Single query for both spending and income (CASE WHEN)
-    monthly_spending, monthly_income = await service.get_spending_and_income(
-        current_user.organization_id, start_date, end_date, account_ids
-    )
-
-    recent_transactions = await service.get_recent_transactions(
-        current_user.organization_id, limit=10, account_ids=account_ids
-    )
-
-    top_expenses = await service.get_expense_by_category(
-        current_user.organization_id, start_date, end_date, limit=10, account_ids=account_ids
-    )
-
-    cash_flow_trend = await service.get_cash_flow_trend(
-        current_user.organization_id, months=12, account_ids=account_ids
+    # Independent reads — run concurrently on pooled sessions
+    org_id = current_user.organization_id
+    (
+        (monthly_spending, monthly_income),  # Single query (CASE WHEN)
+        recent_transactions,
+        top_expenses,
+        cash_flow_trend,
+    ) = await SessionFanOut(db).gather(
+        lambda s: DashboardService(s).get_spending_and_income(
+            org_id, start_date, end_date, account_ids
+        ),
+        lambda s: DashboardService(s).get_recent_transactions(
+            org_id, limit=10, account_ids=account_ids
+        ),
+        lambda s: DashboardService(s).get_expense_by_category(
+            org_id, start_date, end_date, limit=10, account_ids=account_ids
+        ),
+        lambda s: DashboardService(s).get_cash_flow_trend(
+            org_id, months=12, account_ids=account_ids
+        ),
     )
 
     # Convert transactions to TransactionDetail format
@@ -1211,6 +1218,9 @@ class NetWorthHistoryPoint(BaseModel):
     other_debts: float
 
 
+_HISTORY_FIELDS = [name for name in NetWorthHistoryPoint.model_fields if name != "snapshot_date"]
+
+
 @router.get("/net-worth-history", response_model=list[NetWorthHistoryPoint])
 async def get_net_worth_history(
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
@@ -1219,14 +1229,22 @@ async def get_net_worth_history(
         None, description="Filter by user. None = combined household view"
     ),
     user_ids: Optional[List[UUID]] = Query(None, description="Multi-user filter"),
+    resolution: Resolution = Query(
+        "auto", description="auto picks daily/weekly/monthly from the range and max_points"
+    ),
+    max_points: Optional[int] = Query(
+        None, ge=10, le=5000, description="Point budget (default 500 under auto)"
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Return daily net worth snapshots with full asset/liability breakdown.
+    Return net worth snapshots with full asset/liability breakdown.
 
     Uses NetWorthSnapshot records (captured nightly by the snapshot task).
     When user_id is omitted, returns household-level snapshots (user_id IS NULL).
+    Ranges longer than the point budget are served as weekly or monthly
+    closing values, thinned with LTTB if still over budget.
     """
     if start_date is None:
         start_date = date.today() - timedelta(days=365)
@@ -1237,24 +1255,35 @@ async def get_net_worth_history(
     if user_id:
         await verify_household_member(db, user_id, current_user.organization_id)
 
-    # Build query
-    query = select(NetWorthSnapshot).where(
+    conditions = [
         NetWorthSnapshot.organization_id == current_user.organization_id,
         NetWorthSnapshot.snapshot_date >= start_date,
-    )
-
+    ]
     if end_date:
-        query = query.where(NetWorthSnapshot.snapshot_date <= end_date)
-
+        conditions.append(NetWorthSnapshot.snapshot_date <= end_date)
     if user_id:
-        query = query.where(NetWorthSnapshot.user_id == user_id)
+        conditions.append(NetWorthSnapshot.user_id == user_id)
     else:
-        query = query.where(NetWorthSnapshot.user_id.is_(None))
-
-    query = query.order_by(asc(NetWorthSnapshot.snapshot_date))
+        conditions.append(NetWorthSnapshot.user_id.is_(None))
+
+    async def _load():
+        rows, _ = await load_series(
+            db,
+            [
+                NetWorthSnapshot.snapshot_date,
+                *(getattr(NetWorthSnapshot, name) for name in _HISTORY_FIELDS),
+            ],
+            conditions,
+            date_column=NetWorthSnapshot.snapshot_date,
+            value_column=NetWorthSnapshot.total_net_worth,
+            start_date=start_date,
+            end_date=end_date,
+            resolution=resolution,
+            max_points=max_points,
+        )
+        return rows
 
-    result = await db.execute(query)
-    snapshots = result.scalars().all()
+    snapshots = await _load()
 
     # Lazy bootstrap: if no snapshots exist yet, OR if only a stale $0 snapshot
     # exists (captured before accounts were added), re-capture today's snapshot.
@@ -1279,19 +1308,7 @@ async def get_net_worth_history(
             # — avoids showing a $0 placeholder when the org has no accounts yet.
             if snap and snap.total_net_worth and snap.total_net_worth != 0:
                 # Re-query on the original request session now that the snapshot is committed
-                fresh_query = select(NetWorthSnapshot).where(
-                    NetWorthSnapshot.organization_id == current_user.organization_id,
-                    NetWorthSnapshot.snapshot_date >= start_date,
-                )
-                if end_date:
-                    fresh_query = fresh_query.where(NetWorthSnapshot.snapshot_date <= end_date)
-                if user_id:
-                    fresh_query = fresh_query.where(NetWorthSnapshot.user_id == user_id)
-                else:
-                    fresh_query = fresh_query.where(NetWorthSnapshot.user_id.is_(None))
-                fresh_query = fresh_query.order_by(asc(NetWorthSnapshot.snapshot_date))
-                result2 = await db.execute(fresh_query)
-                snapshots = result2.scalars().all()
+                snapshots = await _load()
         except Exception:
             _logger.exception("Net worth lazy bootstrap failed for org %s", current_user.organization_id)
             pass  # Non-fatal: return empty list if bootstrap fails
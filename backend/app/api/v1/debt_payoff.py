@@ -11,6 +11,7 @@ from app.core.database import get_db
 from app.dependencies import get_current_user, get_filtered_accounts, verify_household_member
 from app.services.rate_limit_service import rate_limit_service
 from app.models.user import User
+from app.services.debt_payoff_engine import amortization_rows
 from app.services.payoff_strategy_service import PayoffStrategyService
 
 
@@ -23,6 +24,9 @@ async def _rate_limit(http_request: Request, current_user: User = Depends(get_cu
 
 router = APIRouter(dependencies=[Depends(_rate_limit)])
 
+# Upper bound on amounts per sensitivity request (one engine run each)
+MAX_SENSITIVITY_POINTS = 100
+
 
 @router.get("/debts", response_model=List[Any])
 async def list_debt_accounts(
@@ -100,6 +104,49 @@ async def compare_payoff_strategies(
     return comparison
 
 
+@router.get("/sensitivity", response_model=Dict[str, Any])
+async def get_extra_payment_sensitivity(
+    extra_payments: str = Query(..., description="Comma-separated extra monthly payment amounts"),
+    strategy: str = Query("AVALANCHE", pattern="^(SNOWBALL|AVALANCHE)$"),
+    user_id: Optional[UUID] = Query(None, description="Filter by user"),
+    account_ids: Optional[str] = Query(None, description="Comma-separated account IDs to include"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Months and interest to debt-free for many extra-payment amounts.
+
+    Backs the "extra payment" slider and sensitivity table: every amount is
+    simulated in a single engine run against the minimum-only baseline, with
+    interest and months saved for each.
+    """
+    if user_id:
+        await verify_household_member(db, user_id, current_user.organization_id)
+
+    try:
+        amounts = [Decimal(a.strip()) for a in extra_payments.split(",") if a.strip()]
+    except ArithmeticError:
+        raise HTTPException(status_code=400, detail="Invalid extra_payments format")
+    if not amounts or len(amounts) > MAX_SENSITIVITY_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Provide between 1 and {MAX_SENSITIVITY_POINTS} extra payment amounts",
+        )
+    if any(not a.is_finite() or a < 0 for a in amounts):
+        raise HTTPException(status_code=400, detail="Extra payments must be non-negative")
+
+    account_id_list = None
+    if account_ids:
+        try:
+            account_id_list = [UUID(id.strip()) for id in account_ids.split(",")]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid account_ids format")
+
+    return await PayoffStrategyService.extra_payment_sensitivity(
+        db, current_user.organization_id, amounts, strategy, user_id, account_id_list
+    )
+
+
 @router.get("/summary", response_model=Dict[str, Any])
 async def get_debt_summary(
     user_id: Optional[UUID] = Query(None, description="Filter by user"),
@@ -155,6 +202,7 @@ async def get_loan_amortization(
     """
     Calculate amortization schedule for a loan account (up to 24 months shown).
     Returns monthly payment breakdown: principal, interest, remaining balance.
+    Interest is rounded to the cent each month, as lenders post it.
     """
     from datetime import date as date_type
     from dateutil.relativedelta import relativedelta
@@ -176,46 +224,35 @@ async def get_loan_amortization(
     if not account.minimum_payment or account.minimum_payment <= 0:
         raise HTTPException(status_code=400, detail="Account has no minimum payment set")
 
-    balance = abs(float(account.current_balance or 0))
-    annual_rate = float(account.interest_rate) / 100
-    monthly_rate = annual_rate / 12
-    monthly_payment = float(account.minimum_payment) + float(extra_payment)
+    balance = abs(Decimal(str(account.current_balance or 0)))
+    monthly_rate = float(account.interest_rate) / 100 / 12
+    monthly_payment = Decimal(str(account.minimum_payment)) + extra_payment
 
-    if monthly_rate > 0 and monthly_payment <= balance * monthly_rate:
+    if monthly_rate > 0 and float(monthly_payment) <= float(balance) * monthly_rate:
         raise HTTPException(status_code=400, detail="Monthly payment too small to cover interest")
 
-    schedule = []
-    total_interest = 0.0
-    total_paid = 0.0
-    current_balance = balance
     current_date = date_type.today()
-    MAX_MONTHS = 360
-
-    for month in range(1, MAX_MONTHS + 1):
-        if current_balance <= 0.005:
-            break
-        interest = current_balance * monthly_rate if monthly_rate > 0 else 0.0
-        payment = min(monthly_payment, current_balance + interest)
-        principal = payment - interest
-        current_balance = max(0.0, current_balance - principal)
-        total_interest += interest
-        total_paid += payment
-        payment_date = current_date + relativedelta(months=month)
-
-        schedule.append({
+    schedule = [
+        {
             "month": month,
-            "date": payment_date.isoformat(),
-            "payment": round(payment, 2),
-            "principal": round(principal, 2),
-            "interest": round(interest, 2),
-            "balance": round(current_balance, 2),
-        })
+            "date": (current_date + relativedelta(months=month)).isoformat(),
+            "payment": payment,
+            "principal": principal,
+            "interest": interest,
+            "balance": remaining,
+        }
+        for month, payment, principal, interest, remaining in amortization_rows(
+            balance, account.interest_rate, monthly_payment, paid_off_at=Decimal("0.005")
+        )
+    ]
+    total_interest = sum(row["interest"] for row in schedule)
+    total_paid = sum(row["payment"] for row in schedule)
 
     return {
         "schedule": schedule[:24],  # Return first 24 months in response
         "total_months": len(schedule),
         "total_interest": round(total_interest, 2),
         "total_paid": round(total_paid, 2),
-        "monthly_payment": round(monthly_payment, 2),
+        "monthly_payment": round(float(monthly_payment), 2),
         "payoff_date": schedule[-1]["date"] if schedule else None,
     }
\ No newline at end of file
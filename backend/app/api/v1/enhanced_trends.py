@@ -17,6 +17,7 @@ from app.dependencies import (
 from app.services.rate_limit_service import rate_limit_service
 from app.models.user import User
 from app.services.enhanced_trends_service import EnhancedTrendsService
+from app.services.history_downsampling import Resolution
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +36,16 @@ async def get_net_worth_history(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     user_id: Optional[UUID] = None,
+    resolution: Resolution = "auto",
+    max_points: Optional[int] = Query(None, ge=10, le=5000),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get net worth history time series with asset/liability breakdown."""
+    """Get net worth history time series with asset/liability breakdown.
+
+    Long ranges come back as weekly/monthly closing values within
+    ``max_points`` (default 500) unless ``resolution`` asks for daily.
+    """
     if user_id:
         await verify_household_member(db, user_id, current_user.organization_id)
     service = EnhancedTrendsService(db)
@@ -47,16 +54,21 @@ async def get_net_worth_history(
         user_id=user_id,
         start_date=start_date,
         end_date=end_date,
+        resolution=resolution,
+        max_points=max_points,
     )
 
 
 @router.get("/investment-performance", response_model=Dict[str, Any])
 async def get_investment_performance(
     user_id: Optional[UUID] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get investment portfolio performance: total return, per-holding gains, winners/losers."""
+    """Get investment portfolio performance: total return, per-holding gains, winners/losers,
+    and time-/money-weighted returns over the requested window."""
     account_ids = None
     if user_id:
         await verify_household_member(db, user_id, current_user.organization_id)
@@ -67,6 +79,9 @@ async def get_investment_performance(
     return await service.get_investment_performance(
         organization_id=current_user.organization_id,
         account_ids=account_ids,
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
     )
 
 
@@ -14,6 +14,7 @@ from sqlalchemy import and_, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.session_fanout import SessionFanOut
 from app.dependencies import get_current_user, get_filtered_accounts
 from app.models.account import Account, AccountType
 from app.models.beneficiary import Beneficiary
@@ -73,66 +74,73 @@ async def get_financial_plan_summary(
 
     org_id = current_user.organization_id
 
+    # Sections are independent reads, so they run concurrently on pooled
+    # sessions; insurance and estate need the net-worth total, so they follow.
+    fanout = SessionFanOut(db)
+    nw_result, retirement_section, education_section, debt_section, emergency_section = (
+        await fanout.gather(
+            lambda db: NetWorthService().get_current_breakdown(db, org_id),
+            lambda db: _build_retirement_section(db, org_id, subject_user),
+            lambda db: _build_education_section(db, org_id),
+            lambda db: _build_debt_section(db, org_id),
+            lambda db: _build_emergency_fund_section(db, org_id),
+            return_exceptions=True,
+        )
+    )
+
     # ── Net Worth ────────────────────────────────────────────────────────
-    nw_svc = NetWorthService()
-    try:
-        nw_data = await nw_svc.get_current_breakdown(db, org_id)
-        net_worth_section = {
-            "total": nw_data["total_net_worth"],
-            "assets": nw_data["total_assets"],
-            "liabilities": nw_data["total_liabilities"],
-        }
-    except Exception:
-        logger.exception("financial-plan: net worth section failed")
-        net_worth_section = {"total": 0, "assets": 0, "liabilities": 0}
+    if isinstance(nw_result, BaseException):
+        _log_section_failure("net worth", nw_result)
+        nw_data = {"total_net_worth": 0, "total_assets": 0, "total_liabilities": 0}
+    else:
+        nw_data = nw_result
+    net_worth_section = {
+        "total": nw_data["total_net_worth"],
+        "assets": nw_data["total_assets"],
+        "liabilities": nw_data["total_liabilities"],
+    }
 
     # ── Retirement ───────────────────────────────────────────────────────
-    try:
-        retirement_section = await _build_retirement_section(db, org_id, subject_user)
-    except Exception:
-        logger.exception("financial-plan: retirement section failed")
+    if isinstance(retirement_section, BaseException):
+        _log_section_failure("retirement", retirement_section)
         retirement_section = {"on_track": False, "no_scenario": True, "projected_at_retirement": 0,
                                "monthly_income_projected": 0, "monthly_income_needed": 0, "gap": 0,
                                "retirement_age": RETIREMENT.DEFAULT_RETIREMENT_AGE, "years_until_retirement": 0}
 
     # ── Education ────────────────────────────────────────────────────────
-    try:
-        education_section = await _build_education_section(db, org_id)
-    except Exception:
-        logger.exception("financial-plan: education section failed")
+    if isinstance(education_section, BaseException):
+        _log_section_failure("education", education_section)
         education_section = {"total_education_gap": 0, "children": [], "total_529_balance": 0}
 
     # ── Debt ─────────────────────────────────────────────────────────────
-    try:
-        debt_section = await _build_debt_section(db, org_id)
-    except Exception:
-        logger.exception("financial-plan: debt section failed")
+    if isinstance(debt_section, BaseException):
+        _log_section_failure("debt", debt_section)
         debt_section = {"total_debt": 0, "high_interest_debt": 0, "accounts": []}
 
+    # ── Emergency Fund ───────────────────────────────────────────────────
+    if isinstance(emergency_section, BaseException):
+        _log_section_failure("emergency fund", emergency_section)
+        emergency_section = {"months_covered": 0, "recommended_months": HEALTH.EMERGENCY_FUND_TARGET_MONTHS, "shortfall": 0}
+
+    insurance_section, estate_section = await fanout.gather(
+        lambda db: _build_insurance_section(db, org_id, nw_data["total_net_worth"]),
+        lambda db: _build_estate_section(db, org_id, subject_user, nw_data["total_net_worth"]),
+        return_exceptions=True,
+    )
+
     # ── Insurance ────────────────────────────────────────────────────────
-    try:
-        insurance_section = await _build_insurance_section(db, org_id, nw_data["total_net_worth"])
-    except Exception:
-        logger.exception("financial-plan: insurance section failed")
+    if isinstance(insurance_section, BaseException):
+        _log_section_failure("insurance", insurance_section)
         insurance_section = {"life_coverage_gap": 0, "life_coverage_need": 0, "life_coverage_existing": 0,
                               "has_disability": False, "has_umbrella": False, "umbrella_recommended": False,
                               "_has_life": False, "_coverage_score": 0}
 
     # ── Estate ───────────────────────────────────────────────────────────
-    try:
-        estate_section = await _build_estate_section(db, org_id, subject_user, nw_data["total_net_worth"])
-    except Exception:
-        logger.exception("financial-plan: estate section failed")
+    if isinstance(estate_section, BaseException):
+        _log_section_failure("estate", estate_section)
         estate_section = {"has_will": False, "has_poa": False, "has_hcpoa": False,
                           "has_trust": False, "beneficiary_coverage": 0}
 
-    # ── Emergency Fund ───────────────────────────────────────────────────
-    try:
-        emergency_section = await _build_emergency_fund_section(db, org_id)
-    except Exception:
-        logger.exception("financial-plan: emergency fund section failed")
-        emergency_section = {"months_covered": 0, "recommended_months": HEALTH.EMERGENCY_FUND_TARGET_MONTHS, "shortfall": 0}
-
     # ── Health Score ─────────────────────────────────────────────────────
     health_score = _compute_health_score(
         retirement_section, emergency_section, insurance_section,
@@ -194,6 +202,12 @@ async def get_financial_plan_summary(
 # ── Section builders ─────────────────────────────────────────────────────────
 
 
+def _log_section_failure(section: str, exc: BaseException) -> None:
+    logger.error(
+        "financial-plan: %s section failed", section, exc_info=(type(exc), exc, exc.__traceback__)
+    )
+
+
 async def _build_retirement_section(db: AsyncSession, org_id, user: User) -> dict:
     """Pull most recent active retirement scenario and its simulation result."""
     result = await db.execute(
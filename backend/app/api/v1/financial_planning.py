@@ -687,7 +687,7 @@ async def get_guardrails_stress_test(
         None, ge=-1.0, le=0.0, description="Custom first-year return (e.g. -0.40 for -40%)"
     ),
     guardrails_enabled: bool = Query(True, description="Apply Guyton-Klinger spending rules"),
-    num_simulations: int = Query(1_000, ge=100, le=5_000),
+    num_simulations: int = Query(1_000, ge=100, le=10_000),
     current_user: User = Depends(get_current_user),
 ) -> GuardrailsResponse:
     """
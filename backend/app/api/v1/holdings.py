@@ -2,7 +2,6 @@
 
 import asyncio as _asyncio
 import logging
-import re
 import secrets
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
@@ -13,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import func, select
 from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.core.cache import delete_pattern as cache_delete_pattern
 from app.core.cache import get as cache_get
@@ -57,8 +56,20 @@ from app.schemas.rmd import AccountRMD, RMDSummary
 from app.services.deduplication_service import deduplication_service
 from app.services.financial_data_service import financial_data_service
 from app.services.fund_fee_analyzer_service import resolve_expense_ratio
+from app.services.history_downsampling import Resolution
 from app.services.input_sanitization_service import input_sanitization_service
 from app.services.market_data import get_market_data_provider
+from app.services.security_classification_service import (
+    BUCKET_BOND,
+    BUCKET_CASH,
+    BUCKET_DOMESTIC,
+    BUCKET_INTERNATIONAL,
+    BUCKET_OTHER,
+    DOMESTIC_COUNTRIES,
+    FUND_INDEX_MAP,
+    INTERNATIONAL_TICKERS,
+    classify_holding,
+)
 from app.services.snapshot_service import snapshot_service
 from app.services.rate_limit_service import rate_limit_service
 from app.utils.account_type_groups import (
@@ -134,7 +145,7 @@ async def get_portfolio_summary(
             select(Holding)
             .join(Account)
             .where(Holding.account_id.in_(investment_account_ids))
-            .options(selectinload(Holding.account))
+            .options(selectinload(Holding.account), joinedload(Holding.classification))
             .limit(_HOLDINGS_LIMIT)
         )
         holdings = result.scalars().all()
@@ -368,25 +379,6 @@ async def get_portfolio_summary(
     )
 
     # Calculate geographic breakdown (simple heuristic)
-    international_tickers = {
-        "VXUS",
-        "VEU",
-        "VWO",
-        "VGTSX",
-        "VTIAX",
-        "VTMGX",
-        "VEA",
-        "IEMG",
-        "IXUS",
-        "SCHF",
-        "EFA",
-        "IEFA",
-        "VFWAX",
-        "VFWIX",
-        "VTSNX",
-        "VEMAX",
-        "VIMSX",
-    }
 
     domestic_value = Decimal("0")
     international_value = Decimal("0")
@@ -402,8 +394,8 @@ async def get_portfolio_summary(
             # Check asset_class first, then fallback to hardcoded list or country
             if (
                 asset_class == "international"
-                or summary.ticker.upper() in international_tickers
-                or (country and country not in ["USA", "US", "United States", ""])
+                or summary.ticker.upper() in INTERNATIONAL_TICKERS
+                or country not in DOMESTIC_COUNTRIES
             ):
                 international_value += summary.current_total_value
             elif summary.asset_type in ["stock", "etf", "mutual_fund"]:
@@ -436,136 +428,21 @@ async def get_portfolio_summary(
                 if holding.current_total_value:
                     all_investment_holdings.append(holding)
 
-    # Separate into asset classes with market cap classification
-    domestic_stocks_dict = {}
-    international_stocks_dict = {}
-    bonds_dict = {}
-    cash_dict = {}
-    other_dict = {}
-
     # Asset type resolution order:
-    #   1. holding.asset_type already set (e.g., synced from Plaid) — use as-is, no estimate
-    #   2. Polygon.io /v3/reference/tickers/{ticker} — authoritative, no estimate
-    #   3. Name/ticker heuristics — estimated, set asset_classification_estimated flag
+    #   1. Stored per-symbol classification (refreshed by enrich_holdings_metadata_task)
+    #   2. holding.asset_type already set (e.g., synced from Plaid) — use as-is, no estimate
+    #   3. Polygon.io /v3/reference/tickers/{ticker} — authoritative, no estimate
+    #   4. Name/ticker heuristics — estimated, set asset_classification_estimated flag
     # Track whether any holding fell back to heuristics.
     asset_classification_estimated = False
 
-    # Common ticker patterns (used as fallback, not exhaustive)
-    # Primary classification uses fund name parsing
-    COMMON_PATTERNS = {
-        "cash": {"VMFXX", "SPAXX", "FDRXX", "SWVXX", "VMMXX"},
-        "bonds": {"AGG", "BND", "BNDX", "TLT", "VBTLX", "FBNDX"},
-        "large_cap": {"SPY", "VOO", "IVV", "QQQ", "VV", "SCHX"},
-        "mid_cap": {"MDY", "IJH", "VO", "SCHM", "IVOO"},
-        "small_cap": {"IWM", "IJR", "VB", "SCHA", "VTWO"},
-    }
-
-    def classify_market_cap(ticker: str, name: str = None, asset_type: str = None) -> str:
-        """
-        Classify market cap using intelligent name parsing.
-
-        Strategy:
-        1. Parse fund name for explicit cap size (e.g., "Vanguard Large Cap Index")
-        2. Check against common ETF patterns as fallback
-        3. Use asset_type to make educated defaults
-
-        Returns: 'Large Cap', 'Mid Cap', or 'Small Cap'
-        """
-        name_upper = (name or "").upper()
-        ticker_upper = ticker.upper()
-
-        # Strategy 1: Intelligent name parsing (most reliable for mutual funds/ETFs)
-        if name_upper:
-            # Look for explicit cap size mentions with word boundaries
-            if re.search(r"\b(LARGE[\s-]?CAP|MEGA[\s-]?CAP|LARGECAP)\b", name_upper):
-                return "Large Cap"
-            if re.search(r"\b(MID[\s-]?CAP|MIDCAP)\b", name_upper):
-                return "Mid Cap"
-            if re.search(r"\b(SMALL[\s-]?CAP|MICRO[\s-]?CAP|SMALLCAP)\b", name_upper):
-                return "Small Cap"
-
-            # Check for standalone 'LARGE', 'MID', 'SMALL' keywords
-            if re.search(r"\bLARGE\b", name_upper):
-                return "Large Cap"
-            if re.search(r"\bMID\b", name_upper):
-                return "Mid Cap"
-            if re.search(r"\bSMALL\b", name_upper):
-                return "Small Cap"
-
-        # Strategy 2: Common ETF ticker fallback
-        if ticker_upper in COMMON_PATTERNS["large_cap"]:
-            return "Large Cap"
-        if ticker_upper in COMMON_PATTERNS["mid_cap"]:
-            return "Mid Cap"
-        if ticker_upper in COMMON_PATTERNS["small_cap"]:
-            return "Small Cap"
-
-        # Strategy 3: Default based on asset type (most holdings are large cap)
-        return "Large Cap"
-
-    domestic_stocks_value = Decimal("0")
-    international_value_from_holdings = Decimal("0")
-    bonds_value = Decimal("0")
-    cash_from_holdings = Decimal("0")
-    other_investments = Decimal("0")
-
-    # Store holdings with metadata for cap classification
-    domestic_stocks_with_cap = []  # List of (ticker, value, cap_size, name)
-    international_stocks_with_cap = []  # List of (ticker, value, cap_size, name, country)
-
-    def is_cash_holding(ticker: str, name: str, asset_type: str) -> bool:
-        """Identify cash/money market holdings."""
-        ticker_upper = ticker.upper()
-        name_upper = (name or "").upper()
-
-        # Check common patterns first
-        if ticker_upper in COMMON_PATTERNS["cash"]:
-            return True
-
-        # Parse name for money market keywords
-        if any(
-            keyword in name_upper for keyword in ["MONEY MARKET", "CASH", "SWEEP", "SETTLEMENT"]
-        ):
-            return True
-
-        # Check asset type if available
-        if asset_type == "cash":
-            return True
-
-        return False
-
-    def is_bond_holding(ticker: str, name: str, asset_type: str) -> bool:
-        """Identify bond holdings."""
-        ticker_upper = ticker.upper()
-        name_upper = (name or "").upper()
-
-        # Check common patterns first
-        if ticker_upper in COMMON_PATTERNS["bonds"]:
-            return True
-
-        # Parse name for bond keywords
-        if any(
-            keyword in name_upper
-            for keyword in ["BOND", "TREASURY", "GOVT", "FIXED INCOME", "CORPORATE DEBT"]
-        ):
-            return True
-
-        # Check ticker patterns
-        if any(pattern in ticker_upper for pattern in ["BND", "BOND", "TLT", "AGG"]):
-            return True
-
-        # Check asset type
-        if asset_type == "bond":
-            return True
-
-        return False
-
-    # Pre-resolve asset types for holdings that have none (manual holdings not from Plaid).
-    # Batch the Polygon lookups so we don't block per-holding inside the loop.
+    # Pre-resolve asset types for unclassified holdings that have none (manual holdings
+    # the enrichment task has not seen yet). Batch the Polygon lookups so we don't block
+    # per-holding inside the loop.
     untyped_tickers = list({
         h.ticker.upper()
         for h in all_investment_holdings
-        if not h.asset_type
+        if h.classification is None and not h.asset_type
     })
     resolved_asset_types: dict[str, tuple[str, bool]] = {}  # ticker -> (asset_type, estimated)
     for untyped_ticker in untyped_tickers:
@@ -575,64 +452,47 @@ async def get_portfolio_summary(
         else:
             resolved_asset_types[untyped_ticker] = ("", True)  # will fall through to heuristics
 
+    # One classification per symbol, then a single group-by of values into
+    # bucket -> {ticker: value}
+    bucket_values: dict[str, dict[str, Decimal]] = {
+        bucket: {}
+        for bucket in (
+            BUCKET_CASH,
+            BUCKET_BOND,
+            BUCKET_INTERNATIONAL,
+            BUCKET_DOMESTIC,
+            BUCKET_OTHER,
+        )
+    }
+    classifications = {}
     for holding in all_investment_holdings:
         ticker = holding.ticker.upper()
-        value = holding.current_total_value
-        name = holding.name or ""
-        # Use Plaid-supplied type if available; otherwise use Polygon result
-        if holding.asset_type:
-            asset_type = holding.asset_type
-        else:
-            resolved_type, resolved_estimated = resolved_asset_types.get(ticker, ("", True))
-            asset_type = resolved_type
-            if resolved_estimated:
+        classification = classifications.get(ticker)
+        if classification is None:
+            resolved_type, resolved_estimated = None, False
+            if holding.classification is None and not holding.asset_type:
+                resolved_type, resolved_estimated = resolved_asset_types.get(ticker, ("", True))
+            classification = classify_holding(holding, asset_type=resolved_type)
+            classifications[ticker] = classification
+            if not holding.asset_type and (
+                resolved_estimated
+                or (holding.classification is not None and classification.is_estimated)
+            ):
                 asset_classification_estimated = True
-        asset_class = (holding.asset_class or "").lower()
-        country = holding.country or ""
-
-        if is_cash_holding(ticker, name, asset_type):
-            # Cash/Money Market
-            cash_from_holdings += value
-            if ticker in cash_dict:
-                cash_dict[ticker] += value
-            else:
-                cash_dict[ticker] = value
-        elif is_bond_holding(ticker, name, asset_type):
-            # Bonds
-            bonds_value += value
-            if ticker in bonds_dict:
-                bonds_dict[ticker] += value
-            else:
-                bonds_dict[ticker] = value
-        elif (
-            asset_class == "international"
-            or (ticker in international_tickers)
-            or (country and country not in ["USA", "US", "United States", ""])
-        ):
-            # International - check asset_class first, then fallback to hardcoded list or country
-            international_value_from_holdings += value
-            cap_size = classify_market_cap(ticker, name, asset_type)
-            international_stocks_with_cap.append((ticker, value, cap_size, name, country))
-            if ticker in international_stocks_dict:
-                international_stocks_dict[ticker] += value
-            else:
-                international_stocks_dict[ticker] = value
-        elif asset_type in ["stock", "etf", "mutual_fund"]:
-            # Domestic stocks/equities
-            domestic_stocks_value += value
-            cap_size = classify_market_cap(ticker, name, asset_type)
-            domestic_stocks_with_cap.append((ticker, value, cap_size, name))
-            if ticker in domestic_stocks_dict:
-                domestic_stocks_dict[ticker] += value
-            else:
-                domestic_stocks_dict[ticker] = value
-        else:
-            # Other
-            other_investments += value
-            if ticker in other_dict:
-                other_dict[ticker] += value
-            else:
-                other_dict[ticker] = value
+        by_ticker = bucket_values[classification.bucket]
+        by_ticker[ticker] = by_ticker.get(ticker, Decimal("0")) + holding.current_total_value
+
+    cash_dict = bucket_values[BUCKET_CASH]
+    bonds_dict = bucket_values[BUCKET_BOND]
+    international_stocks_dict = bucket_values[BUCKET_INTERNATIONAL]
+    domestic_stocks_dict = bucket_values[BUCKET_DOMESTIC]
+    other_dict = bucket_values[BUCKET_OTHER]
+
+    cash_from_holdings = sum(cash_dict.values(), Decimal("0"))
+    bonds_value = sum(bonds_dict.values(), Decimal("0"))
+    international_value_from_holdings = sum(international_stocks_dict.values(), Decimal("0"))
+    domestic_stocks_value = sum(domestic_stocks_dict.values(), Decimal("0"))
+    other_investments = sum(other_dict.values(), Decimal("0"))
 
     # Handle investment accounts with balances but no holdings (e.g., not yet synced)
     investment_accounts_without_holdings_value = Decimal("0")
@@ -710,7 +570,8 @@ async def get_portfolio_summary(
     if domestic_stocks_value > 0:
         # Group by market cap
         cap_groups = {}  # {cap_size: [(ticker, value), ...]}
-        for ticker, value, cap_size, name in domestic_stocks_with_cap:
+        for ticker, value in domestic_stocks_dict.items():
+            cap_size = classifications[ticker].cap_size
             if cap_size not in cap_groups:
                 cap_groups[cap_size] = []
             cap_groups[cap_size].append((ticker, value))
@@ -755,88 +616,12 @@ async def get_portfolio_summary(
 
     # Add International with Developed/Emerging market layers
     if international_value_from_holdings > 0:
-        # Define emerging markets (developed markets are the default)
-        EMERGING_MARKETS = {
-            "China",
-            "CN",
-            "CHN",
-            "Taiwan",
-            "TW",
-            "TWN",
-            "India",
-            "IN",
-            "IND",
-            "Brazil",
-            "BR",
-            "BRA",
-            "Russia",
-            "RU",
-            "RUS",
-            "South Africa",
-            "ZA",
-            "ZAF",
-            "Mexico",
-            "MX",
-            "MEX",
-            "Indonesia",
-            "ID",
-            "IDN",
-            "Turkey",
-            "TR",
-            "TUR",
-            "Saudi Arabia",
-            "SA",
-            "SAU",
-            "Poland",
-            "PL",
-            "POL",
-            "Thailand",
-            "TH",
-            "THA",
-            "Malaysia",
-            "MY",
-            "MYS",
-            "Philippines",
-            "PH",
-            "PHL",
-            "Colombia",
-            "CO",
-            "COL",
-            "Chile",
-            "CL",
-            "CHL",
-            "Peru",
-            "PE",
-            "PER",
-            "Egypt",
-            "EG",
-            "EGY",
-            "UAE",
-            "AE",
-            "ARE",
-            "Qatar",
-            "QA",
-            "QAT",
-            "Argentina",
-            "AR",
-            "ARG",
-            "Pakistan",
-            "PK",
-            "PAK",
-            "Vietnam",
-            "VN",
-            "VNM",
-            "Bangladesh",
-            "BD",
-            "BGD",
-        }
-
         # Group by developed vs emerging markets
         developed_holdings = []  # List of (ticker, value)
         emerging_holdings = []  # List of (ticker, value)
 
-        for ticker, value, cap_size, name, country in international_stocks_with_cap:
-            if country in EMERGING_MARKETS:
+        for ticker, value in international_stocks_dict.items():
+            if classifications[ticker].region == "emerging":
                 emerging_holdings.append((ticker, value))
             else:
                 # Default to developed (includes Global funds and unrecognized countries)
@@ -1283,6 +1068,7 @@ async def create_holding(
         cost_basis_per_share=holding_data.cost_basis_per_share,
         total_cost_basis=total_cost_basis,
         asset_type=holding_data.asset_type,
+        asset_type_overridden=holding_data.asset_type is not None,
     )
 
     db.add(holding)
@@ -1381,6 +1167,7 @@ async def update_holding(
         holding.price_as_of = utc_now()
     if holding_data.asset_type is not None:
         holding.asset_type = holding_data.asset_type
+        holding.asset_type_overridden = True
 
     holding.updated_at = utc_now()
 
@@ -1472,6 +1259,12 @@ async def get_historical_snapshots(
         description="Filter by user ID. Omit for household-level snapshots.",
     ),
     user_ids: Optional[List[UUID]] = Query(None, description="Multi-user filter"),
+    resolution: Resolution = Query(
+        "auto", description="auto picks daily/weekly/monthly from the range and max_points"
+    ),
+    max_points: Optional[int] = Query(
+        None, ge=10, le=5000, description="Point budget (default 500 under auto)"
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -1485,6 +1278,9 @@ async def get_historical_snapshots(
     - end_date: End date (defaults to today)
     - limit: Maximum number of snapshots to return (max 5000)
     - user_id: Filter by user. Omit for whole-household snapshots.
+    - resolution: daily, weekly or monthly (period closing values); auto
+      stays daily up to max_points days and steps down beyond that
+    - max_points: thin the series with LTTB to at most this many points
     """
     # Default to last year if no start date provided
     if start_date is None:
@@ -1497,13 +1293,15 @@ async def get_historical_snapshots(
     if user_id is not None:
         await verify_household_member(db, user_id, current_user.organization_id)
 
-    snapshots = await snapshot_service.get_snapshots(
+    snapshots = await snapshot_service.get_snapshot_series(
         db=db,
         organization_id=current_user.organization_id,
         start_date=start_date,
         end_date=end_date,
         limit=limit,
         user_id=user_id,
+        resolution=resolution,
+        max_points=max_points,
     )
 
     return snapshots
@@ -1526,7 +1324,7 @@ async def get_style_box_breakdown(
     result = await db.execute(
         select(Holding)
         .where(Holding.organization_id == current_user.organization_id)
-        .options(selectinload(Holding.account))
+        .options(selectinload(Holding.account), joinedload(Holding.classification))
     )
     holdings = result.scalars().all()
 
@@ -1559,146 +1357,6 @@ async def get_style_box_breakdown(
     if total_value == 0:
         return []
 
-    # Developed and Emerging market country lists
-    DEVELOPED_MARKETS = {
-        "USA",
-        "US",
-        "United States",
-        "UK",
-        "United Kingdom",
-        "GB",
-        "GBR",
-        "Germany",
-        "DE",
-        "DEU",
-        "Japan",
-        "JP",
-        "JPN",
-        "Canada",
-        "CA",
-        "CAN",
-        "France",
-        "FR",
-        "FRA",
-        "Switzerland",
-        "CH",
-        "CHE",
-        "Australia",
-        "AU",
-        "AUS",
-        "Netherlands",
-        "NL",
-        "NLD",
-        "Sweden",
-        "SE",
-        "SWE",
-        "Denmark",
-        "DK",
-        "DNK",
-        "Norway",
-        "NO",
-        "NOR",
-        "Finland",
-        "FI",
-        "FIN",
-        "Spain",
-        "ES",
-        "ESP",
-        "Italy",
-        "IT",
-        "ITA",
-        "Belgium",
-        "BE",
-        "BEL",
-        "Austria",
-        "AT",
-        "AUT",
-        "Singapore",
-        "SG",
-        "SGP",
-        "Hong Kong",
-        "HK",
-        "HKG",
-        "New Zealand",
-        "NZ",
-        "NZL",
-    }
-
-    EMERGING_MARKETS = {
-        "China",
-        "CN",
-        "CHN",
-        "Taiwan",
-        "TW",
-        "TWN",
-        "India",
-        "IN",
-        "IND",
-        "Brazil",
-        "BR",
-        "BRA",
-        "Russia",
-        "RU",
-        "RUS",
-        "South Africa",
-        "ZA",
-        "ZAF",
-        "Mexico",
-        "MX",
-        "MEX",
-        "Indonesia",
-        "ID",
-        "IDN",
-        "Turkey",
-        "TR",
-        "TUR",
-        "Saudi Arabia",
-        "SA",
-        "SAU",
-        "Poland",
-        "PL",
-        "POL",
-        "Thailand",
-        "TH",
-        "THA",
-        "Malaysia",
-        "MY",
-        "MYS",
-        "Philippines",
-        "PH",
-        "PHL",
-        "Colombia",
-        "CO",
-        "COL",
-        "Chile",
-        "CL",
-        "CHL",
-        "Peru",
-        "PE",
-        "PER",
-        "Egypt",
-        "EG",
-        "EGY",
-        "UAE",
-        "AE",
-        "ARE",
-        "Qatar",
-        "QA",
-        "QAT",
-        "Argentina",
-        "AR",
-        "ARG",
-        "Pakistan",
-        "PK",
-        "PAK",
-        "Vietnam",
-        "VN",
-        "VNM",
-        "Bangladesh",
-        "BD",
-        "BGD",
-    }
-
     # Group holdings by various categories
     style_groups: dict[str, dict] = {}
 
@@ -1707,53 +1365,22 @@ async def get_style_box_breakdown(
         if value == 0:
             continue
 
-        # Check if international based on country field and asset_class
-        country = holding.country or ""
-
-        # Determine if this is an international holding
-        is_international = holding.asset_class == "international" or (
-            country and country not in ["USA", "US", "United States", ""]
-        )
+        classification = classify_holding(holding)
 
         # Skip bonds and cash equivalents from holdings (cash accounts handled separately)
-        if holding.asset_class in ["bond", "cash"]:
+        if classification.bucket in (BUCKET_BOND, BUCKET_CASH):
             continue
 
-        if is_international:
-            # Categorize as Developed or Emerging market based on country
-            if country in DEVELOPED_MARKETS:
-                style_class = "International - Developed"
-            elif country in EMERGING_MARKETS:
+        if classification.bucket == BUCKET_INTERNATIONAL:
+            # Unrecognized countries default to Developed (most international stocks are)
+            if classification.region == "emerging":
                 style_class = "International - Emerging"
             else:
-                # If country not recognized, default to Developed
-                # (most international stocks are developed markets)
                 style_class = "International - Developed"
         else:
             # Domestic stocks - categorize by market cap and style
-            market_cap_str = (holding.market_cap or "").lower()
-
-            # Map market cap string to display name
-            if market_cap_str == "large":
-                size = "Large Cap"
-            elif market_cap_str == "mid":
-                size = "Mid Cap"
-            elif market_cap_str == "small":
-                size = "Small Cap"
-            else:
-                # Default to Large Cap if not specified
-                size = "Large Cap"
-
-            # Infer style from asset class or default to Core
-            asset_class_lower = (holding.asset_class or "").lower()
-            if "value" in asset_class_lower:
-                style = "Value"
-            elif "growth" in asset_class_lower:
-                style = "Growth"
-            else:
-                style = "Core"
-
-            style_class = f"{size} {style}"
+            size = classification.cap_size or "Large Cap"
+            style_class = f"{size} {classification.style or 'Core'}"
 
         if style_class not in style_groups:
             style_groups[style_class] = {"value": Decimal("0"), "count": 0}
@@ -2115,92 +1742,6 @@ async def get_roth_analysis(
 
 # ── Fund mapping data for overlap detection and low-cost alternatives ────────
 
-# Maps common ETFs/mutual funds to their underlying index/category
-FUND_INDEX_MAP: dict[str, str] = {
-    # Total US Stock Market
-    "VTI": "Total US Stock Market",
-    "VTSAX": "Total US Stock Market",
-    "ITOT": "Total US Stock Market",
-    "SPTM": "Total US Stock Market",
-    "SCHB": "Total US Stock Market",
-    "FSKAX": "Total US Stock Market",
-    "FZROX": "Total US Stock Market",
-    # S&P 500
-    "SPY": "S&P 500",
-    "VOO": "S&P 500",
-    "IVV": "S&P 500",
-    "VFIAX": "S&P 500",
-    "FXAIX": "S&P 500",
-    "SWPPX": "S&P 500",
-    "SPLG": "S&P 500",
-    # Total International Stock
-    "VXUS": "Total International Stock",
-    "VTIAX": "Total International Stock",
-    "IXUS": "Total International Stock",
-    "FTIHX": "Total International Stock",
-    "FZILX": "Total International Stock",
-    # International Developed
-    "VEA": "International Developed Markets",
-    "EFA": "International Developed Markets",
-    "IEFA": "International Developed Markets",
-    "SWISX": "International Developed Markets",
-    "SCHF": "International Developed Markets",
-    # Emerging Markets
-    "VWO": "Emerging Markets",
-    "EEM": "Emerging Markets",
-    "IEMG": "Emerging Markets",
-    "SCHE": "Emerging Markets",
-    # Total US Bond Market
-    "BND": "Total US Bond Market",
-    "AGG": "Total US Bond Market",
-    "VBTLX": "Total US Bond Market",
-    "SCHZ": "Total US Bond Market",
-    "FXNAX": "Total US Bond Market",
-    # NASDAQ 100
-    "QQQ": "NASDAQ 100",
-    "QQQM": "NASDAQ 100",
-    # S&P 500 Growth
-    "VOOG": "S&P 500 Growth",
-    "IVW": "S&P 500 Growth",
-    "SPYG": "S&P 500 Growth",
-    # S&P 500 Value
-    "VOOV": "S&P 500 Value",
-    "IVE": "S&P 500 Value",
-    "SPYV": "S&P 500 Value",
-    # Small Cap US
-    "VB": "US Small Cap",
-    "IJR": "US Small Cap",
-    "SCHA": "US Small Cap",
-    "VTWO": "US Small Cap (Russell 2000)",
-    "IWM": "US Small Cap (Russell 2000)",
-    # Mid Cap US
-    "VO": "US Mid Cap",
-    "IJH": "US Mid Cap",
-    "SCHM": "US Mid Cap",
-    # TIPS
-    "TIP": "US TIPS (Inflation-Protected)",
-    "SCHP": "US TIPS (Inflation-Protected)",
-    "VTIP": "US TIPS (Inflation-Protected)",
-    # Real Estate / REITs
-    "VNQ": "US Real Estate (REITs)",
-    "SCHH": "US Real Estate (REITs)",
-    "IYR": "US Real Estate (REITs)",
-    "VGSLX": "US Real Estate (REITs)",
-    # International Bond
-    "BNDX": "International Bond",
-    "IAGG": "International Bond",
-    # Dividend
-    "VYM": "US High Dividend Yield",
-    "SCHD": "US High Dividend Yield",
-    "HDV": "US High Dividend Yield",
-    # Target-Date (Vanguard examples)
-    "VFIFX": "Target Date 2050",
-    "VFFVX": "Target Date 2055",
-    "VTHRX": "Target Date 2030",
-    "VFORX": "Target Date 2040",
-}
-
-
 # Maps high-fee funds/ETFs to low-cost alternatives
 LOW_COST_ALTERNATIVES: dict[str, tuple[str, float]] = {
     # (alternative_ticker, alternative_expense_ratio)
@@ -26,6 +26,7 @@ from app.services.market_data import (
     get_market_data_provider,
 )
 from app.services.market_data.cache import invalidate_quotes
+from app.services.market_data.symbol_index import symbol_index
 from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -256,11 +257,13 @@ async def search_symbols(
     query: str = Query(..., min_length=1, description="Search query (symbol or company name)"),
     provider: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """Search for stocks/securities by name or symbol."""
     # Rate limit check
     await check_rate_limit(str(current_user.id), market_data_limiter, "market_data")
 
+    await symbol_index.ensure_fresh(db)
     try:
         market_data = get_market_data_provider(provider)
         results = await market_data.search_symbol(query)
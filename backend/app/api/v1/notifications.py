@@ -6,10 +6,13 @@ from typing import Any, Dict, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core import cache
+from app.core.database import AsyncSessionLocal
 from app.dependencies import get_current_admin_user, get_current_user, get_db
 from app.models.notification import Notification, NotificationPriority, NotificationType
 from app.models.user import User
@@ -65,6 +68,43 @@ async def get_unread_count(
     return {"count": count}
 
 
+@router.get("/stream")
+async def stream_notifications(
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Server-sent event stream of notification changes for the current user.
+
+    Emits ``unread_count`` (``{"count": n}``) on connect and whenever the count
+    may have changed, and ``notification`` (a NotificationResponse) for each
+    new notification.  Replaces polling ``/unread-count`` and ``/``.  Returns
+    503 when Redis is unavailable so clients fall back to polling.
+    """
+    if cache.redis_client is None:
+        raise HTTPException(status_code=503, detail="Realtime notifications unavailable")
+
+    # Release the auth session's pooled connection — the stream may stay open
+    # for hours.  Count refreshes use short-lived sessions instead.
+    await db.close()
+
+    async def load_unread_count() -> int:
+        async with AsyncSessionLocal() as session:
+            return await NotificationService.get_unread_count(session, current_user)
+
+    events = NotificationService.stream_events(
+        current_user,
+        load_unread_count=load_unread_count,
+        is_disconnected=http_request.is_disconnected,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/digest", response_model=Dict[str, Any])
 async def get_household_digest(
     days: int = Query(default=7, ge=1, le=30),
@@ -1,6 +1,7 @@
 """Private Equity Performance API endpoints."""
 
 import logging
+from collections import defaultdict
 from datetime import date
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
@@ -17,7 +18,7 @@ from app.models.account import Account, AccountType
 from app.models.pe_transaction import PETransaction, PETransactionType
 from app.models.user import User
 from app.services.input_sanitization_service import input_sanitization_service
-from app.services.pe_performance_service import compute_pe_metrics
+from app.services.pe_performance_service import compute_pe_metrics, compute_pe_metrics_many
 from app.services.rate_limit_service import rate_limit_service
 
 logger = logging.getLogger(__name__)
@@ -89,37 +90,41 @@ async def get_pe_portfolio(
     if not accounts:
         return {"accounts": [], "portfolio_metrics": None}
 
+    # One query for every account's transactions instead of one per account
+    txn_result = await db.execute(
+        select(PETransaction)
+        .where(PETransaction.account_id.in_([account.id for account in accounts]))
+        .order_by(PETransaction.date.asc())
+    )
+    txns_by_account: Dict[UUID, List[dict]] = defaultdict(list)
+    for t in txn_result.scalars().all():
+        txns_by_account[t.account_id].append(
+            {"type": t.transaction_type.value, "amount": t.amount, "date": t.date}
+        )
+
+    items = []
     all_txn_dicts = []
     total_nav = Decimal("0")
-    account_summaries = []
-
     for account in accounts:
-        txn_result = await db.execute(
-            select(PETransaction)
-            .where(PETransaction.account_id == account.id)
-            .order_by(PETransaction.date.asc())
-        )
-        transactions = txn_result.scalars().all()
-
-        txn_dicts = [
-            {"type": t.transaction_type.value, "amount": t.amount, "date": t.date}
-            for t in transactions
-        ]
-
+        txn_dicts = txns_by_account.get(account.id, [])
         nav = account.current_balance or Decimal("0")
         total_nav += nav
-
-        metrics = compute_pe_metrics(txn_dicts, nav)
         all_txn_dicts.extend(txn_dicts)
+        items.append((txn_dicts, nav))
 
-        account_summaries.append({
+    # Per-account and portfolio-level metrics, with all IRRs solved together
+    *account_metrics, portfolio_metrics = compute_pe_metrics_many(
+        items + [(all_txn_dicts, total_nav)]
+    )
+
+    account_summaries = [
+        {
             "account_id": str(account.id),
             "name": account.name,
             **metrics,
-        })
-
-    # Portfolio-level metrics
-    portfolio_metrics = compute_pe_metrics(all_txn_dicts, total_nav)
+        }
+        for account, metrics in zip(accounts, account_metrics)
+    ]
 
     return {
         "accounts": account_summaries,
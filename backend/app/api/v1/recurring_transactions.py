@@ -356,6 +356,7 @@ async def apply_label_to_recurring(
             merchant_name=pattern.merchant_name,
             account_id=pattern.account_id,
             label_id=pattern.label_id,
+            merchant_id=pattern.merchant_id,
         )
 
     await db.commit()
@@ -390,6 +391,7 @@ async def preview_label_matches(
         organization_id=current_user.organization_id,
         merchant_name=pattern.merchant_name,
         account_id=pattern.account_id,
+        merchant_id=pattern.merchant_id,
     )
     return PreviewLabelResponse(matching_transactions=count)
 
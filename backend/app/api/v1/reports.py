@@ -4,12 +4,13 @@ import re
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, get_db
 from app.dependencies import (
     get_all_household_accounts,
     get_current_user,
@@ -26,7 +27,7 @@ from app.schemas.tax_harvesting import (
 )
 from app.services.deduplication_service import DeduplicationService
 from app.services.rate_limit_service import rate_limit_service
-from app.services.report_service import ReportService
+from app.services.report_service import ReportService, gzip_chunks
 from app.services.tax_loss_harvesting_service import tax_loss_harvesting_service
 from app.utils.datetime_utils import utc_now
 
@@ -516,10 +517,11 @@ async def export_report_csv(
     http_request: Request,
     user_id: Optional[UUID] = Query(None, description="Filter by user"),
     user_ids: Optional[List[UUID]] = Query(None, description="Multi-user filter"),
+    compress: bool = Query(False, description="Gzip the CSV (.csv.gz download)"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Export a saved report as CSV."""
+    """Export a saved report as CSV, streamed as rows are read."""
     await rate_limit_service.check_rate_limit(
         request=http_request,
         max_requests=10,
@@ -554,14 +556,16 @@ async def export_report_csv(
 
     account_ids = [acc.id for acc in accounts]
 
-    # Generate CSV
+    # Stream CSV.  The body is sent after this handler returns, so rows are
+    # read in the stream's own session rather than the request-scoped one.
     try:
-        csv_data = await ReportService.generate_export_csv(
+        csv_chunks = await ReportService.open_export_stream(
             db,
             current_user.organization_id,
             template_id,
             user_id,
             account_ids,
+            session_factory=AsyncSessionLocal,
         )
     except ValueError:
         raise HTTPException(status_code=404, detail="Report template not found")
@@ -571,8 +575,17 @@ async def export_report_csv(
     safe_name = _SAFE_FILENAME_RE.sub("", raw_name)[:80] or "report"
     filename = f"{safe_name}_report.csv"
 
-    return Response(
-        content=csv_data,
+    # Release the request session's pooled connection while the export streams
+    await db.close()
+
+    if compress:
+        return StreamingResponse(
+            gzip_chunks(csv_chunks),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.gz"'},
+        )
+    return StreamingResponse(
+        csv_chunks,
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -122,6 +122,10 @@ class RothConversionResponse(BaseModel):
     estimated_tax_savings: float
     summary: str
     has_retirement_accounts: bool
+    strategy: str = "bracket_fill"
+    lifetime_tax: Optional[float] = None
+    no_conversion_lifetime_tax: Optional[float] = None
+    schedules_evaluated: int = 0
     data_source: Optional[dict] = None  # DataSourceMeta — static/cached/live indicator
 
 
@@ -289,6 +293,12 @@ async def get_roth_conversion(
     years_to_project: int = Query(20, ge=1, le=40),
     respect_irmaa: bool = Query(True, description="Cap conversions to avoid IRMAA tier crossings."),
     assumed_future_rate: Optional[float] = Query(None, ge=0.0, le=1.0, description="Override assumed future marginal tax rate for savings estimate (0.0–1.0). Leave blank to use current-year rate."),
+    strategy: str = Query(
+        "bracket_fill",
+        pattern="^(bracket_fill|lifetime_tax)$",
+        description="'bracket_fill' (fill the current bracket each year) or 'lifetime_tax' "
+        "(search for the schedule with the lowest lifetime tax).",
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> RothConversionResponse:
@@ -296,8 +306,9 @@ async def get_roth_conversion(
     Calculate the optimal annual Roth conversion amount.
 
     Balances are fetched automatically from the user's connected accounts.
-    The optimizer finds the conversion amount that fills the current tax
-    bracket without crossing into the next bracket or an IRMAA tier.
+    By default the optimizer finds the conversion amount that fills the
+    current tax bracket without crossing into the next bracket or an IRMAA
+    tier; ``strategy=lifetime_tax`` searches per-year schedules instead.
     """
     await rate_limit_service.check_rate_limit(
         request=http_request, max_requests=10, window_seconds=60, identifier=str(current_user.id)
@@ -327,7 +338,10 @@ async def get_roth_conversion(
     )
 
     svc = RothConversionService()
-    result = svc.optimize(inp)
+    if strategy == "lifetime_tax":
+        result = svc.optimize_lifetime_tax(inp)
+    else:
+        result = svc.optimize(inp)
 
     return RothConversionResponse(
         years=[RothConversionYearResponse(**vars(y)) for y in result.years],
@@ -340,6 +354,10 @@ async def get_roth_conversion(
         estimated_tax_savings=result.estimated_tax_savings,
         summary=result.summary,
         has_retirement_accounts=has_retirement,
+        strategy=result.strategy,
+        lifetime_tax=result.lifetime_tax,
+        no_conversion_lifetime_tax=result.no_conversion_lifetime_tax,
+        schedules_evaluated=result.schedules_evaluated,
     )
 
 
@@ -91,4 +91,58 @@ async def run_all_scenarios(
         db=db,
         organization_id=current_user.organization_id,
         user_id=user_id,
-    )
\ No newline at end of file
+    )
+
+@router.get(
+    "/replay/scenarios",
+    summary="List historical replay windows",
+    description="Returns the historical windows available to /replay. No DB required.",
+    response_model=List[Any],
+)
+async def list_replay_scenarios(
+    current_user: User = Depends(get_current_user),
+):
+    """Returns replay scenario keys, labels and date ranges."""
+    return [
+        {
+            "scenario_key": key,
+            "label": window["label"],
+            "start_date": window["start"].isoformat(),
+            "end_date": window["end"].isoformat(),
+        }
+        for key, window in STRESS_TEST.REPLAY_WINDOWS.items()
+    ]
+
+
+@router.get(
+    "/replay",
+    summary="Replay a historical crash through current holdings",
+    description=(
+        "Applies the actual daily price path of a historical window (2008, 2020, "
+        "2022 rate shock) to each holding, via its own symbol or an asset-class "
+        "proxy. Returns peak drawdown, recovery time and worst-day loss for the "
+        "portfolio and for each account."
+    ),
+    response_model=Dict[str, Any],
+)
+async def run_historical_replay(
+    http_request: Request,
+    scenario_key: str = Query(..., description="Replay key (e.g. gfc_2008, covid_2020)"),
+    user_id: Optional[UUID] = Query(None, description="Filter to a specific user (household member)"),
+    user_ids: Optional[List[UUID]] = Query(None, description="Multi-user filter"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Replays a historical window's daily returns against current holdings."""
+    await rate_limit_service.check_rate_limit(
+        request=http_request, max_requests=10, window_seconds=60, identifier=str(current_user.id)
+    )
+    try:
+        return await StressTestService.run_historical_replay(
+            db=db,
+            organization_id=current_user.organization_id,
+            scenario_key=scenario_key,
+            user_id=user_id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
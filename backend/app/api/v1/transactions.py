@@ -8,7 +8,7 @@ import re
 from datetime import date, datetime
 from decimal import Decimal
 from io import StringIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID, uuid4
 
 logger = logging.getLogger(__name__)
@@ -21,8 +21,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.core.cache import delete_pattern as cache_delete_pattern
-from app.core.cache import get as cache_get
-from app.core.cache import setex as cache_setex
+from app.core.cache import get_raw as cache_get_raw
+from app.core.cache import setex_raw as cache_setex_raw
 from app.core.database import get_db
 
 
@@ -39,6 +39,7 @@ from app.dependencies import (
     verify_household_member,
 )
 from app.models.account import Account
+from app.models.merchant import Merchant
 from app.models.transaction import Category, Label, Transaction, TransactionLabel
 from app.models.user import User
 from app.schemas.transaction import (
@@ -49,10 +50,23 @@ from app.schemas.transaction import (
     TransactionUpdate,
 )
 from app.services.input_sanitization_service import input_sanitization_service
+from app.services.merchant_service import assign_merchants_nonfatal, merchant_key
 from app.services.nlp_search_service import parse_natural_query
 from app.services.rate_limit_service import rate_limit_service
+from app.services.transaction_projection_service import (
+    project_transaction,
+    transaction_projection,
+)
+from app.services.transaction_search_service import search_rank
+from app.services.transaction_totals_service import (
+    TransactionFilters,
+    TransactionTotal,
+    count_transactions,
+)
 from app.utils.csv_sanitize import sanitize_csv_row
 from app.utils.datetime_utils import utc_now
+from app.utils.fast_json import FastJSONResponse
+from app.utils.fast_json import dumps as fast_json_dumps
 
 router = APIRouter()
 
@@ -109,6 +123,43 @@ def decode_cursor(cursor: str) -> tuple:
         raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
+def _transaction_detail(txn: Transaction) -> TransactionDetail:
+    """Response model for a transaction loaded with account, category and labels."""
+    category_summary = None
+    if txn.category:
+        category_summary = CategorySummary(
+            id=txn.category.id,
+            name=txn.category.name,
+            color=txn.category.color,
+            parent_id=txn.category.parent_category_id,
+            parent_name=txn.category.parent.name if txn.category.parent else None,
+        )
+
+    return TransactionDetail(
+        id=txn.id,
+        organization_id=txn.organization_id,
+        account_id=txn.account_id,
+        external_transaction_id=txn.external_transaction_id,
+        date=txn.date,
+        amount=txn.amount,
+        merchant_name=txn.merchant_name,
+        description=txn.description,
+        category_primary=txn.category_primary,
+        category_detailed=txn.category_detailed,
+        is_pending=txn.is_pending,
+        is_transfer=txn.is_transfer,
+        notes=txn.notes,
+        flagged_for_review=txn.flagged_for_review,
+        created_at=txn.created_at,
+        updated_at=txn.updated_at,
+        account_name=txn.account.name if txn.account else None,
+        account_mask=txn.account.mask if txn.account else None,
+        category=category_summary,
+        # Extract labels from the many-to-many relationship
+        labels=[tl.label for tl in txn.labels if tl.label],
+    )
+
+
 @router.post("/", response_model=TransactionDetail, status_code=201)
 async def create_transaction(
     transaction_data: ManualTransactionCreate,
@@ -156,6 +207,8 @@ async def create_transaction(
         deduplication_hash=str(uuid4()),
     )
     db.add(txn)
+    await db.flush()
+    await assign_merchants_nonfatal(db, current_user.organization_id, [txn])
     await db.commit()
     await db.refresh(txn)
     await _invalidate_transaction_caches(str(current_user.organization_id))
@@ -265,42 +318,7 @@ async def list_flagged_transactions(
         total_result = await db.execute(count_query)
         total = total_result.scalar()
 
-    transaction_details = []
-    for txn in transactions:
-        transaction_labels = [tl.label for tl in txn.labels if tl.label]
-        category_summary = None
-        if txn.category:
-            category_summary = CategorySummary(
-                id=txn.category.id,
-                name=txn.category.name,
-                color=txn.category.color,
-                parent_id=txn.category.parent_category_id,
-                parent_name=txn.category.parent.name if txn.category.parent else None,
-            )
-
-        detail = TransactionDetail(
-            id=txn.id,
-            organization_id=txn.organization_id,
-            account_id=txn.account_id,
-            external_transaction_id=txn.external_transaction_id,
-            date=txn.date,
-            amount=txn.amount,
-            merchant_name=txn.merchant_name,
-            description=txn.description,
-            category_primary=txn.category_primary,
-            category_detailed=txn.category_detailed,
-            is_pending=txn.is_pending,
-            is_transfer=txn.is_transfer,
-            notes=txn.notes,
-            flagged_for_review=txn.flagged_for_review,
-            created_at=txn.created_at,
-            updated_at=txn.updated_at,
-            account_name=txn.account.name if txn.account else None,
-            account_mask=txn.account.mask if txn.account else None,
-            category=category_summary,
-            labels=transaction_labels,
-        )
-        transaction_details.append(detail)
+    transaction_details = [_transaction_detail(txn) for txn in transactions]
 
     return TransactionListResponse(
         transactions=transaction_details,
@@ -330,6 +348,11 @@ async def list_transactions(
     is_income: Optional[bool] = Query(
         None, description="True = income only, False = expenses only"
     ),
+    count: Literal["estimate", "exact"] = Query(
+        "exact",
+        description="How to compute total: 'exact' counts every match, 'estimate' "
+        "caps filtered counts (see total_is_estimate) for clients that render it",
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -339,12 +362,12 @@ async def list_transactions(
     if not cursor and not search and not flagged:
         cache_key = (
             f"transactions:{current_user.organization_id}"
-            f":{user_id}:{account_id}:{start_date}:{end_date}:{page_size}"
+            f":{user_id}:{account_id}:{start_date}:{end_date}:{page_size}:{count}"
         )
         try:
-            cached = await cache_get(cache_key)
+            cached = await cache_get_raw(cache_key)
             if cached is not None:
-                return cached
+                return FastJSONResponse(cached.encode())
         except Exception:
             logger.debug("Transaction list cache read failed for key %s", cache_key, exc_info=True)
 
@@ -380,56 +403,21 @@ async def list_transactions(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
 
-    # Build base query - only include transactions from active accounts
-    query = (
-        select(Transaction)
-        .join(Account)
-        .options(joinedload(Transaction.account))
-        .options(joinedload(Transaction.category).joinedload(Category.parent))
-        .options(joinedload(Transaction.labels).joinedload(TransactionLabel.label))
-        .where(
-            Transaction.organization_id == current_user.organization_id, Account.is_active.is_(True)
-        )
+    filters = TransactionFilters(
+        organization_id=current_user.organization_id,
+        account_id=account_id,
+        user_id=user_id,
+        start_date=start_date_obj,
+        end_date=end_date_obj,
+        search=search or None,
+        flagged=flagged,
+        min_amount=Decimal(str(min_amount)) if min_amount is not None else None,
+        max_amount=Decimal(str(max_amount)) if max_amount is not None else None,
+        is_income=is_income,
     )
 
-    # Apply filters
-    if account_id:
-        query = query.where(Transaction.account_id == account_id)
-
-    if user_id:
-        query = query.where(Account.user_id == user_id)
-
-    if start_date_obj:
-        query = query.where(Transaction.date >= start_date_obj)
-
-    if end_date_obj:
-        query = query.where(Transaction.date <= end_date_obj)
-
-    if search:
-        # Escape ILIKE wildcards in user input to prevent pattern injection
-        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        search_pattern = f"%{escaped}%"
-        query = query.where(
-            Transaction.merchant_name.ilike(search_pattern)
-            | Transaction.description.ilike(search_pattern)
-            | Transaction.notes.ilike(search_pattern)
-        )
-
-    if flagged is not None:
-        query = query.where(Transaction.flagged_for_review.is_(flagged))
-
-    if min_amount is not None:
-        query = query.where(func.abs(Transaction.amount) >= Decimal(str(min_amount)))
-
-    if max_amount is not None:
-        query = query.where(func.abs(Transaction.amount) <= Decimal(str(max_amount)))
-
-    if is_income is True:
-        # Income = positive amount (deposits)
-        query = query.where(Transaction.amount > 0)
-    elif is_income is False:
-        # Expenses = negative amount
-        query = query.where(Transaction.amount < 0)
+    # Response columns only - only include transactions from active accounts
+    query = transaction_projection(db, *filters.conditions(db))
 
     # Apply cursor pagination
     if cursor:
@@ -449,112 +437,45 @@ async def list_transactions(
     query = query.limit(page_size + 1)
 
     result = await db.execute(query)
-    transactions = result.unique().scalars().all()
+    rows = result.all()
 
     # Check if there are more results
-    has_more = len(transactions) > page_size
+    has_more = len(rows) > page_size
     if has_more:
-        transactions = transactions[:page_size]
+        rows = rows[:page_size]
 
     # Generate next cursor from last transaction
     next_cursor = None
-    if has_more and transactions:
-        last_txn = transactions[-1]
-        next_cursor = encode_cursor(last_txn.date, last_txn.created_at, last_txn.id)
+    if has_more and rows:
+        last_row = rows[-1]
+        next_cursor = encode_cursor(last_row.date, last_row.created_at, last_row.id)
 
     # Get total count (only when no cursor, for first page)
-    total = 0
+    total = TransactionTotal(0)
     if not cursor:
-        # Build count query with same filters - only count transactions from active accounts
-        count_query = (
-            select(func.count())
-            .select_from(Transaction)
-            .join(Account)
-            .where(
-                Transaction.organization_id == current_user.organization_id,
-                Account.is_active.is_(True),
-            )
-        )
-        if account_id:
-            count_query = count_query.where(Transaction.account_id == account_id)
-        if user_id:
-            count_query = count_query.where(Account.user_id == user_id)
-        if start_date_obj:
-            count_query = count_query.where(Transaction.date >= start_date_obj)
-        if end_date_obj:
-            count_query = count_query.where(Transaction.date <= end_date_obj)
-        if search:
-            escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-            search_pattern = f"%{escaped}%"
-            count_query = count_query.where(
-                Transaction.merchant_name.ilike(search_pattern)
-                | Transaction.description.ilike(search_pattern)
-                | Transaction.notes.ilike(search_pattern)
-            )
-        if flagged is not None:
-            count_query = count_query.where(Transaction.flagged_for_review.is_(flagged))
-
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-    # Transform to response format
-    transaction_details = []
-    for txn in transactions:
-        # Extract labels from the many-to-many relationship
-        transaction_labels = [tl.label for tl in txn.labels if tl.label]
-
-        # Extract category information
-        category_summary = None
-        if txn.category:
-            category_summary = CategorySummary(
-                id=txn.category.id,
-                name=txn.category.name,
-                color=txn.category.color,
-                parent_id=txn.category.parent_category_id,
-                parent_name=txn.category.parent.name if txn.category.parent else None,
-            )
-
-        detail = TransactionDetail(
-            id=txn.id,
-            organization_id=txn.organization_id,
-            account_id=txn.account_id,
-            external_transaction_id=txn.external_transaction_id,
-            date=txn.date,
-            amount=txn.amount,
-            merchant_name=txn.merchant_name,
-            description=txn.description,
-            category_primary=txn.category_primary,
-            category_detailed=txn.category_detailed,
-            is_pending=txn.is_pending,
-            is_transfer=txn.is_transfer,
-            notes=txn.notes,
-            flagged_for_review=txn.flagged_for_review,
-            created_at=txn.created_at,
-            updated_at=txn.updated_at,
-            account_name=txn.account.name if txn.account else None,
-            account_mask=txn.account.mask if txn.account else None,
-            category=category_summary,
-            labels=transaction_labels,
-        )
-        transaction_details.append(detail)
-
-    response = TransactionListResponse(
-        transactions=transaction_details,
-        total=total,
-        page=1,  # Always return 1 for cursor-based pagination
-        page_size=page_size,
-        has_more=has_more,
-        next_cursor=next_cursor,
+        total = await count_transactions(db, filters, exact=count == "exact")
+
+    # Encode the TransactionListResponse shape directly (trusted column data)
+    body = fast_json_dumps(
+        {
+            "transactions": [project_transaction(row) for row in rows],
+            "total": total.total,
+            "total_is_estimate": total.is_estimate,
+            "page": 1,  # Always return 1 for cursor-based pagination
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
     )
 
     # Cache first-page unfiltered results for 5 minutes
     if cache_key:
         try:
-            await cache_setex(cache_key, 300, response.model_dump(mode="json"))
+            await cache_setex_raw(cache_key, 300, body)
         except Exception:
             pass  # fail-open on Redis errors
 
-    return response
+    return FastJSONResponse(body)
 
 
 @router.get("/merchants", response_model=Dict[str, Any])
@@ -564,24 +485,100 @@ async def get_merchant_names(
     search: Optional[str] = Query(None, description="Filter merchants by prefix"),
     limit: int = Query(500, ge=1, le=1000, description="Max merchants to return"),
 ):
-    """Return distinct merchant names for the org with optional prefix search."""
-    conditions = [
-        Transaction.organization_id == current_user.organization_id,
-        Transaction.merchant_name.isnot(None),
-        Transaction.merchant_name != "",
-    ]
+    """Return the org's merchant names, optionally filtered by prefix.
+
+    Served from the merchant dimension (one row per merchant, not per
+    transaction); with a search, the most used merchants come first.
+    """
+    query = select(Merchant.name).where(
+        Merchant.organization_id == current_user.organization_id,
+        Merchant.transaction_count > 0,
+    )
     if search:
-        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        conditions.append(Transaction.merchant_name.ilike(f"{escaped}%"))
+        key = merchant_key(search)
+        if not key:
+            return {"merchants": []}
+        # Keys hold only letters, digits, "&", "'" and spaces: no LIKE wildcards
+        query = query.where(Merchant.normalized_name.like(f"{key}%")).order_by(
+            Merchant.transaction_count.desc(), Merchant.name
+        )
+    else:
+        query = query.order_by(Merchant.name)
+
+    result = await db.execute(query.limit(limit))
+    return {"merchants": [row[0] for row in result.all()]}
+
+
+@router.get("/search", response_model=TransactionListResponse)
+async def search_transactions(
+    q: str = Query(..., min_length=1, max_length=500, description="Free-text search query"),
+    page: int = Query(1, ge=1, le=1000),
+    page_size: int = Query(50, ge=1, le=200),
+    user_id: Optional[UUID] = Query(
+        None, description="Filter by user. None = combined household view"
+    ),
+    count: Literal["estimate", "exact"] = Query(
+        "exact", description="'estimate' caps total instead of counting every match"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Ranked transaction search from a natural-language query.
+
+    The query is parsed like POST /search/natural ("coffee last month over $5"):
+    date, amount and income/expense phrases become filters and the remaining
+    keywords are matched against merchant name, description and notes through
+    the full-text index, best matches first (merchant-name hits outrank
+    description and notes), then newest first.
+    """
+    if user_id:
+        await verify_household_member(db, user_id, current_user.organization_id)
+
+    raw = input_sanitization_service.sanitize_html(q).strip()
+    if not raw:
+        raise HTTPException(status_code=400, detail="Query must not be empty")
+    parsed = parse_natural_query(raw)
+
+    filters = TransactionFilters(
+        organization_id=current_user.organization_id,
+        user_id=user_id,
+        start_date=parsed.start_date,
+        end_date=parsed.end_date,
+        search=parsed.search or None,
+        min_amount=Decimal(str(parsed.min_amount)) if parsed.min_amount is not None else None,
+        max_amount=Decimal(str(parsed.max_amount)) if parsed.max_amount is not None else None,
+        is_income=parsed.is_income,
+    )
+
+    order_by = [Transaction.date.desc(), Transaction.created_at.desc(), Transaction.id.desc()]
+    rank = search_rank(db, parsed.search) if parsed.search else None
+    if rank is not None:
+        order_by.insert(0, rank.desc())
 
     result = await db.execute(
-        select(Transaction.merchant_name)
-        .where(*conditions)
-        .distinct()
-        .order_by(Transaction.merchant_name)
-        .limit(limit)
+        transaction_projection(db, *filters.conditions(db))
+        .order_by(*order_by)
+        .offset((page - 1) * page_size)
+        .limit(page_size + 1)
+    )
+    rows = result.all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    total = await count_transactions(db, filters, exact=count == "exact")
+
+    return FastJSONResponse(
+        {
+            "transactions": [project_transaction(row) for row in rows],
+            "total": total.total,
+            "total_is_estimate": total.is_estimate,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": None,
+        }
     )
-    return {"merchants": [row[0] for row in result.all()]}
 
 
 @router.get("/{transaction_id}", response_model=TransactionDetail)
@@ -667,6 +664,7 @@ async def update_transaction(
     # Update fields (sanitize text inputs to prevent XSS)
     if update_data.merchant_name is not None:
         txn.merchant_name = input_sanitization_service.sanitize_html(update_data.merchant_name)
+        await assign_merchants_nonfatal(db, current_user.organization_id, [txn])
     if update_data.description is not None:
         txn.description = input_sanitization_service.sanitize_html(update_data.description)
     if update_data.category_primary is not None:
@@ -21,6 +21,13 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 50
     DB_MAX_OVERFLOW: int = 30
     DB_STATEMENT_TIMEOUT_MS: int = 45000  # 45 second query timeout
+    # Extra pooled sessions one request may borrow for parallel reads
+    DB_FANOUT_MAX_SESSIONS: int = 4
+    # Monthly range partitioning for transactions, snapshots, audit_logs and
+    # notifications.  Read by the r81 migration at upgrade time and by the
+    # partition-maintenance / retention tasks.  PostgreSQL only.
+    DB_PARTITIONING_ENABLED: bool = False
+    DB_PARTITION_PREMAKE_MONTHS: int = 3  # Future monthly partitions kept ready
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -70,8 +77,13 @@ class Settings(BaseSettings):
     FINNHUB_API_KEY: Optional[str] = None  # Free: 60 calls/min
     COINGECKO_API_KEY: Optional[str] = None  # Optional: 500 calls/min (free key tier)
     POLYGON_API_KEY: Optional[str] = None  # Polygon.io: security type lookup (CS/ETF/FUND/BOND)
+    # Local symbol listing (CSV or pipe-delimited: symbol, name, type, exchange) for typeahead
+    SYMBOL_LISTING_PATH: Optional[str] = None
     # How long before holdings prices are considered stale (login + daily task throttle)
     PRICE_REFRESH_COOLDOWN_HOURS: int = 6
+    # Directory for cached historical price series used by stress-test replays
+    # (memory only if unset)
+    PRICE_HISTORY_CACHE_DIR: Optional[str] = None
 
     # ── Property Auto-Valuation ──────────────────────────────────────────────
     # Set one or more provider keys to enable the "Refresh Valuation" button.
@@ -165,6 +177,20 @@ class Settings(BaseSettings):
     SMTP_FROM_NAME: str = "Nest Egg"
     SMTP_USE_TLS: bool = True  # Use STARTTLS (port 587). Set False for SSL on port 465.
     APP_BASE_URL: str = "http://localhost:5173"  # Used to build clickable links in emails
+    # Bulk sends (weekly recaps, bill reminders, scheduled reports) reuse a pool
+    # of authenticated SMTP connections and are paced to the provider's limit.
+    EMAIL_BULK_POOL_SIZE: int = 4  # Concurrent SMTP connections
+    EMAIL_BULK_MAX_PER_SECOND: float = 10.0  # Across the pool; 0 = unlimited
+    EMAIL_BULK_MAX_ATTEMPTS: int = 3  # Per recipient, for transient failures
+    EMAIL_BULK_MESSAGES_PER_CONNECTION: int = 100  # Recycle connections after this many
+
+    # Transaction list totals (see app/services/transaction_totals_service.py)
+    TRANSACTION_COUNT_ESTIMATE_CAP: int = 10_000  # Filtered counts stop here in estimate mode
+    TRANSACTION_TOTALS_CACHE_TTL_SECONDS: int = 300  # Cached totals, also versioned per org
+
+    # Realtime notifications (GET /notifications/stream, Redis pub/sub)
+    NOTIFICATION_UNREAD_COUNT_TTL_SECONDS: int = 300  # Cached unread badge count
+    NOTIFICATION_STREAM_KEEPALIVE_SECONDS: int = 15  # SSE comment ping interval
 
     # Prometheus Metrics
     METRICS_ENABLED: bool = True
@@ -173,6 +199,9 @@ class Settings(BaseSettings):
     METRICS_USERNAME: str = "admin"  # Basic auth username — override in prod
     METRICS_PASSWORD: str = "metrics_admin"  # Basic auth password — CHANGE IN PROD
     METRICS_ALLOWED_HOSTS: list[str] = []  # IP/DNS allowlist (empty = allow all authenticated)
+    # Per-request repeated-statement (N+1) detection — see app/core/query_metrics.py
+    DB_N_PLUS_ONE_THRESHOLD: int = 20  # Same normalized statement >N times per request (0 = off)
+    DB_N_PLUS_ONE_RAISE: bool = False  # Raise instead of logging (CI / test environments)
 
     # Compliance
     TERMS_VERSION: str = "2026-02"  # Bump when Terms of Service or Privacy Policy changes
@@ -187,6 +216,14 @@ class Settings(BaseSettings):
     # Safety: dry-run logs what would be deleted without actually deleting.
     # Set to False only after verifying the retention window is correct.
     DATA_RETENTION_DRY_RUN: bool = True
+    # With DB_PARTITIONING_ENABLED, whole months older than the retention
+    # window are retired at once: "drop" deletes them, "detach" keeps each
+    # month as a standalone table for archival.
+    DATA_RETENTION_PARTITION_ACTION: str = "drop"
+    # Live purges (retention and GDPR erasure) delete in committed batches of
+    # this many rows, capped at this many rows/second per job (0 = unthrottled).
+    DATA_PURGE_BATCH_SIZE: int = 1000
+    DATA_PURGE_MAX_ROWS_PER_SECOND: int = 5000
 
     # ── Identity Provider Chain ───────────────────────────────────────────────
     # Ordered comma-separated list of active providers.
@@ -1885,6 +1885,37 @@ class STRESS_TEST:
     }
     BOND_PRICE_SENSITIVITY_PER_YEAR_PER_100BPS = Decimal("-0.01")
 
+    # Historical replays: daily price paths applied to each holding.  Windows
+    # start at the pre-crisis market peak and run long enough to observe the
+    # recovery (or its absence).
+    REPLAY_WINDOWS: dict = {
+        "gfc_2008": {
+            "label": "Financial Crisis replay (Oct 2007 – Mar 2013)",
+            "start": datetime.date(2007, 10, 9),
+            "end": datetime.date(2013, 3, 28),
+        },
+        "covid_2020": {
+            "label": "COVID Crash replay (Feb – Dec 2020)",
+            "start": datetime.date(2020, 2, 19),
+            "end": datetime.date(2020, 12, 31),
+        },
+        "rate_shock_2022": {
+            "label": "2022 Rate Shock replay (Jan 2022 – Jun 2024)",
+            "start": datetime.date(2022, 1, 3),
+            "end": datetime.date(2024, 6, 28),
+        },
+    }
+    # Price series used for holdings whose own symbol has no history covering
+    # the window (manual holdings, funds launched later, balance-only accounts)
+    REPLAY_PROXIES: dict = {
+        "equity": "SPY",
+        "international": "EFA",
+        "bond": "AGG",
+        "crypto": "BTC-USD",
+    }
+    # A series must start within this many days of the window start to be used
+    REPLAY_MAX_START_GAP_DAYS = 7
+
 
 # =========================================================================
 # CASH FLOW TIMING
@@ -44,6 +44,32 @@ async def setex(key: str, ttl: int, value: Any) -> bool:
         return False
 
 
+async def get_raw(key: str) -> Optional[str]:
+    """Get a pre-encoded value (see ``setex_raw``) without decoding it."""
+    if not redis_client:
+        return None
+
+    try:
+        return await redis_client.get(key)
+    except Exception as e:
+        logging.error(f"Cache get error: {e}")
+
+    return None
+
+
+async def setex_raw(key: str, ttl: int, value: bytes | str) -> bool:
+    """Store an already-encoded JSON document with expiration."""
+    if not redis_client:
+        return False
+
+    try:
+        await redis_client.setex(key, ttl, value)
+        return True
+    except Exception as e:
+        logging.error(f"Cache set error: {e}")
+        return False
+
+
 async def delete(key: str) -> bool:
     """Delete a specific cache key."""
     if not redis_client:
@@ -90,3 +116,39 @@ async def delete_pattern(pattern: str) -> int:
     except Exception as e:
         logging.error(f"Cache delete_pattern error: {e}")
         return 0
+
+
+# Adjust a counter only while it is cached; never recreate an expired key
+# (which would lose its TTL and start from the wrong base).
+_INCRBY_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
+
+async def incrby_if_exists(key: str, amount: int) -> Optional[int]:
+    """Atomically add *amount* to an existing integer key.
+
+    Returns the new value, or None if the key is absent or Redis is unavailable.
+    """
+    if not redis_client:
+        return None
+    try:
+        result = await redis_client.eval(_INCRBY_IF_EXISTS, 1, key, amount)
+        return int(result) if result is not None else None
+    except Exception as e:
+        logging.error(f"Cache incrby error: {e}")
+        return None
+
+
+async def publish(channel: str, message: Any) -> int:
+    """Publish a JSON message on a pub/sub channel. Returns the receiver count."""
+    if not redis_client:
+        return 0
+    try:
+        return await redis_client.publish(channel, json.dumps(message))
+    except Exception as e:
+        logging.error(f"Cache publish error: {e}")
+        return 0
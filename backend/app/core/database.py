@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import Session, declarative_base
 
 from app.config import settings
+from app.core.query_metrics import install_query_instrumentation
 
 _logger = logging.getLogger(__name__)
 
@@ -33,6 +34,9 @@ engine = create_async_engine(
     },
 )
 
+if settings.METRICS_ENABLED:
+    install_query_instrumentation(engine)
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -15,6 +15,7 @@ Dev access: curl -u admin:metrics_admin http://localhost:9090/metrics
 Prod: override METRICS_USERNAME and METRICS_PASSWORD in environment.
 """
 
+import asyncio
 import base64
 import hmac
 import ipaddress
@@ -22,7 +23,14 @@ import logging
 import socket
 
 from fastapi import FastAPI
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
 from prometheus_fastapi_instrumentator import Instrumentator, metrics
 from starlette.applications import Starlette
 from starlette.requests import Request
@@ -69,19 +77,9 @@ db_connection_pool_available = Gauge(
     "Available connections in database pool",
 )
 
-# Celery metrics
-celery_task_duration_seconds = Histogram(
-    "celery_task_duration_seconds",
-    "Celery task duration in seconds",
-    ["task_name", "status"],
-    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
-)
-
-celery_tasks_total = Counter(
-    "celery_tasks_total",
-    "Total Celery tasks executed",
-    ["task_name", "status"],
-)
+# Celery metrics (celery_task_duration_seconds, celery_tasks_total, queue
+# length, beat lag) are recorded by worker processes into Redis and exported
+# here by CeleryMetricsCollector — see app/workers/task_metrics.py.
 
 # Rate limiting metrics
 rate_limit_hits_total = Counter(
@@ -184,6 +182,9 @@ def setup_metrics(app: FastAPI) -> None:
     # Instrument only — do NOT expose /metrics on the main port
     instrumentator.instrument(app)
 
+    # Per-request SQL statement counting / N+1 detection
+    app.add_middleware(MetricsMiddleware)
+
 
 def create_metrics_app() -> ASGIApp:
     """
@@ -248,24 +249,56 @@ def create_metrics_app() -> ASGIApp:
                 headers={"WWW-Authenticate": 'Basic realm="metrics"'},
             )
 
-        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+        # Collectors read Redis synchronously — keep that off the API event loop
+        content = await asyncio.to_thread(generate_latest)
+        return Response(content=content, media_type=CONTENT_TYPE_LATEST)
 
+    _register_celery_collector()
     return Starlette(routes=[Route("/metrics", metrics_endpoint)])
 
 
+_celery_collector_registered = False
+
+
+def _register_celery_collector() -> None:
+    """Export worker-side Celery metrics on this (API) process's registry, once."""
+    global _celery_collector_registered
+    if _celery_collector_registered:
+        return
+    from app.workers.task_metrics import CeleryMetricsCollector
+
+    REGISTRY.register(CeleryMetricsCollector())
+    _celery_collector_registered = True
+
+
 # Middleware to track custom metrics
 class MetricsMiddleware:
-    """Middleware to collect custom metrics for each request."""
+    """Middleware to collect custom metrics for each request.
+
+    Counts the SQL statements each request runs and flags repeated
+    statement fingerprints (N+1 loops) — see ``app.core.query_metrics``.
+    """
 
     def __init__(self, app: ASGIApp):
         self.app = app
 
     async def __call__(self, scope, receive, send):
-        if scope["type"] != "http":
+        if scope["type"] != "http" or _is_event_stream(scope):
+            # Long-lived SSE connections legitimately repeat the same query
             await self.app(scope, receive, send)
             return
 
-        await self.app(scope, receive, send)
+        from app.core.query_metrics import track_queries
+
+        with track_queries(f"{scope.get('method', '')} {scope.get('path', '')}"):
+            await self.app(scope, receive, send)
+
+
+def _is_event_stream(scope) -> bool:
+    for name, value in scope.get("headers") or ():
+        if name == b"accept":
+            return b"text/event-stream" in value
+    return False
 
 
 def track_rate_limit_hit(endpoint: str, ip: str = "") -> None:
@@ -279,11 +312,10 @@ def track_rate_limit_request(endpoint: str) -> None:
 
 
 def track_celery_task(task_name: str, status: str, duration_seconds: float) -> None:
-    """Track Celery task execution."""
-    celery_task_duration_seconds.labels(task_name=task_name, status=status).observe(
-        duration_seconds
-    )
-    celery_tasks_total.labels(task_name=task_name, status=status).inc()
+    """Track Celery task execution (recorded automatically by worker signals)."""
+    from app.workers.task_metrics import record_task_run
+
+    record_task_run(task_name, status, duration_seconds)
 
 
 def track_plaid_sync(status: str) -> None:
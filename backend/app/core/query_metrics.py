@@ -0,0 +1,194 @@
+"""SQL statement timing, pool gauges and per-request N+1 detection.
+
+``install_query_instrumentation(engine)`` hooks SQLAlchemy's
+``before_cursor_execute`` / ``after_cursor_execute`` events so every
+statement is timed into ``db_query_duration_seconds``.  The histogram label
+is a short, bounded ``query_type`` ("select transactions", "update
+notifications") so Prometheus cardinality stays flat; the full normalized
+fingerprint (literals, bind markers and IN-lists collapsed) is kept only
+in-process for repeat detection.
+
+``track_queries()`` opens a statement counter in a context variable.
+``MetricsMiddleware`` wraps every HTTP request in one; when a request runs
+the same fingerprint more than DB_N_PLUS_ONE_THRESHOLD times it logs a
+warning naming the endpoint and the statement — the signature of an N+1
+loop — or raises ``RepeatedQueryError`` when DB_N_PLUS_ONE_RAISE is set (or
+``raise_on_repeat=True`` in a test).
+
+Pool gauges are refreshed from ``engine.pool`` on every checkout / checkin.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.core.metrics import (
+    db_connection_pool_available,
+    db_connection_pool_size,
+    db_query_duration_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+_START_TIMES_KEY = "query_metrics_start"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_BIND_MARKER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_VERB_TABLE = re.compile(r"^\s*(update|insert\s+into|delete\s+from)\s+\"?(\w+)", re.IGNORECASE)
+_FROM_TABLE = re.compile(r"\bfrom\s+\"?(\w+)", re.IGNORECASE)
+
+
+class RepeatedQueryError(AssertionError):
+    """A single unit of work ran the same statement more than the allowed number of times."""
+
+
+class QueryStats:
+    """Statements executed inside one ``track_queries()`` block."""
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+        self.total = 0
+        self.duration_seconds = 0.0
+
+    def record(self, fingerprint_: str, elapsed: float) -> None:
+        self.counts[fingerprint_] += 1
+        self.total += 1
+        self.duration_seconds += elapsed
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Fingerprints executed more than *threshold* times, most frequent first."""
+        return [(fp, n) for fp, n in self.counts.most_common() if n > threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Normalize *statement* so executions differing only in values compare equal."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_MARKER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip().lower()
+    return _IN_LIST.sub("(?+)", normalized)
+
+
+@lru_cache(maxsize=2048)
+def query_type(statement: str) -> str:
+    """Bounded metric label: statement verb plus its primary table."""
+    match = _VERB_TABLE.match(statement)
+    if match:
+        return f"{match.group(1).split()[0].lower()} {match.group(2).lower()}"
+    verb = statement.strip().split(None, 1)
+    if not verb:
+        return "unknown"
+    verb = verb[0].lower()
+    if verb in ("select", "with"):
+        table = _FROM_TABLE.search(statement)
+        if table:
+            return f"select {table.group(1).lower()}"
+    return verb
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(_START_TIMES_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    db_query_duration_seconds.labels(query_type=query_type(statement)).observe(elapsed)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(fingerprint(statement), elapsed)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get(_START_TIMES_KEY)
+        if starts:
+            starts.pop()
+
+
+def sample_pool_metrics(pool) -> None:
+    """Refresh the pool gauges (no-op for pools without size accounting)."""
+    try:
+        checked_in = pool.checkedin()
+        checked_out = pool.checkedout()
+    except AttributeError:
+        return
+    db_connection_pool_size.set(checked_in + checked_out)
+    db_connection_pool_available.set(checked_in)
+
+
+def install_query_instrumentation(engine: AsyncEngine) -> None:
+    """Attach timing and pool hooks to *engine* (idempotent)."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+    pool = sync_engine.pool
+    event.listen(pool, "checkout", lambda *_: sample_pool_metrics(pool))
+    event.listen(pool, "checkin", lambda *_: sample_pool_metrics(pool))
+
+
+@contextmanager
+def track_queries(
+    label: str = "block",
+    *,
+    threshold: Optional[int] = None,
+    raise_on_repeat: Optional[bool] = None,
+) -> Iterator[QueryStats]:
+    """Count statements run inside the block and flag repeated fingerprints.
+
+    Args:
+        label: Name used in the warning (request path, task name, test id).
+        threshold: Maximum executions of one fingerprint; defaults to
+            DB_N_PLUS_ONE_THRESHOLD.  0 disables the check.
+        raise_on_repeat: Raise ``RepeatedQueryError`` instead of logging;
+            defaults to DB_N_PLUS_ONE_RAISE.
+    """
+    if threshold is None:
+        threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+    if raise_on_repeat is None:
+        raise_on_repeat = settings.DB_N_PLUS_ONE_RAISE
+
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+    if threshold <= 0:
+        return
+    repeated = stats.repeated(threshold)
+    if not repeated:
+        return
+    fingerprint_, count = repeated[0]
+    message = (
+        f"Possible N+1 in {label}: statement ran {count} times "
+        f"({stats.total} statements total): {fingerprint_[:300]}"
+    )
+    if raise_on_repeat:
+        raise RepeatedQueryError(message)
+    logger.warning(message)
@@ -0,0 +1,103 @@
+"""Run a request's independent read-only queries concurrently.
+
+One ``AsyncSession`` is bound to one connection and cannot run two
+statements at once, so composite endpoints (dashboard, financial health,
+financial-plan summary, smart insights) used to pay the *sum* of a dozen
+round-trips.  ``SessionFanOut`` runs sub-queries side by side instead:
+
+    fanout = SessionFanOut(db)
+    spending, recent, trend = await fanout.gather(
+        lambda s: DashboardService(s).get_spending_and_income(...),
+        lambda s: DashboardService(s).get_recent_transactions(...),
+        lambda s: DashboardService(s).get_cash_flow_trend(...),
+    )
+
+Each callable receives the session it must use.  The first runs on the
+request's own session (idle while it waits); the rest borrow short-lived
+sessions from the same engine pool, at most DB_FANOUT_MAX_SESSIONS at a time
+per request, and return them as soon as their query finishes.  Results come
+back in argument order, so merging is deterministic.
+
+Falls back to running everything one after another on the request's session
+when:
+
+- DB_FANOUT_MAX_SESSIONS < 1;
+- the engine is SQLite (single shared connection in tests, no parallelism);
+- the request session holds unflushed changes that other sessions could not
+  see.
+
+Only pass read-only work: borrowed sessions are rolled back when returned,
+and ORM objects they load come back detached (load relationships eagerly).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SessionWork = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class SessionFanOut:
+    """Per-request helper that borrows extra pooled sessions for parallel reads."""
+
+    def __init__(self, db: AsyncSession, *, max_sessions: Optional[int] = None):
+        self.db = db
+        self.max_sessions = (
+            settings.DB_FANOUT_MAX_SESSIONS if max_sessions is None else max_sessions
+        )
+        # Shared by every gather() on this instance — the per-request cap.
+        self._borrow_slots = asyncio.Semaphore(max(1, self.max_sessions))
+        self._factory: Optional[async_sessionmaker] = None
+
+    @property
+    def concurrent(self) -> bool:
+        bind = self.db.bind
+        if self.max_sessions < 1 or bind is None or bind.dialect.name == "sqlite":
+            return False
+        return not (self.db.new or self.db.dirty or self.db.deleted)
+
+    async def gather(self, *work: SessionWork, return_exceptions: bool = False) -> list:
+        """Run each callable with a session; results are returned in argument order.
+
+        With ``return_exceptions=True`` a failing callable yields its
+        exception in place of a result instead of cancelling the others.
+        """
+        if not work:
+            return []
+        if not self.concurrent:
+            return await self._sequential(work, return_exceptions)
+
+        first, *rest = work
+        return list(
+            await asyncio.gather(
+                first(self.db),
+                *(self._borrowed(fn) for fn in rest),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    async def _sequential(self, work, return_exceptions: bool) -> list:
+        results = []
+        for fn in work:
+            try:
+                results.append(await fn(self.db))
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                results.append(exc)
+        return results
+
+    async def _borrowed(self, fn: SessionWork) -> Any:
+        if self._factory is None:
+            self._factory = async_sessionmaker(
+                self.db.bind, class_=AsyncSession, expire_on_commit=False, autoflush=False
+            )
+        async with self._borrow_slots:
+            async with self._factory() as session:
+                return await fn(session)
@@ -10,6 +10,7 @@ from app.models.contribution import AccountContribution
 from app.models.dividend import DividendIncome
 from app.models.holding import Holding
 from app.models.identity import UserIdentity
+from app.models.merchant import Merchant, MerchantAlias
 from app.models.mfa import UserMFA
 from app.models.net_worth_snapshot import NetWorthSnapshot
 from app.models.notification import Notification
@@ -19,9 +20,11 @@ from app.models.recurring_transaction import RecurringTransaction
 from app.models.report_template import ReportTemplate
 from app.models.rule import Rule, RuleAction, RuleCondition
 from app.models.savings_goal import SavingsGoal
+from app.models.security_classification import SecurityClassification
 from app.models.target_allocation import TargetAllocation
 from app.models.tax_lot import CostBasisMethod, TaxLot
 from app.models.transaction import Category, Label, Transaction, TransactionLabel
+from app.models.transaction_count import TransactionCount
 from app.models.transaction_merge import TransactionMerge
 from app.models.dependent import Dependent
 from app.models.insurance_policy import InsurancePolicy, PolicyType
@@ -45,9 +48,13 @@ __all__ = [
     "RuleCondition",
     "RuleAction",
     "Holding",
+    "Merchant",
+    "MerchantAlias",
+    "SecurityClassification",
     "NetWorthSnapshot",
     "PortfolioSnapshot",
     "TransactionMerge",
+    "TransactionCount",
     "Budget",
     "SavingsGoal",
     "RecurringTransaction",
@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Column, Index, String, DateTime, ForeignKey, Numeric
+from sqlalchemy import Boolean, Column, Index, String, DateTime, ForeignKey, Numeric
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -49,6 +49,9 @@ class Holding(Base):
     asset_type = Column(
         String(50), nullable=True
     )  # 'stock', 'bond', 'etf', 'mutual_fund', 'cash', 'other'
+    # Set when a user chose asset_type; enrichment and sync then leave it alone
+    # and it is layered over the stored per-symbol classification.
+    asset_type_overridden = Column(Boolean, default=False, nullable=False, server_default="false")
     asset_class = Column(
         String(50), nullable=True
     )  # 'domestic', 'international', 'bond', 'cash', 'other'
@@ -86,3 +89,11 @@ class Holding(Base):
 
     # Relationships
     account = relationship("Account", back_populates="holdings")
+    # Per-symbol bucketing; only populated when a query joinedload()s it
+    classification = relationship(
+        "SecurityClassification",
+        primaryjoin="func.upper(foreign(Holding.ticker)) == remote(SecurityClassification.ticker)",
+        viewonly=True,
+        uselist=False,
+        lazy="noload",
+    )
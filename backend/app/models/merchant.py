@@ -0,0 +1,59 @@
+"""Per-organization merchant dimension."""
+
+import uuid
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+from app.utils.datetime_utils import utc_now_lambda
+
+
+class Merchant(Base):
+    """One merchant of an organization, however its bank spells it.
+
+    ``normalized_name`` is ``merchant_service.merchant_key`` of the raw
+    names ("STARBUCKS #1234" and "Starbucks #88" both become "starbucks");
+    ``name`` is the first raw spelling seen.  ``transaction_count`` and
+    ``last_seen_date`` rank typeahead results; they are adjusted on ingest
+    and recomputed nightly by ``reconcile_merchants_task``.
+    """
+
+    __tablename__ = "merchants"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    name = Column(String(255), nullable=False)  # Display name
+    normalized_name = Column(String(255), nullable=False)
+    transaction_count = Column(Integer, nullable=False, default=0)
+    last_seen_date = Column(Date, nullable=True)
+
+    created_at = Column(DateTime, default=utc_now_lambda, nullable=False)
+    updated_at = Column(DateTime, default=utc_now_lambda, onupdate=utc_now_lambda, nullable=False)
+
+    __table_args__ = (
+        Index("ix_merchants_org_normalized", "organization_id", "normalized_name", unique=True),
+    )
+
+
+class MerchantAlias(Base):
+    """A raw ``Transaction.merchant_name`` spelling and the merchant it belongs to."""
+
+    __tablename__ = "merchant_aliases"
+
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    name = Column(String(255), primary_key=True)  # Exactly as stored on transactions
+    merchant_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("merchants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
@@ -3,7 +3,7 @@
 from decimal import Decimal
 from uuid import uuid4
 
-from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, Numeric
+from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, LargeBinary, Numeric
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
 from app.core.database import Base
@@ -47,8 +47,14 @@ class PortfolioSnapshot(Base):
     domestic_value = Column(Numeric(15, 2), default=Decimal("0"))
     international_value = Column(Numeric(15, 2), default=Decimal("0"))
 
-    # Full snapshot data (JSONB for flexibility)
-    # Contains complete PortfolioSummary for historical drill-down
+    # Complete PortfolioSummary for historical drill-down, stored compactly
+    # (see app/services/snapshot_codec.py): zlib-compressed JSON holding either
+    # the full document (keyframe_date NULL) or a delta against the keyframe
+    # captured on keyframe_date.  Read it through SnapshotService.get_snapshot_data.
+    snapshot_blob = Column(LargeBinary, nullable=True)
+    keyframe_date = Column(Date, nullable=True)
+
+    # Legacy uncompressed form; only set on rows written before snapshot_blob
     snapshot_data = Column(JSON, nullable=True)
 
     created_at = Column(DateTime, default=utc_now_lambda)
@@ -57,6 +57,13 @@ class RecurringTransaction(Base):
 
     # Pattern details
     merchant_name = Column(String(255), nullable=False, index=True)
+    # When set, matches every spelling of the merchant instead of merchant_name alone
+    merchant_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("merchants.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
     description_pattern = Column(String(500), nullable=True)  # Regex or pattern for matching
     frequency = Column(SQLEnum(RecurringFrequency, native_enum=False), nullable=False)
     average_amount = Column(Numeric(15, 2), nullable=False)
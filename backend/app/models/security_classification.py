@@ -0,0 +1,33 @@
+"""Per-symbol portfolio classification cache."""
+
+from sqlalchemy import Boolean, Column, DateTime, String
+
+from app.core.database import Base
+from app.utils.datetime_utils import utc_now_lambda
+
+
+class SecurityClassification(Base):
+    """Portfolio bucket, cap size, region, style and fund index for one ticker.
+
+    Built from provider metadata plus the keyword rules in
+    ``security_classification_service`` and refreshed by
+    ``enrich_holdings_metadata_task``.  Shared across organizations: it holds
+    only public facts about the symbol.
+    """
+
+    __tablename__ = "security_classifications"
+
+    ticker = Column(String(20), primary_key=True)  # Upper-case symbol
+
+    asset_type = Column(String(50), nullable=True)  # Provider asset type, when known
+    bucket = Column(
+        String(20), nullable=False
+    )  # 'cash', 'bond', 'international', 'domestic', 'other'
+    cap_size = Column(String(20), nullable=True)  # 'Large Cap', 'Mid Cap', 'Small Cap'
+    region = Column(String(20), nullable=True)  # 'developed', 'emerging' (international only)
+    style = Column(String(10), nullable=True)  # 'Value', 'Core', 'Growth'
+    index_category = Column(String(100), nullable=True)  # Tracked index, for fund overlap
+    # True when the bucket came from name/ticker heuristics rather than a provider asset type
+    is_estimated = Column(Boolean, nullable=False, default=True)
+
+    updated_at = Column(DateTime, default=utc_now_lambda, onupdate=utc_now_lambda, nullable=False)
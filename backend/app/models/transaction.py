@@ -37,6 +37,13 @@ class Transaction(Base):
     amount = Column(Numeric(15, 2), nullable=False)  # Positive for income, negative for expenses
     merchant_name = Column(String(255), nullable=True, index=True)
     description = Column(Text, nullable=True)
+    # Normalized merchant for merchant_name; NULL until resolved (see merchant_service)
+    merchant_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("merchants.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
 
     # Categorization
     category_id = Column(
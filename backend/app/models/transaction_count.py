@@ -0,0 +1,34 @@
+"""Per-account, per-month transaction counters."""
+
+from sqlalchemy import Column, Date, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class TransactionCount(Base):
+    """Number of transactions one account has in one calendar month.
+
+    On PostgreSQL the ``transaction_counts_apply`` trigger (migration
+    r84_transaction_counts) keeps these rows in step with every insert,
+    delete and account/date change on ``transactions``, so unfiltered list
+    totals are a sum over a few dozen rows instead of a ``COUNT(*)``.
+    ``transaction_totals_service.rebuild_transaction_counts`` recomputes
+    them from scratch.
+    """
+
+    __tablename__ = "transaction_counts"
+
+    account_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    month = Column(Date, primary_key=True)  # First day of the month
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    count = Column(Integer, nullable=False, default=0)
@@ -124,6 +124,7 @@ class TransactionListResponse(BaseModel):
 
     transactions: List[TransactionDetail]
     total: int
+    total_is_estimate: bool = False  # total is a lower bound or planner estimate
     page: int
     page_size: int
     has_more: bool
@@ -1,12 +1,12 @@
 """Service for amortization calculations and debt payoff math."""
 
 import calendar
-import math
 from datetime import date
 from decimal import Decimal
 from typing import Dict, List, Optional
 
 from app.constants.financial import DEBT
+from app.services.debt_payoff_engine import amortization_rows, level_payment_months
 
 
 class AmortizationService:
@@ -92,31 +92,7 @@ class AmortizationService:
         Returns:
             Number of months to payoff (0 if payment too low)
         """
-        if balance <= 0:
-            return 0
-
-        if monthly_payment <= 0:
-            return 999  # Payment too low, will never pay off
-
-        if annual_rate == 0:
-            # No interest, simple division
-            return math.ceil(float(balance / monthly_payment))
-
-        monthly_rate = float(annual_rate / Decimal(100) / Decimal(12))
-        monthly_interest = float(balance) * monthly_rate
-
-        # Check if payment covers interest
-        if monthly_payment <= Decimal(str(monthly_interest)):
-            return 999  # Payment too low to cover interest
-
-        # Use logarithm formula: n = -log(1 - r*P/M) / log(1 + r)
-        try:
-            numerator = -math.log(1 - (monthly_rate * float(balance) / float(monthly_payment)))
-            denominator = math.log(1 + monthly_rate)
-            months = math.ceil(numerator / denominator)
-            return min(months, 999)  # Cap at 999 months
-        except (ValueError, ZeroDivisionError):
-            return 999
+        return int(level_payment_months([balance], [annual_rate], [monthly_payment])[0])
 
     @staticmethod
     def generate_amortization_schedule(
@@ -129,6 +105,10 @@ class AmortizationService:
         """
         Generate month-by-month amortization schedule.
 
+        Steps the loan with the shared payoff engine: interest is rounded to
+        the cent each month and the final payment is capped at the remaining
+        balance plus interest.
+
         Args:
             principal: Starting principal
             annual_rate: Annual interest rate as percentage
@@ -142,41 +122,22 @@ class AmortizationService:
         if start_date is None:
             start_date = date.today()
 
+        rows = amortization_rows(
+            principal, annual_rate, monthly_payment, max_months=max_months, cent_balances=True
+        )
+
         schedule = []
-        remaining_balance = principal
         current_date = start_date
         original_day = start_date.day
-        month_num = 0
-
-        monthly_rate = annual_rate / Decimal(100) / Decimal(12)
-
-        while remaining_balance > Decimal("0.01") and month_num < max_months:
-            month_num += 1
-
-            # Calculate interest for this month
-            interest_payment = (remaining_balance * monthly_rate).quantize(Decimal("0.01"))
-
-            # Principal payment is remainder
-            principal_payment = monthly_payment - interest_payment
-
-            # Handle final payment
-            if principal_payment >= remaining_balance:
-                principal_payment = remaining_balance
-                total_payment = principal_payment + interest_payment
-            else:
-                total_payment = monthly_payment
-
-            remaining_balance -= principal_payment
-            remaining_balance = remaining_balance.quantize(Decimal("0.01"))
-
+        for month_num, payment, principal_payment, interest_payment, balance in rows:
             schedule.append(
                 {
                     "month": month_num,
                     "date": current_date.isoformat(),
-                    "payment": float(total_payment),
-                    "principal": float(principal_payment),
-                    "interest": float(interest_payment),
-                    "balance": float(max(remaining_balance, Decimal(0))),
+                    "payment": payment,
+                    "principal": principal_payment,
+                    "interest": interest_payment,
+                    "balance": balance,
                 }
             )
 
@@ -189,10 +150,6 @@ class AmortizationService:
             last_day = calendar.monthrange(next_year, next_month)[1]
             current_date = date(next_year, next_month, min(original_day, last_day))
 
-            # Stop if balance is paid off
-            if remaining_balance <= Decimal("0.01"):
-                break
-
         return schedule
 
     @staticmethod
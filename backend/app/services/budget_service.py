@@ -6,8 +6,9 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import String, and_, cast, func, or_, select
+from sqlalchemy import String, and_, case, cast, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.budget import Budget, BudgetPeriod
 from app.models.notification import Notification, NotificationPriority, NotificationType
@@ -16,6 +17,9 @@ from app.models.user import Organization, User
 from app.services.notification_service import NotificationService
 from app.utils.datetime_utils import utc_now
 
+# Budget periods summed per spending statement (two per rollover budget)
+SPENDING_SCOPES_PER_QUERY = 200
+
 
 class BudgetService:
     """Service for creating and managing budgets."""
@@ -208,14 +212,35 @@ class BudgetService:
 
         return budget
 
+    @staticmethod
+    def _visible_to(user: User):
+        """Filter for budgets owned by or shared with ``user``."""
+        return or_(
+            Budget.user_id == user.id,
+            and_(
+                Budget.is_shared.is_(True),
+                or_(
+                    # Shared with all org members; a None JSON value is stored as 'null'
+                    Budget.shared_user_ids.is_(None),
+                    cast(Budget.shared_user_ids, String) == "null",
+                    cast(Budget.shared_user_ids, String).contains(str(user.id)),
+                ),
+            ),
+        )
+
     @staticmethod
     async def get_budgets(
         db: AsyncSession,
         user: User,
         is_active: Optional[bool] = None,
         user_id: Optional[UUID] = None,
+        visible_only: bool = False,
     ) -> List[Budget]:
-        """Get all budgets for organization."""
+        """Get all budgets for organization.
+
+        With ``visible_only`` only budgets the user owns or that are shared
+        with them are returned, matching get_budget().
+        """
         query = select(Budget).where(Budget.organization_id == user.organization_id)
 
         if is_active is not None:
@@ -224,6 +249,9 @@ class BudgetService:
         if user_id is not None:
             query = query.where(Budget.user_id == user_id)
 
+        if visible_only:
+            query = query.where(BudgetService._visible_to(user))
+
         query = query.order_by(Budget.created_at.desc())
 
         result = await db.execute(query)
@@ -241,16 +269,7 @@ class BudgetService:
                 and_(
                     Budget.id == budget_id,
                     Budget.organization_id == user.organization_id,
-                    or_(
-                        Budget.user_id == user.id,
-                        and_(
-                            Budget.is_shared.is_(True),
-                            or_(
-                                Budget.shared_user_ids.is_(None),  # shared with all org members
-                                cast(Budget.shared_user_ids, String).contains(str(user.id)),
-                            ),
-                        ),
-                    ),
+                    BudgetService._visible_to(user),
                 )
             )
         )
@@ -329,6 +348,32 @@ class BudgetService:
         if not budget:
             return {}
 
+        spending = await BudgetService.get_budgets_spending(
+            db, [budget], user, period_start=period_start, period_end=period_end
+        )
+        return spending[budget.id]
+
+    @staticmethod
+    async def get_budgets_spending(
+        db: AsyncSession,
+        budgets: List[Budget],
+        user: User,
+        period_start: Optional[date] = None,
+        period_end: Optional[date] = None,
+    ) -> Dict[UUID, Dict[str, Decimal]]:
+        """
+        Calculate spending for many budgets at once, keyed by budget id.
+
+        Costs a fixed number of queries however many budgets are passed: the
+        org's period start day, one recursive CTE expanding every budget
+        category into its sub-categories, and one aggregate over the
+        transactions spanning all current and rollover periods (split every
+        SPENDING_SCOPES_PER_QUERY periods).  Callers are responsible for
+        checking the user may see the budgets.
+        """
+        if not budgets:
+            return {}
+
         # Determine period dates
         monthly_start_day = 1
         if period_start is None or period_end is None:
@@ -337,118 +382,172 @@ class BudgetService:
             )
             org = org_result.scalar_one_or_none()
             monthly_start_day = org.monthly_start_day if org else 1
-            period_start, period_end = BudgetService._get_period_dates(
-                budget.period, monthly_start_day=monthly_start_day
-            )
 
-        # Calculate rollover from previous period
-        rollover_amount = Decimal("0.00")
-        if budget.rollover_unused:
-            prev_end = period_start - timedelta(days=1)
-            prev_start, _ = BudgetService._get_period_dates(
-                budget.period,
-                reference_date=prev_end,
-                monthly_start_day=monthly_start_day,
-            )
-            prev_query = select(func.sum(Transaction.amount)).where(
-                and_(
-                    Transaction.organization_id == user.organization_id,
-                    Transaction.date >= prev_start,
-                    Transaction.date <= prev_end,
-                    Transaction.amount < 0,
+        categories = await BudgetService._expand_categories(
+            db,
+            user.organization_id,
+            {budget.category_id for budget in budgets if budget.category_id},
+        )
+
+        # One (start, end, filters) scope for each current period and, for
+        # rollover budgets, the previous period
+        scopes = []
+        periods = {}
+        for budget in budgets:
+            if period_start is None or period_end is None:
+                start, end = BudgetService._get_period_dates(
+                    budget.period, monthly_start_day=monthly_start_day
                 )
-            )
-            if budget.category_id:
-                prev_query = prev_query.where(Transaction.category_id == budget.category_id)
-            if budget.label_id:
-                prev_query = prev_query.join(
-                    TransactionLabel,
-                    and_(
-                        TransactionLabel.transaction_id == Transaction.id,
-                        TransactionLabel.label_id == budget.label_id,
-                    ),
+            else:
+                start, end = period_start, period_end
+            filters = BudgetService._spending_filters(budget, categories)
+            periods[budget.id] = (start, end)
+            scopes.append(((budget.id, "current"), start, end, filters))
+            if budget.rollover_unused:
+                prev_end = start - timedelta(days=1)
+                prev_start, _ = BudgetService._get_period_dates(
+                    budget.period,
+                    reference_date=prev_end,
+                    monthly_start_day=monthly_start_day,
                 )
-            prev_result = await db.execute(prev_query)
-            prev_spent = abs(prev_result.scalar() or Decimal("0.00"))
-            rollover_amount = max(Decimal("0.00"), budget.amount - prev_spent)
+                scopes.append(((budget.id, "previous"), prev_start, prev_end, filters))
 
-        effective_budget = budget.amount + rollover_amount
+        spent_by_scope = await BudgetService._sum_spending(db, user.organization_id, scopes)
 
-        # Build query for transactions
-        query = select(func.sum(Transaction.amount)).where(
-            and_(
-                Transaction.organization_id == user.organization_id,
-                Transaction.date >= period_start,
-                Transaction.date <= period_end,
-                Transaction.amount < 0,  # Expenses only
+        results = {}
+        for budget in budgets:
+            start, end = periods[budget.id]
+
+            # Calculate rollover from previous period
+            rollover_amount = Decimal("0.00")
+            if budget.rollover_unused:
+                prev_spent = spent_by_scope[(budget.id, "previous")]
+                rollover_amount = max(Decimal("0.00"), budget.amount - prev_spent)
+
+            effective_budget = budget.amount + rollover_amount
+            spent = spent_by_scope[(budget.id, "current")]
+            remaining = effective_budget - spent
+            percentage = (
+                (spent / effective_budget * 100) if effective_budget > 0 else Decimal("0.00")
             )
-        )
 
-        # Filter by category if budget is category-specific
-        if budget.category_id:
-            # Load the category and all its children so that transactions assigned
-            # to a sub-category roll up into the parent budget.
-            # Always scope to the user's org — defense-in-depth against IDOR.
-            cat_result = await db.execute(
-                select(Category).where(
-                    Category.id == budget.category_id,
-                    Category.organization_id == user.organization_id,
-                )
-            )
-            category = cat_result.scalar_one_or_none()
+            results[budget.id] = {
+                "budget_amount": budget.amount,
+                "spent": spent,
+                "remaining": remaining,
+                "percentage": percentage,
+                "period_start": start,
+                "period_end": end,
+                "rollover_amount": rollover_amount,
+                "effective_budget": effective_budget,
+            }
+        return results
 
-            if category:
-                children_result = await db.execute(
-                    select(Category).where(
-                        Category.parent_category_id == budget.category_id,
-                        Category.organization_id == user.organization_id,
-                    )
-                )
-                children = list(children_result.scalars().all())
-
-                # All category IDs in scope: parent + children
-                all_category_ids = [budget.category_id] + [c.id for c in children]
+    @staticmethod
+    async def _expand_categories(
+        db: AsyncSession,
+        organization_id: UUID,
+        category_ids: set,
+    ) -> Dict[UUID, tuple[set, set]]:
+        """Map each budget category to (ids, lower-cased names) of itself and its descendants.
+
+        Transactions assigned to a sub-category roll up into the parent
+        budget; the names match provider-categorized transactions
+        (``category_primary``) that have no category_id assigned yet.
+        Categories outside the organization are absent from the result —
+        defense-in-depth against IDOR.
+        """
+        if not category_ids:
+            return {}
 
-                # Names to match against category_primary for provider-categorized
-                # transactions that have no category_id assigned yet.
-                all_names = set()
-                for cat in [category] + children:
-                    all_names.add((cat.plaid_category_name or cat.name).lower())
+        child = aliased(Category)
+        tree = (
+            select(Category.id.label("root_id"), Category.id.label("category_id"))
+            .where(
+                Category.id.in_(category_ids),
+                Category.organization_id == organization_id,
+            )
+            .cte("category_tree", recursive=True)
+        )
+        # UNION (not UNION ALL) so a parent cycle cannot recurse forever
+        tree = tree.union(
+            select(tree.c.root_id, child.id)
+            .join(child, child.parent_category_id == tree.c.category_id)
+            .where(child.organization_id == organization_id)
+        )
+        result = await db.execute(
+            select(tree.c.root_id, Category.id, Category.name, Category.plaid_category_name).join(
+                Category, Category.id == tree.c.category_id
+            )
+        )
 
-                conditions = [Transaction.category_id.in_(all_category_ids)]
-                if all_names:
-                    conditions.append(func.lower(Transaction.category_primary).in_(all_names))
+        expanded: Dict[UUID, tuple[set, set]] = {}
+        for root_id, category_id, name, plaid_name in result.all():
+            ids, names = expanded.setdefault(root_id, (set(), set()))
+            ids.add(category_id)
+            names.add((plaid_name or name).lower())
+        return expanded
 
-                query = query.where(or_(*conditions))
+    @staticmethod
+    def _spending_filters(budget: Budget, categories: Dict[UUID, tuple[set, set]]) -> list:
+        """Transaction conditions for a budget's category and label."""
+        filters = []
+        if budget.category_id:
+            if budget.category_id in categories:
+                ids, names = categories[budget.category_id]
+                conditions = [Transaction.category_id.in_(ids)]
+                if names:
+                    conditions.append(func.lower(Transaction.category_primary).in_(names))
+                filters.append(or_(*conditions))
             else:
-                query = query.where(Transaction.category_id == budget.category_id)
-
-        # Filter by label if budget is label-specific
+                filters.append(Transaction.category_id == budget.category_id)
         if budget.label_id:
-            query = query.join(
-                TransactionLabel,
-                and_(
+            filters.append(
+                exists().where(
                     TransactionLabel.transaction_id == Transaction.id,
                     TransactionLabel.label_id == budget.label_id,
-                ),
+                )
             )
+        return filters
 
-        result = await db.execute(query)
-        spent = abs(result.scalar() or Decimal("0.00"))
-
-        remaining = effective_budget - spent
-        percentage = (spent / effective_budget * 100) if effective_budget > 0 else Decimal("0.00")
+    @staticmethod
+    async def _sum_spending(
+        db: AsyncSession,
+        organization_id: UUID,
+        scopes: list,
+    ) -> Dict[tuple, Decimal]:
+        """Expenses per (key, start, end, filters) scope, as positive amounts.
 
-        return {
-            "budget_amount": budget.amount,
-            "spent": spent,
-            "remaining": remaining,
-            "percentage": percentage,
-            "period_start": period_start,
-            "period_end": period_end,
-            "rollover_amount": rollover_amount,
-            "effective_budget": effective_budget,
-        }
+        Each scope is one conditional SUM column over a single scan of the
+        organization's expenses between the earliest start and latest end.
+        """
+        spent: Dict[tuple, Decimal] = {}
+        for offset in range(0, len(scopes), SPENDING_SCOPES_PER_QUERY):
+            chunk = scopes[offset : offset + SPENDING_SCOPES_PER_QUERY]
+            columns = [
+                func.sum(
+                    case(
+                        (
+                            and_(Transaction.date >= start, Transaction.date <= end, *filters),
+                            Transaction.amount,
+                        ),
+                        else_=None,
+                    )
+                )
+                for _, start, end, filters in chunk
+            ]
+            result = await db.execute(
+                select(*columns).where(
+                    Transaction.organization_id == organization_id,
+                    Transaction.date >= min(start for _, start, _, _ in chunk),
+                    Transaction.date <= max(end for _, _, end, _ in chunk),
+                    Transaction.amount < 0,  # Expenses only
+                )
+            )
+            row = result.one()
+            for (key, _, _, _), total in zip(chunk, row):
+                spent[key] = abs(total or Decimal("0.00"))
+        return spent
 
     @staticmethod
     async def check_budget_alerts(
@@ -461,8 +560,20 @@ class BudgetService:
         Returns:
             List of budgets that triggered alerts
         """
-        budgets = await BudgetService.get_budgets(db, user, is_active=True)
+        # Active budgets this user can see, as get_budget_spending would allow
+        budgets_result = await db.execute(
+            select(Budget)
+            .where(
+                Budget.organization_id == user.organization_id,
+                Budget.is_active.is_(True),
+                BudgetService._visible_to(user),
+            )
+            .order_by(Budget.created_at.desc())
+        )
+        budgets = list(budgets_result.scalars().all())
         alerts = []
+        if not budgets:
+            return alerts
 
         # Fetch org members once so we can attach a real user_id to alerts
         members_result = await db.execute(
@@ -477,74 +588,77 @@ class BudgetService:
             (m for m in org_members if m.is_org_admin), org_members[0] if org_members else user
         )
 
-        for budget in budgets:
-            spending = await BudgetService.get_budget_spending(db, budget.id, user)
-
-            if not spending:
-                continue
+        spending_by_budget = await BudgetService.get_budgets_spending(db, budgets, user)
+        over_threshold = [
+            budget
+            for budget in budgets
+            if spending_by_budget[budget.id]["percentage"] >= (budget.alert_threshold * 100)
+        ]
+        if not over_threshold:
+            return alerts
+
+        # Deduplication: skip budgets with an unread BUDGET_ALERT already created
+        # today for this org (prevents duplicate alerts from repeated runs)
+        today_str = utc_now().date().isoformat()
+        existing_result = await db.execute(
+            select(Notification.related_entity_id).where(
+                and_(
+                    Notification.organization_id == user.organization_id,
+                    Notification.type == NotificationType.BUDGET_ALERT,
+                    Notification.related_entity_id.in_([b.id for b in over_threshold]),
+                    Notification.is_read.is_(False),
+                    func.date(Notification.created_at) == today_str,
+                )
+            )
+        )
+        already_alerted = set(existing_result.scalars().all())
 
+        for budget in over_threshold:
+            spending = spending_by_budget[budget.id]
             percentage = spending["percentage"]
 
-            # Check if over alert threshold
-            if percentage >= (budget.alert_threshold * 100):
-                # Deduplication: skip if an unread BUDGET_ALERT for this budget already
-                # exists today for this org (prevents duplicate alerts from repeated runs)
-                today_str = utc_now().date().isoformat()
-                existing_result = await db.execute(
-                    select(Notification.id)
-                    .where(
-                        and_(
-                            Notification.organization_id == user.organization_id,
-                            Notification.type == NotificationType.BUDGET_ALERT,
-                            Notification.related_entity_id == budget.id,
-                            Notification.is_read.is_(False),
-                            func.date(Notification.created_at) == today_str,
-                        )
-                    )
-                    .limit(1)
-                )
-                if existing_result.scalar_one_or_none() is not None:
-                    continue
+            if budget.id in already_alerted:
+                continue
 
-                # Create notification
-                priority = (
-                    NotificationPriority.HIGH if percentage >= 100 else NotificationPriority.MEDIUM
-                )
+            # Create notification
+            priority = (
+                NotificationPriority.HIGH if percentage >= 100 else NotificationPriority.MEDIUM
+            )
 
-                title = f"Budget Alert: {budget.name}"
-                period_labels = {
-                    "monthly": "monthly",
-                    "quarterly": "quarterly",
-                    "semi_annual": "6-month",
-                    "yearly": "yearly",
-                }
-                period_label = period_labels.get(budget.period.value, budget.period.value)
-                message = (
-                    f"You've spent ${spending['spent']:.2f} of ${budget.amount:.2f} "
-                    f"({percentage:.1f}%) in the current {period_label} period."
-                )
+            title = f"Budget Alert: {budget.name}"
+            period_labels = {
+                "monthly": "monthly",
+                "quarterly": "quarterly",
+                "semi_annual": "6-month",
+                "yearly": "yearly",
+            }
+            period_label = period_labels.get(budget.period.value, budget.period.value)
+            message = (
+                f"You've spent ${spending['spent']:.2f} of ${budget.amount:.2f} "
+                f"({percentage:.1f}%) in the current {period_label} period."
+            )
 
-                await NotificationService.create_notification(
-                    db=db,
-                    organization_id=user.organization_id,
-                    user_id=alert_user.id,
-                    type=NotificationType.BUDGET_ALERT,
-                    title=title,
-                    message=message,
-                    priority=priority,
-                    related_entity_type="budget",
-                    related_entity_id=budget.id,
-                    action_url=f"/budgets/{budget.id}",
-                    action_label="View Budget",
-                    expires_in_days=7,
-                )
+            await NotificationService.create_notification(
+                db=db,
+                organization_id=user.organization_id,
+                user_id=alert_user.id,
+                type=NotificationType.BUDGET_ALERT,
+                title=title,
+                message=message,
+                priority=priority,
+                related_entity_type="budget",
+                related_entity_id=budget.id,
+                action_url=f"/budgets/{budget.id}",
+                action_label="View Budget",
+                expires_in_days=7,
+            )
 
-                alerts.append(
-                    {
-                        "budget": budget,
-                        "spending": spending,
-                    }
-                )
+            alerts.append(
+                {
+                    "budget": budget,
+                    "spending": spending,
+                }
+            )
 
         return alerts
 
@@ -0,0 +1,242 @@
+"""Bulk email dispatch over a pool of reused SMTP connections.
+
+``EmailService.send_email`` opens, authenticates and closes an SMTP session
+per message — fine for a password reset, far too slow for a weekly recap
+to thousands of households (TLS + AUTH handshakes dominate and the Celery
+task hits its time limit).  ``BulkEmailDispatcher`` instead:
+
+- runs EMAIL_BULK_POOL_SIZE workers, each holding one authenticated
+  ``aiosmtplib`` connection for up to EMAIL_BULK_MESSAGES_PER_CONNECTION
+  messages before recycling it;
+- spaces sends across all workers to EMAIL_BULK_MAX_PER_SECOND so provider
+  rate limits (SES, SendGrid, Gmail) are respected;
+- retries transient failures (disconnects, timeouts, 4xx replies) on a fresh
+  connection up to EMAIL_BULK_MAX_ATTEMPTS times; 5xx replies fail at once;
+- returns a per-recipient ``DeliveryResult`` and remembers each successful
+  ``OutboundEmail.key`` in Redis, so when a Celery task is retried the
+  recipients that already got their copy are skipped.
+
+Message bodies are rendered by the callers (cheap string templates); MIME
+encoding happens inside the workers alongside the network I/O.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional, Sequence
+
+import aiosmtplib
+
+from app.config import settings
+from app.core import cache
+from app.services.email_service import EmailService, email_service
+from app.utils.logging_utils import redact_email
+
+logger = logging.getLogger(__name__)
+
+SENT_KEY_PREFIX = "email:sent:"
+SENT_KEY_TTL_SECONDS = 3 * 24 * 3600
+
+_TRANSIENT_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPTimeoutError,
+    ConnectionError,
+    asyncio.TimeoutError,
+)
+
+
+class DeliveryStatus(str, Enum):
+    SENT = "sent"
+    FAILED = "failed"
+    DUPLICATE = "duplicate"  # Already sent under the same key (task retry)
+    SKIPPED = "skipped"  # SMTP not configured
+
+
+@dataclass
+class OutboundEmail:
+    """One rendered message for one recipient."""
+
+    to_email: str
+    subject: str
+    html_body: str
+    text_body: str
+    # Idempotency key, stable across task retries
+    # (e.g. "weekly_recap:2026-10-12:<user_id>").
+    key: Optional[str] = None
+
+
+@dataclass
+class DeliveryResult:
+    email: OutboundEmail
+    status: DeliveryStatus
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class DispatchReport:
+    """Per-recipient outcomes, in the same order as the input."""
+
+    results: list[DeliveryResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def count(self, status: DeliveryStatus) -> int:
+        return sum(1 for r in self.results if r.status == status)
+
+    @property
+    def failed(self) -> list[DeliveryResult]:
+        return [r for r in self.results if r.status == DeliveryStatus.FAILED]
+
+
+class _SendRateLimiter:
+    """Spaces acquisitions at least ``1 / per_second`` apart across all workers."""
+
+    def __init__(self, per_second: float):
+        self._interval = 1.0 / per_second if per_second and per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused):
+        # Greylisting / mailbox-busy replies are 4xx per recipient
+        return bool(exc.recipients) and all(400 <= r.code < 500 for r in exc.recipients)
+    if isinstance(exc, aiosmtplib.SMTPResponseException):
+        return 400 <= exc.code < 500
+    return isinstance(exc, _TRANSIENT_ERRORS)
+
+
+async def _close(smtp: Optional[aiosmtplib.SMTP]) -> None:
+    if smtp is None or not smtp.is_connected:
+        return
+    try:
+        await smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+class BulkEmailDispatcher:
+    """Send many emails concurrently over pooled SMTP connections."""
+
+    def __init__(
+        self,
+        service: Optional[EmailService] = None,
+        *,
+        pool_size: Optional[int] = None,
+        max_per_second: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        messages_per_connection: Optional[int] = None,
+        retry_delay: float = 1.0,
+    ):
+        self.service = service or email_service
+        self.pool_size = max(1, pool_size or settings.EMAIL_BULK_POOL_SIZE)
+        self.max_attempts = max(1, max_attempts or settings.EMAIL_BULK_MAX_ATTEMPTS)
+        self.messages_per_connection = max(
+            1, messages_per_connection or settings.EMAIL_BULK_MESSAGES_PER_CONNECTION
+        )
+        self.retry_delay = retry_delay
+        self._limiter = _SendRateLimiter(
+            settings.EMAIL_BULK_MAX_PER_SECOND if max_per_second is None else max_per_second
+        )
+
+    async def dispatch(self, emails: Sequence[OutboundEmail]) -> DispatchReport:
+        """Send *emails*; never raises for individual delivery failures."""
+        started = time.monotonic()
+        if not emails:
+            return DispatchReport()
+        if not self.service.is_configured:
+            logger.info("Email not configured — skipping %d bulk sends", len(emails))
+            return DispatchReport(
+                results=[DeliveryResult(e, DeliveryStatus.SKIPPED) for e in emails]
+            )
+
+        results: list[Optional[DeliveryResult]] = [None] * len(emails)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index in range(len(emails)):
+            queue.put_nowait(index)
+
+        workers = min(self.pool_size, len(emails))
+        await asyncio.gather(*(self._worker(emails, queue, results) for _ in range(workers)))
+
+        report = DispatchReport(results=results, elapsed_seconds=time.monotonic() - started)
+        logger.info(
+            "bulk_email_dispatched",
+            extra={
+                "sent": report.count(DeliveryStatus.SENT),
+                "failed": report.count(DeliveryStatus.FAILED),
+                "duplicate": report.count(DeliveryStatus.DUPLICATE),
+                "connections": workers,
+                "elapsed_seconds": round(report.elapsed_seconds, 2),
+            },
+        )
+        return report
+
+    async def _worker(self, emails, queue: asyncio.Queue, results: list) -> None:
+        smtp: Optional[aiosmtplib.SMTP] = None
+        sent_on_connection = 0
+        try:
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                email = emails[index]
+
+                if email.key and await cache.get(SENT_KEY_PREFIX + email.key):
+                    results[index] = DeliveryResult(email, DeliveryStatus.DUPLICATE)
+                    continue
+
+                attempts = 0
+                while True:
+                    attempts += 1
+                    try:
+                        if smtp is None or sent_on_connection >= self.messages_per_connection:
+                            await _close(smtp)
+                            smtp = None
+                            smtp = await self.service.open_connection()
+                            sent_on_connection = 0
+                        await self._limiter.acquire()
+                        await smtp.send_message(
+                            self.service.build_message(
+                                email.to_email, email.subject, email.html_body, email.text_body
+                            )
+                        )
+                    except Exception as exc:
+                        transient = _is_transient(exc)
+                        if transient:
+                            await _close(smtp)
+                            smtp = None
+                        if transient and attempts < self.max_attempts:
+                            await asyncio.sleep(self.retry_delay * attempts)
+                            continue
+                        logger.error(
+                            "Bulk email to %s failed after %d attempt(s): %s",
+                            redact_email(email.to_email),
+                            attempts,
+                            exc,
+                        )
+                        results[index] = DeliveryResult(
+                            email, DeliveryStatus.FAILED, attempts, str(exc)
+                        )
+                        break
+
+                    sent_on_connection += 1
+                    results[index] = DeliveryResult(email, DeliveryStatus.SENT, attempts)
+                    if email.key:
+                        await cache.setex(SENT_KEY_PREFIX + email.key, SENT_KEY_TTL_SECONDS, 1)
+                    break
+        finally:
+            await _close(smtp)
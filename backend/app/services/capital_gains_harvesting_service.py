@@ -9,6 +9,7 @@ import datetime
 from decimal import Decimal
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -74,87 +75,34 @@ class CapitalGainsHarvestingService:
     ) -> list[dict]:
         """Returns tax lots with unrealized long-term gains eligible for harvesting.
 
-        Filters: held > 365 days, unrealized gain > min_gain.
-        TaxLot uses acquisition_date, total_cost_basis, sale_proceeds, is_closed,
-        realized_gain_loss, and closed_at fields.
+        Filters: held >= 366 days (``LONG_TERM_DAYS``), unrealized gain >=
+        min_gain.  Lots are valued in one query by ``load_open_lots``; lots
+        whose holding has no current price are skipped.
         """
-        from app.models.tax_lot import TaxLot
-        from datetime import date, timedelta
-
-        ltcg_cutoff = date.today() - timedelta(days=366)  # Must hold > 1 year (366 days)
-
-        # TaxLot doesn't have a user_id — filter via account join if user_id given
-        if user_id:
-            from app.models.account import Account
+        from app.models.account import AccountType
+        from app.services.tax_lot_valuation_service import load_open_lots
 
-            stmt = (
-                select(TaxLot)
-                .join(Account, TaxLot.account_id == Account.id)
-                .where(
-                    TaxLot.organization_id == organization_id,
-                    TaxLot.is_closed.is_(False),
-                    TaxLot.acquisition_date <= ltcg_cutoff,
-                    Account.user_id == user_id,
-                )
-            )
-        else:
-            stmt = select(TaxLot).where(
-                TaxLot.organization_id == organization_id,
-                TaxLot.is_closed.is_(False),
-                TaxLot.acquisition_date <= ltcg_cutoff,
-            )
-
-        result = await db.execute(stmt)
-        lots = result.scalars().all()
+        valuations = await load_open_lots(db, organization_id, user_id=user_id)
+        eligible = (
+            valuations.is_long_term
+            & valuations.has_price
+            & (valuations.unrealized_gain >= float(min_gain))
+        )
 
         candidates = []
-        for lot in lots:
-            # Use total_cost_basis; current_value must be estimated from holding price
-            # since TaxLot doesn't store current_value directly.
-            # We require total_cost_basis to compute gain; skip if missing.
-            if not lot.total_cost_basis:
-                continue
-
-            # Fetch current value from the associated holding
-            from app.models.holding import Holding
-            from app.models.account import Account, AccountType
-
-            holding_result = await db.execute(
-                select(Holding).where(Holding.id == lot.holding_id)
-            )
-            holding = holding_result.scalar_one_or_none()
-            if not holding or not holding.current_total_value:
-                continue
-
-            # Compute per-lot current value proportional to remaining quantity
-            if not holding.shares or holding.shares == 0:
-                continue
-            lot_fraction = lot.remaining_quantity / holding.shares
-            lot_current_value = holding.current_total_value * lot_fraction
-            lot_cost_basis = lot.total_cost_basis * (lot.remaining_quantity / lot.quantity)
-
-            gain = lot_current_value - lot_cost_basis
-            if gain < min_gain:
-                continue
-
-            # Fetch account type to determine crypto-specific tax treatment
-            acct_result = await db.execute(
-                select(Account.account_type).where(Account.id == lot.account_id)
-            )
-            account_type = acct_result.scalar_one_or_none()
-            is_crypto = account_type == AccountType.CRYPTO
-
-            holding_period_days = (date.today() - lot.acquisition_date).days
+        for i in np.flatnonzero(eligible):
+            lot = valuations.lots[i]
+            is_crypto = valuations.account_types[i] == AccountType.CRYPTO
             candidates.append(
                 {
                     "tax_lot_id": str(lot.id),
-                    "ticker": holding.ticker,
-                    "shares": float(lot.remaining_quantity),
-                    "cost_basis": float(lot_cost_basis),
-                    "current_value": float(lot_current_value),
-                    "unrealized_gain": float(gain),
+                    "ticker": valuations.holdings[i].ticker,
+                    "shares": float(valuations.quantity[i]),
+                    "cost_basis": float(valuations.cost_basis[i]),
+                    "current_value": float(valuations.current_value[i]),
+                    "unrealized_gain": float(valuations.unrealized_gain[i]),
                     "acquisition_date": lot.acquisition_date.isoformat(),
-                    "holding_period_days": holding_period_days,
+                    "holding_period_days": int(valuations.days_held[i]),
                     "is_long_term": True,
                     "is_crypto": is_crypto,
                     "no_wash_sale_rule": is_crypto,
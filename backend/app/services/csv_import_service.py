@@ -15,6 +15,7 @@ from app.core.cache import delete_pattern as cache_delete_pattern
 from app.models.transaction import Transaction
 from app.models.account import Account
 from app.models.user import User
+from app.services.merchant_service import assign_merchants_nonfatal
 
 
 class CSVImportService:
@@ -218,6 +219,7 @@ class CSVImportService:
         imported = 0
         skipped = 0
         errors = []
+        batch: List[Transaction] = []
 
         # Pre-fetch existing dedup hashes for this account to avoid N+1 queries
         existing_hashes = set()
@@ -274,16 +276,23 @@ class CSVImportService:
                 )
 
                 db.add(transaction)
+                batch.append(transaction)
                 imported += 1
 
                 # Commit in batches of 100
                 if imported % 100 == 0:
+                    await db.flush()
+                    await assign_merchants_nonfatal(db, user.organization_id, batch)
+                    batch = []
                     await db.commit()
 
             except Exception as e:
                 errors.append(f"Row {i}: {str(e)}")
 
         # Final commit
+        if batch:
+            await db.flush()
+            await assign_merchants_nonfatal(db, user.organization_id, batch)
         await db.commit()
 
         # Invalidate caches that depend on transaction data
@@ -25,6 +25,22 @@ Tables covered
   purges when your policy explicitly requires it.  The default behaviour
   skips audit log purges unless AUDIT_LOG_RETENTION_DAYS is set separately.
 
+Partitioned mode
+----------------
+When DB_PARTITIONING_ENABLED is on, the Celery task passes
+``partition_action`` ("drop" or "detach") and ``purge_all_orgs`` first
+retires every whole monthly partition older than the cutoff via
+``PartitionMaintenanceService``.  The per-org row deletes that follow only
+have the single boundary month left to scan.
+
+Batched deletes
+---------------
+Live purges never issue one unbounded DELETE.  Rows are removed through
+``ChunkedPurger`` in primary-key-ordered batches of DATA_PURGE_BATCH_SIZE,
+each in its own short transaction, throttled to
+DATA_PURGE_MAX_ROWS_PER_SECOND and checkpointed in Redis so a crashed run
+resumes where it stopped.  Dry runs still issue a single COUNT.
+
 GDPR "right to erasure"
 -----------------------
 `gdpr_delete_user` performs a hard delete of a single user record and all
@@ -34,15 +50,20 @@ household members is NOT deleted.
 
 import logging
 from datetime import date, timedelta
+from typing import Optional
 
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.models.account import Account
 from app.models.audit_log import AuditLog
 from app.models.net_worth_snapshot import NetWorthSnapshot
 from app.models.notification import Notification
+from app.models.portfolio_snapshot import PortfolioSnapshot
 from app.models.transaction import Transaction
 from app.models.user import User
+from app.services.chunked_purge_service import ChunkedPurger
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +73,19 @@ def _is_indefinite(retention_days) -> bool:
     return retention_days is None or retention_days < 0
 
 
+def _transaction_dependents() -> Optional[dict[str, str]]:
+    """Transaction child tables to clear per batch when FKs are not enforced.
+
+    Partitioning drops the FKs into transactions.id, so their ON DELETE
+    CASCADE no longer fires; otherwise the database handles children.
+    """
+    if not settings.DB_PARTITIONING_ENABLED:
+        return None
+    from app.services.partition_service import TRANSACTION_CHILD_TABLES
+
+    return TRANSACTION_CHILD_TABLES
+
+
 class DataRetentionService:
     """Purge old data per configurable retention policy."""
 
@@ -64,6 +98,7 @@ class DataRetentionService:
         retention_days: int,
         *,
         dry_run: bool = True,
+        purger: Optional[ChunkedPurger] = None,
     ) -> int:
         """Delete transactions older than *retention_days* for the given org."""
         cutoff = date.today() - timedelta(days=retention_days)
@@ -83,13 +118,13 @@ class DataRetentionService:
             )
             return count
 
-        result = await db.execute(
-            delete(Transaction).where(
-                Transaction.organization_id == org_id, Transaction.date < cutoff
-            )
+        deleted = await (purger or ChunkedPurger(db)).purge(
+            Transaction,
+            Transaction.organization_id == org_id,
+            Transaction.date < cutoff,
+            checkpoint_key=f"retention:transactions:{org_id}:{cutoff.isoformat()}",
+            dependents=_transaction_dependents(),
         )
-        await db.commit()
-        deleted = result.rowcount
         logger.info(
             "transactions: org=%s deleted %d rows older than %s",
             org_id,
@@ -105,6 +140,7 @@ class DataRetentionService:
         retention_days: int,
         *,
         dry_run: bool = True,
+        purger: Optional[ChunkedPurger] = None,
     ) -> int:
         """Delete net-worth snapshots older than *retention_days* for the given org."""
         cutoff = date.today() - timedelta(days=retention_days)
@@ -127,14 +163,12 @@ class DataRetentionService:
             )
             return count
 
-        result = await db.execute(
-            delete(NetWorthSnapshot).where(
-                NetWorthSnapshot.organization_id == org_id,
-                NetWorthSnapshot.snapshot_date < cutoff,
-            )
+        deleted = await (purger or ChunkedPurger(db)).purge(
+            NetWorthSnapshot,
+            NetWorthSnapshot.organization_id == org_id,
+            NetWorthSnapshot.snapshot_date < cutoff,
+            checkpoint_key=f"retention:net_worth_snapshots:{org_id}:{cutoff.isoformat()}",
         )
-        await db.commit()
-        deleted = result.rowcount
         logger.info(
             "snapshots: org=%s deleted %d rows older than %s",
             org_id,
@@ -150,6 +184,7 @@ class DataRetentionService:
         retention_days: int,
         *,
         dry_run: bool = True,
+        purger: Optional[ChunkedPurger] = None,
     ) -> int:
         """Delete notifications older than *retention_days* for the given org."""
         from datetime import datetime, timezone
@@ -174,14 +209,12 @@ class DataRetentionService:
             )
             return count
 
-        result = await db.execute(
-            delete(Notification).where(
-                Notification.organization_id == org_id,
-                Notification.created_at < cutoff,
-            )
+        deleted = await (purger or ChunkedPurger(db)).purge(
+            Notification,
+            Notification.organization_id == org_id,
+            Notification.created_at < cutoff,
+            checkpoint_key=f"retention:notifications:{org_id}:{cutoff.date().isoformat()}",
         )
-        await db.commit()
-        deleted = result.rowcount
         logger.info(
             "notifications: org=%s deleted %d rows older than %s",
             org_id,
@@ -196,6 +229,7 @@ class DataRetentionService:
         retention_days: int,
         *,
         dry_run: bool = True,
+        purger: Optional[ChunkedPurger] = None,
     ) -> int:
         """Delete audit log entries older than *retention_days* (global, not per-org).
 
@@ -218,12 +252,56 @@ class DataRetentionService:
             )
             return count
 
-        result = await db.execute(delete(AuditLog).where(AuditLog.created_at < cutoff))
-        await db.commit()
-        deleted = result.rowcount
+        deleted = await (purger or ChunkedPurger(db)).purge(
+            AuditLog,
+            AuditLog.created_at < cutoff,
+            checkpoint_key=f"retention:audit_logs:{cutoff.date().isoformat()}",
+        )
         logger.info("audit_logs: deleted %d rows older than %s", deleted, cutoff.isoformat())
         return deleted
 
+    @staticmethod
+    async def retire_expired_partitions(
+        db: AsyncSession,
+        retention_days: int,
+        *,
+        action: str = "drop",
+        dry_run: bool = True,
+        audit_log_retention_days: int | None = None,
+    ) -> dict:
+        """Drop or detach whole monthly partitions older than the retention cutoff.
+
+        Covers transactions, net_worth_snapshots and notifications (using
+        *retention_days*) and audit_logs (using *audit_log_retention_days*,
+        skipped when indefinite).  Tables that are not partitioned are skipped.
+
+        Returns:
+            Dict mapping table name → list of retired partition names.
+        """
+        from app.services.partition_service import PartitionMaintenanceService
+
+        cutoffs = {
+            "transactions": retention_days,
+            "net_worth_snapshots": retention_days,
+            "notifications": retention_days,
+        }
+        if not _is_indefinite(audit_log_retention_days):
+            cutoffs["audit_logs"] = audit_log_retention_days
+
+        retired: dict = {}
+        for table, days in cutoffs.items():
+            if not await PartitionMaintenanceService.is_partitioned(db, table):
+                continue
+            parts = await PartitionMaintenanceService.retire_partitions_before(
+                db,
+                table,
+                date.today() - timedelta(days=days),
+                action=action,
+                dry_run=dry_run,
+            )
+            retired[table] = [p.name for p in parts]
+        return retired
+
     # ── Orchestration ─────────────────────────────────────────────────────────
 
     @staticmethod
@@ -233,6 +311,7 @@ class DataRetentionService:
         retention_days: int,
         *,
         dry_run: bool = True,
+        purger: Optional[ChunkedPurger] = None,
     ) -> dict:
         """Run all per-org purges for one organisation.
 
@@ -243,13 +322,13 @@ class DataRetentionService:
             return {"transactions": 0, "snapshots": 0, "notifications": 0}
 
         transactions = await DataRetentionService.purge_transactions(
-            db, org_id, retention_days, dry_run=dry_run
+            db, org_id, retention_days, dry_run=dry_run, purger=purger
         )
         snapshots = await DataRetentionService.purge_snapshots(
-            db, org_id, retention_days, dry_run=dry_run
+            db, org_id, retention_days, dry_run=dry_run, purger=purger
         )
         notifications = await DataRetentionService.purge_notifications(
-            db, org_id, retention_days, dry_run=dry_run
+            db, org_id, retention_days, dry_run=dry_run, purger=purger
         )
         return {
             "transactions": transactions,
@@ -264,6 +343,7 @@ class DataRetentionService:
         *,
         dry_run: bool = True,
         audit_log_retention_days: int | None = None,
+        partition_action: str | None = None,
     ) -> dict:
         """Run the retention purge for every organisation.
 
@@ -272,21 +352,36 @@ class DataRetentionService:
             dry_run: If True, count rows but don't delete.
             audit_log_retention_days: If set, also purge audit_logs older than
                 this many days (independent of per-org retention).
+            partition_action: "drop" or "detach" to retire whole expired
+                monthly partitions first (partitioned mode only).
 
         Returns:
-            Dict mapping org_id → per-table counts, plus an "audit_logs" total.
+            Dict mapping org_id → per-table counts, plus an "audit_logs" total
+            (and "_partitions" when partitions were retired).
         """
         if _is_indefinite(retention_days):
             logger.info("Data retention: indefinite policy — skipping purge")
             return {}
 
+        partitions = None
+        if partition_action is not None:
+            partitions = await DataRetentionService.retire_expired_partitions(
+                db,
+                retention_days,
+                action=partition_action,
+                dry_run=dry_run,
+                audit_log_retention_days=audit_log_retention_days,
+            )
+
         orgs = await db.execute(select(User.organization_id).distinct())
         org_ids = [row[0] for row in orgs.all()]
 
+        # One purger for the whole run so the rows/second budget is global.
+        purger = ChunkedPurger(db)
         results: dict = {}
         for org_id in org_ids:
             counts = await DataRetentionService.purge_old_data(
-                db, org_id, retention_days, dry_run=dry_run
+                db, org_id, retention_days, dry_run=dry_run, purger=purger
             )
             results[str(org_id)] = counts
 
@@ -295,8 +390,9 @@ class DataRetentionService:
         if not _is_indefinite(audit_log_retention_days):
             audit_deleted = await DataRetentionService.purge_audit_logs(
                 db,
-                audit_log_retention_days,
-                dry_run=dry_run,  # type: ignore[arg-type]
+                audit_log_retention_days,  # type: ignore[arg-type]
+                dry_run=dry_run,
+                purger=purger,
             )
 
         total_tx = sum(v.get("transactions", 0) for v in results.values())
@@ -314,6 +410,8 @@ class DataRetentionService:
         )
 
         results["_audit_logs"] = audit_deleted
+        if partitions is not None:
+            results["_partitions"] = partitions
         return results
 
     # ── GDPR right to erasure ─────────────────────────────────────────────────
@@ -323,17 +421,52 @@ class DataRetentionService:
         """Hard-delete a user and all their personally-identifiable data.
 
         The user's organisation is NOT deleted — it may be shared with other
-        household members.  Only the User row (and its cascade-deleted children:
-        refresh_tokens, mfa, consents, identities) is removed.
+        household members.  The User row and its cascade-deleted children
+        (refresh_tokens, mfa, consents, identities, owned accounts) are removed.
+
+        The high-volume children — transactions in the user's accounts,
+        notifications and snapshots — are deleted first in throttled batches
+        so the final ``DELETE FROM users`` only cascades over small tables.
 
         Called by the ``gdpr_delete_user_task`` Celery task after a 24-hour
-        grace period following the user's deletion request.
+        grace period following the user's deletion request.  Safe to retry:
+        an interrupted run resumes from its checkpoints.
         """
         from uuid import UUID
 
-        from sqlalchemy import delete as sa_delete
-
         user_uuid = UUID(user_id)
-        result = await db.execute(sa_delete(User).where(User.id == user_uuid))
+        purger = ChunkedPurger(db)
+        owned_accounts = select(Account.id).where(Account.user_id == user_uuid)
+
+        counts = {
+            "transactions": await purger.purge(
+                Transaction,
+                Transaction.account_id.in_(owned_accounts),
+                checkpoint_key=f"gdpr:{user_id}:transactions",
+                dependents=_transaction_dependents(),
+            ),
+            "notifications": await purger.purge(
+                Notification,
+                Notification.user_id == user_uuid,
+                checkpoint_key=f"gdpr:{user_id}:notifications",
+            ),
+            "net_worth_snapshots": await purger.purge(
+                NetWorthSnapshot,
+                NetWorthSnapshot.user_id == user_uuid,
+                checkpoint_key=f"gdpr:{user_id}:net_worth_snapshots",
+            ),
+            "portfolio_snapshots": await purger.purge(
+                PortfolioSnapshot,
+                PortfolioSnapshot.user_id == user_uuid,
+                checkpoint_key=f"gdpr:{user_id}:portfolio_snapshots",
+            ),
+        }
+
+        result = await db.execute(delete(User).where(User.id == user_uuid))
         await db.commit()
-        logger.info("GDPR erasure complete: user_id=%s rows_deleted=%d", user_id, result.rowcount)
+        logger.info(
+            "GDPR erasure complete: user_id=%s rows_deleted=%d children=%s",
+            user_id,
+            result.rowcount,
+            counts,
+        )
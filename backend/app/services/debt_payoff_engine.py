@@ -0,0 +1,424 @@
+"""Shared amortization and debt-payoff simulation engine.
+
+Every loan schedule, payoff strategy and "what if I paid $X more" question in
+the app is the same month step, run over one or more debts:
+
+    interest  = balance * annual_rate / 12, rounded to the cent (half-even)
+    payment   = min(minimum_payment, balance + interest)
+    balance  -= payment - interest
+
+followed, for payoff strategies, by one extra payment on the highest-priority
+debt still owing, which grows by each minimum freed when a debt is cleared
+with extra money (the snowball effect).
+
+``simulate_payoffs`` runs that step for a whole grid at once: state arrays
+are shaped ``(scenarios, debts)`` and each scenario has its own extra payment
+and priority order, so snowball, avalanche, minimum-only pace and any number
+of extra-payment amounts come out of one month loop of array operations
+instead of a Python loop per debt per month per scenario.  Below
+VECTORIZE_MIN_SCENARIOS scenarios the per-call overhead of small arrays
+outweighs that, so each scenario steps on plain Python integers instead;
+both paths produce identical results.
+
+Money is held as integers in 1/10,000ths of a dollar (UNITS_PER_DOLLAR) and
+annual rates as integer millionths of a percent (RATE_SCALE), so the cent
+rounding of interest is an exact half-even integer division rather than a
+float or 28-digit ``Decimal`` approximation, and sub-cent minimums such as
+2% of a balance stay exact.
+
+``level_payment_months`` is the closed-form counterpart for a single
+level-payment loan, vectorized over many balances / rates / payments.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from app.constants.financial import DEBT
+
+UNITS_PER_DOLLAR = 10_000
+UNITS_PER_CENT = 100
+RATE_SCALE = 1_000_000  # annual percentage rate units per 1%
+
+# cents of interest = balance units * rate units / _INTEREST_DIVISOR
+_INTEREST_DIVISOR = UNITS_PER_CENT * RATE_SCALE * 100 * 12
+_INT64_MAX = np.iinfo(np.int64).max
+
+# Scenario count from which one array loop beats a plain-integer loop per scenario
+VECTORIZE_MIN_SCENARIOS = 16
+
+# Months reported by level_payment_months when a payment never retires the debt
+NEVER_PAID_OFF = 999
+
+Number = Union[Decimal, float, int, str]
+
+
+def _scaled(value: Number, scale: int) -> int:
+    return int((Decimal(str(value)) * scale).to_integral_value(ROUND_HALF_EVEN))
+
+
+def to_units(amounts: Sequence[Number]) -> np.ndarray:
+    """Dollar amounts as integer units (half-even below 1/10,000 of a dollar)."""
+    return np.array([_scaled(a, UNITS_PER_DOLLAR) for a in amounts], dtype=np.int64)
+
+
+def to_dollars(units) -> float:
+    """One unit value back to dollars (exactly rounded to the nearest float)."""
+    return int(units) / UNITS_PER_DOLLAR
+
+
+def _div_half_even(numerator, denominator: int):
+    """Integer division rounding half to even, for non-negative ints or int arrays.
+
+    ``q + (2r + (q & 1) > d)`` rounds up past the half, and at exactly half
+    only when ``q`` is odd.
+    """
+    if isinstance(numerator, np.ndarray) and numerator.dtype != object:
+        quotient, remainder = np.divmod(numerator, denominator)
+    else:
+        quotient, remainder = numerator // denominator, numerator % denominator
+    return quotient + ((remainder * 2 + (quotient & 1)) > denominator)
+
+
+@dataclass
+class PayoffRun:
+    """Result of ``simulate_payoffs``; money arrays are in integer units.
+
+    ``months[s]`` is the month on which scenario *s* was found fully paid
+    (one past its last payment) or ``max_months`` when it never was.
+    ``payoff_month[s, d]`` is the month debt *d* was cleared, 0 when it was
+    not cleared within the horizon (or owed nothing to begin with).
+    ``history`` holds ``interest``, ``payment`` and ``balance`` arrays
+    shaped ``(month, scenario, debt)`` when the run was recorded.
+    """
+
+    months: np.ndarray
+    payoff_month: np.ndarray
+    balance: np.ndarray
+    interest: np.ndarray
+    paid: np.ndarray
+    history: Optional[dict[str, np.ndarray]] = None
+
+
+def simulate_payoffs(
+    balances: Sequence[Number],
+    annual_rates: Sequence[Number],
+    minimum_payments: Sequence[Number],
+    *,
+    extra_payments: Sequence[Number] = (0,),
+    priorities: Optional[Sequence[Sequence[int]]] = None,
+    max_months: int = DEBT.MAX_PAYOFF_MONTHS,
+    paid_off_at: Number = Decimal("0.01"),
+    cent_balances: bool = False,
+    record: bool = False,
+) -> PayoffRun:
+    """Step every debt of every scenario month by month until all are paid.
+
+    Args:
+        balances: Starting balance of each debt, in dollars
+        annual_rates: Annual interest rate of each debt as a percentage
+        minimum_payments: Monthly minimum payment of each debt
+        extra_payments: Extra monthly payment of each scenario
+        priorities: Per scenario, debt indices in the order extra payments
+            target them (defaults to the order given)
+        max_months: Simulation horizon
+        paid_off_at: A debt at or below this balance counts as paid
+        cent_balances: Round balances to the cent after each payment
+            (for schedules whose payment is not a whole number of cents)
+        record: Keep the per-month interest / payment / balance arrays
+    """
+    balance0 = [_scaled(b, UNITS_PER_DOLLAR) for b in balances]
+    rates = [_scaled(r, RATE_SCALE) for r in annual_rates]
+    minimums = [_scaled(m, UNITS_PER_DOLLAR) for m in minimum_payments]
+    extras = [_scaled(e, UNITS_PER_DOLLAR) for e in extra_payments]
+    n_debts = len(balance0)
+    orders = (
+        [list(order) for order in priorities]
+        if priorities is not None
+        else [list(range(n_debts))] * len(extras)
+    )
+    options = {
+        "max_months": max_months,
+        "threshold": _scaled(paid_off_at, UNITS_PER_DOLLAR),
+        "cent_balances": cent_balances,
+        "record": record,
+    }
+    if len(extras) >= VECTORIZE_MIN_SCENARIOS:
+        return _simulate_grid(balance0, rates, minimums, extras, orders, **options)
+    runs = [
+        _simulate_one(balance0, rates, minimums, extra, order, **options)
+        for extra, order in zip(extras, orders)
+    ]
+    return _stack(runs, n_debts, record)
+
+
+def _simulate_one(
+    balance0: list[int],
+    rates: list[int],
+    minimums: list[int],
+    extra: int,
+    order: list[int],
+    *,
+    max_months: int,
+    threshold: int,
+    cent_balances: bool,
+    record: bool,
+) -> PayoffRun:
+    """One scenario with plain integers — cheaper than array calls for small grids."""
+    n_debts = len(balance0)
+    balance = list(balance0)
+    interest_total = [0] * n_debts
+    paid_total = [0] * n_debts
+    payoff_month = [0] * n_debts
+    freed = 0
+    months = max_months
+    history: dict[str, list] = {"interest": [], "payment": [], "balance": []}
+
+    for month in range(1, max_months + 1):
+        owing = [b > threshold for b in balance]
+        if not any(owing):
+            months = month
+            break
+
+        # Minimum payments and interest on every open debt
+        interest = [0] * n_debts
+        payment = [0] * n_debts
+        for d in range(n_debts):
+            if not owing[d]:
+                continue
+            cents, rest = divmod(balance[d] * rates[d], _INTEREST_DIVISOR)
+            accrued = (cents + ((rest * 2 + (cents & 1)) > _INTEREST_DIVISOR)) * UNITS_PER_CENT
+            paid = min(minimums[d], balance[d] + accrued)
+            remaining = max(balance[d] - (paid - accrued), 0)
+            if cent_balances and remaining % UNITS_PER_CENT:
+                remaining = _div_half_even(remaining, UNITS_PER_CENT) * UNITS_PER_CENT
+            balance[d] = remaining
+            interest[d], payment[d] = accrued, paid
+            interest_total[d] += accrued
+            paid_total[d] += paid
+            if remaining <= threshold and payoff_month[d] == 0:
+                payoff_month[d] = month
+
+        # Extra payment on the first debt still owing in priority order
+        available = extra + freed
+        target = next((d for d in order if balance[d] > threshold), None) if available > 0 else None
+        if target is not None:
+            amount = min(available, balance[target])
+            balance[target] -= amount
+            paid_total[target] += amount
+            payment[target] += amount
+            if balance[target] <= threshold:
+                balance[target] = 0
+                payoff_month[target] = month
+                # Snowball effect: a debt cleared with extra money frees its minimum for good
+                freed += minimums[target]
+
+        if record:
+            history["interest"].append(interest)
+            history["payment"].append(payment)
+            history["balance"].append(list(balance))
+
+    return PayoffRun(
+        months=np.array([months]),
+        payoff_month=np.array([payoff_month], dtype=np.int64),
+        balance=np.array([balance], dtype=np.int64),
+        interest=np.array([interest_total], dtype=np.int64),
+        paid=np.array([paid_total], dtype=np.int64),
+        history=_history_arrays(history, 1, n_debts) if record else None,
+    )
+
+
+def _simulate_grid(
+    balance0: list[int],
+    rates: list[int],
+    minimums: list[int],
+    extras: list[int],
+    orders: list[list[int]],
+    *,
+    max_months: int,
+    threshold: int,
+    cent_balances: bool,
+    record: bool,
+) -> PayoffRun:
+    """Every scenario at once on ``(scenario, debt)`` arrays."""
+    n_scenarios, n_debts = len(extras), len(balance0)
+    rates = np.array(rates, dtype=np.int64)
+    minimums = np.array(minimums, dtype=np.int64)
+    extras = np.array(extras, dtype=np.int64)
+    rank = np.empty((n_scenarios, n_debts), dtype=np.int64)
+    for s, order in enumerate(orders):
+        rank[s, order] = np.arange(n_debts)
+
+    rows = np.arange(n_scenarios)
+    balance = np.tile(np.array(balance0, dtype=np.int64), (n_scenarios, 1))
+    interest_total = np.zeros_like(balance)
+    paid_total = np.zeros_like(balance)
+    payoff_month = np.zeros_like(balance)
+    freed = np.zeros(n_scenarios, dtype=np.int64)
+    months = np.full(n_scenarios, max_months, dtype=np.int64)
+    running = np.ones(n_scenarios, dtype=bool)
+    product_limit = _INT64_MAX // max(int(rates.max(initial=0)), 1)
+    history: dict[str, list] = {"interest": [], "payment": [], "balance": []}
+
+    for month in range(1, max_months + 1):
+        owing = balance > threshold
+        finished = running & ~owing.any(axis=1)
+        months[finished] = month
+        running &= ~finished
+        if not running.any():
+            break
+        owing &= running[:, None]
+
+        # Minimum payments and interest on every open debt
+        if balance.max(initial=0) <= product_limit:
+            accrued = balance * rates
+        else:  # Beyond int64: exact Python integers for this month
+            accrued = balance.astype(object) * rates.astype(object)
+        interest = (_div_half_even(accrued, _INTEREST_DIVISOR) * UNITS_PER_CENT).astype(np.int64)
+        interest *= owing
+        payment = np.minimum(minimums, balance + interest) * owing
+        balance = np.maximum(balance - (payment - interest), 0)
+        if cent_balances:
+            rounded = _div_half_even(balance, UNITS_PER_CENT) * UNITS_PER_CENT
+            balance = np.where(owing, rounded, balance)
+        interest_total += interest
+        paid_total += payment
+        payoff_month[owing & (balance <= threshold) & (payoff_month == 0)] = month
+
+        # Extra payment on the first debt still owing in priority order
+        available = extras + freed
+        still_open = (balance > threshold) & running[:, None]
+        target = np.where(still_open, rank, n_debts).argmin(axis=1)
+        apply = still_open.any(axis=1) & (available > 0)
+        if apply.any():
+            s, d = rows[apply], target[apply]
+            amount = np.minimum(available[apply], balance[s, d])
+            balance[s, d] -= amount
+            paid_total[s, d] += amount
+            payment[s, d] += amount
+            cleared = balance[s, d] <= threshold
+            s, d = s[cleared], d[cleared]
+            balance[s, d] = 0
+            payoff_month[s, d] = month
+            # Snowball effect: a debt cleared with extra money frees its minimum for good
+            np.add.at(freed, s, minimums[d])
+
+        if record:
+            history["interest"].append(interest)
+            history["payment"].append(payment)
+            history["balance"].append(balance.copy())
+
+    return PayoffRun(
+        months=months,
+        payoff_month=payoff_month,
+        balance=balance,
+        interest=interest_total,
+        paid=paid_total,
+        history=_history_arrays(history, n_scenarios, n_debts) if record else None,
+    )
+
+
+def _history_arrays(history: dict[str, list], n_scenarios: int, n_debts: int) -> dict:
+    return {
+        k: np.array(v, dtype=np.int64).reshape(-1, n_scenarios, n_debts) for k, v in history.items()
+    }
+
+
+def _stack(runs: list[PayoffRun], n_debts: int, record: bool) -> PayoffRun:
+    """Combine single-scenario runs as if they had run on one grid."""
+    history = None
+    if record:
+        # Scenarios that finish early sit idle (no payments, balance unchanged) meanwhile
+        length = max(len(run.history["payment"]) for run in runs)
+        history = {}
+        for key in ("interest", "payment", "balance"):
+            padded = []
+            for run in runs:
+                values = run.history[key]
+                fill = run.balance if key == "balance" else np.zeros((1, n_debts), np.int64)
+                pad = np.broadcast_to(fill, (length - len(values), 1, n_debts))
+                padded.append(np.concatenate([values, pad]))
+            history[key] = np.concatenate(padded, axis=1)
+    return PayoffRun(
+        months=np.concatenate([run.months for run in runs]),
+        payoff_month=np.concatenate([run.payoff_month for run in runs]),
+        balance=np.concatenate([run.balance for run in runs]),
+        interest=np.concatenate([run.interest for run in runs]),
+        paid=np.concatenate([run.paid for run in runs]),
+        history=history,
+    )
+
+
+def amortization_rows(
+    principal: Number,
+    annual_rate: Number,
+    monthly_payment: Number,
+    *,
+    max_months: int = DEBT.MAX_PAYOFF_MONTHS,
+    paid_off_at: Number = Decimal("0.01"),
+    cent_balances: bool = True,
+) -> list[tuple[int, float, float, float, float]]:
+    """``(month, payment, principal, interest, balance)`` for one level-payment loan.
+
+    Rows stop after the payment that brings the balance to ``paid_off_at``
+    or below; the final payment is capped at the balance plus interest.
+    """
+    run = simulate_payoffs(
+        [principal],
+        [annual_rate],
+        [monthly_payment],
+        max_months=max_months,
+        paid_off_at=paid_off_at,
+        cent_balances=cent_balances,
+        record=True,
+    )
+    # One debt: history stops the month after payoff, so every row is a payment
+    payments, interest, balance = (
+        run.history[k][:, 0, 0].tolist() for k in ("payment", "interest", "balance")
+    )
+    return [
+        (
+            month,
+            p / UNITS_PER_DOLLAR,
+            (p - i) / UNITS_PER_DOLLAR,
+            i / UNITS_PER_DOLLAR,
+            b / UNITS_PER_DOLLAR,
+        )
+        for month, p, i, b in zip(range(1, len(payments) + 1), payments, interest, balance)
+    ]
+
+
+def level_payment_months(
+    balances: Sequence[Number], annual_rates: Sequence[Number], payments: Sequence[Number]
+) -> np.ndarray:
+    """Closed-form months to retire each level-payment loan.
+
+    ``n = -log(1 - r*P/M) / log(1 + r)`` rounded up and capped at
+    NEVER_PAID_OFF, which is also returned when the payment does not cover
+    the first month's interest.  Zero-rate loans take ``ceil(P / M)``.
+    """
+    balance = np.asarray([float(b) for b in balances])
+    rate = np.asarray([float(r) for r in annual_rates]) / 100 / 12
+    payment = np.asarray([float(p) for p in payments])
+
+    # Interest-free loans: ceil(P / M) on the Decimal quotient
+    interest_free = np.array(
+        [
+            math.ceil(float(Decimal(str(b)) / Decimal(str(p)))) if Decimal(str(p)) > 0 else 0
+            for b, p in zip(balances, payments)
+        ]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = 1 - rate * balance / payment
+        amortizing = np.minimum(np.ceil(-np.log(ratio) / np.log(1 + rate)), NEVER_PAID_OFF)
+
+    months = np.where(rate == 0, interest_free, amortizing)
+    months = np.where((rate > 0) & (payment <= balance * rate), NEVER_PAID_OFF, months)
+    months = np.where(payment <= 0, NEVER_PAID_OFF, months)
+    months = np.where(balance <= 0, 0, months)
+    return np.nan_to_num(months, nan=NEVER_PAID_OFF).astype(np.int64)
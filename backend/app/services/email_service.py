@@ -141,16 +141,8 @@ class EmailService:
             )
             return False
 
-        # Strip CR/LF to prevent email header injection via Subject or To fields.
-        subject = subject.replace("\r", "").replace("\n", "")
-        to_email = to_email.replace("\r", "").replace("\n", "")
-
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = f"{self._from_name} <{self._from_email}>"
-        msg["To"] = to_email
-        msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
+        msg = self.build_message(to_email, subject, html_body, text_body)
+        to_email, subject = msg["To"], msg["Subject"]
 
         try:
             await aiosmtplib.send(
@@ -168,6 +160,40 @@ class EmailService:
             logger.error("Failed to send email to %s: %s", redact_email(to_email), exc)
             return False
 
+    def build_message(
+        self, to_email: str, subject: str, html_body: str, text_body: str
+    ) -> MIMEMultipart:
+        """Build the multipart/alternative message sent by every path."""
+        # Strip CR/LF to prevent email header injection via Subject or To fields.
+        subject = subject.replace("\r", "").replace("\n", "")
+        to_email = to_email.replace("\r", "").replace("\n", "")
+
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = f"{self._from_name} <{self._from_email}>"
+        msg["To"] = to_email
+        msg.attach(MIMEText(text_body, "plain"))
+        msg.attach(MIMEText(html_body, "html"))
+        return msg
+
+    async def open_connection(self, timeout: float = 30) -> aiosmtplib.SMTP:
+        """Open an authenticated SMTP session for sending many messages.
+
+        Used by the bulk dispatcher's connection pool; the caller must
+        ``quit()`` it.  ``send_email`` keeps one session per message.
+        """
+        smtp = aiosmtplib.SMTP(
+            hostname=self._host,
+            port=self._port,
+            use_tls=False,  # SSL on port 465
+            start_tls=self._use_tls,  # STARTTLS on port 587 (default)
+            timeout=timeout,
+        )
+        await smtp.connect()
+        if self._username:
+            await smtp.login(self._username, self._password)
+        return smtp
+
     async def send_verification_email(self, to_email: str, token: str, display_name: str) -> bool:
         """Send an email-address verification link."""
         verify_url = f"{self._base_url}/verify-email?token={token}"
@@ -294,6 +320,19 @@ class EmailService:
 
         Returns True on success, False on failure (never raises).
         """
+        subject, html_body, text_body = self.render_notification_email(
+            title, message, action_url, action_label
+        )
+        return await self.send_email(to_email, subject, html_body, text_body)
+
+    def render_notification_email(
+        self,
+        title: str,
+        message: str,
+        action_url: Optional[str] = None,
+        action_label: Optional[str] = None,
+    ) -> tuple[str, str, str]:
+        """Return ``(subject, html_body, text_body)`` for a notification email."""
         # Build optional action button HTML
         safe_title = html.escape(title)
         safe_message = html.escape(message)
@@ -334,7 +373,7 @@ class EmailService:
             f"You received this email because you have email notifications enabled in Nest Egg.\n"
             f"You can disable them in Settings."
         )
-        return await self.send_email(to_email, subject, html_body, text_body)
+        return subject, html_body, text_body
 
 
 # Module-level singleton — constructed once from loaded settings
@@ -16,7 +16,15 @@ from app.models.account import Account
 from app.models.dividend import DividendIncome
 from app.models.holding import Holding
 from app.models.net_worth_snapshot import NetWorthSnapshot
+from app.models.portfolio_snapshot import PortfolioSnapshot
 from app.models.transaction import Transaction
+from app.services.history_downsampling import load_series
+from app.services.performance_returns import (
+    annualize,
+    money_weighted_return,
+    time_weighted_return,
+)
+from app.utils.account_type_groups import INVESTMENT_ACCOUNT_TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +45,14 @@ class EnhancedTrendsService:
         user_id: Optional[UUID] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        resolution: str = "auto",
+        max_points: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get net worth history time series from snapshots.
 
-        Returns daily data points with asset/liability breakdown.
+        Returns data points with asset/liability breakdown — daily, or weekly
+        or monthly closing values for ranges longer than the point budget
+        (see ``history_downsampling.load_series``).
         """
         if end_date is None:
             end_date = date.today()
@@ -57,12 +69,31 @@ class EnhancedTrendsService:
         else:
             conditions.append(NetWorthSnapshot.user_id.is_(None))
 
-        result = await self.db.execute(
-            select(NetWorthSnapshot)
-            .where(and_(*conditions))
-            .order_by(NetWorthSnapshot.snapshot_date)
+        snapshots, resolution = await load_series(
+            self.db,
+            [
+                NetWorthSnapshot.snapshot_date,
+                NetWorthSnapshot.total_net_worth,
+                NetWorthSnapshot.total_assets,
+                NetWorthSnapshot.total_liabilities,
+                NetWorthSnapshot.cash_and_checking,
+                NetWorthSnapshot.savings,
+                NetWorthSnapshot.investments,
+                NetWorthSnapshot.retirement,
+                NetWorthSnapshot.property,
+                NetWorthSnapshot.credit_cards,
+                NetWorthSnapshot.loans,
+                NetWorthSnapshot.student_loans,
+                NetWorthSnapshot.mortgages,
+            ],
+            conditions,
+            date_column=NetWorthSnapshot.snapshot_date,
+            value_column=NetWorthSnapshot.total_net_worth,
+            start_date=start_date,
+            end_date=end_date,
+            resolution=resolution,
+            max_points=max_points,
         )
-        snapshots = list(result.scalars().all())
 
         data_points = []
         for s in snapshots:
@@ -75,7 +106,7 @@ class EnhancedTrendsService:
                     "cash": float((s.cash_and_checking or 0) + (s.savings or 0)),
                     "investments": float(s.investments or 0),
                     "retirement": float(s.retirement or 0),
-                    "property": float(getattr(s, "property", 0) or 0),
+                    "property": float(s.property or 0),
                     "credit_cards": float(s.credit_cards or 0),
                     "loans": float((s.loans or 0) + (s.student_loans or 0)),
                     "mortgages": float(s.mortgages or 0),
@@ -100,6 +131,7 @@ class EnhancedTrendsService:
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
             "snapshot_count": len(data_points),
+            "resolution": resolution,
         }
 
     # ------------------------------------------------------------------
@@ -110,10 +142,16 @@ class EnhancedTrendsService:
         self,
         organization_id: UUID,
         account_ids: Optional[List[UUID]] = None,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> Dict[str, Any]:
         """Get investment portfolio performance metrics.
 
-        Computes total gain/loss, weighted return, and per-holding performance.
+        Computes total gain/loss, weighted return, and per-holding performance,
+        plus time- and money-weighted returns over the window (default: the
+        trailing year) from portfolio snapshots and transfers in and out of
+        investment accounts.
         """
         conditions = [
             Holding.organization_id == organization_id,
@@ -178,6 +216,77 @@ class EnhancedTrendsService:
             "holdings": holding_performance,
             "top_winners": winners,
             "top_losers": losers,
+            "period_returns": await self._period_returns(
+                organization_id, account_ids, user_id, start_date, end_date
+            ),
+        }
+
+    async def _period_returns(
+        self,
+        organization_id: UUID,
+        account_ids: Optional[List[UUID]],
+        user_id: Optional[UUID],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Dict[str, Any]:
+        """TWR / MWR over a window from snapshot valuations and external transfers."""
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=365)
+
+        snapshot_conditions = [
+            PortfolioSnapshot.organization_id == organization_id,
+            PortfolioSnapshot.snapshot_date >= start_date,
+            PortfolioSnapshot.snapshot_date <= end_date,
+        ]
+        if user_id:
+            snapshot_conditions.append(PortfolioSnapshot.user_id == user_id)
+        else:
+            snapshot_conditions.append(PortfolioSnapshot.user_id.is_(None))
+        snapshot_result = await self.db.execute(
+            select(PortfolioSnapshot.snapshot_date, PortfolioSnapshot.total_value)
+            .where(and_(*snapshot_conditions))
+            .order_by(PortfolioSnapshot.snapshot_date)
+        )
+        valuations = [(d, float(v)) for d, v in snapshot_result.all()]
+
+        # Transfers into (positive) and out of (negative) investment accounts
+        flow_conditions = [
+            Transaction.organization_id == organization_id,
+            Transaction.is_transfer.is_(True),
+            Transaction.date > start_date,
+            Transaction.date <= end_date,
+            Account.account_type.in_(INVESTMENT_ACCOUNT_TYPES),
+        ]
+        if account_ids:
+            flow_conditions.append(Transaction.account_id.in_(account_ids))
+        flow_result = await self.db.execute(
+            select(Transaction.date, func.sum(Transaction.amount))
+            .join(Account, Account.id == Transaction.account_id)
+            .where(and_(*flow_conditions))
+            .group_by(Transaction.date)
+        )
+        flows = [(d, float(amount)) for d, amount in flow_result.all()]
+
+        twr = time_weighted_return(valuations, flows)
+        days = (valuations[-1][0] - valuations[0][0]).days if len(valuations) >= 2 else 0
+        twr_annualized = annualize(twr, days)
+        mwr = money_weighted_return(valuations, flows)
+
+        def pct(value: Optional[float]) -> Optional[float]:
+            return round(value * 100, 2) if value is not None else None
+
+        return {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "snapshot_count": len(valuations),
+            "net_contributions": round(
+                sum(a for d, a in flows if valuations and d > valuations[0][0]), 2
+            ),
+            "twr_pct": pct(twr),
+            "twr_annualized_pct": pct(twr_annualized),
+            "mwr_pct": pct(mwr),
         }
 
     # ------------------------------------------------------------------
@@ -14,6 +14,7 @@ from sqlalchemy import and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants.financial import HEALTH
+from app.core.session_fanout import SessionFanOut
 from app.models.account import Account
 from app.models.transaction import Transaction
 from app.models.user import User
@@ -260,6 +261,65 @@ def _build_recommendations(components: Dict[str, Dict[str, Any]]) -> List[str]:
     return recs
 
 
+# ---------------------------------------------------------------------------
+# Data fetchers (each takes its own session so they can run concurrently)
+# ---------------------------------------------------------------------------
+
+
+async def _fetch_accounts(
+    db: AsyncSession, organization_id: str, account_ids: Optional[List[UUID]]
+) -> list[Account]:
+    conditions = [
+        Account.organization_id == organization_id,
+        Account.is_active.is_(True),
+    ]
+    if account_ids is not None:
+        conditions.append(Account.id.in_(account_ids))
+    result = await db.execute(select(Account).where(and_(*conditions)))
+    return list(result.scalars().all())
+
+
+async def _fetch_three_month_cash_flow(
+    db: AsyncSession, organization_id: str, account_ids: Optional[List[UUID]]
+) -> tuple[Decimal, Decimal]:
+    """(income, expenses) over the three full months before this one."""
+    now = utc_now()
+    three_months_ago = date(now.year, now.month, 1) - timedelta(days=90)
+    end = date(now.year, now.month, 1) - timedelta(days=1)  # end of last month
+
+    txn_conditions = [
+        Transaction.organization_id == organization_id,
+        Transaction.date >= three_months_ago,
+        Transaction.date <= end,
+    ]
+    if account_ids is not None:
+        txn_conditions.append(Transaction.account_id.in_(account_ids))
+
+    txn_result = await db.execute(
+        select(
+            func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0)).label("income"),
+            func.sum(case((Transaction.amount < 0, Transaction.amount), else_=0)).label("expenses"),
+        ).where(and_(*txn_conditions))
+    )
+    row = txn_result.one()
+    total_income = row.income if row.income else Decimal(0)
+    total_expenses = abs(row.expenses) if row.expenses else Decimal(0)
+    return total_income, total_expenses
+
+
+async def _fetch_age(db: AsyncSession, user_id: Optional[UUID]) -> Optional[int]:
+    """User's age in whole years (for the retirement benchmark), if known."""
+    if not user_id:
+        return None
+    user_result = await db.execute(select(User).where(User.id == user_id))
+    user = user_result.scalar_one_or_none()
+    if not (user and user.birthdate):
+        return None
+    today = date.today()
+    bd = user.birthdate
+    return today.year - bd.year - ((today.month, today.day) < (bd.month, bd.day))
+
+
 # ---------------------------------------------------------------------------
 # Main service
 # ---------------------------------------------------------------------------
@@ -289,16 +349,13 @@ class FinancialHealthService:
         account_ids : list[UUID] | None
             Optional pre-filtered account ids (from the household dedup layer).
         """
-        # -- 1. Fetch active accounts -----------------------------------------
-        conditions = [
-            Account.organization_id == organization_id,
-            Account.is_active.is_(True),
-        ]
-        if account_ids is not None:
-            conditions.append(Account.id.in_(account_ids))
-
-        result = await self.db.execute(select(Account).where(and_(*conditions)))
-        accounts: list[Account] = list(result.scalars().all())
+        # -- 1. Accounts, 3-month cash flow and user age are independent ------
+        #       reads: run them concurrently on pooled sessions.
+        accounts, (total_income, total_expenses), age = await SessionFanOut(self.db).gather(
+            lambda s: _fetch_accounts(s, organization_id, account_ids),
+            lambda s: _fetch_three_month_cash_flow(s, organization_id, account_ids),
+            lambda s: _fetch_age(s, user_id),
+        )
 
         # -- 2. Aggregate account balances by category -------------------------
         liquid_savings = Decimal(0)
@@ -323,48 +380,12 @@ class FinancialHealthService:
                 if acct.minimum_payment:
                     monthly_debt_payments += acct.minimum_payment
 
-        # -- 3. Get 3-month average income & expenses --------------------------
-        now = utc_now()
-        three_months_ago = date(now.year, now.month, 1) - timedelta(days=90)
-        end = date(now.year, now.month, 1) - timedelta(days=1)  # end of last month
-
-        txn_conditions = [
-            Transaction.organization_id == organization_id,
-            Transaction.date >= three_months_ago,
-            Transaction.date <= end,
-        ]
-        if account_ids is not None:
-            txn_conditions.append(Transaction.account_id.in_(account_ids))
-
-        txn_result = await self.db.execute(
-            select(
-                func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0)).label(
-                    "income"
-                ),
-                func.sum(case((Transaction.amount < 0, Transaction.amount), else_=0)).label(
-                    "expenses"
-                ),
-            ).where(and_(*txn_conditions))
-        )
-        row = txn_result.one()
-        total_income = row.income if row.income else Decimal(0)
-        total_expenses = abs(row.expenses) if row.expenses else Decimal(0)
-
+        # -- 3. 3-month average income & expenses ------------------------------
         monthly_income = total_income / 3
         monthly_expenses = total_expenses / 3
         monthly_savings = monthly_income - monthly_expenses
         annual_income = monthly_income * 12
 
-        # -- 4. Determine user age (for retirement benchmark) ------------------
-        age: Optional[int] = None
-        if user_id:
-            user_result = await self.db.execute(select(User).where(User.id == user_id))
-            user = user_result.scalar_one_or_none()
-            if user and user.birthdate:
-                today = date.today()
-                bd = user.birthdate
-                age = today.year - bd.year - ((today.month, today.day) < (bd.month, bd.day))
-
         # -- 5. Compute component scores ---------------------------------------
         components = {
             "savings_rate": _savings_rate_score(monthly_savings, monthly_income),
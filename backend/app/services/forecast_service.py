@@ -6,9 +6,10 @@ from collections import defaultdict
 from datetime import date, datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 from decimal import Decimal as D
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 from uuid import UUID
 
+import numpy as np
 from dateutil.relativedelta import relativedelta
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +24,65 @@ from app.services.recurring_detection_service import RecurringDetectionService
 from app.utils.account_type_groups import AMORTIZING_LOAN_TYPES, NET_WORTH_EXCLUDED_BY_DEFAULT
 from app.utils.datetime_utils import utc_now
 
+# Calendar-aware frequency increments (avoids drift from fixed day counts)
+FREQUENCY_DELTAS = {
+    RecurringFrequency.WEEKLY: relativedelta(weeks=1),
+    RecurringFrequency.BIWEEKLY: relativedelta(weeks=2),
+    RecurringFrequency.MONTHLY: relativedelta(months=1),
+    RecurringFrequency.QUARTERLY: relativedelta(months=3),
+    RecurringFrequency.YEARLY: relativedelta(years=1),
+}
+
+# Nightly batch projections: organizations per query batch and cache lifetime
+PROJECTION_BATCH_SIZE = 200
+PROJECTION_CACHE_TTL = 3600
+
+
+class BalanceProjection(NamedTuple):
+    """
+    Projected household balance as a starting balance plus daily net changes.
+
+    ``deltas[i]`` is the net change on ``start_date + i`` days, so the
+    projected balance for each day is ``start_balance + cumsum(deltas)`` —
+    the same running balance generate_forecast reports, without the
+    per-transaction breakdowns.
+    """
+
+    start_date: date
+    start_balance: float
+    deltas: np.ndarray
+
+    def balances(self) -> np.ndarray:
+        # Rounded to cents so float drift on days that net to zero never
+        # reads as a negative balance the Decimal path would not report
+        return np.round(self.start_balance + np.cumsum(self.deltas), 2)
+
+    def first_below(self, threshold: float = 0.0) -> Optional[Tuple[date, float]]:
+        """First (day, projected balance) under *threshold*, or None."""
+        balances = self.balances()
+        below = np.flatnonzero(balances < threshold)
+        if not below.size:
+            return None
+        day = int(below[0])
+        return self.start_date + timedelta(days=day), float(balances[day])
+
+    def to_cache(self) -> Dict:
+        """Sparse form: only the days with a non-zero change are stored."""
+        days = np.flatnonzero(self.deltas)
+        return {
+            "start": self.start_date.isoformat(),
+            "balance": self.start_balance,
+            "length": len(self.deltas),
+            "days": days.tolist(),
+            "deltas": self.deltas[days].tolist(),
+        }
+
+    @classmethod
+    def from_cache(cls, data: Dict) -> "BalanceProjection":
+        deltas = np.zeros(data["length"])
+        deltas[data["days"]] = data["deltas"]
+        return cls(date.fromisoformat(data["start"]), data["balance"], deltas)
+
 
 class ForecastService:
     """Service for forecasting future cash flow."""
@@ -322,81 +382,82 @@ class ForecastService:
         result = await db.execute(select(Account).where(and_(*conditions)))
         accounts = result.scalars().all()
 
-        total = Decimal(0)
         today = utc_now().date()
+        return sum(
+            (ForecastService._account_balance(account, today) for account in accounts),
+            Decimal(0),
+        )
 
-        # Account types that default to excluded from net worth when include_in_networth is None
-
-        for account in accounts:
-            # Check if account should be included
-            include = account.include_in_networth
-            if include is None:
-                # Auto-determine
-                if account.account_type in NET_WORTH_EXCLUDED_BY_DEFAULT:
-                    include = False
-                elif account.account_type in (AccountType.PRIVATE_EQUITY, AccountType.STOCK_OPTIONS):
-                    include = bool(
-                        account.company_status and account.company_status.value == "public"
-                    )
-                else:
-                    include = True
-
-            if not include:
-                continue
+    @staticmethod
+    def _account_balance(account: Account, today: date) -> Decimal:
+        """
+        Contribution of one account to the cash-flow starting balance.
 
-            # Calculate account value
-            # Handle Business Equity accounts
-            if account.account_type == AccountType.BUSINESS_EQUITY:
-                # If direct equity value is provided, use it (Decimal(0) is valid)
-                if account.equity_value is not None:
-                    total += account.equity_value
-                # If company valuation is provided
-                elif account.company_valuation is not None:
-                    # If ownership percentage is also provided, calculate proportional value
-                    if account.ownership_percentage is not None:
-                        total += (
-                            account.company_valuation * account.ownership_percentage
-                        ) / Decimal(100)
-                    # If no percentage provided, assume 100% ownership (use full valuation)
-                    else:
-                        total += account.company_valuation
-                # Fallback to current_balance
-                else:
-                    total += account.current_balance or Decimal(0)
-            # Handle equity accounts (Private Equity + Stock Options) with vesting schedule
-            elif account.account_type in (AccountType.PRIVATE_EQUITY, AccountType.STOCK_OPTIONS) and account.vesting_schedule:
-                # Calculate vested value
-                try:
-                    milestones = json.loads(account.vesting_schedule)
-                    if isinstance(milestones, list):
-                        vested_quantity = Decimal(0)
-                        for milestone in milestones:
-                            vest_date_str = milestone.get("date")
-                            quantity = milestone.get("quantity", 0)
-                            if vest_date_str:
-                                try:
-                                    vest_date = datetime.strptime(vest_date_str, "%Y-%m-%d").date()
-                                    if vest_date <= today:
-                                        vested_quantity += Decimal(str(quantity))
-                                except (ValueError, TypeError):
-                                    continue
-
-                        share_price = account.share_price or Decimal(0)
-                        total += vested_quantity * share_price
-                    else:
-                        total += account.current_balance or Decimal(0)
-                except (json.JSONDecodeError, TypeError):
-                    total += account.current_balance or Decimal(0)
+        Zero for accounts excluded from net worth; debts count negative.
+        """
+        # Check if account should be included
+        include = account.include_in_networth
+        if include is None:
+            # Auto-determine
+            if account.account_type in NET_WORTH_EXCLUDED_BY_DEFAULT:
+                include = False
+            elif account.account_type in (AccountType.PRIVATE_EQUITY, AccountType.STOCK_OPTIONS):
+                include = bool(account.company_status and account.company_status.value == "public")
             else:
-                # Regular account
-                balance = account.current_balance or Decimal(0)
-                # Handle debt accounts (negative contribution)
-                if account.account_type.is_debt:
-                    total -= abs(balance)
-                else:
-                    total += balance
+                include = True
+
+        if not include:
+            return Decimal(0)
+
+        # Calculate account value
+        # Handle Business Equity accounts
+        if account.account_type == AccountType.BUSINESS_EQUITY:
+            # If direct equity value is provided, use it (Decimal(0) is valid)
+            if account.equity_value is not None:
+                return account.equity_value
+            # If company valuation is provided
+            if account.company_valuation is not None:
+                # If ownership percentage is also provided, calculate proportional value
+                if account.ownership_percentage is not None:
+                    return (account.company_valuation * account.ownership_percentage) / Decimal(100)
+                # If no percentage provided, assume 100% ownership (use full valuation)
+                return account.company_valuation
+            # Fallback to current_balance
+            return account.current_balance or Decimal(0)
+
+        # Handle equity accounts (Private Equity + Stock Options) with vesting schedule
+        if (
+            account.account_type in (AccountType.PRIVATE_EQUITY, AccountType.STOCK_OPTIONS)
+            and account.vesting_schedule
+        ):
+            # Calculate vested value
+            try:
+                milestones = json.loads(account.vesting_schedule)
+                if isinstance(milestones, list):
+                    vested_quantity = Decimal(0)
+                    for milestone in milestones:
+                        vest_date_str = milestone.get("date")
+                        quantity = milestone.get("quantity", 0)
+                        if vest_date_str:
+                            try:
+                                vest_date = datetime.strptime(vest_date_str, "%Y-%m-%d").date()
+                                if vest_date <= today:
+                                    vested_quantity += Decimal(str(quantity))
+                            except (ValueError, TypeError):
+                                continue
+
+                    share_price = account.share_price or Decimal(0)
+                    return vested_quantity * share_price
+            except (json.JSONDecodeError, TypeError):
+                pass
+            return account.current_balance or Decimal(0)
 
-        return total
+        # Regular account
+        balance = account.current_balance or Decimal(0)
+        # Handle debt accounts (negative contribution)
+        if account.account_type.is_debt:
+            return -abs(balance)
+        return balance
 
     @staticmethod
     def _calculate_future_occurrences(
@@ -419,16 +480,7 @@ class ForecastService:
         current_date = pattern.next_expected_date or date.today()
         end_date = date.today() + timedelta(days=days_ahead)
 
-        # Calendar-aware frequency increments (avoids drift from fixed day counts)
-        frequency_deltas = {
-            RecurringFrequency.WEEKLY: relativedelta(weeks=1),
-            RecurringFrequency.BIWEEKLY: relativedelta(weeks=2),
-            RecurringFrequency.MONTHLY: relativedelta(months=1),
-            RecurringFrequency.QUARTERLY: relativedelta(months=3),
-            RecurringFrequency.YEARLY: relativedelta(years=1),
-        }
-
-        delta = frequency_deltas.get(pattern.frequency, relativedelta(months=1))
+        delta = FREQUENCY_DELTAS.get(pattern.frequency, relativedelta(months=1))
 
         # Resolve category: custom category > provider category > None
         if pattern.category:
@@ -854,6 +906,168 @@ class ForecastService:
 
         return None
 
+    @staticmethod
+    async def project_balances(
+        db: AsyncSession,
+        organization_ids: Sequence[UUID],
+        days_ahead: int = 30,
+    ) -> Dict[UUID, BalanceProjection]:
+        """
+        Household balance projections for many organizations at once.
+
+        The batch counterpart of generate_forecast for jobs that only need
+        the running balance: accounts and recurring patterns for the whole
+        batch are loaded with one query each, every projected event is
+        bucketed into a per-day delta array, and balances are its cumulative
+        sum.  Categories, labels and merchants are never resolved, and an
+        organization without recurring patterns is projected from its
+        account events alone rather than triggering pattern detection.
+
+        Projections are cached as compact deltas for PROJECTION_CACHE_TTL
+        seconds, so a retried or repeated run skips the recomputation.
+
+        Args:
+            db: Database session
+            organization_ids: Organizations to project
+            days_ahead: Number of days to forecast
+
+        Returns:
+            Projection per organization ID
+        """
+        today = date.today()
+        projections: Dict[UUID, BalanceProjection] = {}
+        pending: List[UUID] = []
+        for organization_id in organization_ids:
+            cached = await cache.get(f"forecast:deltas:{organization_id}:{days_ahead}")
+            if cached is not None and cached["start"] == today.isoformat():
+                projections[organization_id] = BalanceProjection.from_cache(cached)
+            else:
+                pending.append(organization_id)
+        if not pending:
+            return projections
+
+        accounts_by_org: Dict[UUID, List[Account]] = defaultdict(list)
+        result = await db.execute(
+            select(Account).where(
+                Account.organization_id.in_(pending),
+                Account.is_active.is_(True),
+            )
+        )
+        for account in result.scalars():
+            accounts_by_org[account.organization_id].append(account)
+
+        # Column projection: only what the occurrence dates and amounts need
+        patterns_by_org: Dict[UUID, list] = defaultdict(list)
+        result = await db.execute(
+            select(
+                RecurringTransaction.organization_id,
+                RecurringTransaction.next_expected_date,
+                RecurringTransaction.frequency,
+                RecurringTransaction.average_amount,
+            ).where(
+                RecurringTransaction.organization_id.in_(pending),
+                RecurringTransaction.is_active.is_(True),
+            )
+        )
+        for row in result:
+            patterns_by_org[row.organization_id].append(row)
+
+        end_date = today + timedelta(days=days_ahead)
+        balance_date = utc_now().date()
+        for organization_id in pending:
+            accounts = accounts_by_org.get(organization_id, [])
+            offsets: List[int] = []
+            amounts: List[float] = []
+
+            for pattern in patterns_by_org.get(organization_id, ()):
+                step = FREQUENCY_DELTAS.get(pattern.frequency, relativedelta(months=1))
+                amount = float(pattern.average_amount)
+                current_date = pattern.next_expected_date or today
+                while current_date <= end_date:
+                    offsets.append((current_date - today).days)
+                    amounts.append(amount)
+                    current_date += step
+
+            for events in (
+                ForecastService._get_future_vesting_events(accounts, days_ahead),
+                ForecastService._get_future_private_debt_events(accounts, days_ahead),
+                ForecastService._get_future_cd_maturity_events(accounts, days_ahead),
+                ForecastService._get_mortgage_payment_events(accounts, days_ahead),
+                ForecastService._get_bond_coupon_events(accounts, days_ahead),
+                ForecastService._get_pension_annuity_income_events(accounts, days_ahead),
+            ):
+                for event in events:
+                    offsets.append((event["date"] - today).days)
+                    amounts.append(float(event["amount"]))
+
+            # Occurrences still dated before today never land on a forecast day
+            day_offsets = np.asarray(offsets, dtype=np.int64)
+            in_range = (day_offsets >= 0) & (day_offsets <= days_ahead)
+            deltas = np.bincount(
+                day_offsets[in_range],
+                weights=np.asarray(amounts, dtype=np.float64)[in_range],
+                minlength=days_ahead + 1,
+            )
+            start_balance = sum(
+                (
+                    ForecastService._account_balance(account, balance_date)
+                    for account in accounts
+                    if not account.exclude_from_cash_flow
+                ),
+                Decimal(0),
+            )
+            projection = BalanceProjection(today, float(start_balance), deltas)
+            projections[organization_id] = projection
+            await cache.setex(
+                f"forecast:deltas:{organization_id}:{days_ahead}",
+                PROJECTION_CACHE_TTL,
+                projection.to_cache(),
+            )
+
+        return projections
+
+    @staticmethod
+    async def check_negative_balance_alerts(
+        db: AsyncSession,
+        organization_ids: Sequence[UUID],
+        days_ahead: int = 30,
+    ) -> Dict[UUID, Dict]:
+        """
+        Batch form of check_negative_balance_alert for the nightly job.
+
+        Projects every organization in batches of PROJECTION_BATCH_SIZE and
+        creates the same household alert for each one whose balance is
+        projected to go negative.
+
+        Returns:
+            First negative day (``date``, ``projected_balance``) per alerted
+            organization
+        """
+        alerts: Dict[UUID, Dict] = {}
+        for i in range(0, len(organization_ids), PROJECTION_BATCH_SIZE):
+            batch = organization_ids[i : i + PROJECTION_BATCH_SIZE]
+            projections = await ForecastService.project_balances(db, batch, days_ahead)
+            for organization_id, projection in projections.items():
+                negative = projection.first_below(0.0)
+                if negative is None:
+                    continue
+                day = {"date": negative[0].isoformat(), "projected_balance": negative[1]}
+                await NotificationService.create_notification(
+                    db=db,
+                    organization_id=organization_id,
+                    user_id=None,
+                    type=NotificationType.LARGE_TRANSACTION,
+                    title="⚠️ Cash Flow Alert",
+                    message=(
+                        f"Your balance is projected to go negative on "
+                        f"{day['date']} (${day['projected_balance']:.2f})"
+                    ),
+                    priority=NotificationPriority.HIGH,
+                    expires_in_days=7,
+                )
+                alerts[organization_id] = day
+        return alerts
+
     @staticmethod
     def _get_bond_coupon_events(all_accounts: List[Account], days_ahead: int) -> List[Dict]:
         """
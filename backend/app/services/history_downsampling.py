@@ -0,0 +1,146 @@
+"""Downsampled snapshot history for long-range charts.
+
+Net worth and portfolio snapshots are captured daily, so a ten-year chart is
+~3,650 rows.  ``load_series`` keeps the cost of a chart proportional to its
+point budget rather than its range:
+
+* Only the requested columns are selected — never the ``breakdown_json`` /
+  ``snapshot_data`` blobs or the rest of the ORM row.
+* ``weekly`` and ``monthly`` resolutions are aggregated in SQL: a window
+  function keeps the last snapshot of each period (balances are
+  point-in-time, so the period's closing value is the right aggregate) plus
+  the first snapshot in range, so period-over-period change is unchanged.
+* Whatever is left over the point budget is thinned with
+  Largest-Triangle-Three-Buckets (``lttb_indices``), which keeps the peaks
+  and troughs a chart needs and always keeps the first and last points.
+
+``auto`` picks the finest resolution whose period count fits the budget:
+up to ``DEFAULT_MAX_POINTS`` days stays daily (the default one-year charts
+are unchanged), longer ranges step to weekly, then monthly.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+Resolution = Literal["auto", "daily", "weekly", "monthly"]
+
+DEFAULT_MAX_POINTS = 500
+
+_PG_UNITS = {"weekly": "week", "monthly": "month"}
+_SQLITE_FORMATS = {"weekly": "%Y-%W", "monthly": "%Y-%m"}
+
+
+def choose_resolution(start_date: date, end_date: date, max_points: int) -> str:
+    """Finest of daily/weekly/monthly whose period count fits *max_points*."""
+    days = (end_date - start_date).days + 1
+    if days <= max_points:
+        return "daily"
+    if days // 7 + 1 <= max_points:
+        return "weekly"
+    return "monthly"
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> np.ndarray:
+    """Indices of the points Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept; the interior is split into
+    ``threshold - 2`` buckets and each contributes the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average.  *x* must be ascending.
+    """
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Bucket boundaries over the interior points 1..n-2 (integer math keeps
+    # the final boundary exactly at n - 1)
+    bounds = (np.arange(threshold - 1) * (n - 2)) // (threshold - 2) + 1
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = bounds[i], bounds[i + 1]
+        next_stop = bounds[i + 2] if i + 2 < len(bounds) else n
+        avg_x = xs[stop:next_stop].mean()
+        avg_y = ys[stop:next_stop].mean()
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[start:stop] - ys[a]) - (xs[a] - xs[start:stop]) * (avg_y - ys[a])
+        )
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def _period_key(db: AsyncSession, date_column, resolution: str):
+    bind = getattr(db, "bind", None)
+    if bind is not None and bind.dialect.name == "postgresql":
+        return func.date_trunc(_PG_UNITS[resolution], date_column)
+    return func.strftime(_SQLITE_FORMATS[resolution], date_column)
+
+
+async def load_series(
+    db: AsyncSession,
+    columns: Sequence[Any],
+    conditions: Sequence[Any],
+    *,
+    date_column,
+    value_column,
+    start_date: date,
+    end_date: Optional[date] = None,
+    resolution: str = "auto",
+    max_points: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Tuple[List[Any], str]:
+    """Snapshot rows for a chart, ascending by date, and the resolution used.
+
+    *columns* are the model columns to return (they must include
+    *date_column*); rows expose them by attribute name.  *value_column* is
+    the series LTTB preserves the shape of.  ``max_points`` only applies
+    LTTB when given, except under ``auto`` where it defaults to
+    ``DEFAULT_MAX_POINTS``.
+    """
+    if resolution == "auto":
+        max_points = max_points or DEFAULT_MAX_POINTS
+        resolution = choose_resolution(start_date, end_date or date.today(), max_points)
+
+    if resolution == "daily":
+        stmt = select(*columns).where(*conditions).order_by(date_column)
+    else:
+        ranked = (
+            select(
+                *columns,
+                func.row_number()
+                .over(
+                    partition_by=_period_key(db, date_column, resolution),
+                    order_by=date_column.desc(),
+                )
+                .label("period_rank"),
+                func.min(date_column).over().label("first_date"),
+            )
+            .where(*conditions)
+            .subquery()
+        )
+        day = ranked.c[date_column.key]
+        stmt = (
+            select(*(ranked.c[column.key] for column in columns))
+            .where(or_(ranked.c.period_rank == 1, day == ranked.c.first_date))
+            .order_by(day)
+        )
+    if limit:
+        stmt = stmt.limit(limit)
+
+    rows = list((await db.execute(stmt)).all())
+    if max_points and len(rows) > max_points:
+        key = value_column.key
+        x = [getattr(row, date_column.key).toordinal() for row in rows]
+        y = [float(getattr(row, key) or 0) for row in rows]
+        rows = [rows[i] for i in lttb_indices(x, y, max_points)]
+    return rows, resolution
@@ -4,6 +4,7 @@ Uses constants from app.constants.financial.LENDING.
 """
 from decimal import Decimal
 from app.constants.financial import LENDING
+from app.services.debt_payoff_engine import amortization_rows
 
 
 class LoanModelingService:
@@ -52,23 +53,21 @@ class LoanModelingService:
         annual_rate: Decimal,
         term_months: int,
     ) -> list[dict]:
-        """Returns full amortization schedule."""
+        """Returns full amortization schedule (the final payment is capped at what is owed)."""
         monthly_payment = LoanModelingService.calculate_monthly_payment(principal, annual_rate, term_months)
-        r = annual_rate / 12
-        balance = principal
-        schedule = []
-        for month in range(1, term_months + 1):
-            interest = (balance * r).quantize(Decimal("0.01"))
-            principal_paid = monthly_payment - interest
-            balance = max(Decimal("0"), balance - principal_paid)
-            schedule.append({
+        rows = amortization_rows(
+            principal, annual_rate * 100, monthly_payment, max_months=term_months, paid_off_at=0
+        )
+        return [
+            {
                 "month": month,
-                "payment": float(monthly_payment),
-                "principal": float(principal_paid),
-                "interest": float(interest),
-                "balance": float(balance),
-            })
-        return schedule
+                "payment": payment,
+                "principal": principal_paid,
+                "interest": interest,
+                "balance": balance,
+            }
+            for month, payment, principal_paid, interest, balance in rows
+        ]
 
     @staticmethod
     def buy_vs_lease(
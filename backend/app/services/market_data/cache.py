@@ -11,6 +11,10 @@ quote:{symbol}              → QuoteData JSON          TTL = QUOTE_TTL (5 min)
 metadata:{symbol}           → HoldingMetadata JSON    TTL = METADATA_TTL (24 h)
 historical:{symbol}:{interval}:{start}:{end} → [HistoricalPrice] TTL = 7 days
 
+Symbol search is served from the in-process ``symbol_index`` rather than
+Redis, falling through to the provider unless the index holds a full listing
+with a page of matches; see symbol_index.py.
+
 Design constraints
 ------------------
 * Never raise on cache miss or Redis failure — always fall through to provider.
@@ -35,6 +39,7 @@ from .base_provider import (
     QuoteData,
     SearchResult,
 )
+from .symbol_index import DEFAULT_LIMIT, SymbolIndex, symbol_index
 
 logger = logging.getLogger(__name__)
 
@@ -106,8 +111,9 @@ async def _cache_set_metadata(symbol: str, meta: HoldingMetadata) -> None:
 class CachedMarketDataProvider(MarketDataProvider):
     """Transparent caching wrapper around any MarketDataProvider."""
 
-    def __init__(self, provider: MarketDataProvider):
+    def __init__(self, provider: MarketDataProvider, index: Optional[SymbolIndex] = None):
         self._provider = provider
+        self._index = index if index is not None else symbol_index
         self._cb = get_circuit_breaker()
         self._cb_service = provider.get_provider_name().lower().replace(" ", "_")
 
@@ -206,11 +212,25 @@ class CachedMarketDataProvider(MarketDataProvider):
         return meta
 
     # ------------------------------------------------------------------
-    # Pass-through (search is interactive, not worth caching)
+    # Search — answered from the local symbol index when it holds a full
+    # listing and a full page of matches; otherwise index hits come first,
+    # followed by provider results, which are added to the index
     # ------------------------------------------------------------------
 
     async def search_symbol(self, query: str) -> List[SearchResult]:
-        return await self._provider.search_symbol(query)
+        local = self._index.search(query)
+        if self._index.is_complete and len(local) >= DEFAULT_LIMIT:
+            return local
+        try:
+            results = await self._provider.search_symbol(query)
+        except Exception as e:
+            if not local:
+                raise
+            logger.warning("symbol search provider failed, serving index hits: %s", e)
+            return local
+        self._index.add(results)
+        seen = {r.symbol for r in local}
+        return local + [r for r in results if r.symbol.upper() not in seen]
 
     def supports_realtime(self) -> bool:
         return self._provider.supports_realtime()
@@ -0,0 +1,143 @@
+"""Local store of daily closing-price series for historical replays.
+
+Stress-test replays apply a fixed historical window (e.g. Oct 2007 – Mar
+2013) to every symbol a household holds.  Those closes never change, so a
+series only has to be fetched from the provider once per (symbol, window):
+
+* series are kept in memory as ``(day ordinals, closes)`` numpy arrays;
+* when ``PRICE_HISTORY_CACHE_DIR`` is set they are also written there as
+  ``.npz`` files, so a restart does not refetch them;
+* misses are fetched concurrently (at most FETCH_CONCURRENCY at a time)
+  through the cached provider chain; a symbol the provider has no data for
+  is remembered as empty for MISSING_RETRY_SECONDS rather than refetched on
+  every replay.
+
+Lookups never raise — a symbol whose fetch fails simply has no series, and
+the caller falls back to a proxy.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+FETCH_CONCURRENCY = 8
+MISSING_RETRY_SECONDS = 3_600
+
+# (day ordinals ascending, closes) — both 1-D and the same length
+PriceSeries = Tuple[np.ndarray, np.ndarray]
+
+_EMPTY: PriceSeries = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+_UNSAFE_FILENAME = re.compile(r"[^A-Z0-9._-]")
+
+
+class PriceHistoryStore:
+    """Memory (and optionally disk) cache of daily closes per symbol and window."""
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self._cache_dir = cache_dir
+        self._series: Dict[Tuple[str, date, date], PriceSeries] = {}
+        self._missing: Dict[Tuple[str, date, date], float] = {}
+
+    def put(self, symbol: str, start: date, end: date, series: PriceSeries) -> None:
+        """Store *series* for *symbol* over [start, end] (memory and disk)."""
+        key = (symbol.upper(), start, end)
+        self._series[key] = series
+        self._missing.pop(key, None)
+        path = self._path(*key)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                np.savez(path, days=series[0], closes=series[1])
+            except OSError as e:
+                logger.warning("price history cache write failed for %s: %s", symbol, e)
+
+    def get_cached(self, symbol: str, start: date, end: date) -> Optional[PriceSeries]:
+        """Series from memory or disk, or None when it has to be fetched."""
+        key = (symbol.upper(), start, end)
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        missing_at = self._missing.get(key)
+        if missing_at is not None and time.monotonic() - missing_at < MISSING_RETRY_SECONDS:
+            return _EMPTY
+        path = self._path(*key)
+        if path is not None and path.is_file():
+            try:
+                with np.load(path) as data:
+                    series = (data["days"], data["closes"])
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("price history cache read failed for %s: %s", symbol, e)
+                return None
+            self._series[key] = series
+            return series
+        return None
+
+    async def get_many(
+        self, symbols: Iterable[str], start: date, end: date
+    ) -> Dict[str, PriceSeries]:
+        """Series for every symbol over [start, end], fetching only cache misses.
+
+        Symbols without data map to empty arrays.
+        """
+        result: Dict[str, PriceSeries] = {}
+        missing = []
+        for symbol in {s.upper() for s in symbols}:
+            series = self.get_cached(symbol, start, end)
+            if series is None:
+                missing.append(symbol)
+            else:
+                result[symbol] = series
+
+        if missing:
+            semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+            async def fetch(symbol: str) -> PriceSeries:
+                async with semaphore:
+                    return await self._fetch(symbol, start, end)
+
+            for symbol, series in zip(missing, await asyncio.gather(*map(fetch, missing))):
+                result[symbol] = series
+        return result
+
+    async def _fetch(self, symbol: str, start: date, end: date) -> PriceSeries:
+        from .provider_factory import get_market_data_provider
+
+        try:
+            prices = await get_market_data_provider().get_historical_prices(symbol, start, end)
+        except Exception as e:
+            logger.info("price history unavailable for %s: %s", symbol, e)
+            prices = []
+        if not prices:
+            self._missing[(symbol, start, end)] = time.monotonic()
+            return _EMPTY
+
+        prices = sorted(prices, key=lambda p: p.date)
+        series = (
+            np.fromiter((p.date.toordinal() for p in prices), dtype=np.int64, count=len(prices)),
+            np.fromiter(
+                (float(p.adjusted_close or p.close) for p in prices),
+                dtype=np.float64,
+                count=len(prices),
+            ),
+        )
+        self.put(symbol, start, end, series)
+        return series
+
+    def _path(self, symbol: str, start: date, end: date) -> Optional[Path]:
+        if not self._cache_dir:
+            return None
+        name = _UNSAFE_FILENAME.sub("_", symbol)
+        return Path(self._cache_dir) / f"{name}_{start:%Y%m%d}_{end:%Y%m%d}.npz"
+
+
+price_history_store = PriceHistoryStore(settings.PRICE_HISTORY_CACHE_DIR)
@@ -0,0 +1,254 @@
+"""In-process symbol index for typeahead search.
+
+Provider search is a live API call per keystroke (Yahoo even fetches a full
+``Ticker.info``).  ``SymbolIndex`` answers searches from memory instead:
+
+* ``_symbols`` — upper-case tickers, sorted, so a ticker prefix is one
+  ``bisect`` plus a short scan;
+* ``_names`` — ``(suffix, symbol)`` pairs for every word-boundary suffix of
+  each lower-cased name ("vanguard total stock market etf", "total stock
+  market etf", ...), sorted, so "total sto" and "vanguard" both resolve
+  with one ``bisect``.
+
+Entries come from an optional local listing file (``SYMBOL_LISTING_PATH``,
+CSV or pipe-delimited with symbol / name / type / exchange columns), from
+holdings that a provider has priced (public symbols only), named from the
+shared ``metadata:{symbol}`` cache when present, and from provider search
+results as they are returned.  The index is rebuilt at most every
+REFRESH_SECONDS by ``ensure_fresh``; searches never wait on a rebuild
+once it has been loaded.  Without a listing file the index only knows
+symbols seen before, so ``is_complete`` tells callers whether a short
+result list can be trusted.
+"""
+
+import asyncio
+import csv
+import logging
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.holding import Holding
+from app.models.security_classification import SecurityClassification
+
+from .base_provider import SearchResult
+
+logger = logging.getLogger(__name__)
+
+REFRESH_SECONDS = 3_600
+DEFAULT_LIMIT = 10
+
+# Header aliases accepted in listing files (e.g. NASDAQ Trader symbol directories)
+_LISTING_COLUMNS = {
+    "symbol": ("symbol", "ticker", "nasdaq symbol", "act symbol"),
+    "name": ("name", "security name", "company name"),
+    "type": ("type", "asset_type", "quote type"),
+    "exchange": ("exchange", "listing exchange"),
+}
+
+
+class SymbolIndex:
+    """Sorted-array prefix index over symbols and security names."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, SearchResult] = {}
+        self._symbols: List[str] = []
+        self._names: List[tuple[str, str]] = []
+        self._loaded_at: Optional[float] = None
+        self._complete = False
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    @property
+    def is_complete(self) -> bool:
+        """True when the last rebuild included a full listing file."""
+        return self._complete
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> List[SearchResult]:
+        """Exact ticker first, then ticker-prefix matches, then name-prefix matches."""
+        query = " ".join(query.split())
+        if not query:
+            return []
+        entries, symbols, names = self._entries, self._symbols, self._names
+
+        found: List[str] = []
+        seen = set()
+
+        def take(symbol: str) -> bool:
+            if symbol not in seen:
+                seen.add(symbol)
+                found.append(symbol)
+            return len(found) >= limit
+
+        upper = query.upper()
+        if upper in entries and take(upper):
+            return [entries[s] for s in found]
+
+        i = bisect_left(symbols, upper)
+        while i < len(symbols) and symbols[i].startswith(upper):
+            if take(symbols[i]):
+                return [entries[s] for s in found]
+            i += 1
+
+        lower = query.lower()
+        i = bisect_left(names, (lower, ""))
+        while i < len(names) and names[i][0].startswith(lower):
+            if take(names[i][1]):
+                break
+            i += 1
+        return [entries[s] for s in found]
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def replace(self, results: Iterable[SearchResult], complete: bool = False) -> None:
+        """Swap in a new set of entries (later duplicates of a symbol win).
+
+        *complete* marks the entries as a full listing rather than only the
+        symbols seen so far.
+        """
+        self._publish(_keyed(results))
+        self._complete = complete
+        self._loaded_at = time.monotonic()
+
+    def add(self, results: Iterable[SearchResult]) -> None:
+        """Merge entries (e.g. fresh provider search results) into the index."""
+        new = _keyed(results)
+        if not new:
+            return
+        self._publish({**self._entries, **new})
+
+    def _publish(self, entries: Dict[str, SearchResult]) -> None:
+        names = []
+        for symbol, result in entries.items():
+            words = result.name.lower().split() if result.name else []
+            names.extend((" ".join(words[i:]), symbol) for i in range(len(words)))
+        names.sort()
+        # Assign together so concurrent searches see one consistent snapshot
+        self._entries, self._symbols, self._names = entries, sorted(entries), names
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """Rebuild when never loaded or older than REFRESH_SECONDS; never raises."""
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < REFRESH_SECONDS:
+            return
+        if self._lock.locked() and self.is_loaded:
+            return  # Another request is rebuilding; serve the current snapshot
+        async with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < REFRESH_SECONDS:
+                return
+            try:
+                self.replace(await load_symbol_listing(db), complete=_listing_file() is not None)
+                logger.info("symbol index rebuilt: %d symbols", len(self))
+            except Exception as e:
+                logger.warning("symbol index rebuild failed: %s", e)
+                # Back off for a full interval instead of retrying on every keystroke
+                self._loaded_at = time.monotonic()
+
+
+def _keyed(results: Iterable[SearchResult]) -> Dict[str, SearchResult]:
+    """Entries by upper-case symbol, with the symbol itself upper-cased."""
+    entries = {}
+    for r in results:
+        if r.symbol:
+            symbol = r.symbol.upper()
+            entries[symbol] = r if r.symbol == symbol else r.model_copy(update={"symbol": symbol})
+    return entries
+
+
+def _listing_file() -> Optional[str]:
+    """SYMBOL_LISTING_PATH when it names an existing file."""
+    path = settings.SYMBOL_LISTING_PATH
+    return path if path and Path(path).is_file() else None
+
+
+def read_listing_file(path: str) -> List[SearchResult]:
+    """Parse a CSV / pipe-delimited listing of symbols and names."""
+    with open(path, newline="", encoding="utf-8") as f:
+        header = f.readline()
+        delimiter = "|" if header.count("|") > header.count(",") else ","
+        columns = [c.strip().lower() for c in next(csv.reader([header], delimiter=delimiter))]
+        index = {
+            field: next((columns.index(a) for a in aliases if a in columns), None)
+            for field, aliases in _LISTING_COLUMNS.items()
+        }
+        if index["symbol"] is None or index["name"] is None:
+            raise ValueError(f"{path}: listing needs symbol and name columns")
+
+        def cell(row: List[str], field: str) -> Optional[str]:
+            i = index[field]
+            if i is None or i >= len(row):
+                return None
+            return row[i].strip() or None
+
+        results = []
+        for row in csv.reader(f, delimiter=delimiter):
+            symbol, name = cell(row, "symbol"), cell(row, "name")
+            if not symbol or not name or symbol.startswith("File Creation Time"):
+                continue
+            results.append(
+                SearchResult(
+                    symbol=symbol.upper(),
+                    name=name,
+                    type=(cell(row, "type") or "stock").lower(),
+                    exchange=cell(row, "exchange"),
+                )
+            )
+        return results
+
+
+async def load_symbol_listing(db: AsyncSession) -> List[SearchResult]:
+    """Provider-priced holdings named from the metadata cache, then listing file entries.
+
+    Holding names and types are organization-editable, so they are never
+    indexed; a symbol missing from the metadata cache is named by its ticker
+    until the listing file or a provider search supplies a name.
+    """
+    from .cache import _cache_get_metadata
+
+    results: List[SearchResult] = []
+
+    # Only symbols a provider has quoted — manual holdings stay private
+    rows = await db.execute(
+        select(func.upper(Holding.ticker), func.max(SecurityClassification.asset_type))
+        .outerjoin(
+            SecurityClassification,
+            SecurityClassification.ticker == func.upper(Holding.ticker),
+        )
+        .where(Holding.price_as_of.isnot(None))
+        .group_by(func.upper(Holding.ticker))
+    )
+    held = rows.all()
+    metadata = await asyncio.gather(*(_cache_get_metadata(ticker) for ticker, _ in held))
+    for (ticker, asset_type), meta in zip(held, metadata):
+        name = None
+        if meta is not None:
+            name = meta.name
+            asset_type = meta.asset_type or asset_type
+        results.append(
+            SearchResult(symbol=ticker, name=name or ticker, type=(asset_type or "stock").lower())
+        )
+
+    # Listing entries last so their official names win over ticker placeholders
+    listing_path = _listing_file()
+    if listing_path:
+        results.extend(await asyncio.to_thread(read_listing_file, listing_path))
+    return results
+
+
+symbol_index = SymbolIndex()
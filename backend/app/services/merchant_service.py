@@ -0,0 +1,268 @@
+"""Normalized merchant dimension.
+
+Banks spell one merchant many ways ("STARBUCKS #1234", "Starbucks #88",
+"SQ *STARBUCKS").  Each organization gets one ``Merchant`` per
+``merchant_key`` and one ``MerchantAlias`` per raw spelling, and
+``Transaction.merchant_id`` points at the merchant.  Typeahead, recurring
+detection, subscription history and rule runs read that small indexed table
+instead of grouping or scanning raw ``merchant_name`` strings.
+
+- ``assign_merchants`` resolves transactions at ingest (sync, CSV import,
+  manual entry, edits) and adjusts usage counts;
+- writers that change ``merchant_name`` without resolving (rule actions,
+  bulk undo, provider updates) clear ``merchant_id`` instead;
+- ``reconcile_merchants`` (nightly) resolves every transaction still
+  without a merchant and recomputes usage counts.
+
+``merchant_id`` is therefore either NULL or the merchant of the current
+``merchant_name``; readers treat NULL as "not yet resolved".
+"""
+
+import logging
+import re
+import uuid
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.merchant import Merchant, MerchantAlias
+from app.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+_CHUNK = 1000
+_MAX_NAME = 255
+
+# Card-processor prefixes: "SQ *", "TST* ", "PAYPAL *", ...
+_PROCESSOR_PREFIX_RE = re.compile(r"^(?:sq|tst|sp|pp|paypal|pos|py|dd|ddr|in)\s*\*\s*")
+_STORE_NUMBER_RE = re.compile(r"\s*#\s*\d.*$")
+_TOKEN_RE = re.compile(r"[a-z0-9&']+")
+
+
+def merchant_key(name: Optional[str]) -> str:
+    """Normalized grouping key for a raw merchant name ("" when it has none).
+
+    Lower-cased, card-processor prefix and "#<store number>" tails removed,
+    and tokens containing digits (store, terminal and order numbers)
+    dropped: "SQ *BLUE BOTTLE #12" and "Blue Bottle" share "blue bottle".
+    """
+    if not name:
+        return ""
+    text = _PROCESSOR_PREFIX_RE.sub("", name.strip().lower())
+    text = _STORE_NUMBER_RE.sub("", text)
+    tokens = _TOKEN_RE.findall(text)
+    words = [t for t in tokens if not any(c.isdigit() for c in t)]
+    return " ".join(words or tokens)[:_MAX_NAME]
+
+
+def _display_name(name: str) -> str:
+    return " ".join(name.split())[:_MAX_NAME]
+
+
+def _insert(db: AsyncSession):
+    bind = getattr(db, "bind", None)
+    return sqlite_insert if bind is not None and bind.dialect.name == "sqlite" else pg_insert
+
+
+def merchant_condition(merchant_id: Optional[UUID], merchant_name: str):
+    """Transactions of a merchant when known, else of one exact spelling."""
+    if merchant_id is not None:
+        return Transaction.merchant_id == merchant_id
+    return Transaction.merchant_name == merchant_name
+
+
+async def resolve_merchant_names(
+    db: AsyncSession, organization_id: UUID, names: Iterable[str]
+) -> Dict[str, UUID]:
+    """Merchant id for each raw name, creating merchants and aliases as needed.
+
+    The first spelling of a new merchant becomes its display name.  Inserts
+    ignore conflicts, so concurrent syncs of one organization agree on ids.
+    """
+    names = list(dict.fromkeys(n for n in names if n and merchant_key(n)))
+    resolved: Dict[str, UUID] = {}
+    for start in range(0, len(names), _CHUNK):
+        result = await db.execute(
+            select(MerchantAlias.name, MerchantAlias.merchant_id).where(
+                MerchantAlias.organization_id == organization_id,
+                MerchantAlias.name.in_(names[start : start + _CHUNK]),
+            )
+        )
+        resolved.update(result.all())
+
+    missing = [n for n in names if n not in resolved]
+    if not missing:
+        return resolved
+
+    display: Dict[str, str] = {}
+    for name in missing:
+        display.setdefault(merchant_key(name), _display_name(name))
+    insert = _insert(db)
+    keys = list(display)
+    key_ids: Dict[str, UUID] = {}
+    for start in range(0, len(keys), _CHUNK):
+        chunk = keys[start : start + _CHUNK]
+        await db.execute(
+            insert(Merchant)
+            .values(
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "organization_id": organization_id,
+                        "name": display[key],
+                        "normalized_name": key,
+                        "transaction_count": 0,
+                    }
+                    for key in chunk
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["organization_id", "normalized_name"])
+        )
+        result = await db.execute(
+            select(Merchant.normalized_name, Merchant.id).where(
+                Merchant.organization_id == organization_id,
+                Merchant.normalized_name.in_(chunk),
+            )
+        )
+        key_ids.update(result.all())
+
+    aliases = [
+        {
+            "organization_id": organization_id,
+            "name": name,
+            "merchant_id": key_ids[merchant_key(name)],
+        }
+        for name in missing
+    ]
+    for start in range(0, len(aliases), _CHUNK):
+        await db.execute(
+            insert(MerchantAlias)
+            .values(aliases[start : start + _CHUNK])
+            .on_conflict_do_nothing(index_elements=["organization_id", "name"])
+        )
+    resolved.update((row["name"], row["merchant_id"]) for row in aliases)
+    return resolved
+
+
+async def assign_merchants(
+    db: AsyncSession, organization_id: UUID, transactions: Iterable[Transaction]
+) -> int:
+    """Point each transaction at the merchant of its merchant_name.
+
+    Moves usage counts from a transaction's previous merchant to its new
+    one.  Returns the number of transactions whose merchant changed.
+    """
+    transactions = list(transactions)
+    resolved = await resolve_merchant_names(
+        db, organization_id, (t.merchant_name for t in transactions)
+    )
+
+    deltas: Dict[UUID, int] = defaultdict(int)
+    last_seen: Dict[UUID, date] = {}
+    changed = 0
+    for txn in transactions:
+        merchant_id = resolved.get(txn.merchant_name) if txn.merchant_name else None
+        if merchant_id == txn.merchant_id:
+            continue
+        if txn.merchant_id is not None:
+            deltas[txn.merchant_id] -= 1
+        if merchant_id is not None:
+            deltas[merchant_id] += 1
+            if txn.date and (merchant_id not in last_seen or txn.date > last_seen[merchant_id]):
+                last_seen[merchant_id] = txn.date
+        txn.merchant_id = merchant_id
+        changed += 1
+
+    for merchant_id, delta in deltas.items():
+        count = Merchant.transaction_count + delta
+        values = {"transaction_count": case((count < 0, 0), else_=count)}
+        seen = last_seen.get(merchant_id)
+        if seen is not None:
+            values["last_seen_date"] = case(
+                (
+                    or_(Merchant.last_seen_date.is_(None), Merchant.last_seen_date < seen),
+                    seen,
+                ),
+                else_=Merchant.last_seen_date,
+            )
+        if delta or seen is not None:
+            await db.execute(update(Merchant).where(Merchant.id == merchant_id).values(**values))
+    return changed
+
+
+async def assign_merchants_nonfatal(
+    db: AsyncSession, organization_id: UUID, transactions: Iterable[Transaction]
+) -> None:
+    """``assign_merchants`` for ingest paths: failures are logged, never raised.
+
+    Runs in a savepoint so a failure cannot abort the caller's transaction;
+    the transactions are left unresolved for ``reconcile_merchants``.
+    """
+    transactions = list(transactions)
+    try:
+        async with db.begin_nested():
+            await assign_merchants(db, organization_id, transactions)
+    except Exception as e:
+        logger.warning("Merchant assignment failed (non-fatal): %s", e)
+        for txn in transactions:
+            txn.merchant_id = None
+
+
+async def reconcile_merchants(db: AsyncSession, organization_id: UUID) -> int:
+    """Resolve transactions without a merchant and recompute usage counts.
+
+    Does not commit.  Returns the number of transactions resolved.
+    """
+    unresolved = (
+        select(Transaction.merchant_name)
+        .where(
+            Transaction.organization_id == organization_id,
+            Transaction.merchant_id.is_(None),
+            Transaction.merchant_name.isnot(None),
+        )
+        .group_by(Transaction.merchant_name)
+        # Most frequent spelling first, so it names any new merchant
+        .order_by(func.count().desc())
+    )
+    names: List[str] = [row[0] for row in (await db.execute(unresolved)).all()]
+    await resolve_merchant_names(db, organization_id, names)
+
+    resolved = 0
+    alias_id = (
+        select(MerchantAlias.merchant_id)
+        .where(
+            MerchantAlias.organization_id == Transaction.organization_id,
+            MerchantAlias.name == Transaction.merchant_name,
+        )
+        .scalar_subquery()
+    )
+    for start in range(0, len(names), _CHUNK):
+        result = await db.execute(
+            update(Transaction)
+            .where(
+                Transaction.organization_id == organization_id,
+                Transaction.merchant_id.is_(None),
+                Transaction.merchant_name.in_(names[start : start + _CHUNK]),
+            )
+            .values(merchant_id=alias_id)
+            .execution_options(synchronize_session=False)
+        )
+        resolved += result.rowcount or 0
+
+    usage = select(Transaction.merchant_id).where(Transaction.merchant_id == Merchant.id)
+    await db.execute(
+        update(Merchant)
+        .where(Merchant.organization_id == organization_id)
+        .values(
+            transaction_count=usage.with_only_columns(func.count()).scalar_subquery(),
+            last_seen_date=usage.with_only_columns(func.max(Transaction.date)).scalar_subquery(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return resolved
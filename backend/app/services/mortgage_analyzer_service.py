@@ -17,8 +17,13 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import date
+from decimal import Decimal
 from typing import Optional
 
+import numpy as np
+
+from app.services.debt_payoff_engine import UNITS_PER_DOLLAR, simulate_payoffs
+
 logger = logging.getLogger(__name__)
 
 
@@ -103,6 +108,48 @@ def _monthly_payment(principal: float, annual_rate: float, months: int) -> float
     return round(pmt, 2)
 
 
+def _amortize_many(
+    balance: float,
+    annual_rate: float,
+    monthly_payment: float,
+    extras: list[float],
+    max_months: int = 480,
+) -> list[list[AmortizationRow]]:
+    """Amortization schedules for several extra monthly payments in one engine run."""
+    run = simulate_payoffs(
+        [balance],
+        [Decimal(str(annual_rate)) * 100],
+        [monthly_payment],
+        extra_payments=extras,
+        max_months=max_months,
+        paid_off_at=0,
+        cent_balances=True,
+        record=True,
+    )
+    history = run.history
+    schedules = []
+    for s in range(len(extras)):
+        months = int(run.payoff_month[s, 0]) or len(history["payment"])
+        payment, interest, remaining = (
+            history[k][:months, s, 0].tolist() for k in ("payment", "interest", "balance")
+        )
+        cumulative = np.cumsum(interest).tolist()
+        schedules.append(
+            [
+                AmortizationRow(
+                    month=m + 1,
+                    payment=payment[m] / UNITS_PER_DOLLAR,
+                    principal=(payment[m] - interest[m]) / UNITS_PER_DOLLAR,
+                    interest=interest[m] / UNITS_PER_DOLLAR,
+                    balance=remaining[m] / UNITS_PER_DOLLAR,
+                    cumulative_interest=cumulative[m] / UNITS_PER_DOLLAR,
+                )
+                for m in range(months)
+            ]
+        )
+    return schedules
+
+
 def _amortize(
     balance: float,
     annual_rate: float,
@@ -111,32 +158,7 @@ def _amortize(
     extra_monthly: float = 0.0,
 ) -> list[AmortizationRow]:
     """Build full amortization schedule."""
-    rows: list[AmortizationRow] = []
-    r = annual_rate / 12
-    cumulative_interest = 0.0
-
-    for m in range(1, max_months + 1):
-        if balance <= 0:
-            break
-        interest = round(balance * r, 2)
-        pmt = min(monthly_payment + extra_monthly, balance + interest)
-        principal = round(pmt - interest, 2)
-        balance = round(max(0.0, balance - principal), 2)
-        cumulative_interest = round(cumulative_interest + interest, 2)
-        rows.append(
-            AmortizationRow(
-                month=m,
-                payment=round(pmt, 2),
-                principal=principal,
-                interest=interest,
-                balance=balance,
-                cumulative_interest=cumulative_interest,
-            )
-        )
-        if balance == 0:
-            break
-
-    return rows
+    return _amortize_many(balance, annual_rate, monthly_payment, [extra_monthly], max_months)[0]
 
 
 def _iso_month(start: date, months_ahead: int) -> str:
@@ -252,13 +274,13 @@ class MortgageAnalyzerService:
 
         # Current loan amortization
         pmt = _monthly_payment(balance, rate, months)
-        rows = _amortize(balance, rate, pmt, extra_monthly=extra_monthly_payment)
+        # With and without the extra payment in one engine run
+        rows, baseline_rows = _amortize_many(balance, rate, pmt, [extra_monthly_payment, 0.0])
         summary = _summarise(rows, today)
 
         # Extra payment impact (compared to baseline with no extra)
         extra_impact: Optional[ExtraPaymentImpact] = None
         if extra_monthly_payment > 0:
-            baseline_rows = _amortize(balance, rate, pmt, extra_monthly=0.0)
             extra_impact = ExtraPaymentImpact(
                 original_payoff_months=len(baseline_rows),
                 new_payoff_months=len(rows),
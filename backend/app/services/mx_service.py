@@ -32,6 +32,7 @@ from app.models.transaction import Transaction
 from app.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from app.services.dividend_detection_service import DividendDetectionService
 from app.services.encryption_service import get_encryption_service
+from app.services.merchant_service import assign_merchants_nonfatal
 from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -412,6 +413,7 @@ class MxService:
                     await detector.process_batch(synced, account.organization_id)
                 except Exception as e:
                     logger.warning("Dividend auto-detection failed (non-fatal): %s", e)
+                await assign_merchants_nonfatal(db, account.organization_id, synced)
 
             await db.commit()
             return synced
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import timedelta
-from typing import List, Optional
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
 from uuid import UUID
 
 from sqlalchemy import and_, case, func, or_, select, update
@@ -10,6 +10,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.notification import Notification, NotificationPriority, NotificationType
 from app.models.user import User
+from app.schemas.notification import NotificationResponse
+from app.services import notification_stream_service as stream
+from app.services.bulk_email_service import (
+    BulkEmailDispatcher,
+    DeliveryStatus,
+    DispatchReport,
+    OutboundEmail,
+)
 from app.services.email_service import email_service
 from app.utils.datetime_utils import utc_now
 
@@ -89,6 +97,56 @@ def _muted_types_for_user(prefs: dict | None) -> list[str]:
     return muted
 
 
+async def _recipient_ids(db: AsyncSession, notification: Notification) -> list[UUID]:
+    """Users whose unread count includes *notification* (all members if org-wide)."""
+    if notification.user_id is not None:
+        return [notification.user_id]
+    result = await db.execute(
+        select(User.id).where(User.organization_id == notification.organization_id)
+    )
+    return list(result.scalars().all())
+
+
+def _counts_as_unread(notification: Notification) -> bool:
+    """Mirror of the get_unread_count filter for a single loaded row."""
+    return (
+        not notification.is_read
+        and not notification.is_dismissed
+        and (notification.expires_at is None or notification.expires_at > utc_now())
+    )
+
+
+async def _on_created(db: AsyncSession, notification: Notification) -> None:
+    """Bump cached unread counts and push a new notification to connected clients.
+
+    Best effort: the notification is already committed, and a miss only
+    means clients fall back to a recount / their next poll.
+    """
+    try:
+        await stream.adjust_unread_counts(await _recipient_ids(db, notification), 1)
+        await stream.publish_event(
+            notification.organization_id,
+            stream.EVENT_NOTIFICATION,
+            user_id=notification.user_id,
+            notification=NotificationResponse.model_validate(notification).model_dump(mode="json"),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to push new notification: {e}")
+
+
+async def _on_unread_cleared(db: AsyncSession, notification: Notification) -> None:
+    """Decrement cached counts and push the change after a read/dismiss (best effort)."""
+    try:
+        await stream.adjust_unread_counts(await _recipient_ids(db, notification), -1)
+        await stream.publish_event(
+            notification.organization_id,
+            stream.EVENT_UNREAD_CHANGED,
+            user_id=notification.user_id,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to push unread-count change: {e}")
+
+
 class NotificationService:
     """Service for creating and managing notifications."""
 
@@ -106,6 +164,7 @@ class NotificationService:
         action_url: Optional[str] = None,
         action_label: Optional[str] = None,
         expires_in_days: Optional[int] = None,
+        send_email: bool = True,
     ) -> Notification:
         """
         Create a new notification.
@@ -123,6 +182,8 @@ class NotificationService:
             action_url: Optional URL for user action
             action_label: Label for action button
             expires_in_days: Auto-expire after N days
+            send_email: Email the user now.  Bulk senders pass False and queue
+                the email with ``notification_email`` instead.
 
         Returns:
             Created notification
@@ -149,11 +210,13 @@ class NotificationService:
         await db.commit()
         await db.refresh(notification)
 
+        await _on_created(db, notification)
+
         # Email notification — track delivery status on the record
         email_attempted = False
         email_succeeded = False
         try:
-            if email_service.is_configured and user_id:
+            if send_email and email_service.is_configured and user_id:
                 # Look up the user to check email preference
                 user_result = await db.execute(select(User).where(User.id == user_id))
                 user = user_result.scalar_one_or_none()
@@ -177,6 +240,36 @@ class NotificationService:
 
         return notification
 
+    @staticmethod
+    def notification_email(
+        notification: Notification, user: User, key: str
+    ) -> Optional[OutboundEmail]:
+        """Render *notification* as a bulk email to *user*, or None if not wanted."""
+        if not (email_service.is_configured and user.email_notifications_enabled and user.email):
+            return None
+        subject, html_body, text_body = email_service.render_notification_email(
+            notification.title,
+            notification.message,
+            notification.action_url,
+            notification.action_label,
+        )
+        return OutboundEmail(user.email, subject, html_body, text_body, key=key)
+
+    @staticmethod
+    async def send_notification_emails(
+        db: AsyncSession,
+        queued: List[tuple[Notification, OutboundEmail]],
+    ) -> DispatchReport:
+        """Send queued notification emails in bulk and record ``email_sent``."""
+        report = await BulkEmailDispatcher().dispatch([email for _, email in queued])
+        for (notification, _), result in zip(queued, report.results):
+            if result.status in (DeliveryStatus.SENT, DeliveryStatus.DUPLICATE):
+                notification.email_sent = True
+            elif result.status == DeliveryStatus.FAILED:
+                notification.email_sent = False
+        await db.commit()
+        return report
+
     @staticmethod
     async def get_user_notifications(
         db: AsyncSession,
@@ -247,10 +340,13 @@ class NotificationService:
         notification = result.scalar_one_or_none()
 
         if notification:
+            was_unread = _counts_as_unread(notification)
             notification.is_read = True
             notification.read_at = utc_now()
             await db.commit()
             await db.refresh(notification)
+            if was_unread:
+                await _on_unread_cleared(db, notification)
 
         return notification
 
@@ -273,10 +369,13 @@ class NotificationService:
         notification = result.scalar_one_or_none()
 
         if notification:
+            was_unread = _counts_as_unread(notification)
             notification.is_dismissed = True
             notification.dismissed_at = utc_now()
             await db.commit()
             await db.refresh(notification)
+            if was_unread:
+                await _on_unread_cleared(db, notification)
 
         return notification
 
@@ -308,6 +407,14 @@ class NotificationService:
         result = await db.execute(stmt)
         await db.commit()
 
+        if result.rowcount:
+            # Some of those rows may have been expired or dismissed already, so
+            # recount on next read rather than guessing a delta.
+            await stream.invalidate_unread_count(user.id)
+            await stream.publish_event(
+                user.organization_id, stream.EVENT_UNREAD_CHANGED, user_id=user.id
+            )
+
         return result.rowcount
 
     @staticmethod
@@ -315,7 +422,11 @@ class NotificationService:
         db: AsyncSession,
         user: User,
     ) -> int:
-        """Get count of unread notifications."""
+        """Get count of unread notifications (Redis-cached per user)."""
+        cached = await stream.get_cached_unread_count(user.id)
+        if cached is not None:
+            return cached
+
         query = (
             select(func.count())
             .select_from(Notification)
@@ -331,7 +442,25 @@ class NotificationService:
         )
 
         result = await db.execute(query)
-        return result.scalar() or 0
+        count = result.scalar() or 0
+        await stream.store_unread_count(user.id, count)
+        return count
+
+    @staticmethod
+    def stream_events(
+        user: User,
+        *,
+        load_unread_count: Callable[[], Awaitable[int]],
+        is_disconnected: Callable[[], Awaitable[bool]],
+    ) -> AsyncIterator[str]:
+        """SSE frames for *user*: new notifications (minus muted types) and count updates."""
+        return stream.stream_user_events(
+            user.id,
+            user.organization_id,
+            load_unread_count=load_unread_count,
+            is_disconnected=is_disconnected,
+            muted_types=_muted_types_for_user(user.notification_preferences),
+        )
 
     @staticmethod
     async def create_account_sync_notification(
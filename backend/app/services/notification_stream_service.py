@@ -0,0 +1,141 @@
+"""Realtime notification push and cached unread counters.
+
+Replaces client polling of ``/notifications/unread-count`` and
+``/notifications/``:
+
+- Unread counts are cached per user in Redis
+  (``notifications:unread:<user_id>``).  ``NotificationService`` keeps the
+  counter in step on create / read / dismiss with ``INCRBY`` — only while
+  the key exists, so a miss always falls back to one ``COUNT(*)``.  The TTL
+  (NOTIFICATION_UNREAD_COUNT_TTL_SECONDS) bounds drift from notifications
+  that expire on their own.
+- Every change is published on the household's pub/sub channel
+  (``notifications:org:<org_id>``).  ``stream_user_events`` turns that
+  channel into server-sent events for one user: a ``notification`` event for
+  each new notification addressed to them (muted categories skipped) and an
+  ``unread_count`` event whenever their badge count may have changed.
+
+Without Redis every helper degrades to a no-op / cache miss and the
+``/stream`` endpoint returns 503 so clients keep polling.
+"""
+
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from app.config import settings
+from app.core import cache
+
+logger = logging.getLogger(__name__)
+
+EVENT_NOTIFICATION = "notification"
+EVENT_UNREAD_CHANGED = "unread_changed"
+
+
+def unread_count_key(user_id: UUID) -> str:
+    return f"notifications:unread:{user_id}"
+
+
+def org_channel(organization_id: UUID) -> str:
+    return f"notifications:org:{organization_id}"
+
+
+async def get_cached_unread_count(user_id: UUID) -> Optional[int]:
+    """Cached unread count, or None on a miss (or a counter that drifted negative)."""
+    value = await cache.get(unread_count_key(user_id))
+    if isinstance(value, int) and value >= 0:
+        return value
+    return None
+
+
+async def store_unread_count(user_id: UUID, count: int) -> None:
+    await cache.setex(
+        unread_count_key(user_id), settings.NOTIFICATION_UNREAD_COUNT_TTL_SECONDS, count
+    )
+
+
+async def adjust_unread_counts(user_ids: Iterable[UUID], delta: int) -> None:
+    """Add *delta* to each user's cached count (skipped where not cached)."""
+    for user_id in user_ids:
+        await cache.incrby_if_exists(unread_count_key(user_id), delta)
+
+
+async def invalidate_unread_count(user_id: UUID) -> None:
+    await cache.delete(unread_count_key(user_id))
+
+
+async def publish_event(
+    organization_id: UUID,
+    event: str,
+    *,
+    user_id: Optional[UUID] = None,
+    notification: Optional[dict] = None,
+) -> None:
+    """Publish a change on the household channel.
+
+    ``user_id`` is the addressee; None means every household member.
+    """
+    message = {"event": event, "user_id": str(user_id) if user_id else None}
+    if notification is not None:
+        message["notification"] = notification
+    await cache.publish(org_channel(organization_id), message)
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def stream_user_events(
+    user_id: UUID,
+    organization_id: UUID,
+    *,
+    load_unread_count: Callable[[], Awaitable[int]],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    muted_types: Iterable[str] = (),
+    keepalive_seconds: Optional[float] = None,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for one user until the client disconnects.
+
+    Starts with the current ``unread_count`` so the client never needs an
+    initial poll, then relays household channel messages addressed to this
+    user.  Sends a comment frame every *keepalive_seconds* of silence so
+    proxies keep the connection open.
+    """
+    if keepalive_seconds is None:
+        keepalive_seconds = settings.NOTIFICATION_STREAM_KEEPALIVE_SECONDS
+    me = str(user_id)
+    muted = set(muted_types)
+
+    pubsub = cache.redis_client.pubsub()
+    await pubsub.subscribe(org_channel(organization_id))
+    try:
+        yield format_sse("unread_count", {"count": await load_unread_count()})
+        while not await is_disconnected():
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=keepalive_seconds
+            )
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+
+            try:
+                payload = json.loads(message["data"])
+            except (TypeError, ValueError):
+                logger.warning("Ignoring malformed notification event: %r", message)
+                continue
+            if payload.get("user_id") not in (None, me):
+                continue
+
+            notification = payload.get("notification")
+            if (
+                payload.get("event") == EVENT_NOTIFICATION
+                and notification
+                and notification.get("type") not in muted
+            ):
+                yield format_sse("notification", notification)
+            yield format_sse("unread_count", {"count": await load_unread_count()})
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
@@ -0,0 +1,294 @@
+"""Monthly range-partition maintenance for high-volume, time-ordered tables.
+
+Optional mode enabled with DB_PARTITIONING_ENABLED.  When on, the
+``r81_time_partitioning`` migration converts the tables below into
+``PARTITION BY RANGE (<key>)`` parents with one child per calendar month
+(named ``<table>_pYYYY_MM``) plus a ``<table>_default`` catch-all.
+
+Why
+---
+- Date-bounded queries (``WHERE date >= :start``) only touch the matching
+  monthly children (partition pruning) instead of the whole table.
+- Retention becomes ``DROP TABLE`` / ``DETACH PARTITION`` on whole months —
+  no multi-million-row DELETEs, no table bloat, no long row locks.
+
+This service
+------------
+- ``ensure_partitions`` pre-creates upcoming months so inserts never land in
+  the default partition (run nightly by ``maintain_partitions_task``).
+- ``list_partitions`` reads bounds back from the PostgreSQL catalog.
+- ``retire_partitions_before`` drops (or detaches, for archival) every
+  partition whose upper bound is at or before a retention cutoff.  The
+  boundary month that straddles the cutoff is left to the regular
+  row-level purge, which now only scans that one partition.
+
+Everything here is PostgreSQL-only; callers must check
+``settings.DB_PARTITIONING_ENABLED`` before using it.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Partitioned table → range partition key column.
+PARTITIONED_TABLES: dict[str, str] = {
+    "transactions": "date",
+    "net_worth_snapshots": "snapshot_date",
+    "portfolio_snapshots": "snapshot_date",
+    "audit_logs": "created_at",
+    "notifications": "created_at",
+}
+
+# Child tables that referenced transactions.id before partitioning.  A
+# partitioned parent cannot be the target of a FK on ``id`` alone, so the
+# migration drops these constraints and replaces the cascade with an AFTER
+# DELETE row trigger; partition drops fire no row triggers and clean up here.
+TRANSACTION_CHILD_TABLES: dict[str, str] = {
+    "transaction_labels": "transaction_id",
+    "transaction_splits": "parent_transaction_id",
+    "transaction_attachments": "transaction_id",
+    "transaction_merges": "primary_transaction_id",
+}
+
+RETENTION_ACTIONS = ("drop", "detach")
+
+_BOUND_RE = re.compile(r"FROM \('(\d{4}-\d{2}-\d{2})[^']*'\) TO \('(\d{4}-\d{2}-\d{2})")
+
+
+@dataclass
+class PartitionInfo:
+    """A single child partition and its [lower, upper) range."""
+
+    table: str
+    name: str
+    lower: Optional[date]  # None for the default partition
+    upper: Optional[date]
+    estimated_rows: int = 0
+
+    @property
+    def is_default(self) -> bool:
+        return self.lower is None
+
+
+def month_start(d: date) -> date:
+    """First day of the month containing *d*."""
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    """Shift a first-of-month date by *months* (may be negative)."""
+    index = d.year * 12 + (d.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Child partition name for *table* covering *month*."""
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def parse_partition_bound(bound: str) -> tuple[Optional[date], Optional[date]]:
+    """Parse ``pg_get_expr(relpartbound)`` output into ``(lower, upper)`` dates.
+
+    Returns ``(None, None)`` for ``DEFAULT`` partitions.
+    """
+    match = _BOUND_RE.search(bound or "")
+    if not match:
+        return None, None
+    return date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2))
+
+
+def _check_table(table: str) -> str:
+    # Identifiers are interpolated into DDL, so only allow known tables.
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"{table!r} is not a partitioned table")
+    return table
+
+
+class PartitionMaintenanceService:
+    """Create, inspect and retire monthly partitions."""
+
+    @staticmethod
+    async def is_partitioned(db: AsyncSession, table: str) -> bool:
+        """Return True when *table* is a partitioned parent."""
+        result = await db.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = :table"
+            ),
+            {"table": _check_table(table)},
+        )
+        return result.scalar() is not None
+
+    @staticmethod
+    async def list_partitions(db: AsyncSession, table: str) -> list[PartitionInfo]:
+        """List child partitions of *table*, oldest first (default last)."""
+        result = await db.execute(
+            text(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), "
+                "GREATEST(child.reltuples, 0)::bigint "
+                "FROM pg_inherits i "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": _check_table(table)},
+        )
+        partitions = []
+        for name, bound, rows in result.all():
+            lower, upper = parse_partition_bound(bound)
+            partitions.append(
+                PartitionInfo(
+                    table=table,
+                    name=name,
+                    lower=lower,
+                    upper=upper,
+                    estimated_rows=int(rows or 0),
+                )
+            )
+        partitions.sort(key=lambda p: (p.is_default, p.lower or date.max))
+        return partitions
+
+    @staticmethod
+    async def ensure_partitions(
+        db: AsyncSession,
+        table: str,
+        *,
+        months_ahead: int = 3,
+        today: Optional[date] = None,
+    ) -> list[str]:
+        """Create monthly partitions from the current month through *months_ahead*.
+
+        Idempotent (``CREATE TABLE IF NOT EXISTS``).  Returns the names of the
+        partitions that did not exist before.
+        """
+        _check_table(table)
+        existing = {p.name for p in await PartitionMaintenanceService.list_partitions(db, table)}
+        first = month_start(today or date.today())
+
+        created = []
+        for offset in range(months_ahead + 1):
+            lower = add_months(first, offset)
+            name = partition_name(table, lower)
+            if name in existing:
+                continue
+            upper = add_months(lower, 1)
+            await db.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+                )
+            )
+            created.append(name)
+
+        await db.commit()
+        if created:
+            logger.info("partitions: %s created %s", table, ", ".join(created))
+        return created
+
+    @staticmethod
+    async def maintain_all(
+        db: AsyncSession,
+        *,
+        months_ahead: int = 3,
+        today: Optional[date] = None,
+    ) -> dict[str, list[str]]:
+        """Run ``ensure_partitions`` for every partitioned table.
+
+        Tables that have not been converted yet are skipped.  Also warns when
+        a default partition has rows — those belong in a monthly child and
+        block creating it.
+        """
+        results: dict[str, list[str]] = {}
+        for table in PARTITIONED_TABLES:
+            if not await PartitionMaintenanceService.is_partitioned(db, table):
+                logger.warning("partitions: %s is not partitioned — skipping", table)
+                continue
+            results[table] = await PartitionMaintenanceService.ensure_partitions(
+                db, table, months_ahead=months_ahead, today=today
+            )
+            for part in await PartitionMaintenanceService.list_partitions(db, table):
+                if part.is_default and part.estimated_rows > 0:
+                    logger.warning(
+                        "partitions: %s has ~%d rows outside monthly ranges",
+                        part.name,
+                        part.estimated_rows,
+                    )
+        return results
+
+    @staticmethod
+    async def retire_partitions_before(
+        db: AsyncSession,
+        table: str,
+        cutoff: date,
+        *,
+        action: str = "drop",
+        dry_run: bool = True,
+    ) -> list[PartitionInfo]:
+        """Drop or detach every monthly partition entirely older than *cutoff*.
+
+        Args:
+            action: ``"drop"`` deletes the data; ``"detach"`` keeps the child
+                as a standalone table for archival (e.g. ``pg_dump`` then drop).
+                For ``transactions`` both remove the rows' labels, splits,
+                attachments and merges from the live child tables.
+            dry_run: If True, only report which partitions would be retired.
+
+        Returns:
+            The retired (or would-be retired) partitions.
+        """
+        _check_table(table)
+        if action not in RETENTION_ACTIONS:
+            raise ValueError(f"action must be one of {RETENTION_ACTIONS}, got {action!r}")
+
+        expired = [
+            p
+            for p in await PartitionMaintenanceService.list_partitions(db, table)
+            if not p.is_default and p.upper is not None and p.upper <= cutoff
+        ]
+        if dry_run or not expired:
+            for part in expired:
+                logger.info(
+                    "DRY RUN — partitions: would %s %s (~%d rows)",
+                    action,
+                    part.name,
+                    part.estimated_rows,
+                )
+            return expired
+
+        for part in expired:
+            if table == "transactions":
+                # FKs to transactions.id were removed when partitioning, so
+                # clear dependent rows that ON DELETE CASCADE used to handle.
+                # A detached month leaves the live tables too, so its labels,
+                # splits, etc. must not linger pointing at missing rows.
+                for child, column in TRANSACTION_CHILD_TABLES.items():
+                    await db.execute(
+                        text(f"DELETE FROM {child} WHERE {column} IN (SELECT id FROM {part.name})")
+                    )
+            if action == "detach":
+                await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {part.name}"))
+            else:
+                await db.execute(text(f"DROP TABLE {part.name}"))
+            if table == "transactions":
+                # Partition drops and detaches bypass the row trigger that
+                # maintains transaction_counts; retire those months here.
+                await db.execute(
+                    text("DELETE FROM transaction_counts WHERE month >= :lower AND month < :upper"),
+                    {"lower": part.lower, "upper": part.upper},
+                )
+            await db.commit()
+            logger.info(
+                "partitions: %s %s (~%d rows)",
+                "detached" if action == "detach" else "dropped",
+                part.name,
+                part.estimated_rows,
+            )
+        return expired
@@ -12,12 +12,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.constants.financial import DEBT
 from app.models.account import Account, AccountType
 from app.services.amortization_service import AmortizationService
+from app.services.debt_payoff_engine import UNITS_PER_CENT, simulate_payoffs, to_dollars
 
 # Build the debt type list dynamically from the enum so new debt types are
 # automatically included when added to AccountType.
 _DEBT_ACCOUNT_TYPES = [t.name for t in AccountType if t.is_debt]
 
 
+def _months_from_now(months: int) -> str:
+    """ISO date of the first of the month *months* after the current one."""
+    return (date.today().replace(day=1) + relativedelta(months=months)).isoformat()
+
+
 class DebtAccount:
     """Simple debt account representation for payoff calculations."""
 
@@ -179,6 +185,57 @@ class PayoffStrategyService:
 
         return PayoffStrategyService._calculate_strategy(debts, Decimal(0), "CURRENT_PACE")
 
+    @staticmethod
+    def calculate_extra_payment_sensitivity(
+        debts: List[DebtAccount], extra_payments: List[Decimal], strategy: str = "AVALANCHE"
+    ) -> Dict:
+        """
+        Evaluate one strategy across many extra-payment amounts at once.
+
+        All amounts, plus the minimum-only baseline, are simulated in a single
+        engine run, so a slider or sensitivity table costs one call.
+
+        Args:
+            debts: List of debt accounts
+            extra_payments: Extra monthly payment amounts to evaluate
+            strategy: SNOWBALL or AVALANCHE priority order
+
+        Returns:
+            Baseline totals and one row of totals/savings per extra payment
+        """
+        if not debts:
+            return {"strategy": strategy, "current_pace": None, "scenarios": []}
+
+        order = PayoffStrategyService._priority_order(debts, strategy)
+        results = PayoffStrategyService._calculate_strategies(
+            debts,
+            [(list(range(len(debts))), Decimal(0), "CURRENT_PACE")]
+            + [(order, Decimal(extra), strategy) for extra in extra_payments],
+        )
+        totals = ("total_months", "total_interest", "total_paid", "debt_free_date")
+        current_pace = {key: results[0][key] for key in totals}
+
+        scenarios = []
+        for extra, result in zip(extra_payments, results[1:]):
+            row = {"extra_payment": float(extra), **{key: result[key] for key in totals}}
+            row["interest_saved_vs_current"] = (
+                current_pace["total_interest"] - result["total_interest"]
+            )
+            row["months_saved_vs_current"] = current_pace["total_months"] - result["total_months"]
+            scenarios.append(row)
+
+        return {"strategy": strategy, "current_pace": current_pace, "scenarios": scenarios}
+
+    @staticmethod
+    def _priority_order(debts: List[DebtAccount], strategy: str) -> List[int]:
+        """Indices of *debts* in the order the strategy targets them with extra money."""
+        indices = range(len(debts))
+        if strategy == "SNOWBALL":
+            return sorted(indices, key=lambda i: debts[i].balance)
+        if strategy == "AVALANCHE":
+            return sorted(indices, key=lambda i: debts[i].interest_rate, reverse=True)
+        return list(indices)
+
     @staticmethod
     def _calculate_strategy(
         debts: List[DebtAccount], extra_payment: Decimal, strategy_name: str
@@ -196,116 +253,74 @@ class PayoffStrategyService:
         Returns:
             Complete strategy results
         """
-        # Create working copies with running balances
-        debt_states = [
-            {
-                "account_id": str(debt.account_id),
-                "name": debt.name,
-                "account_type": debt.account_type.value,
-                "original_balance": float(debt.balance),
-                "balance": debt.balance,
-                "interest_rate": debt.interest_rate,
-                "minimum_payment": debt.minimum_payment,
-                "months_to_payoff": 0,
-                "total_interest": Decimal(0),
-                "total_paid": Decimal(0),
-                "payoff_date": None,
-            }
-            for debt in debts
-        ]
+        return PayoffStrategyService._calculate_strategies(
+            debts, [(list(range(len(debts))), extra_payment, strategy_name)]
+        )[0]
 
-        available_extra = extra_payment
-        freed_minimums = Decimal(0)
-        current_month = 0
-        max_months = DEBT.MAX_PAYOFF_MONTHS
+    @staticmethod
+    def _calculate_strategies(
+        debts: List[DebtAccount], scenarios: List[tuple[List[int], Decimal, str]]
+    ) -> List[Dict]:
+        """
+        Simulate several strategies over the same debts in one engine run.
 
-        while current_month < max_months:
-            current_month += 1
-            all_paid = True
-
-            # Apply minimum payments and interest to all debts
-            for debt in debt_states:
-                if debt["balance"] > Decimal("0.01"):
-                    all_paid = False
-
-                    # Calculate interest for this month
-                    monthly_rate = debt["interest_rate"] / Decimal(100) / Decimal(12)
-                    interest = (debt["balance"] * monthly_rate).quantize(Decimal("0.01"))
-
-                    # Apply minimum payment
-                    payment = min(debt["minimum_payment"], debt["balance"] + interest)
-                    principal = payment - interest
-
-                    debt["balance"] -= principal
-                    debt["balance"] = max(debt["balance"], Decimal(0))
-                    debt["total_interest"] += interest
-                    debt["total_paid"] += payment
-
-                    # Track payoff month if minimum payment just zeroed this debt
-                    if debt["balance"] <= Decimal("0.01") and debt["months_to_payoff"] == 0:
-                        debt["months_to_payoff"] = current_month
-                        debt["payoff_date"] = (
-                            date.today().replace(day=1) + relativedelta(months=current_month)
-                        ).isoformat()
-
-            if all_paid:
-                break
-
-            # Apply extra payment to first debt with balance (snowball/avalanche priority)
-            for debt in debt_states:
-                if debt["balance"] > Decimal("0.01") and available_extra > 0:
-                    extra_principal = min(available_extra, debt["balance"])
-                    debt["balance"] -= extra_principal
-                    debt["total_paid"] += extra_principal
-                    available_extra -= extra_principal
-
-                    if debt["balance"] <= Decimal("0.01"):
-                        debt["balance"] = Decimal(0)
-                        debt["months_to_payoff"] = current_month
-                        debt["payoff_date"] = (
-                            date.today().replace(day=1) + relativedelta(months=current_month)
-                        ).isoformat()
-
-                        # Snowball effect: permanently free this debt's minimum payment
-                        freed_minimums += debt["minimum_payment"]
-
-                    break
-
-            # Reset available extra for next month (include freed minimums from paid-off debts)
-            available_extra = extra_payment + freed_minimums
-
-        # Calculate totals
-        total_interest = sum(debt["total_interest"] for debt in debt_states)
-        total_paid = sum(debt["total_paid"] for debt in debt_states)
-
-        # Safety net: set payoff month/date for any debt paid off but not yet recorded
-        for debt in debt_states:
-            if debt["months_to_payoff"] == 0 and debt["balance"] <= Decimal("0.01"):
-                debt["months_to_payoff"] = current_month
-                debt["payoff_date"] = (
-                    date.today().replace(day=1) + relativedelta(months=current_month)
-                ).isoformat()
-
-        # Convert Decimal to float for JSON serialization
-        for debt in debt_states:
-            debt["balance"] = float(debt["balance"])
-            debt["total_interest"] = float(debt["total_interest"])
-            debt["total_paid"] = float(debt["total_paid"])
-            debt["interest_rate"] = float(debt["interest_rate"])
-            debt["minimum_payment"] = float(debt["minimum_payment"])
+        Each scenario is ``(priority order, extra payment, strategy name)``;
+        the priority order lists indices into *debts* and also sets the order
+        of the per-debt results.
 
-        return {
-            "strategy": strategy_name,
-            "total_months": current_month,
-            "total_interest": float(total_interest),
-            "total_paid": float(total_paid),
-            "debt_free_date": (
-                (date.today().replace(day=1) + relativedelta(months=current_month)).isoformat()
-                if current_month < max_months
-                else None
-            ),
-            "debts": debt_states,
-        }
+        Returns:
+            One result dict per scenario, as returned by ``_calculate_strategy``
+        """
+        max_months = DEBT.MAX_PAYOFF_MONTHS
+        run = simulate_payoffs(
+            [debt.balance for debt in debts],
+            [debt.interest_rate for debt in debts],
+            [debt.minimum_payment for debt in debts],
+            extra_payments=[extra for _, extra, _ in scenarios],
+            priorities=[order for order, _, _ in scenarios],
+            max_months=max_months,
+        )
+        results = []
+        for s, (order, _, strategy_name) in enumerate(scenarios):
+            current_month = int(run.months[s])
+            debt_states = []
+            for d in order:
+                debt = debts[d]
+                months_to_payoff = int(run.payoff_month[s, d])
+                # Debts that started paid off (<= $0.01) count as cleared when the run ends
+                if months_to_payoff == 0 and run.balance[s, d] <= UNITS_PER_CENT:
+                    months_to_payoff = current_month
+                debt_states.append(
+                    {
+                        "account_id": str(debt.account_id),
+                        "name": debt.name,
+                        "account_type": debt.account_type.value,
+                        "original_balance": float(debt.balance),
+                        "balance": to_dollars(run.balance[s, d]),
+                        "interest_rate": float(debt.interest_rate),
+                        "minimum_payment": float(debt.minimum_payment),
+                        "months_to_payoff": months_to_payoff,
+                        "total_interest": to_dollars(run.interest[s, d]),
+                        "total_paid": to_dollars(run.paid[s, d]),
+                        "payoff_date": (
+                            _months_from_now(months_to_payoff) if months_to_payoff else None
+                        ),
+                    }
+                )
+
+            results.append(
+                {
+                    "strategy": strategy_name,
+                    "total_months": current_month,
+                    "total_interest": to_dollars(run.interest[s].sum()),
+                    "total_paid": to_dollars(run.paid[s].sum()),
+                    "debt_free_date": (
+                        _months_from_now(current_month) if current_month < max_months else None
+                    ),
+                    "debts": debt_states,
+                }
+            )
+        return results
 
     @staticmethod
     async def compare_strategies(
@@ -342,9 +357,23 @@ class PayoffStrategyService:
                 "recommendation": None,
             }
 
-        snowball = PayoffStrategyService.calculate_snowball(debts, extra_payment)
-        avalanche = PayoffStrategyService.calculate_avalanche(debts, extra_payment)
-        current_pace = PayoffStrategyService.calculate_current_pace(debts)
+        # All three strategies share one engine run
+        snowball, avalanche, current_pace = PayoffStrategyService._calculate_strategies(
+            debts,
+            [
+                (
+                    PayoffStrategyService._priority_order(debts, "SNOWBALL"),
+                    extra_payment,
+                    "SNOWBALL",
+                ),
+                (
+                    PayoffStrategyService._priority_order(debts, "AVALANCHE"),
+                    extra_payment,
+                    "AVALANCHE",
+                ),
+                (list(range(len(debts))), Decimal(0), "CURRENT_PACE"),
+            ],
+        )
 
         # Add savings comparisons
         if extra_payment > 0:
@@ -373,3 +402,35 @@ class PayoffStrategyService:
             "current_pace": current_pace,
             "recommendation": recommendation,
         }
+
+    @staticmethod
+    async def extra_payment_sensitivity(
+        db: AsyncSession,
+        organization_id: UUID,
+        extra_payments: List[Decimal],
+        strategy: str = "AVALANCHE",
+        user_id: Optional[UUID] = None,
+        account_ids: Optional[List[UUID]] = None,
+    ) -> Dict:
+        """
+        Evaluate a strategy across many extra-payment amounts for an organization's debts.
+
+        Args:
+            db: Database session
+            organization_id: Organization ID
+            extra_payments: Extra monthly payment amounts to evaluate
+            strategy: SNOWBALL or AVALANCHE priority order
+            user_id: Optional user ID for filtering
+            account_ids: Optional list of specific account IDs to include
+
+        Returns:
+            Sensitivity table, as returned by ``calculate_extra_payment_sensitivity``
+        """
+        debts = await PayoffStrategyService.get_debt_accounts(db, organization_id, user_id)
+
+        if account_ids:
+            debts = [d for d in debts if d.account_id in account_ids]
+
+        return PayoffStrategyService.calculate_extra_payment_sensitivity(
+            debts, extra_payments, strategy
+        )
@@ -1,6 +1,8 @@
 """Private Equity Performance Metrics Service.
 
 Calculates IRR, TVPI, DPI for PE/PD accounts from their transaction history.
+IRRs are solved by the vectorized XIRR kernel in ``performance_returns``, so
+portfolio views solve every account in one batch.
 """
 
 import logging
@@ -8,6 +10,8 @@ from datetime import date
 from decimal import Decimal
 from typing import List, Optional
 
+from app.services.performance_returns import xirr, xirr_many
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,7 +43,7 @@ def calculate_irr(
     max_iterations: int = 100,
     tolerance: float = 1e-6,
 ) -> Optional[float]:
-    """Calculate IRR using Newton's method.
+    """Calculate IRR with the bracketed solver in ``performance_returns``.
 
     cash_flows: list of (date, amount) where capital calls are negative,
                 distributions are positive
@@ -47,63 +51,75 @@ def calculate_irr(
     nav_date: date of the current NAV
 
     Returns annualized IRR as a decimal (e.g. 0.12 = 12%), or None if
-    convergence fails.
+    the flows have no IRR.
     """
     if not cash_flows and current_nav <= 0:
         return None
+    flows = list(cash_flows) + [(nav_date, float(current_nav))]
+    return xirr(flows, tolerance=tolerance, max_iterations=max_iterations)
 
-    # Build full cash flow list with dates
-    flows = list(cash_flows)
-    flows.append((nav_date, float(current_nav)))
-
-    if len(flows) < 2:
-        return None
-
-    # Sort by date
-    flows.sort(key=lambda x: x[0])
-    base_date = flows[0][0]
-
-    # Convert dates to year fractions
-    year_fracs = []
-    amounts = []
-    for dt, amt in flows:
-        year_frac = (dt - base_date).days / 365.25
-        year_fracs.append(year_frac)
-        amounts.append(float(amt))
 
-    # Newton-Raphson to find IRR
-    rate = 0.10  # Initial guess: 10%
+def _summarize(transactions: list) -> tuple[Decimal, Decimal, list]:
+    """Totals called / distributed and the dated cash flows for one set of transactions."""
+    total_called = Decimal("0")
+    total_distributions = Decimal("0")
+    cash_flows = []
 
-    for _ in range(max_iterations):
-        npv = 0.0
-        d_npv = 0.0
-        for i, (t, cf) in enumerate(zip(year_fracs, amounts)):
-            denom = (1 + rate) ** t
-            if denom == 0:
-                return None
-            npv += cf / denom
-            if t > 0:
-                d_npv -= t * cf / ((1 + rate) ** (t + 1))
+    for txn in transactions:
+        txn_type = txn["type"]
+        amount = Decimal(str(txn["amount"]))
+        txn_date = txn["date"]
 
-        if abs(d_npv) < 1e-14:
-            # Derivative too small, try bisection fallback
-            break
+        if txn_type == "capital_call":
+            total_called += amount
+            cash_flows.append((txn_date, -float(amount)))
+        elif txn_type == "distribution":
+            total_distributions += amount
+            cash_flows.append((txn_date, float(amount)))
+        # nav_update transactions don't affect cash flows
 
-        new_rate = rate - npv / d_npv
+    return total_called, total_distributions, cash_flows
 
-        # Clamp to prevent divergence
-        if new_rate < -0.99:
-            new_rate = -0.99
-        if new_rate > 10.0:
-            new_rate = 10.0
 
-        if abs(new_rate - rate) < tolerance:
-            return round(new_rate, 6)
+def compute_pe_metrics_many(
+    items: List[tuple],  # list of (transactions, current_nav)
+    nav_date: Optional[date] = None,
+) -> List[dict]:
+    """Compute PE metrics for several accounts, solving every IRR in one batch.
 
-        rate = new_rate
+    items: list of (transactions, current_nav) pairs, transactions in the
+    format accepted by ``compute_pe_metrics``.  Results are in input order.
+    """
+    if nav_date is None:
+        nav_date = date.today()
 
-    # Fallback: return last estimate if close enough
-    return round(rate, 6) if abs(npv) < 0.01 else None
+    summaries = [(_summarize(transactions), current_nav) for transactions, current_nav in items]
+    irr_series = [
+        cash_flows + [(nav_date, float(current_nav))]
+        for (_, _, cash_flows), current_nav in summaries
+    ]
+    irrs = xirr_many(irr_series)
+
+    results = []
+    for ((total_called, total_distributions, cash_flows), current_nav), irr in zip(summaries, irrs):
+        if not cash_flows and current_nav <= 0:
+            irr = None
+        tvpi = calculate_tvpi(total_distributions, current_nav, total_called)
+        dpi = calculate_dpi(total_distributions, total_called)
+        results.append(
+            {
+                "total_called": float(total_called),
+                "total_distributions": float(total_distributions),
+                "current_nav": float(current_nav),
+                "tvpi": round(tvpi, 4),
+                "dpi": round(dpi, 4),
+                "irr": irr,
+                "irr_pct": round(irr * 100, 2) if irr is not None else None,
+                "moic": round(tvpi, 4),  # MOIC is same as TVPI
+                "net_profit": float(total_distributions + current_nav - total_called),
+            }
+        )
+    return results
 
 
 def compute_pe_metrics(
@@ -117,38 +133,4 @@ def compute_pe_metrics(
         {"type": "capital_call"|"distribution"|"nav_update",
          "amount": Decimal, "date": date}
     """
-    if nav_date is None:
-        nav_date = date.today()
-
-    total_called = Decimal("0")
-    total_distributions = Decimal("0")
-    cash_flows = []
-
-    for txn in transactions:
-        txn_type = txn["type"]
-        amount = Decimal(str(txn["amount"]))
-        txn_date = txn["date"]
-
-        if txn_type == "capital_call":
-            total_called += amount
-            cash_flows.append((txn_date, -float(amount)))
-        elif txn_type == "distribution":
-            total_distributions += amount
-            cash_flows.append((txn_date, float(amount)))
-        # nav_update transactions don't affect cash flows
-
-    tvpi = calculate_tvpi(total_distributions, current_nav, total_called)
-    dpi = calculate_dpi(total_distributions, total_called)
-    irr = calculate_irr(cash_flows, current_nav, nav_date)
-
-    return {
-        "total_called": float(total_called),
-        "total_distributions": float(total_distributions),
-        "current_nav": float(current_nav),
-        "tvpi": round(tvpi, 4),
-        "dpi": round(dpi, 4),
-        "irr": irr,
-        "irr_pct": round(irr * 100, 2) if irr is not None else None,
-        "moic": round(tvpi, 4),  # MOIC is same as TVPI
-        "net_profit": float(total_distributions + current_nav - total_called),
-    }
+    return compute_pe_metrics_many([(transactions, current_nav)], nav_date)[0]
@@ -0,0 +1,189 @@
+"""Vectorized XIRR and time-/money-weighted return kernels.
+
+``xirr_many`` solves the internal rate of return for many dated cash-flow
+series at once.  Series are packed into ``(num_series, max_flows)`` NumPy
+arrays of amounts and year fractions (zero-padded), so each solver
+iteration is one array expression over every account instead of a Python
+loop over every cash flow of every account.
+
+Each series is first bracketed on ``[RATE_FLOOR, RATE_CEILING]`` — the
+bracket's upper end is widened until NPV changes sign, for very high
+returns — and then solved with safeguarded Newton: a Newton step is taken
+when it stays strictly inside the current bracket, otherwise the step
+bisects, and the bracket shrinks every iteration.  Unlike plain Newton this
+cannot diverge or oscillate, so a result is returned whenever a root is
+bracketed.  Series without both an inflow and an outflow, or whose rate
+lies beyond the widest bracket, yield None.
+
+``time_weighted_return`` chains sub-period returns between valuations,
+treating external flows as arriving at the end of the sub-period they fall
+in.  ``money_weighted_return`` is the XIRR of a window: the starting value
+invested, flows in between, and the ending value withdrawn.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional, Sequence
+
+import numpy as np
+
+DAYS_PER_YEAR = 365.25
+
+# Rates are solved on (-100%, +∞); the search starts on this bracket
+RATE_FLOOR = -0.9999
+RATE_CEILING = 10.0
+_MAX_CEILING = 1e6
+
+CashFlows = Sequence[tuple[date, float]]
+
+
+def _pack(series: Sequence[CashFlows]) -> tuple[np.ndarray, np.ndarray]:
+    """Amounts and year fractions (from each series' first date), zero-padded."""
+    width = max((len(flows) for flows in series), default=0)
+    amounts = np.zeros((len(series), width))
+    years = np.zeros((len(series), width))
+    for i, flows in enumerate(series):
+        if not flows:
+            continue
+        ordered = sorted(flows, key=lambda flow: flow[0])
+        days = np.array([d for d, _ in ordered], dtype="datetime64[D]")
+        years[i, : len(ordered)] = (days - days[0]).astype(np.float64) / DAYS_PER_YEAR
+        amounts[i, : len(ordered)] = [float(amount) for _, amount in ordered]
+    return amounts, years
+
+
+def _npv(rates: np.ndarray, amounts: np.ndarray, years: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore", invalid="ignore"):
+        discount = np.exp(-years * np.log1p(rates)[:, None])
+        return (amounts * discount).sum(axis=1)
+
+
+def _npv_and_slope(
+    rates: np.ndarray, amounts: np.ndarray, years: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    with np.errstate(over="ignore", invalid="ignore"):
+        growth = np.log1p(rates)[:, None]
+        discounted = amounts * np.exp(-years * growth)
+        slope = (-years * discounted).sum(axis=1) / (1.0 + rates)
+        return discounted.sum(axis=1), slope
+
+
+def xirr_many(
+    series: Sequence[CashFlows],
+    *,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+    guess: float = 0.10,
+) -> list[Optional[float]]:
+    """Annualized IRR for each cash-flow series (None where it has no root).
+
+    Amounts are signed from the investor's side: contributions negative,
+    distributions and ending value positive.
+    """
+    if not series:
+        return []
+    amounts, years = _pack(series)
+    n = len(series)
+
+    solvable = (amounts > 0).any(axis=1) & (amounts < 0).any(axis=1)
+    lo = np.full(n, RATE_FLOOR)
+    hi = np.full(n, RATE_CEILING)
+    f_lo = _npv(lo, amounts, years)
+    f_hi = _npv(hi, amounts, years)
+
+    # Widen the ceiling for series whose IRR is above it
+    while True:
+        widen = solvable & (np.sign(f_lo) == np.sign(f_hi)) & (hi < _MAX_CEILING)
+        if not widen.any():
+            break
+        hi = np.where(widen, hi * 10.0, hi)
+        f_hi = np.where(widen, _npv(hi, amounts, years), f_hi)
+
+    bracketed = solvable & np.isfinite(f_lo) & np.isfinite(f_hi) & (np.sign(f_lo) != np.sign(f_hi))
+    rates = np.clip(np.full(n, guess), lo, hi)
+    active = bracketed.copy()
+
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        f, slope = _npv_and_slope(rates, amounts, years)
+
+        # Keep the root between lo and hi
+        same_side_as_lo = np.sign(f) == np.sign(f_lo)
+        lo = np.where(active & same_side_as_lo, rates, lo)
+        hi = np.where(active & ~same_side_as_lo, rates, hi)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = rates - f / slope
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        candidate = np.where(inside, newton, 0.5 * (lo + hi))
+
+        step = np.abs(candidate - rates)
+        rates = np.where(active, candidate, rates)
+        converged = (step <= tolerance * (1.0 + np.abs(rates))) | (f == 0.0)
+        active &= ~converged
+
+    return [
+        round(float(rate), 6) if ok and not still_active else None
+        for rate, ok, still_active in zip(rates, bracketed, active)
+    ]
+
+
+def xirr(flows: CashFlows, **kwargs) -> Optional[float]:
+    """Annualized IRR for a single cash-flow series."""
+    return xirr_many([flows], **kwargs)[0]
+
+
+def time_weighted_return(valuations: CashFlows, flows: CashFlows = ()) -> Optional[float]:
+    """Cumulative time-weighted return across a series of dated valuations.
+
+    Each flow is assigned to the sub-period ending at the first valuation on
+    or after its date and is removed from that valuation before computing the
+    sub-period's growth.  Sub-periods that start from a non-positive value
+    are skipped.  None with fewer than two valuations.
+    """
+    if len(valuations) < 2:
+        return None
+    ordered = sorted(valuations, key=lambda v: v[0])
+    dates = np.array([d for d, _ in ordered], dtype="datetime64[D]")
+    values = np.array([float(v) for _, v in ordered])
+
+    period_flows = np.zeros(len(values))
+    if flows:
+        flow_dates = np.array([d for d, _ in flows], dtype="datetime64[D]")
+        flow_amounts = np.array([float(a) for _, a in flows])
+        # Flows after the first valuation and on/before the last one
+        period = np.searchsorted(dates, flow_dates, side="left")
+        in_window = (flow_dates > dates[0]) & (period < len(values))
+        np.add.at(period_flows, period[in_window], flow_amounts[in_window])
+
+    start = values[:-1]
+    usable = start > 0
+    if not usable.any():
+        return None
+    growth = (values[1:] - period_flows[1:])[usable] / start[usable]
+    return float(np.prod(growth) - 1.0)
+
+
+def money_weighted_return(valuations: CashFlows, flows: CashFlows = ()) -> Optional[float]:
+    """Annualized money-weighted return (XIRR) from the first to the last valuation.
+
+    ``flows`` are external contributions (positive) and withdrawals
+    (negative) into the portfolio; only those inside the window count.
+    """
+    if len(valuations) < 2:
+        return None
+    ordered = sorted(valuations, key=lambda v: v[0])
+    (start_date, start_value), (end_date, end_value) = ordered[0], ordered[-1]
+    series = [(start_date, -float(start_value))]
+    series += [(d, -float(a)) for d, a in flows if start_date < d <= end_date]
+    series.append((end_date, float(end_value)))
+    return xirr(series)
+
+
+def annualize(total_return: Optional[float], days: int) -> Optional[float]:
+    """Annualize a cumulative return over *days*; returned as-is for windows under a year."""
+    if total_return is None or days < DAYS_PER_YEAR or total_return <= -1.0:
+        return total_return
+    return (1.0 + total_return) ** (DAYS_PER_YEAR / days) - 1.0
@@ -68,7 +68,8 @@ class PlaidHoldingsSyncService:
                 holding.total_cost_basis = cost_basis
                 if cost_basis and shares > 0:
                     holding.cost_basis_per_share = (cost_basis / shares).quantize(Decimal("0.01"))
-                holding.asset_type = asset_type
+                if not holding.asset_type_overridden:
+                    holding.asset_type = asset_type
                 holding.name = security.get("name")
                 holding.price_as_of = utc_now()
             else:
@@ -20,6 +20,7 @@ from app.core.cache import delete_pattern as cache_delete_pattern, redis_client
 from app.models.account import Account, PlaidItem
 from app.models.transaction import Transaction
 from app.services.dividend_detection_service import DividendDetectionService
+from app.services.merchant_service import assign_merchants_nonfatal
 from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -187,6 +188,7 @@ class PlaidTransactionSyncService:
                     await detector.process_batch(new_transactions, organization_id)
                 except Exception as e:
                     logger.warning("Dividend auto-detection failed (non-fatal): %s", e)
+                await assign_merchants_nonfatal(db, organization_id, new_transactions)
 
             await db.commit()
 
@@ -359,7 +361,10 @@ class PlaidTransactionSyncService:
         """Update an existing transaction with new data from Plaid."""
         # Update fields that may have changed
         transaction.is_pending = txn_data.get("pending", False)
-        transaction.merchant_name = txn_data.get("merchant_name") or txn_data.get("name")
+        merchant_name = txn_data.get("merchant_name") or txn_data.get("name")
+        if merchant_name != transaction.merchant_name:
+            transaction.merchant_name = merchant_name
+            transaction.merchant_id = None  # Re-resolved by reconcile_merchants
         transaction.updated_at = utc_now()
 
         stats["updated"] += 1
@@ -1,6 +1,6 @@
 """Service for detecting recurring transaction patterns."""
 
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional
@@ -14,6 +14,7 @@ from app.models.account import Account
 from app.models.recurring_transaction import RecurringFrequency, RecurringTransaction
 from app.models.transaction import Label, Transaction, TransactionLabel
 from app.models.user import User
+from app.services.merchant_service import merchant_condition
 from app.utils.datetime_utils import utc_now
 
 
@@ -127,6 +128,7 @@ class RecurringDetectionService:
         result = await db.execute(
             select(
                 Transaction.merchant_name,
+                Transaction.merchant_id,
                 Transaction.account_id,
                 Transaction.date,
                 Transaction.amount,
@@ -139,19 +141,37 @@ class RecurringDetectionService:
         )
         rows = result.all()
 
-        # Group by merchant name and account
+        # Group by merchant and account; every spelling of a resolved merchant
+        # counts together, unresolved rows group by their raw name
         grouped: Dict[tuple, List] = defaultdict(list)
         for row in rows:
-            key = (row.merchant_name, row.account_id)
+            key = (row.merchant_id or row.merchant_name, row.account_id)
             grouped[key].append(row)
 
+        # Load existing patterns once, keyed both ways
+        existing_result = await db.execute(
+            select(RecurringTransaction).where(
+                RecurringTransaction.organization_id == user.organization_id
+            )
+        )
+        by_merchant: Dict[tuple, RecurringTransaction] = {}
+        by_name: Dict[tuple, RecurringTransaction] = {}
+        for existing in existing_result.scalars().all():
+            if existing.merchant_id is not None:
+                by_merchant.setdefault((existing.merchant_id, existing.account_id), existing)
+            by_name.setdefault((existing.merchant_name, existing.account_id), existing)
+
         # Detect patterns
         patterns = []
 
-        for (merchant_name, account_id), txns in grouped.items():
+        for (merchant_key, account_id), txns in grouped.items():
             if len(txns) < min_occurrences:
                 continue
 
+            merchant_id = merchant_key if isinstance(merchant_key, UUID) else None
+            spellings = Counter(row.merchant_name for row in txns)
+            merchant_name = spellings.most_common(1)[0][0]
+
             # Calculate frequency
             dates = [row.date for row in txns]
             frequency = RecurringDetectionService._calculate_frequency(dates)
@@ -211,19 +231,17 @@ class RecurringDetectionService:
                     best_category_id = cid
                     best_count = cnt
 
-            # Check if pattern already exists
-            existing_result = await db.execute(
-                select(RecurringTransaction).where(
-                    and_(
-                        RecurringTransaction.organization_id == user.organization_id,
-                        RecurringTransaction.account_id == account_id,
-                        RecurringTransaction.merchant_name == merchant_name,
-                    )
+            # Check if pattern already exists, under this merchant or any of its spellings
+            existing = by_merchant.get((merchant_id, account_id)) if merchant_id else None
+            if existing is None:
+                existing = next(
+                    (by_name[(n, account_id)] for n in spellings if (n, account_id) in by_name),
+                    None,
                 )
-            )
-            existing = existing_result.scalar_one_or_none()
 
             if existing:
+                if merchant_id and existing.merchant_id is None:
+                    existing.merchant_id = merchant_id
                 # Update existing pattern
                 existing.frequency = frequency
                 existing.average_amount = avg_amount
@@ -247,6 +265,7 @@ class RecurringDetectionService:
                     organization_id=user.organization_id,
                     account_id=account_id,
                     merchant_name=merchant_name,
+                    merchant_id=merchant_id,
                     frequency=frequency,
                     average_amount=avg_amount,
                     amount_variance=amount_variance,
@@ -274,12 +293,12 @@ class RecurringDetectionService:
                 merchant_name=pattern.merchant_name,
                 account_id=pattern.account_id,
                 label_id=pattern.label_id,
+                merchant_id=pattern.merchant_id,
             )
 
         # Mark auto-detected patterns not seen in this run as "no longer found"
-        detected_keys = {
-            (merchant_name, str(account_id)) for (merchant_name, account_id) in grouped.keys()
-        }
+        detected_keys = {(key, str(account_id)) for (key, account_id) in grouped.keys()}
+        detected_keys.update((row.merchant_name, str(row.account_id)) for row in rows)
         all_auto_result = await db.execute(
             select(RecurringTransaction).where(
                 and_(
@@ -290,8 +309,11 @@ class RecurringDetectionService:
             )
         )
         for auto_pattern in all_auto_result.scalars().all():
-            key = (auto_pattern.merchant_name, str(auto_pattern.account_id))
-            if key not in detected_keys:
+            keys = {
+                (auto_pattern.merchant_id, str(auto_pattern.account_id)),
+                (auto_pattern.merchant_name, str(auto_pattern.account_id)),
+            }
+            if not keys & detected_keys:
                 auto_pattern.is_no_longer_found = True
                 auto_pattern.updated_at = utc_now()
 
@@ -609,9 +631,11 @@ class RecurringDetectionService:
         merchant_name: str,
         account_id: UUID,
         label_id: UUID,
+        merchant_id: Optional[UUID] = None,
     ) -> int:
         """
         Apply a label to all transactions matching the given merchant + account.
+        With a merchant_id, every spelling of that merchant matches.
         Skips transactions that already have the label.
         Returns the count of newly labelled transactions.
         """
@@ -621,7 +645,7 @@ class RecurringDetectionService:
                 and_(
                     Transaction.organization_id == organization_id,
                     Transaction.account_id == account_id,
-                    Transaction.merchant_name == merchant_name,
+                    merchant_condition(merchant_id, merchant_name),
                 )
             )
         )
@@ -660,6 +684,7 @@ class RecurringDetectionService:
         organization_id: UUID,
         merchant_name: str,
         account_id: UUID,
+        merchant_id: Optional[UUID] = None,
     ) -> int:
         """Count transactions matching the given merchant + account (for UI preview)."""
         result = await db.execute(
@@ -667,7 +692,7 @@ class RecurringDetectionService:
                 and_(
                     Transaction.organization_id == organization_id,
                     Transaction.account_id == account_id,
-                    Transaction.merchant_name == merchant_name,
+                    merchant_condition(merchant_id, merchant_name),
                 )
             )
         )
@@ -1,20 +1,31 @@
 """Service for custom report execution and management."""
 
 import csv
+import hashlib
 import io
+import zlib
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Dict, Optional, Any
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, case
+import orjson
+from sqlalchemy import Select, and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.transaction import Transaction
+from app.core import cache
 from app.models.account import Account
 from app.models.report_template import ReportTemplate
+from app.models.transaction import Transaction
 from app.utils.csv_sanitize import sanitize_csv_row
 
+# Rows fetched per round trip when streaming a report, and rows per CSV chunk
+STREAM_BATCH_ROWS = 1000
+CSV_CHUNK_ROWS = 500
+
+# Cached report results (scheduled deliveries sharing one execution)
+REPORT_CACHE_TTL = 3600
+
 
 class ReportService:
     """Service for executing and managing custom reports."""
@@ -40,13 +51,52 @@ class ReportService:
         Returns:
             Report result with data and metadata
         """
-        # Parse date range
-        start_date, end_date = ReportService._parse_date_range(config.get("dateRange", {}))
+        conditions, start_date, end_date = ReportService._report_conditions(
+            organization_id, config, user_id, account_ids
+        )
 
         # Get grouping configuration
         group_by = config.get("groupBy", "category")
         time_grouping = config.get("timeGrouping", "monthly")
 
+        # Execute query based on grouping
+        if group_by == "time":
+            result_data = await ReportService._execute_time_grouped_query(
+                db, conditions, time_grouping
+            )
+        elif group_by == "category":
+            result_data = await ReportService._execute_category_query(db, conditions, config)
+        elif group_by == "merchant":
+            result_data = await ReportService._execute_merchant_query(db, conditions, config)
+        elif group_by == "account":
+            result_data = await ReportService._execute_account_query(db, conditions, config)
+        else:
+            result_data = []
+
+        # Calculate summary metrics
+        metrics = ReportService._calculate_metrics(result_data, config.get("metrics", ["sum"]))
+
+        return {
+            "data": result_data,
+            "metrics": metrics,
+            "config": config,
+            "dateRange": {
+                "startDate": start_date.isoformat(),
+                "endDate": end_date.isoformat(),
+            },
+        }
+
+    @staticmethod
+    def _report_conditions(
+        organization_id: UUID,
+        config: Dict[str, Any],
+        user_id: Optional[UUID] = None,
+        account_ids: Optional[List[UUID]] = None,
+    ) -> tuple[List, date, date]:
+        """Query conditions and resolved date range for a report config."""
+        # Parse date range
+        start_date, end_date = ReportService._parse_date_range(config.get("dateRange", {}))
+
         # Get filters
         filters = config.get("filters", {})
         transaction_type = filters.get("transactionType", "both")
@@ -79,32 +129,7 @@ class ReportService:
         if filters.get("maxAmount"):
             conditions.append(func.abs(Transaction.amount) <= Decimal(str(filters["maxAmount"])))
 
-        # Execute query based on grouping
-        if group_by == "time":
-            result_data = await ReportService._execute_time_grouped_query(
-                db, conditions, time_grouping
-            )
-        elif group_by == "category":
-            result_data = await ReportService._execute_category_query(db, conditions, config)
-        elif group_by == "merchant":
-            result_data = await ReportService._execute_merchant_query(db, conditions, config)
-        elif group_by == "account":
-            result_data = await ReportService._execute_account_query(db, conditions, config)
-        else:
-            result_data = []
-
-        # Calculate summary metrics
-        metrics = ReportService._calculate_metrics(result_data, config.get("metrics", ["sum"]))
-
-        return {
-            "data": result_data,
-            "metrics": metrics,
-            "config": config,
-            "dateRange": {
-                "startDate": start_date.isoformat(),
-                "endDate": end_date.isoformat(),
-            },
-        }
+        return conditions, start_date, end_date
 
     @staticmethod
     def _parse_date_range(date_range_config: Dict) -> tuple[date, date]:
@@ -142,10 +167,8 @@ class ReportService:
             return start_date, end_date
 
     @staticmethod
-    async def _execute_time_grouped_query(
-        db: AsyncSession, conditions: List, time_grouping: str
-    ) -> List[Dict]:
-        """Execute query grouped by time period."""
+    def _time_grouped_statement(conditions: List, time_grouping: str) -> Select:
+        """Income/expense totals per time period."""
         # Determine time truncation based on grouping
         if time_grouping == "daily":
             date_expr = func.date(Transaction.date)
@@ -158,7 +181,7 @@ class ReportService:
         else:  # monthly
             date_expr = func.date_trunc("month", Transaction.date)
 
-        result = await db.execute(
+        return (
             select(
                 date_expr.label("period"),
                 func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0)).label(
@@ -176,29 +199,32 @@ class ReportService:
             .order_by(date_expr)
         )
 
-        data = []
-        for row in result.all():
-            period_str = row.period.strftime("%Y-%m-%d") if row.period else ""
-            income = float(row.income or 0)
-            expenses = abs(float(row.expenses or 0))
-
-            data.append(
-                {
-                    "name": period_str,
-                    "income": income,
-                    "expenses": expenses,
-                    "net": income - expenses,
-                    "count": row.count,
-                }
-            )
-
-        return data
+    @staticmethod
+    def _time_row(row) -> Dict:
+        period_str = row.period.strftime("%Y-%m-%d") if row.period else ""
+        income = float(row.income or 0)
+        expenses = abs(float(row.expenses or 0))
+        return {
+            "name": period_str,
+            "income": income,
+            "expenses": expenses,
+            "net": income - expenses,
+            "count": row.count,
+        }
 
     @staticmethod
-    async def _execute_category_query(
-        db: AsyncSession, conditions: List, config: Dict
+    async def _execute_time_grouped_query(
+        db: AsyncSession, conditions: List, time_grouping: str
     ) -> List[Dict]:
-        """Execute query grouped by category."""
+        """Execute query grouped by time period."""
+        result = await db.execute(
+            ReportService._time_grouped_statement(conditions, time_grouping)
+        )
+        return [ReportService._time_row(row) for row in result.all()]
+
+    @staticmethod
+    def _category_statement(conditions: List, config: Dict) -> Select:
+        """Top categories by absolute amount (or count)."""
         sort_by = config.get("sortBy", "amount")
         sort_direction = config.get("sortDirection", "desc")
         limit = config.get("limit", 20)
@@ -208,7 +234,7 @@ class ReportService:
             else func.sum(func.abs(Transaction.amount))
         )
 
-        result = await db.execute(
+        return (
             select(
                 Transaction.category_primary,
                 func.sum(func.abs(Transaction.amount)).label("total"),
@@ -224,34 +250,51 @@ class ReportService:
             .limit(limit)
         )
 
-        data = []
-        total_sum = 0
-        for row in result.all():
-            amount = float(row.total or 0)
-            total_sum += amount
-
-            data.append(
-                {
-                    "name": row.category_primary or "Uncategorized",
-                    "amount": amount,
-                    "count": row.count,
-                }
-            )
+    @staticmethod
+    def _category_share_statement(conditions: List, config: Dict) -> Select:
+        """
+        The category query with each row's share of the total alongside.
 
-        # Calculate percentages
-        for item in data:
-            item["percentage"] = (item["amount"] / total_sum * 100) if total_sum > 0 else 0
+        The total is a window sum over the limited categories, so rows can be
+        streamed without a second pass to compute percentages.
+        """
+        top = ReportService._category_statement(conditions, config).subquery()
+        sort_col = top.c.count if config.get("sortBy", "amount") == "count" else top.c.total
+        return select(
+            top.c.category_primary,
+            top.c.total,
+            top.c.count,
+            func.sum(top.c.total).over().label("grand_total"),
+        ).order_by(
+            sort_col.desc() if config.get("sortDirection", "desc") == "desc" else sort_col.asc()
+        )
 
-        return data
+    @staticmethod
+    def _category_row(row, total_sum: float) -> Dict:
+        amount = float(row.total or 0)
+        return {
+            "name": row.category_primary or "Uncategorized",
+            "amount": amount,
+            "count": row.count,
+            "percentage": (amount / total_sum * 100) if total_sum > 0 else 0,
+        }
 
     @staticmethod
-    async def _execute_merchant_query(
+    async def _execute_category_query(
         db: AsyncSession, conditions: List, config: Dict
     ) -> List[Dict]:
-        """Execute query grouped by merchant."""
+        """Execute query grouped by category."""
+        result = await db.execute(ReportService._category_statement(conditions, config))
+        rows = result.all()
+        total_sum = sum(float(row.total or 0) for row in rows)
+        return [ReportService._category_row(row, total_sum) for row in rows]
+
+    @staticmethod
+    def _merchant_statement(conditions: List, config: Dict) -> Select:
+        """Top merchants by absolute amount."""
         limit = config.get("limit", 20)
 
-        result = await db.execute(
+        return (
             select(
                 Transaction.merchant_name,
                 func.sum(func.abs(Transaction.amount)).label("total"),
@@ -265,24 +308,26 @@ class ReportService:
             .limit(limit)
         )
 
-        data = []
-        for row in result.all():
-            data.append(
-                {
-                    "name": row.merchant_name or "Unknown",
-                    "amount": float(row.total or 0),
-                    "count": row.count,
-                }
-            )
-
-        return data
+    @staticmethod
+    def _merchant_row(row) -> Dict:
+        return {
+            "name": row.merchant_name or "Unknown",
+            "amount": float(row.total or 0),
+            "count": row.count,
+        }
 
     @staticmethod
-    async def _execute_account_query(
+    async def _execute_merchant_query(
         db: AsyncSession, conditions: List, config: Dict
     ) -> List[Dict]:
-        """Execute query grouped by account."""
-        result = await db.execute(
+        """Execute query grouped by merchant."""
+        result = await db.execute(ReportService._merchant_statement(conditions, config))
+        return [ReportService._merchant_row(row) for row in result.all()]
+
+    @staticmethod
+    def _account_statement(conditions: List, config: Dict) -> Select:
+        """Totals per account by absolute amount."""
+        return (
             select(
                 Account.name,
                 func.sum(func.abs(Transaction.amount)).label("total"),
@@ -295,17 +340,64 @@ class ReportService:
             .order_by(func.sum(func.abs(Transaction.amount)).desc())
         )
 
-        data = []
-        for row in result.all():
-            data.append(
-                {
-                    "name": row.name,
-                    "amount": float(row.total or 0),
-                    "count": row.count,
-                }
+    @staticmethod
+    def _account_row(row) -> Dict:
+        return {
+            "name": row.name,
+            "amount": float(row.total or 0),
+            "count": row.count,
+        }
+
+    @staticmethod
+    async def _execute_account_query(
+        db: AsyncSession, conditions: List, config: Dict
+    ) -> List[Dict]:
+        """Execute query grouped by account."""
+        result = await db.execute(ReportService._account_statement(conditions, config))
+        return [ReportService._account_row(row) for row in result.all()]
+
+    @staticmethod
+    async def stream_report_rows(
+        db: AsyncSession,
+        organization_id: UUID,
+        config: Dict[str, Any],
+        user_id: Optional[UUID] = None,
+        account_ids: Optional[List[UUID]] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield a report's data rows as the database returns them.
+
+        Same rows as ``execute_report(...)["data"]``, read through a streaming
+        (server-side) cursor STREAM_BATCH_ROWS at a time, so memory stays
+        constant however many rows the report has.
+        """
+        conditions, _, _ = ReportService._report_conditions(
+            organization_id, config, user_id, account_ids
+        )
+        group_by = config.get("groupBy", "category")
+        if group_by == "time":
+            statement = ReportService._time_grouped_statement(
+                conditions, config.get("timeGrouping", "monthly")
             )
+            to_row = ReportService._time_row
+        elif group_by == "category":
+            statement = ReportService._category_share_statement(conditions, config)
 
-        return data
+            def to_row(row):
+                return ReportService._category_row(row, float(row.grand_total or 0))
+
+        elif group_by == "merchant":
+            statement = ReportService._merchant_statement(conditions, config)
+            to_row = ReportService._merchant_row
+        elif group_by == "account":
+            statement = ReportService._account_statement(conditions, config)
+            to_row = ReportService._account_row
+        else:
+            return
+
+        result = await db.stream(statement.execution_options(yield_per=STREAM_BATCH_ROWS))
+        async for row in result:
+            yield to_row(row)
 
     @staticmethod
     def _calculate_metrics(data: List[Dict], metrics: List[str]) -> Dict:
@@ -331,15 +423,67 @@ class ReportService:
         return result
 
     @staticmethod
-    async def generate_export_csv(
+    def execution_key(
+        organization_id: UUID,
+        config: Dict[str, Any],
+        user_id: Optional[UUID] = None,
+        account_ids: Optional[List[UUID]] = None,
+    ) -> str:
+        """
+        Identity of one report execution.
+
+        Two executions with the same key return the same result: same
+        organization, scope and config, with preset date ranges resolved to
+        the concrete period they cover today.
+        """
+        start_date, end_date = ReportService._parse_date_range(config.get("dateRange", {}))
+        identity = {
+            "organization_id": str(organization_id),
+            "user_id": str(user_id) if user_id else None,
+            "account_ids": sorted(str(a) for a in account_ids) if account_ids else None,
+            "config": config,
+            "period": [start_date.isoformat(), end_date.isoformat()],
+        }
+        return hashlib.sha256(
+            orjson.dumps(identity, option=orjson.OPT_SORT_KEYS, default=str)
+        ).hexdigest()
+
+    @staticmethod
+    async def execute_report_cached(
+        db: AsyncSession,
+        organization_id: UUID,
+        config: Dict[str, Any],
+        user_id: Optional[UUID] = None,
+        account_ids: Optional[List[UUID]] = None,
+    ) -> Dict[str, Any]:
+        """execute_report, cached by execution_key for REPORT_CACHE_TTL seconds."""
+        cache_key = "report:result:" + ReportService.execution_key(
+            organization_id, config, user_id, account_ids
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await ReportService.execute_report(
+            db, organization_id, config, user_id, account_ids
+        )
+        await cache.setex(cache_key, REPORT_CACHE_TTL, result)
+        return result
+
+    @staticmethod
+    async def open_export_stream(
         db: AsyncSession,
         organization_id: UUID,
         template_id: UUID,
         user_id: Optional[UUID] = None,
         account_ids: Optional[List[UUID]] = None,
-    ) -> str:
+        session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]] = None,
+    ) -> AsyncIterator[str]:
         """
-        Generate CSV export from a saved template.
+        CSV export of a saved template as a stream of text chunks.
+
+        The template is loaded (and ValueError raised if it does not exist)
+        before this returns; rows are only read as the stream is consumed.
 
         Args:
             db: Database session
@@ -347,9 +491,12 @@ class ReportService:
             template_id: Report template ID
             user_id: Optional user ID for filtering
             account_ids: Optional list of account IDs for filtering
+            session_factory: When set, rows are read in a session the stream
+                opens and closes itself, so it may outlive *db* (e.g. a
+                request-scoped session closed before the response body is sent)
 
         Returns:
-            CSV string
+            Async iterator of CSV chunks
         """
         # Load template
         result = await db.execute(
@@ -365,27 +512,88 @@ class ReportService:
         if not template:
             raise ValueError(f"Report template {template_id} not found")
 
-        # Execute report
-        report_result = await ReportService.execute_report(
-            db,
-            organization_id,
-            template.config,
-            user_id,
-            account_ids,
+        if session_factory is not None:
+            return _csv_chunks(
+                _stream_rows_in_session(
+                    session_factory, organization_id, template.config, user_id, account_ids
+                )
+            )
+        return _csv_chunks(
+            ReportService.stream_report_rows(
+                db, organization_id, template.config, user_id, account_ids
+            )
         )
 
-        # Build CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header row
-        data = report_result.get("data", [])
-        if data:
-            headers = list(data[0].keys())
-            writer.writerow(headers)
+    @staticmethod
+    async def generate_export_csv(
+        db: AsyncSession,
+        organization_id: UUID,
+        template_id: UUID,
+        user_id: Optional[UUID] = None,
+        account_ids: Optional[List[UUID]] = None,
+    ) -> str:
+        """
+        Generate CSV export from a saved template.
 
-            # Data rows
-            for row in data:
-                writer.writerow(sanitize_csv_row([row.get(header, "") for header in headers]))
+        Args:
+            db: Database session
+            organization_id: Organization ID
+            template_id: Report template ID
+            user_id: Optional user ID for filtering
+            account_ids: Optional list of account IDs for filtering
 
-        return output.getvalue()
+        Returns:
+            CSV string
+        """
+        chunks = await ReportService.open_export_stream(
+            db, organization_id, template_id, user_id, account_ids
+        )
+        return "".join([chunk async for chunk in chunks])
+
+
+async def _stream_rows_in_session(
+    session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+    organization_id: UUID,
+    config: Dict[str, Any],
+    user_id: Optional[UUID],
+    account_ids: Optional[List[UUID]],
+) -> AsyncIterator[Dict]:
+    """``stream_report_rows`` in a session owned by the stream."""
+    async with session_factory() as session:
+        async for row in ReportService.stream_report_rows(
+            session, organization_id, config, user_id, account_ids
+        ):
+            yield row
+
+
+async def _csv_chunks(rows: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    """CSV text for *rows* (header from the first row), CSV_CHUNK_ROWS rows per chunk."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    headers = None
+    pending = 0
+
+    async for row in rows:
+        if headers is None:
+            headers = list(row.keys())
+            writer.writerow(headers)
+        writer.writerow(sanitize_csv_row([row.get(header, "") for header in headers]))
+        pending += 1
+        if pending >= CSV_CHUNK_ROWS:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            pending = 0
+
+    if output.tell():
+        yield output.getvalue()
+
+
+async def gzip_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Gzip-compress a text stream incrementally (for ``.csv.gz`` downloads)."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
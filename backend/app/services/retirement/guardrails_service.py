@@ -14,8 +14,9 @@ This service implements two capabilities:
      - *Capital-preservation rule*: if current_wr > UPPER_GUARD * initial_wr
        AND more than 15 years of retirement remain, cut spending by 10%.
 
-Both modes run a configurable number of Monte Carlo paths and return
-percentile fan data, success rates, and per-year statistics.
+Both modes run a configurable number of Monte Carlo paths through the shared
+vectorized kernel in ``path_simulation`` and return percentile fan data,
+success rates, and per-year statistics.
 
 Constants
 ---------
@@ -38,12 +39,18 @@ References
 
 from __future__ import annotations
 
-import math
-import random
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 from app.constants.financial import FIRE
+from app.services.retirement.path_simulation import (
+    SpendingRule,
+    generate_normal_returns,
+    simulate_paths,
+    summarize_paths,
+)
 
 # ---------------------------------------------------------------------------
 # Historical crash scenario reference data
@@ -91,6 +98,36 @@ _ADJUSTMENT = 0.10  # 10 % raise or cut
 _MIN_YEARS_FOR_CUTS = 15  # Don't cut spending within 15 years of end
 
 
+def _guardrails_rule(initial_wr: float, total_years: int) -> SpendingRule:
+    """Build the Guyton-Klinger raise/cut rule as a masked array update."""
+
+    def rule(
+        year: int, balances: np.ndarray, spending: np.ndarray, alive: np.ndarray
+    ) -> np.ndarray:
+        funded = alive & (balances > 0)
+        current_wr = np.divide(
+            spending, balances, out=np.zeros_like(spending), where=funded
+        )
+        years_remaining = total_years - year
+
+        # Prosperity rule: raise spending 10 %
+        raise_mask = funded & (current_wr < _LOWER_GUARD * initial_wr)
+        # Capital-preservation rule: cut spending 10 %
+        cut_mask = (
+            funded
+            & ~raise_mask
+            & (current_wr > _UPPER_GUARD * initial_wr)
+            & (years_remaining >= _MIN_YEARS_FOR_CUTS)
+        )
+
+        adjusted = spending.copy()
+        adjusted[raise_mask] *= 1 + _ADJUSTMENT
+        adjusted[cut_mask] *= 1 - _ADJUSTMENT
+        return adjusted
+
+    return rule
+
+
 @dataclass
 class YearStats:
     """Per-year summary statistics across all simulation paths."""
@@ -218,100 +255,40 @@ def run_guardrails_simulation(
 
     initial_wr = annual_spending / initial_portfolio
 
-    all_paths: list[list[float]] = []
-    all_spending_paths: list[list[float]] = []
-    depleted_count = 0
-
-    for _ in range(num_simulations):
-        portfolio = initial_portfolio
-        spending = annual_spending  # nominal, adjusted each year
-        path: list[float] = [portfolio]
-        spending_path: list[float] = []
-        depleted = False
-        depletion_year = total_years + 1
-
-        for year in range(1, total_years + 1):
-            if depleted:
-                path.append(0.0)
-                spending_path.append(spending)
-                continue
-
-            # Year 1: forced crash return; subsequent years: stochastic
-            if year == 1:
-                annual_return = crash_return
-            else:
-                u1 = random.random() or 1e-10
-                u2 = random.random()
-                z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-                annual_return = mu + z * sigma
-
-            # Apply guardrails before withdrawal
-            if guardrails_enabled and portfolio > 0:
-                current_wr = spending / portfolio
-                years_remaining = total_years - year
-
-                if current_wr < _LOWER_GUARD * initial_wr:
-                    # Prosperity rule: raise spending 10 %
-                    spending = spending * (1 + _ADJUSTMENT)
-                elif (current_wr > _UPPER_GUARD * initial_wr
-                      and years_remaining >= _MIN_YEARS_FOR_CUTS):
-                    # Capital-preservation rule: cut spending 10 %
-                    spending = spending * (1 - _ADJUSTMENT)
-
-            # Grow then withdraw
-            portfolio = portfolio * (1 + annual_return)
-            net_withdrawal = max(spending, 0.0)
-            portfolio = max(portfolio - net_withdrawal, 0.0)
-
-            # Inflate spending for next year
-            spending = spending * (1 + inflation)
-
-            if portfolio <= 0 and not depleted:
-                depleted = True
-                depletion_year = year
-                depleted_count += 1
-
-            path.append(portfolio)
-            spending_path.append(net_withdrawal)
-
-        all_paths.append(path)
-        all_spending_paths.append(spending_path)
+    # Year 1: forced crash return; subsequent years: stochastic
+    returns = generate_normal_returns(num_simulations, total_years, mu, sigma)
+    returns[:, 0] = crash_return
+
+    spending_rule = _guardrails_rule(initial_wr, total_years) if guardrails_enabled else None
+    sim = simulate_paths(
+        initial_balance=initial_portfolio,
+        initial_spending=annual_spending,
+        annual_returns=returns,
+        inflation=inflation,
+        spending_rule=spending_rule,
+    )
 
     # Build per-year stats
-    yearly_stats: list[YearStats] = []
-    for year in range(total_years + 1):
-        values = sorted(p[year] for p in all_paths)
-        n = len(values)
-        depleted_at_year = sum(1 for v in values if v <= 0) / n
-
-        def pct(q: float) -> float:
-            idx = int(q * n)
-            return values[min(idx, n - 1)]
-
-        yearly_stats.append(
-            YearStats(
-                year=year,
-                age=current_age + year,
-                p10=round(pct(0.10), 2),
-                p25=round(pct(0.25), 2),
-                p50=round(pct(0.50), 2),
-                p75=round(pct(0.75), 2),
-                p90=round(pct(0.90), 2),
-                mean=round(sum(values) / n, 2),
-                pct_depleted=round(depleted_at_year, 4),
-            )
+    summary = summarize_paths(sim.balances)
+    pcts = summary.percentiles
+    yearly_stats: list[YearStats] = [
+        YearStats(
+            year=year,
+            age=current_age + year,
+            p10=round(float(pcts[0.10][year]), 2),
+            p25=round(float(pcts[0.25][year]), 2),
+            p50=round(float(pcts[0.50][year]), 2),
+            p75=round(float(pcts[0.75][year]), 2),
+            p90=round(float(pcts[0.90][year]), 2),
+            mean=round(float(summary.mean[year]), 2),
+            pct_depleted=round(float(summary.pct_depleted[year]), 4),
         )
-
-    final_values = sorted(p[-1] for p in all_paths)
-    n = len(final_values)
-
-    def _pct(q: float) -> float:
-        idx = int(q * n)
-        return final_values[min(idx, n - 1)]
+        for year in range(total_years + 1)
+    ]
 
     # Median spending path (median path by final value)
-    median_idx = n // 2
-    median_spending = [round(v, 2) for v in all_spending_paths[median_idx]]
+    median_idx = sim.median_path_index()
+    median_spending = [round(float(v), 2) for v in sim.withdrawals[median_idx]]
 
     return GuardrailsResult(
         initial_portfolio=initial_portfolio,
@@ -320,10 +297,10 @@ def run_guardrails_simulation(
         crash_scenario_name=scenario_name,
         crash_first_year_return=crash_return,
         guardrails_enabled=guardrails_enabled,
-        success_rate=round((num_simulations - depleted_count) / num_simulations, 4),
-        median_final_portfolio=round(_pct(0.50), 2),
-        p10_final_portfolio=round(_pct(0.10), 2),
-        p90_final_portfolio=round(_pct(0.90), 2),
+        success_rate=round(sim.success_rate, 4),
+        median_final_portfolio=round(float(pcts[0.50][-1]), 2),
+        p10_final_portfolio=round(float(pcts[0.10][-1]), 2),
+        p90_final_portfolio=round(float(pcts[0.90][-1]), 2),
         yearly_stats=yearly_stats,
         median_spending_path=median_spending,
         num_simulations=num_simulations,
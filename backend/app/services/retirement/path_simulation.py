@@ -0,0 +1,185 @@
+"""Vectorized Monte Carlo path-simulation kernel.
+
+Shared core for the retirement stress tests (Guyton-Klinger guardrails,
+survivor income scenarios).  All paths are simulated at once as NumPy
+arrays of shape ``(num_paths, num_years)``, so the only Python-level loop
+is over simulation years — 10,000 paths over a 40-year horizon run in a
+few milliseconds instead of seconds.
+
+Each simulated year follows the same order of operations that the scalar
+loops used:
+
+  1. The optional ``spending_rule`` callback may adjust each live path's
+     nominal spending based on its current (pre-growth) balance.
+  2. The balance grows by that year's return.
+  3. Net withdrawal (spending minus any guaranteed income) is taken out,
+     floored at zero.
+  4. Spending is inflated for the following year.
+
+Once a path depletes it stays at $0 and its spending is frozen; callbacks
+only ever see masked updates for live paths.
+
+Percentiles use the same nearest-rank convention as the original loops
+(``sorted_values[min(int(q * n), n - 1)]``) so the reported fan data is
+unchanged for a given set of paths.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+# Callback signature: (year, balances, spending, alive) -> new spending.
+# ``year`` is 1-based; ``alive`` is a boolean mask of non-depleted paths.
+SpendingRule = Callable[[int, np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+DEFAULT_QUANTILES: tuple[float, ...] = (0.10, 0.25, 0.50, 0.75, 0.90)
+
+
+@dataclass
+class PathSimulation:
+    """Raw simulation output for every path."""
+
+    balances: np.ndarray  # (num_paths, num_years + 1); column 0 = initial balance
+    withdrawals: np.ndarray  # (num_paths, num_years); net withdrawal each year
+    depletion_year: np.ndarray  # (num_paths,); num_years + 1 if never depleted
+
+    @property
+    def num_paths(self) -> int:
+        return int(self.balances.shape[0])
+
+    @property
+    def num_years(self) -> int:
+        return int(self.withdrawals.shape[1])
+
+    @property
+    def depleted(self) -> np.ndarray:
+        """Boolean mask of paths that ran out of money at any point."""
+        return self.depletion_year <= self.num_years
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of paths that never depleted."""
+        return float(1.0 - self.depleted.mean())
+
+    def median_path_index(self) -> int:
+        """Index of the path whose final balance is the median."""
+        order = np.argsort(self.balances[:, -1], kind="stable")
+        return int(order[self.num_paths // 2])
+
+
+@dataclass
+class PathSummary:
+    """Per-year cross-sectional statistics over all paths."""
+
+    percentiles: dict[float, np.ndarray]  # quantile -> (num_years + 1,)
+    mean: np.ndarray  # (num_years + 1,)
+    pct_depleted: np.ndarray  # (num_years + 1,) fraction of paths at $0
+
+
+def generate_normal_returns(
+    num_paths: int,
+    num_years: int,
+    mean: float,
+    std_dev: float,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Draw a ``(num_paths, num_years)`` matrix of normally distributed returns."""
+    rng = rng if rng is not None else np.random.default_rng()
+    return rng.normal(mean, std_dev, size=(num_paths, num_years))
+
+
+def simulate_paths(
+    initial_balance: float,
+    initial_spending: float,
+    annual_returns: np.ndarray,
+    inflation: float,
+    income: Optional[np.ndarray] = None,
+    spending_rule: Optional[SpendingRule] = None,
+) -> PathSimulation:
+    """Simulate portfolio balances for every path in ``annual_returns``.
+
+    Parameters
+    ----------
+    initial_balance:
+        Starting portfolio value shared by all paths.
+    initial_spending:
+        Nominal spending in year 1.
+    annual_returns:
+        Matrix of shape ``(num_paths, num_years)`` with decimal returns.
+    inflation:
+        Annual inflation applied to spending after each year.
+    income:
+        Optional per-year guaranteed income of shape ``(num_years,)`` that
+        offsets spending before the portfolio is drawn on (e.g. Social
+        Security once claimed, zero before).
+    spending_rule:
+        Optional callback that returns adjusted spending for live paths
+        before growth (e.g. guardrail raises/cuts).
+    """
+    returns = np.asarray(annual_returns, dtype=float)
+    if returns.ndim != 2:
+        raise ValueError("annual_returns must be a (num_paths, num_years) matrix")
+    num_paths, num_years = returns.shape
+    if income is not None:
+        income = np.asarray(income, dtype=float)
+        if income.shape != (num_years,):
+            raise ValueError("income must have one entry per simulated year")
+
+    balances = np.empty((num_paths, num_years + 1))
+    withdrawals = np.zeros((num_paths, num_years))
+    depletion_year = np.full(num_paths, num_years + 1, dtype=np.int64)
+
+    balance = np.full(num_paths, float(initial_balance))
+    spending = np.full(num_paths, float(initial_spending))
+    alive = np.ones(num_paths, dtype=bool)
+    balances[:, 0] = balance
+
+    for year in range(1, num_years + 1):
+        if spending_rule is not None:
+            adjusted = spending_rule(year, balance, spending, alive)
+            spending = np.where(alive, adjusted, spending)
+
+        offset = income[year - 1] if income is not None else 0.0
+        net_withdrawal = np.maximum(spending - offset, 0.0)
+        grown = np.maximum(balance * (1.0 + returns[:, year - 1]) - net_withdrawal, 0.0)
+
+        balance = np.where(alive, grown, 0.0)
+        withdrawals[:, year - 1] = net_withdrawal
+        spending = np.where(alive, spending * (1.0 + inflation), spending)
+
+        newly_depleted = alive & (balance <= 0.0)
+        depletion_year[newly_depleted] = year
+        alive &= ~newly_depleted
+
+        balances[:, year] = balance
+
+    return PathSimulation(
+        balances=balances,
+        withdrawals=withdrawals,
+        depletion_year=depletion_year,
+    )
+
+
+def summarize_paths(
+    balances: np.ndarray,
+    quantiles: Sequence[float] = DEFAULT_QUANTILES,
+) -> PathSummary:
+    """Compute per-year percentiles, mean and depletion fraction."""
+    ordered = np.sort(balances, axis=0)
+    n = ordered.shape[0]
+    percentiles = {q: ordered[min(int(q * n), n - 1)] for q in quantiles}
+    return PathSummary(
+        percentiles=percentiles,
+        mean=balances.mean(axis=0),
+        pct_depleted=(balances <= 0.0).mean(axis=0),
+    )
+
+
+def nearest_rank(values: np.ndarray, q: float) -> float:
+    """Nearest-rank percentile of a 1-D array (matches :func:`summarize_paths`)."""
+    ordered = np.sort(values)
+    n = ordered.shape[0]
+    return float(ordered[min(int(q * n), n - 1)])
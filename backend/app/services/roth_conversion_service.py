@@ -17,6 +17,10 @@ For each projected year:
   6. From age 73 onwards layer in RMDs (no conversion needed once RMDs
      exceed the bracket headroom).
 
+``optimize_lifetime_tax`` is the search-based alternative: instead of a
+fixed rule, it looks for the per-year schedule with the lowest lifetime tax
+(see :class:`TaxKernel` and the method docstring).
+
 The service is pure Python / no database — all inputs are passed in.
 This makes it straightforward to unit-test and call from API endpoints
 that have already fetched balances.
@@ -30,6 +34,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from app.constants.financial import FIRE, MEDICARE, RMD, TAX
 
 logger = logging.getLogger(__name__)
@@ -125,6 +131,93 @@ def _rmd_amount(traditional_balance: float, age: int) -> float:
     return traditional_balance / factor
 
 
+# ── Vectorized tax kernel ──────────────────────────────────────────────────
+
+# Conversion amounts tried per balance grid point by the DP, as fractions of
+# what is left to convert (bracket and IRMAA fill targets are added to these)
+_DP_FRACTIONS = np.linspace(0.0, 1.0, 21)
+_DP_GRID_POINTS = 241
+
+
+class TaxKernel:
+    """Federal brackets, IRMAA tiers and RMDs evaluated over arrays.
+
+    Bracket ceilings and IRMAA thresholds are projected forward by a constant
+    COLA, and a bracket schedule scaled by ``f`` satisfies
+    ``tax(x) = f * tax_0(x / f)``.  Every year can therefore be evaluated
+    against the *current-year* table with a single ``np.searchsorted``,
+    broadcasting over any shape of incomes and year offsets.
+    """
+
+    def __init__(self, filing_status: str) -> None:
+        married = filing_status.lower() in ("married", "mfj")
+        brackets = TAX.BRACKETS_MARRIED if married else TAX.BRACKETS_SINGLE
+        self.rates = np.array([rate for rate, _ in brackets], dtype=np.float64)
+        self.ceilings = np.array([ceiling for _, ceiling in brackets], dtype=np.float64)
+        self.floors = np.concatenate(([0.0], self.ceilings[:-1]))
+        # Tax owed on income up to each bracket's floor
+        self.floor_tax = np.concatenate(
+            ([0.0], np.cumsum((self.ceilings[:-1] - self.floors[:-1]) * self.rates[:-1]))
+        )
+
+        irmaa = MEDICARE.IRMAA_BRACKETS_MARRIED if married else MEDICARE.IRMAA_BRACKETS_SINGLE
+        self.irmaa_thresholds = np.array([float(t) for t, _, _ in irmaa])
+        # Annual surcharge per tier: monthly Part B + Part D, for each enrollee
+        enrollees = 2 if married else 1
+        self.irmaa_surcharges = np.array([(b + d) * 12 * enrollees for _, b, d in irmaa])
+
+        divisors = np.full(121, np.inf)
+        for age in range(RMD.TRIGGER_AGE, 121):
+            divisors[age] = float(RMD.UNIFORM_LIFETIME_TABLE.get(age, 3.1))
+        self.rmd_divisors = divisors
+
+        self.standard_deduction = float(
+            TAX.STANDARD_DEDUCTION_MARRIED if married else TAX.STANDARD_DEDUCTION_SINGLE
+        )
+
+    @staticmethod
+    def _growth(years_from_now, cola: float) -> np.ndarray:
+        return (1 + cola) ** np.asarray(years_from_now, dtype=np.float64)
+
+    def income_tax(self, taxable_income, years_from_now) -> np.ndarray:
+        """Federal ordinary income tax on *taxable_income* (after deductions)."""
+        scale = self._growth(years_from_now, _BRACKET_COLA)
+        income = np.maximum(np.asarray(taxable_income, dtype=np.float64), 0.0) / scale
+        i = np.searchsorted(self.ceilings, income, side="left")
+        return scale * (self.floor_tax[i] + (income - self.floors[i]) * self.rates[i])
+
+    def marginal_rate(self, taxable_income, years_from_now) -> np.ndarray:
+        """Rate on the last dollar of *taxable_income*."""
+        scale = self._growth(years_from_now, _BRACKET_COLA)
+        income = np.asarray(taxable_income, dtype=np.float64) / scale
+        return self.rates[np.searchsorted(self.ceilings, income, side="left")]
+
+    def deduction(self, years_from_now) -> np.ndarray:
+        """Inflation-adjusted standard deduction."""
+        return self.standard_deduction * self._growth(years_from_now, _BRACKET_COLA)
+
+    def bracket_ceilings(self, years_from_now) -> np.ndarray:
+        """Finite bracket ceilings, shape ``(..., brackets - 1)``."""
+        scale = self._growth(years_from_now, _BRACKET_COLA)
+        return scale[..., None] * self.ceilings[:-1]
+
+    def irmaa_surcharge(self, magi, years_from_now) -> np.ndarray:
+        """Annual IRMAA surcharge on *magi* (thresholds projected at IRMAA_COLA)."""
+        scale = self._growth(years_from_now, FIRE.IRMAA_COLA)
+        magi = np.asarray(magi, dtype=np.float64) / scale
+        return self.irmaa_surcharges[np.searchsorted(self.irmaa_thresholds, magi, side="left")]
+
+    def irmaa_thresholds_for(self, years_from_now) -> np.ndarray:
+        """Finite IRMAA tier thresholds, shape ``(..., tiers - 1)``."""
+        scale = self._growth(years_from_now, FIRE.IRMAA_COLA)
+        return scale[..., None] * self.irmaa_thresholds[:-1]
+
+    def rmd(self, traditional_balance, age) -> np.ndarray:
+        """Required minimum distribution; zero before RMD.TRIGGER_AGE."""
+        age = np.minimum(np.asarray(age), 120)
+        return np.asarray(traditional_balance, dtype=np.float64) / self.rmd_divisors[age]
+
+
 # ── Data classes ───────────────────────────────────────────────────────────
 
 
@@ -203,6 +296,13 @@ class RothConversionResult:
     # Rough estimate of lifetime tax saved
     estimated_tax_savings: float
     summary: str
+    # 'bracket_fill' (greedy rule) or 'lifetime_tax' (search)
+    strategy: str = "bracket_fill"
+    # Present value of federal tax + IRMAA over the horizon, plus tax on the
+    # remaining traditional balance at the end (set by optimize_lifetime_tax)
+    lifetime_tax: Optional[float] = None
+    no_conversion_lifetime_tax: Optional[float] = None
+    schedules_evaluated: int = 0
 
 
 # ── Service ────────────────────────────────────────────────────────────────
@@ -362,3 +462,234 @@ class RothConversionService:
             estimated_tax_savings=round(tax_savings, 2),
             summary=summary,
         )
+
+    # ── Search-based optimizer ─────────────────────────────────────────────
+
+    def optimize_lifetime_tax(self, inp: RothConversionInput) -> RothConversionResult:
+        """
+        Find the conversion schedule with the lowest lifetime tax.
+
+        Lifetime tax is the present value (discounted at ``expected_return``,
+        i.e. conversion taxes are paid from funds that would otherwise have
+        grown) of each year's federal tax on income + RMD + conversion, the
+        IRMAA surcharge that year's MAGI triggers two years later, and tax on
+        the traditional balance left at the end of the horizon at
+        ``assumed_future_rate`` (default: the current marginal rate).
+
+        Two searches run on :class:`TaxKernel`:
+
+        1. Dynamic programming over a grid of traditional balances, trying
+           bracket / IRMAA fill targets and fractions of the balance each year.
+        2. A grid of "fill to bracket or IRMAA threshold X from year a to
+           year b" schedules, simulated together as arrays.
+
+        The cheapest of those, the greedy :meth:`optimize` schedule and no
+        conversions at all is returned, so the result never costs more than
+        either rule.
+        """
+        kernel = TaxKernel(inp.filing_status)
+        n = inp.years_to_project
+
+        candidates = [np.zeros(n), self._dp_schedule(kernel, inp)]
+        candidates.append(
+            np.array([y.optimal_conversion for y in self.optimize(inp).years], dtype=np.float64)
+        )
+        amounts = np.vstack(candidates)
+        targets = np.full_like(amounts, -np.inf)
+
+        # Fill-to-target windows: every (target, first year, last year) triple
+        years = np.arange(n)
+        fill_targets = kernel.bracket_ceilings(years) + kernel.deduction(years)[:, None]
+        if inp.respect_irmaa:
+            fill_targets = np.hstack([fill_targets, kernel.irmaa_thresholds_for(years)])
+        first, last = np.triu_indices(n)
+        in_window = (years >= first[:, None]) & (years <= last[:, None])  # (windows, n)
+        window_targets = np.where(
+            in_window[:, None, :], fill_targets.T[None, :, :], -np.inf
+        ).reshape(-1, n)
+        targets = np.vstack([targets, window_targets])
+        amounts = np.vstack([amounts, np.zeros_like(window_targets)])
+
+        lifetime, conversions = self._simulate(kernel, inp, amounts, targets)
+        best = int(np.argmin(lifetime))
+        result = self._plan(inp, conversions[best])
+        result.strategy = "lifetime_tax"
+        result.lifetime_tax = round(float(lifetime[best]), 2)
+        result.no_conversion_lifetime_tax = round(float(lifetime[0]), 2)
+        result.estimated_tax_savings = round(float(lifetime[0] - lifetime[best]), 2)
+        result.schedules_evaluated = len(lifetime)
+        if result.total_converted > 0:
+            result.summary = (
+                f"Converting ${result.total_converted:,.0f} over {n} years "
+                f"(tax cost ${result.total_tax_cost:,.0f}) lowers lifetime tax by "
+                f"~${result.estimated_tax_savings:,.0f} in today's dollars, the best of "
+                f"{result.schedules_evaluated:,} schedules compared."
+            )
+        else:
+            result.summary = (
+                "No conversions recommended — converting would not lower lifetime tax "
+                "at the assumed future tax rate."
+            )
+        return result
+
+    @staticmethod
+    def _terminal_rate(kernel: TaxKernel, inp: RothConversionInput) -> float:
+        if inp.assumed_future_rate is not None:
+            return inp.assumed_future_rate
+        return float(kernel.marginal_rate(max(0.0, inp.current_income - kernel.deduction(0)), 0))
+
+    @staticmethod
+    def _year_cost(kernel: TaxKernel, inp: RothConversionInput, i: int, trad, conversion):
+        """Year-*i* tax + discounted IRMAA for converting *conversion* out of *trad*.
+
+        Returns ``(cost, next_traditional_balance)``; arrays broadcast.
+        """
+        age = inp.current_age + i
+        rmd = kernel.rmd(trad, age)
+        gross = inp.current_income * (1 + _BRACKET_COLA) ** i + rmd + conversion
+        cost = kernel.income_tax(gross - kernel.deduction(i), i)
+        if inp.respect_irmaa and age + 2 >= MEDICARE.ELIGIBILITY_AGE:
+            # Surcharges are billed two years after the income year
+            cost = cost + kernel.irmaa_surcharge(gross, i + 2) / (1 + inp.expected_return) ** 2
+        return cost, (trad - rmd - conversion) * (1 + inp.expected_return)
+
+    def _conversion_candidates(self, kernel: TaxKernel, inp: RothConversionInput, i: int, trad):
+        """Conversion amounts the DP tries for each balance in *trad* (shape (G, 1))."""
+        rmd = kernel.rmd(trad, inp.current_age + i)
+        available = np.maximum(trad - rmd, 0.0)
+        income = inp.current_income * (1 + _BRACKET_COLA) ** i + rmd
+        targets = kernel.bracket_ceilings(np.float64(i)) + kernel.deduction(i)
+        if inp.respect_irmaa:
+            targets = np.concatenate([targets, kernel.irmaa_thresholds_for(np.float64(i))])
+        fills = targets[None, :] - income
+        return np.clip(np.hstack([fills, available * _DP_FRACTIONS]), 0.0, available)
+
+    def _dp_schedule(self, kernel: TaxKernel, inp: RothConversionInput) -> np.ndarray:
+        """Per-year conversion amounts from DP over the traditional balance."""
+        n = inp.years_to_project
+        if inp.traditional_balance <= 0:
+            return np.zeros(n)
+        growth = 1 + inp.expected_return
+        grids = [
+            np.linspace(0.0, inp.traditional_balance * growth**i, _DP_GRID_POINTS)
+            for i in range(n + 1)
+        ]
+        # Value of the balance at each grid point in year-i dollars
+        values = [None] * (n + 1)
+        values[n] = grids[n] * self._terminal_rate(kernel, inp)
+        for i in reversed(range(n)):
+            trad = grids[i][:, None]
+            conversion = self._conversion_candidates(kernel, inp, i, trad)
+            cost, trad_next = self._year_cost(kernel, inp, i, trad, conversion)
+            total = cost + np.interp(trad_next, grids[i + 1], values[i + 1]) / growth
+            values[i] = total.min(axis=1)
+
+        schedule = np.zeros(n)
+        trad = np.array([[inp.traditional_balance]])
+        for i in range(n):
+            conversion = self._conversion_candidates(kernel, inp, i, trad)
+            cost, trad_next = self._year_cost(kernel, inp, i, trad, conversion)
+            total = cost + np.interp(trad_next, grids[i + 1], values[i + 1]) / growth
+            best = int(total[0].argmin())
+            schedule[i] = conversion[0, best]
+            trad = trad_next[:, best : best + 1]
+        return schedule
+
+    def _simulate(
+        self,
+        kernel: TaxKernel,
+        inp: RothConversionInput,
+        amounts: np.ndarray,
+        targets: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Lifetime tax of many schedules at once.
+
+        Row *s* converts, each year, the larger of ``amounts[s, i]`` and
+        whatever brings gross income up to ``targets[s, i]``, limited to the
+        balance left after the RMD.  Returns ``(lifetime_tax, conversions)``.
+        """
+        n_schedules, n = amounts.shape
+        growth = 1 + inp.expected_return
+        trad = np.full(n_schedules, float(inp.traditional_balance))
+        lifetime = np.zeros(n_schedules)
+        conversions = np.zeros((n_schedules, n))
+        for i in range(n):
+            rmd = kernel.rmd(trad, inp.current_age + i)
+            available = np.maximum(trad - rmd, 0.0)
+            income = inp.current_income * (1 + _BRACKET_COLA) ** i + rmd
+            conversion = np.clip(np.maximum(amounts[:, i], targets[:, i] - income), 0.0, available)
+            cost, trad = self._year_cost(kernel, inp, i, trad, conversion)
+            lifetime += cost / growth**i
+            conversions[:, i] = conversion
+        lifetime += trad * self._terminal_rate(kernel, inp) / growth**n
+        return lifetime, conversions
+
+    @staticmethod
+    def _plan(inp: RothConversionInput, conversions: np.ndarray) -> RothConversionResult:
+        """Per-year detail for a fixed conversion schedule (same fields as ``optimize``)."""
+        years: list[RothConversionYear] = []
+        trad = inp.traditional_balance
+        roth = inp.roth_balance
+        total_converted = 0.0
+        total_tax_cost = 0.0
+        for i, planned in enumerate(conversions):
+            age = inp.current_age + i
+            notes: list[str] = []
+            brackets = _get_brackets(inp.filing_status, i)
+            inflated_income = inp.current_income * (1 + _BRACKET_COLA) ** i
+            taxable_income = max(0.0, inflated_income - _standard_deduction(inp.filing_status, i))
+
+            rmd = _rmd_amount(trad, age)
+            if rmd > 0:
+                notes.append(f"RMD of ${rmd:,.0f} required at age {age}")
+            conversion = round(min(float(planned), max(0.0, trad - rmd)), 2)
+
+            rate_at_conversion = _marginal_rate(taxable_income + rmd + conversion, brackets)
+            tax_cost = round(
+                _bracket_tax(taxable_income + rmd + conversion, brackets)
+                - _bracket_tax(taxable_income + rmd, brackets),
+                2,
+            )
+            if conversion > 0:
+                notes.append(f"Converts into the {rate_at_conversion:.0%} bracket")
+
+            trad_end = round((trad - rmd - conversion) * (1 + inp.expected_return), 2)
+            roth_end = round((roth + conversion) * (1 + inp.expected_return), 2)
+            years.append(
+                RothConversionYear(
+                    year=i + 1,
+                    age=age,
+                    optimal_conversion=conversion,
+                    marginal_rate_at_conversion=rate_at_conversion,
+                    rmd_amount=round(rmd, 2),
+                    traditional_balance_start=round(trad, 2),
+                    roth_balance_start=round(roth, 2),
+                    traditional_balance_end=trad_end,
+                    roth_balance_end=roth_end,
+                    tax_cost_of_conversion=tax_cost,
+                    notes=notes,
+                )
+            )
+            total_converted += conversion
+            total_tax_cost += tax_cost
+            trad = trad_end
+            roth = roth_end
+
+        nc_trad = inp.traditional_balance
+        nc_roth = inp.roth_balance
+        for nc_i in range(inp.years_to_project):
+            nc_rmd = _rmd_amount(nc_trad, inp.current_age + nc_i)
+            nc_trad = max(0.0, (nc_trad - nc_rmd) * (1 + inp.expected_return))
+            nc_roth = nc_roth * (1 + inp.expected_return)
+
+        return RothConversionResult(
+            years=years,
+            total_converted=round(total_converted, 2),
+            total_tax_cost=round(total_tax_cost, 2),
+            no_conversion_traditional_end=round(nc_trad, 2),
+            no_conversion_roth_end=round(nc_roth, 2),
+            with_conversion_traditional_end=round(trad, 2),
+            with_conversion_roth_end=round(roth, 2),
+            estimated_tax_savings=0.0,
+            summary="",
+        )
@@ -3,14 +3,17 @@
 import logging
 import re
 from datetime import datetime
-from typing import List
+from types import SimpleNamespace
+from typing import List, Optional
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.utils.datetime_utils import utc_now
 
+from app.models.merchant import MerchantAlias
 from app.models.rule import (
     Rule,
     RuleCondition,
@@ -217,7 +220,9 @@ class RuleEngine:
                 return True
 
             elif action.action_type == ActionType.SET_MERCHANT:
-                transaction.merchant_name = action.action_value
+                if transaction.merchant_name != action.action_value:
+                    transaction.merchant_name = action.action_value
+                    transaction.merchant_id = None  # Re-resolved by reconcile_merchants
                 return True
 
             elif action.action_type == ActionType.ADD_LABEL:
@@ -288,6 +293,32 @@ class RuleEngine:
 
         return applied
 
+    async def _matching_merchant_ids(self, rule: Rule) -> Optional[List[UUID]]:
+        """Merchants that can satisfy an ALL rule's merchant-name conditions.
+
+        Every resolved transaction's merchant_name is an alias of its
+        merchant, so evaluating those conditions once per alias narrows a
+        rule run to the matching merchants (plus unresolved rows) instead of
+        the org's whole history.  None when the rule has no such conditions.
+        """
+        if rule.match_type != RuleMatchType.ALL:
+            return None
+        conditions = [c for c in rule.conditions if c.field == ConditionField.MERCHANT_NAME]
+        if not conditions:
+            return None
+
+        result = await self.db.execute(
+            select(MerchantAlias.name, MerchantAlias.merchant_id).where(
+                MerchantAlias.organization_id == rule.organization_id
+            )
+        )
+        matching = set()
+        for name, merchant_id in result.all():
+            probe = SimpleNamespace(merchant_name=name)
+            if all(self.evaluate_condition(probe, condition) for condition in conditions):
+                matching.add(merchant_id)
+        return list(matching)
+
     async def apply_rule_to_transactions(
         self, rule: Rule, transaction_ids: List[str] = None
     ) -> int:
@@ -309,6 +340,12 @@ class RuleEngine:
         if transaction_ids:
             base_query = base_query.where(Transaction.id.in_(transaction_ids))
 
+        merchant_ids = await self._matching_merchant_ids(rule)
+        if merchant_ids is not None:
+            base_query = base_query.where(
+                or_(Transaction.merchant_id.in_(merchant_ids), Transaction.merchant_id.is_(None))
+            )
+
         count = 0
         offset = 0
         while True:
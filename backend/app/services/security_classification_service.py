@@ -0,0 +1,438 @@
+"""Per-symbol security classification for portfolio bucketing.
+
+The portfolio summary, style box and fund-overlap views all need to know,
+for each ticker, whether it is cash, bonds, international or domestic equity,
+its cap size, region and which index it tracks.  They used to work that out
+per holding on every cache miss with keyword scans over names and tickers.
+
+``classify_security`` holds those rules.  ``refresh_classifications`` runs
+them once per symbol from provider metadata (``enrich_holdings_metadata_task``)
+and upserts the result into ``security_classifications``; request paths read
+it through ``Holding.classification`` in the same query that loads holdings.
+The stored row wins over a holding's own asset type, class and country,
+which enrichment overwrites from the same metadata anyway.  Only an asset
+type a user chose (``Holding.asset_type_overridden``) is layered on top, so
+the shared per-symbol row never overrides what an organization set.
+"""
+
+import logging
+import re
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.holding import Holding
+from app.models.security_classification import SecurityClassification
+from app.utils.datetime_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+BUCKET_CASH = "cash"
+BUCKET_BOND = "bond"
+BUCKET_INTERNATIONAL = "international"
+BUCKET_DOMESTIC = "domestic"
+BUCKET_OTHER = "other"
+
+EQUITY_ASSET_TYPES = {"stock", "etf", "mutual_fund"}
+DOMESTIC_COUNTRIES = {"USA", "US", "United States", ""}
+
+# Common ticker patterns (used as fallback, not exhaustive).
+# Primary classification uses fund name parsing.
+COMMON_PATTERNS = {
+    "cash": {"VMFXX", "SPAXX", "FDRXX", "SWVXX", "VMMXX"},
+    "bonds": {"AGG", "BND", "BNDX", "TLT", "VBTLX", "FBNDX"},
+    "large_cap": {"SPY", "VOO", "IVV", "QQQ", "VV", "SCHX"},
+    "mid_cap": {"MDY", "IJH", "VO", "SCHM", "IVOO"},
+    "small_cap": {"IWM", "IJR", "VB", "SCHA", "VTWO"},
+}
+
+INTERNATIONAL_TICKERS = {
+    "VXUS",
+    "VEU",
+    "VWO",
+    "VGTSX",
+    "VTIAX",
+    "VTMGX",
+    "VEA",
+    "IEMG",
+    "IXUS",
+    "SCHF",
+    "EFA",
+    "IEFA",
+    "VFWAX",
+    "VFWIX",
+    "VTSNX",
+    "VEMAX",
+    "VIMSX",
+}
+
+# Everything international that is not listed here counts as developed
+EMERGING_MARKETS = {
+    "China",
+    "CN",
+    "CHN",
+    "Taiwan",
+    "TW",
+    "TWN",
+    "India",
+    "IN",
+    "IND",
+    "Brazil",
+    "BR",
+    "BRA",
+    "Russia",
+    "RU",
+    "RUS",
+    "South Africa",
+    "ZA",
+    "ZAF",
+    "Mexico",
+    "MX",
+    "MEX",
+    "Indonesia",
+    "ID",
+    "IDN",
+    "Turkey",
+    "TR",
+    "TUR",
+    "Saudi Arabia",
+    "SA",
+    "SAU",
+    "Poland",
+    "PL",
+    "POL",
+    "Thailand",
+    "TH",
+    "THA",
+    "Malaysia",
+    "MY",
+    "MYS",
+    "Philippines",
+    "PH",
+    "PHL",
+    "Colombia",
+    "CO",
+    "COL",
+    "Chile",
+    "CL",
+    "CHL",
+    "Peru",
+    "PE",
+    "PER",
+    "Egypt",
+    "EG",
+    "EGY",
+    "UAE",
+    "AE",
+    "ARE",
+    "Qatar",
+    "QA",
+    "QAT",
+    "Argentina",
+    "AR",
+    "ARG",
+    "Pakistan",
+    "PK",
+    "PAK",
+    "Vietnam",
+    "VN",
+    "VNM",
+    "Bangladesh",
+    "BD",
+    "BGD",
+}
+
+_CASH_NAME_KEYWORDS = ("MONEY MARKET", "CASH", "SWEEP", "SETTLEMENT")
+_BOND_NAME_KEYWORDS = ("BOND", "TREASURY", "GOVT", "FIXED INCOME", "CORPORATE DEBT")
+_BOND_TICKER_PATTERNS = ("BND", "BOND", "TLT", "AGG")
+_PROVIDER_CAP_SIZES = {"large": "Large Cap", "mid": "Mid Cap", "small": "Small Cap"}
+
+
+# Maps common ETFs/mutual funds to their underlying index/category
+FUND_INDEX_MAP: dict[str, str] = {
+    # Total US Stock Market
+    "VTI": "Total US Stock Market",
+    "VTSAX": "Total US Stock Market",
+    "ITOT": "Total US Stock Market",
+    "SPTM": "Total US Stock Market",
+    "SCHB": "Total US Stock Market",
+    "FSKAX": "Total US Stock Market",
+    "FZROX": "Total US Stock Market",
+    # S&P 500
+    "SPY": "S&P 500",
+    "VOO": "S&P 500",
+    "IVV": "S&P 500",
+    "VFIAX": "S&P 500",
+    "FXAIX": "S&P 500",
+    "SWPPX": "S&P 500",
+    "SPLG": "S&P 500",
+    # Total International Stock
+    "VXUS": "Total International Stock",
+    "VTIAX": "Total International Stock",
+    "IXUS": "Total International Stock",
+    "FTIHX": "Total International Stock",
+    "FZILX": "Total International Stock",
+    # International Developed
+    "VEA": "International Developed Markets",
+    "EFA": "International Developed Markets",
+    "IEFA": "International Developed Markets",
+    "SWISX": "International Developed Markets",
+    "SCHF": "International Developed Markets",
+    # Emerging Markets
+    "VWO": "Emerging Markets",
+    "EEM": "Emerging Markets",
+    "IEMG": "Emerging Markets",
+    "SCHE": "Emerging Markets",
+    # Total US Bond Market
+    "BND": "Total US Bond Market",
+    "AGG": "Total US Bond Market",
+    "VBTLX": "Total US Bond Market",
+    "SCHZ": "Total US Bond Market",
+    "FXNAX": "Total US Bond Market",
+    # NASDAQ 100
+    "QQQ": "NASDAQ 100",
+    "QQQM": "NASDAQ 100",
+    # S&P 500 Growth
+    "VOOG": "S&P 500 Growth",
+    "IVW": "S&P 500 Growth",
+    "SPYG": "S&P 500 Growth",
+    # S&P 500 Value
+    "VOOV": "S&P 500 Value",
+    "IVE": "S&P 500 Value",
+    "SPYV": "S&P 500 Value",
+    # Small Cap US
+    "VB": "US Small Cap",
+    "IJR": "US Small Cap",
+    "SCHA": "US Small Cap",
+    "VTWO": "US Small Cap (Russell 2000)",
+    "IWM": "US Small Cap (Russell 2000)",
+    # Mid Cap US
+    "VO": "US Mid Cap",
+    "IJH": "US Mid Cap",
+    "SCHM": "US Mid Cap",
+    # TIPS
+    "TIP": "US TIPS (Inflation-Protected)",
+    "SCHP": "US TIPS (Inflation-Protected)",
+    "VTIP": "US TIPS (Inflation-Protected)",
+    # Real Estate / REITs
+    "VNQ": "US Real Estate (REITs)",
+    "SCHH": "US Real Estate (REITs)",
+    "IYR": "US Real Estate (REITs)",
+    "VGSLX": "US Real Estate (REITs)",
+    # International Bond
+    "BNDX": "International Bond",
+    "IAGG": "International Bond",
+    # Dividend
+    "VYM": "US High Dividend Yield",
+    "SCHD": "US High Dividend Yield",
+    "HDV": "US High Dividend Yield",
+    # Target-Date (Vanguard examples)
+    "VFIFX": "Target Date 2050",
+    "VFFVX": "Target Date 2055",
+    "VTHRX": "Target Date 2030",
+    "VFORX": "Target Date 2040",
+}
+
+
+def is_cash_security(ticker: str, name: Optional[str], asset_type: Optional[str]) -> bool:
+    """Identify cash/money market holdings."""
+    name_upper = (name or "").upper()
+    return (
+        ticker.upper() in COMMON_PATTERNS["cash"]
+        or any(keyword in name_upper for keyword in _CASH_NAME_KEYWORDS)
+        or asset_type == "cash"
+    )
+
+
+def is_bond_security(ticker: str, name: Optional[str], asset_type: Optional[str]) -> bool:
+    """Identify bond holdings."""
+    ticker_upper = ticker.upper()
+    name_upper = (name or "").upper()
+    return (
+        ticker_upper in COMMON_PATTERNS["bonds"]
+        or any(keyword in name_upper for keyword in _BOND_NAME_KEYWORDS)
+        or any(pattern in ticker_upper for pattern in _BOND_TICKER_PATTERNS)
+        or asset_type == "bond"
+    )
+
+
+def is_international_security(
+    ticker: str, asset_class: Optional[str], country: Optional[str]
+) -> bool:
+    """asset_class first, then the known international fund list, then country of domicile."""
+    return (
+        (asset_class or "").lower() == "international"
+        or ticker.upper() in INTERNATIONAL_TICKERS
+        or (country or "") not in DOMESTIC_COUNTRIES
+    )
+
+
+def classify_market_cap(
+    ticker: str, name: Optional[str] = None, market_cap: Optional[str] = None
+) -> str:
+    """
+    Classify market cap.
+
+    Strategy:
+    1. Provider market cap ('large' / 'mid' / 'small') when known
+    2. Parse fund name for explicit cap size (e.g., "Vanguard Large Cap Index")
+    3. Check against common ETF patterns as fallback
+    4. Default to large cap (most holdings are)
+
+    Returns: 'Large Cap', 'Mid Cap', or 'Small Cap'
+    """
+    provider = _PROVIDER_CAP_SIZES.get((market_cap or "").lower())
+    if provider:
+        return provider
+
+    name_upper = (name or "").upper()
+    if name_upper:
+        # Look for explicit cap size mentions with word boundaries
+        if re.search(r"\b(LARGE[\s-]?CAP|MEGA[\s-]?CAP|LARGECAP)\b", name_upper):
+            return "Large Cap"
+        if re.search(r"\b(MID[\s-]?CAP|MIDCAP)\b", name_upper):
+            return "Mid Cap"
+        if re.search(r"\b(SMALL[\s-]?CAP|MICRO[\s-]?CAP|SMALLCAP)\b", name_upper):
+            return "Small Cap"
+
+        # Check for standalone 'LARGE', 'MID', 'SMALL' keywords
+        if re.search(r"\bLARGE\b", name_upper):
+            return "Large Cap"
+        if re.search(r"\bMID\b", name_upper):
+            return "Mid Cap"
+        if re.search(r"\bSMALL\b", name_upper):
+            return "Small Cap"
+
+    ticker_upper = ticker.upper()
+    if ticker_upper in COMMON_PATTERNS["large_cap"]:
+        return "Large Cap"
+    if ticker_upper in COMMON_PATTERNS["mid_cap"]:
+        return "Mid Cap"
+    if ticker_upper in COMMON_PATTERNS["small_cap"]:
+        return "Small Cap"
+    return "Large Cap"
+
+
+def classify_security(
+    ticker: str,
+    *,
+    name: Optional[str] = None,
+    asset_type: Optional[str] = None,
+    asset_class: Optional[str] = None,
+    country: Optional[str] = None,
+    market_cap: Optional[str] = None,
+) -> SecurityClassification:
+    """Classify one symbol; returns an unsaved ``SecurityClassification``."""
+    ticker = ticker.upper()
+    if is_cash_security(ticker, name, asset_type):
+        bucket = BUCKET_CASH
+    elif is_bond_security(ticker, name, asset_type):
+        bucket = BUCKET_BOND
+    elif is_international_security(ticker, asset_class, country):
+        bucket = BUCKET_INTERNATIONAL
+    elif asset_type in EQUITY_ASSET_TYPES:
+        bucket = BUCKET_DOMESTIC
+    else:
+        bucket = BUCKET_OTHER
+
+    equity = bucket in (BUCKET_INTERNATIONAL, BUCKET_DOMESTIC)
+    asset_class_lower = (asset_class or "").lower()
+    if "value" in asset_class_lower:
+        style = "Value"
+    elif "growth" in asset_class_lower:
+        style = "Growth"
+    else:
+        style = "Core"
+
+    return SecurityClassification(
+        ticker=ticker,
+        asset_type=asset_type or None,
+        bucket=bucket,
+        cap_size=classify_market_cap(ticker, name, market_cap) if equity else None,
+        region=(
+            ("emerging" if country in EMERGING_MARKETS else "developed")
+            if bucket == BUCKET_INTERNATIONAL
+            else None
+        ),
+        style=style if equity else None,
+        index_category=FUND_INDEX_MAP.get(ticker),
+        is_estimated=not asset_type,
+    )
+
+
+def classify_holding(holding: Holding, asset_type: Optional[str] = None) -> SecurityClassification:
+    """Stored classification for a holding, with any user-chosen asset type applied.
+
+    Holdings without a stored row are classified inline from their own
+    fields; *asset_type* overrides ``holding.asset_type`` there (e.g. a type
+    resolved from a reference-data provider), but never a user's choice.
+    """
+    stored = holding.classification
+    if holding.asset_type_overridden and holding.asset_type:
+        asset_type = holding.asset_type
+    elif stored is not None:
+        return stored
+    else:
+        asset_type = asset_type or holding.asset_type
+    return classify_security(
+        holding.ticker,
+        name=holding.name,
+        asset_type=asset_type,
+        asset_class=holding.asset_class,
+        country=holding.country,
+        market_cap=holding.market_cap,
+    )
+
+
+_FIELDS = ("name", "asset_type", "asset_class", "country", "market_cap")
+_UPSERT_CHUNK = 1000
+
+
+async def refresh_classifications(db: AsyncSession, metadata_by_ticker: dict) -> int:
+    """Re-classify every symbol in *metadata_by_ticker* and upsert the results.
+
+    Rows are built only from provider metadata (``HoldingMetadata`` keyed by
+    upper-case ticker), never from holding columns, which organizations can
+    edit.  Symbols whose metadata carries none of the classification fields
+    are skipped and keep any existing row.  Returns the number of symbols
+    written.
+    """
+    attrs: dict[str, dict] = {}
+    for ticker, metadata in metadata_by_ticker.items():
+        fields = {field: getattr(metadata, field, None) for field in _FIELDS}
+        if any(value is not None for value in fields.values()):
+            attrs[ticker.upper()] = fields
+
+    if not attrs:
+        return 0
+
+    now = utc_now()
+    rows = [
+        {
+            "ticker": c.ticker,
+            "asset_type": c.asset_type,
+            "bucket": c.bucket,
+            "cap_size": c.cap_size,
+            "region": c.region,
+            "style": c.style,
+            "index_category": c.index_category,
+            "is_estimated": c.is_estimated,
+            "updated_at": now,
+        }
+        for c in (classify_security(ticker, **fields) for ticker, fields in attrs.items())
+    ]
+
+    bind = db.bind
+    insert = sqlite_insert if bind is not None and bind.dialect.name == "sqlite" else pg_insert
+    # Chunked to stay well under the driver's bind-parameter limit
+    for start in range(0, len(rows), _UPSERT_CHUNK):
+        stmt = insert(SecurityClassification).values(rows[start : start + _UPSERT_CHUNK])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["ticker"],
+            set_={key: stmt.excluded[key] for key in rows[0] if key != "ticker"},
+        )
+        await db.execute(stmt)
+    logger.info(f"Refreshed security classifications for {len(rows)} symbols")
+    return len(rows)
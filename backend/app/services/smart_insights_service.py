@@ -18,7 +18,6 @@ an extra Pydantic pass.
 
 from __future__ import annotations
 
-import inspect
 import logging
 from datetime import date, timedelta
 from decimal import Decimal
@@ -29,6 +28,7 @@ from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants.financial import CRYPTO_TAX, MEDICARE, RENTAL, RETIREMENT, SMART_INSIGHTS, TAX
+from app.core.session_fanout import SessionFanOut
 from app.models.account import Account, AccountType, RentalType
 from app.models.budget import Budget, BudgetPeriod
 from app.models.holding import Holding
@@ -184,6 +184,10 @@ class SmartInsightsService:
 
     # ── Public API ────────────────────────────────────────────────────────
 
+    def _on_session(self, check):
+        """Adapt a check for SessionFanOut: run it on a service bound to *session*."""
+        return lambda session: check(self if session is self.db else type(self)(session))
+
     async def get_insights(
         self,
         organization_id: UUID,
@@ -201,34 +205,47 @@ class SmartInsightsService:
             return []
 
         account_ids = [a.id for a in accounts]
+        # In the original priority tie-break order.  ``(True, fn)`` checks run
+        # queries: they are independent reads, so they run side by side, each
+        # on its own pooled session (see SessionFanOut).  ``(False, fn)``
+        # checks are computed from the loaded accounts alone.
         checks = [
-            self._check_emergency_fund(accounts, account_ids),
-            self._check_cash_drag(accounts, account_ids),
-            self._check_fund_fees(organization_id, user_id),
-            self._check_stock_concentration(organization_id, user_id),
-            self._check_ltcg_opportunity(accounts, account_ids),
-            self._check_irmaa_cliff(account_ids, user_birthdate),
-            self._check_roth_opportunity_sync(accounts, user_birthdate),
-            self._check_hsa_opportunity_sync(accounts),
-            self._check_net_worth_benchmark(accounts, account_ids, user_birthdate),
-            self._check_spending_anomaly(account_ids),
-            self._check_budget_overrun(organization_id, user_id, account_ids),
-            self._check_str_opportunity(accounts),
-            self._check_crypto_tlh(accounts, account_ids),
+            (True, lambda svc: svc._check_emergency_fund(accounts, account_ids)),
+            (True, lambda svc: svc._check_cash_drag(accounts, account_ids)),
+            (True, lambda svc: svc._check_fund_fees(organization_id, user_id)),
+            (True, lambda svc: svc._check_stock_concentration(organization_id, user_id)),
+            (True, lambda svc: svc._check_ltcg_opportunity(accounts, account_ids)),
+            (True, lambda svc: svc._check_irmaa_cliff(account_ids, user_birthdate)),
+            (False, lambda svc: svc._check_roth_opportunity_sync(accounts, user_birthdate)),
+            (False, lambda svc: svc._check_hsa_opportunity_sync(accounts)),
+            (
+                True,
+                lambda svc: svc._check_net_worth_benchmark(accounts, account_ids, user_birthdate),
+            ),
+            (True, lambda svc: svc._check_spending_anomaly(account_ids)),
+            (True, lambda svc: svc._check_budget_overrun(organization_id, user_id, account_ids)),
+            (False, lambda svc: svc._check_str_opportunity(accounts)),
+            (True, lambda svc: svc._check_crypto_tlh(accounts, account_ids)),
         ]
+        db_work = [self._on_session(check) for uses_db, check in checks if uses_db]
+        query_results = iter(await SessionFanOut(self.db).gather(*db_work, return_exceptions=True))
 
         insights: list[_Insight] = []
-        for coro in checks:
-            try:
-                # Some checks are sync and return directly; others are async
-                if inspect.isawaitable(coro):
-                    result = await coro
-                else:
-                    result = coro
-                if result is not None:
-                    insights.append(result)
-            except Exception:
-                logger.exception("Smart insight check failed — skipping")
+        for uses_db, check in checks:
+            if uses_db:
+                result = next(query_results)
+            else:
+                try:
+                    result = check(self)
+                except Exception as exc:
+                    result = exc
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Smart insight check failed — skipping",
+                    exc_info=(type(result), result, result.__traceback__),
+                )
+            elif result is not None:
+                insights.append(result)
 
         insights.sort(key=lambda x: x.priority_score, reverse=True)
         return [i.to_dict() for i in insights[:max_insights]]
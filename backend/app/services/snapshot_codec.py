@@ -0,0 +1,187 @@
+"""Compact keyframe/delta encoding for ``PortfolioSnapshot.snapshot_data``.
+
+A portfolio snapshot document (``holdings_by_ticker``, ``holdings_by_account``
+and the breakdowns) is captured every day for the household and for every
+member, and most of it is identical from one day to the next: the holdings
+are the same, only prices and the values derived from them move.
+
+Snapshots are therefore stored as ``snapshot_blob`` — zlib-compressed JSON —
+in one of two shapes:
+
+* a **keyframe** (``keyframe_date`` NULL): the full document;
+* a **delta** (``keyframe_date`` set): only what differs from the keyframe
+  captured on ``keyframe_date``.
+
+Deltas are always taken against the keyframe rather than the previous day,
+so rebuilding any day reads at most two rows.  The first capture of each
+calendar month is a keyframe — ``portfolio_snapshots`` is partitioned by
+month, so dropping an old partition never orphans a delta — as is any
+capture where the portfolio has churned enough that the delta would be
+nearly as large as the full document.
+
+Delta objects are JSON and take one of three forms:
+
+* ``{"=": value}`` — replace with ``value``;
+* ``{"+": {key: value}, "~": {key: delta}, "-": [key, ...]}`` — patch a
+  dict: assign changed scalars and added keys, patch nested containers,
+  drop removed keys;
+* ``{"#": id_field, "+": {id: record}, "~": {id: delta}, "ids": [id, ...]}``
+  — patch a list of records keyed by ``id_field`` (``id``, ``account_id``,
+  ``ticker`` or ``sector``) record by record; ``ids`` is the new order and
+  is omitted when it is unchanged.
+
+Daily price moves therefore cost a few ``"+"`` entries per holding.
+"""
+
+from __future__ import annotations
+
+import zlib
+from datetime import date
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+import orjson
+
+# Write a keyframe instead when the delta is more than this share of the
+# full document (both compressed)
+MAX_DELTA_RATIO = 0.75
+
+_LIST_KEYS = ("id", "account_id", "ticker", "sector")
+
+
+def pack(value: Any) -> bytes:
+    """Compressed JSON bytes for *value*."""
+    return zlib.compress(orjson.dumps(value), 6)
+
+
+def unpack(blob: bytes) -> Any:
+    """Inverse of ``pack``."""
+    return orjson.loads(zlib.decompress(blob))
+
+
+def _record_key(base: list, new: list) -> Optional[str]:
+    """The identity field shared by every record in both lists, if any."""
+    records = base + new
+    if not records or not all(isinstance(r, dict) for r in records):
+        return None
+    for field in _LIST_KEYS:
+        for items in (base, new):
+            ids = [r.get(field) for r in items]
+            if not all(isinstance(i, str) for i in ids) or len(set(ids)) != len(ids):
+                break
+        else:
+            return field
+    return None
+
+
+def _split(patches: dict) -> dict:
+    """Fold ``{"=": v}`` patches into ``"+"`` assignments, the rest into ``"~"``."""
+    delta: dict = {}
+    for key, sub in patches.items():
+        if "=" in sub:
+            delta.setdefault("+", {})[key] = sub["="]
+        else:
+            delta.setdefault("~", {})[key] = sub
+    return delta
+
+
+def diff(base: Any, new: Any) -> Optional[dict]:
+    """Delta turning *base* into *new*, or None when they are equal."""
+    if base == new:
+        return None
+    if isinstance(base, dict) and isinstance(new, dict):
+        patches = {}
+        for key, value in new.items():
+            sub = diff(base[key], value) if key in base else {"=": value}
+            if sub is not None:
+                patches[key] = sub
+        delta = _split(patches)
+        removed = [key for key in base if key not in new]
+        if removed:
+            delta["-"] = removed
+        return delta
+    if isinstance(base, list) and isinstance(new, list):
+        field = _record_key(base, new)
+        if field is not None:
+            old = {r[field]: r for r in base}
+            patches = {}
+            for record in new:
+                record_id = record[field]
+                sub = diff(old[record_id], record) if record_id in old else {"=": record}
+                if sub is not None:
+                    patches[record_id] = sub
+            delta = {"#": field, **_split(patches)}
+            ids = [r[field] for r in new]
+            if ids != [r[field] for r in base]:
+                delta["ids"] = ids
+            return delta
+    return {"=": new}
+
+
+def apply(base: Any, delta: Optional[dict]) -> Any:
+    """Rebuild the document *delta* was taken from, given its *base*."""
+    if delta is None:
+        return base
+    if "=" in delta:
+        return delta["="]
+    assigned = delta.get("+", {})
+    patched = delta.get("~", {})
+    if "#" in delta:
+        field = delta["#"]
+        old = {r[field]: r for r in base}
+        ids = delta["ids"] if "ids" in delta else list(old)
+        return [
+            assigned[record_id]
+            if record_id in assigned
+            else apply(old[record_id], patched.get(record_id))
+            for record_id in ids
+        ]
+    result = {key: value for key, value in base.items() if key not in delta.get("-", ())}
+    result.update(assigned)
+    for key, sub in patched.items():
+        result[key] = apply(base[key], sub)
+    return result
+
+
+def encode(document: Any, keyframe: Any = None) -> Tuple[bytes, bool]:
+    """Blob for *document* and whether it is a delta against *keyframe*.
+
+    Without a keyframe, or when the delta would not be meaningfully smaller
+    than the document itself, the full document is stored.
+    """
+    full = pack(document)
+    if keyframe is None:
+        return full, False
+    delta = pack(diff(keyframe, document) or {})
+    if len(delta) > len(full) * MAX_DELTA_RATIO:
+        return full, False
+    return delta, True
+
+
+def decode(blob: bytes, keyframe_blob: Optional[bytes] = None) -> Any:
+    """Document stored in *blob*; deltas also need their keyframe's blob."""
+    if keyframe_blob is None:
+        return unpack(blob)
+    return apply(unpack(keyframe_blob), unpack(blob))
+
+
+def same_month(a: date, b: date) -> bool:
+    return (a.year, a.month) == (b.year, b.month)
+
+
+def encode_series(days: Iterable[Tuple[date, Any]]) -> Iterator[Tuple[date, bytes, Optional[date]]]:
+    """Encode one series' documents in date order.
+
+    Yields ``(snapshot_date, snapshot_blob, keyframe_date)`` per day, applying
+    the same keyframe policy as ``SnapshotService.capture_snapshot``.
+    """
+    keyframe = keyframe_date = None
+    for day, document in days:
+        base = None
+        if keyframe_date is not None and same_month(keyframe_date, day):
+            base = keyframe
+        blob, is_delta = encode(document, base)
+        if is_delta:
+            yield day, blob, keyframe_date
+        else:
+            keyframe, keyframe_date = document, day
+            yield day, blob, None
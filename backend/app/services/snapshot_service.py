@@ -7,20 +7,35 @@ Captures daily portfolio snapshots for performance analysis and trend tracking.
 import logging
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, null, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.portfolio_snapshot import PortfolioSnapshot
 from app.schemas.holding import PortfolioSummary
+from app.services import snapshot_codec
+from app.services.history_downsampling import load_series
 from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
 
 
+def _series_conditions(organization_id: UUID, user_id: Optional[UUID]) -> list:
+    """One snapshot series: a user's, or the household's (user_id IS NULL)."""
+    return [
+        PortfolioSnapshot.organization_id == organization_id,
+        (
+            PortfolioSnapshot.user_id == user_id
+            if user_id is not None
+            else PortfolioSnapshot.user_id.is_(None)
+        ),
+    ]
+
+
 class SnapshotService:
     """Service for managing portfolio snapshots."""
 
@@ -85,6 +100,10 @@ class SnapshotService:
             ),
         }
 
+        snapshot_blob, keyframe_date = await self._encode_snapshot_data(
+            db, organization_id, user_id, snapshot_date, snapshot_data
+        )
+
         # Prepare snapshot values
         values = {
             "organization_id": organization_id,
@@ -120,7 +139,8 @@ class SnapshotService:
                 if portfolio.geographic_breakdown
                 else Decimal("0")
             ),
-            "snapshot_data": snapshot_data,
+            "snapshot_blob": snapshot_blob,
+            "keyframe_date": keyframe_date,
         }
 
         # Upsert snapshot (insert or update if exists).
@@ -153,7 +173,9 @@ class SnapshotService:
                 "taxable_value": stmt.excluded.taxable_value,
                 "domestic_value": stmt.excluded.domestic_value,
                 "international_value": stmt.excluded.international_value,
-                "snapshot_data": stmt.excluded.snapshot_data,
+                "snapshot_blob": stmt.excluded.snapshot_blob,
+                "keyframe_date": stmt.excluded.keyframe_date,
+                "snapshot_data": null(),
             },
         ).returning(PortfolioSnapshot)
 
@@ -168,6 +190,149 @@ class SnapshotService:
         )
         return snapshot
 
+    async def _encode_snapshot_data(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        user_id: Optional[UUID],
+        snapshot_date: date,
+        document: dict,
+    ) -> Tuple[bytes, Optional[date]]:
+        """``snapshot_blob`` and ``keyframe_date`` for *document* (see snapshot_codec).
+
+        The document is stored as a delta against the series' latest keyframe
+        earlier in the same month.  Re-capturing a day that is itself a
+        keyframe keeps it one and re-encodes the deltas that reference it.
+        """
+        conditions = _series_conditions(organization_id, user_id)
+        result = await db.execute(
+            select(PortfolioSnapshot.snapshot_date, PortfolioSnapshot.snapshot_blob)
+            .where(
+                *conditions,
+                PortfolioSnapshot.keyframe_date.is_(None),
+                PortfolioSnapshot.snapshot_blob.isnot(None),
+                PortfolioSnapshot.snapshot_date >= snapshot_date.replace(day=1),
+                PortfolioSnapshot.snapshot_date <= snapshot_date,
+            )
+            .order_by(PortfolioSnapshot.snapshot_date.desc())
+            .limit(1)
+        )
+        keyframe = result.first()
+        if keyframe is None:
+            return snapshot_codec.pack(document), None
+
+        if keyframe.snapshot_date == snapshot_date:
+            old_keyframe = snapshot_codec.unpack(keyframe.snapshot_blob)
+            dependents = await db.execute(
+                select(PortfolioSnapshot.id, PortfolioSnapshot.snapshot_blob).where(
+                    *conditions, PortfolioSnapshot.keyframe_date == snapshot_date
+                )
+            )
+            for row in dependents.all():
+                previous = snapshot_codec.apply(
+                    old_keyframe, snapshot_codec.unpack(row.snapshot_blob)
+                )
+                blob, is_delta = snapshot_codec.encode(previous, document)
+                await db.execute(
+                    update(PortfolioSnapshot)
+                    .where(PortfolioSnapshot.id == row.id)
+                    .values(snapshot_blob=blob, keyframe_date=snapshot_date if is_delta else None)
+                )
+            return snapshot_codec.pack(document), None
+
+        blob, is_delta = snapshot_codec.encode(
+            document, snapshot_codec.unpack(keyframe.snapshot_blob)
+        )
+        return blob, keyframe.snapshot_date if is_delta else None
+
+    async def get_snapshot_data(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        snapshot_date: date,
+        user_id: Optional[UUID] = None,
+    ) -> Optional[dict]:
+        """The full snapshot document captured on *snapshot_date*, if any."""
+        documents = await self.get_snapshot_data_range(
+            db, organization_id, snapshot_date, snapshot_date, user_id=user_id
+        )
+        return documents.get(snapshot_date)
+
+    async def get_snapshot_data_range(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        start_date: date,
+        end_date: date,
+        user_id: Optional[UUID] = None,
+    ) -> Dict[date, dict]:
+        """
+        Rebuild the snapshot documents captured between two dates (inclusive).
+
+        Each keyframe is read and decompressed once for all of its deltas.
+        Documents share their unchanged parts, so treat them as read-only.
+
+        Returns:
+            Snapshot documents by date, in date order
+        """
+        conditions = _series_conditions(organization_id, user_id)
+        result = await db.execute(
+            select(
+                PortfolioSnapshot.snapshot_date,
+                PortfolioSnapshot.snapshot_blob,
+                PortfolioSnapshot.keyframe_date,
+                PortfolioSnapshot.snapshot_data,
+            )
+            .where(
+                *conditions,
+                PortfolioSnapshot.snapshot_date >= start_date,
+                PortfolioSnapshot.snapshot_date <= end_date,
+            )
+            .order_by(PortfolioSnapshot.snapshot_date.asc())
+        )
+        rows = result.all()
+
+        keyframe_blobs = {
+            row.snapshot_date: row.snapshot_blob
+            for row in rows
+            if row.snapshot_blob is not None and row.keyframe_date is None
+        }
+        missing = {row.keyframe_date for row in rows if row.keyframe_date} - keyframe_blobs.keys()
+        if missing:
+            result = await db.execute(
+                select(PortfolioSnapshot.snapshot_date, PortfolioSnapshot.snapshot_blob).where(
+                    *conditions, PortfolioSnapshot.snapshot_date.in_(missing)
+                )
+            )
+            keyframe_blobs.update(dict(result.all()))
+
+        keyframes: Dict[date, dict] = {}
+        documents: Dict[date, dict] = {}
+        for row in rows:
+            if row.snapshot_blob is None:
+                if row.snapshot_data is not None:
+                    documents[row.snapshot_date] = row.snapshot_data
+                continue
+            if row.keyframe_date is None:
+                if row.snapshot_date not in keyframes:
+                    keyframes[row.snapshot_date] = snapshot_codec.unpack(row.snapshot_blob)
+                documents[row.snapshot_date] = keyframes[row.snapshot_date]
+                continue
+            if row.keyframe_date not in keyframes:
+                if row.keyframe_date not in keyframe_blobs:
+                    logger.warning(
+                        f"Keyframe {row.keyframe_date} missing for snapshot "
+                        f"{row.snapshot_date} of org {organization_id}"
+                    )
+                    continue
+                keyframes[row.keyframe_date] = snapshot_codec.unpack(
+                    keyframe_blobs[row.keyframe_date]
+                )
+            documents[row.snapshot_date] = snapshot_codec.apply(
+                keyframes[row.keyframe_date], snapshot_codec.unpack(row.snapshot_blob)
+            )
+        return documents
+
     async def get_snapshots(
         self,
         db: AsyncSession,
@@ -192,8 +357,14 @@ class SnapshotService:
         Returns:
             List of PortfolioSnapshot objects ordered by date ascending
         """
-        query = select(PortfolioSnapshot).where(
-            PortfolioSnapshot.organization_id == organization_id
+        query = (
+            select(PortfolioSnapshot)
+            .where(PortfolioSnapshot.organization_id == organization_id)
+            # The documents are only read through get_snapshot_data
+            .options(
+                defer(PortfolioSnapshot.snapshot_blob, raiseload=True),
+                defer(PortfolioSnapshot.snapshot_data, raiseload=True),
+            )
         )
 
         # Filter by user: specific user or household (NULL)
@@ -219,6 +390,57 @@ class SnapshotService:
         logger.info(f"Retrieved {len(snapshots)} snapshots for org {organization_id}")
         return list(snapshots)
 
+    async def get_snapshot_series(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        start_date: date,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        user_id: Optional[UUID] = None,
+        resolution: str = "auto",
+        max_points: Optional[int] = None,
+    ) -> List[Row]:
+        """
+        Get the chart series of snapshot totals for an organization.
+
+        Selects only the ``SnapshotResponse`` columns (not ``snapshot_data``)
+        and downsamples long ranges per ``history_downsampling.load_series``.
+
+        Returns:
+            Rows with the SnapshotResponse fields, ordered by date ascending
+        """
+        conditions = [
+            *_series_conditions(organization_id, user_id),
+            PortfolioSnapshot.snapshot_date >= start_date,
+        ]
+        if end_date:
+            conditions.append(PortfolioSnapshot.snapshot_date <= end_date)
+
+        snapshots, resolution = await load_series(
+            db,
+            [
+                PortfolioSnapshot.id,
+                PortfolioSnapshot.organization_id,
+                PortfolioSnapshot.user_id,
+                PortfolioSnapshot.snapshot_date,
+                PortfolioSnapshot.total_value,
+                PortfolioSnapshot.total_cost_basis,
+                PortfolioSnapshot.total_gain_loss,
+                PortfolioSnapshot.total_gain_loss_percent,
+            ],
+            conditions,
+            date_column=PortfolioSnapshot.snapshot_date,
+            value_column=PortfolioSnapshot.total_value,
+            start_date=start_date,
+            end_date=end_date,
+            resolution=resolution,
+            max_points=max_points,
+            limit=limit,
+        )
+        logger.info(f"Retrieved {len(snapshots)} {resolution} snapshots for org {organization_id}")
+        return snapshots
+
     async def get_latest_snapshot(
         self, db: AsyncSession, organization_id: UUID
     ) -> Optional[PortfolioSnapshot]:
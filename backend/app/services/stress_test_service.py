@@ -2,18 +2,38 @@
 
 Models portfolio impact under historical and hypothetical market scenarios
 using hardcoded scenario parameters from STRESS_TEST constants.
+
+Two models are available:
+
+* ``run_scenario`` — applies a scenario's aggregate equity / bond shock to
+  the portfolio's three asset-class buckets.
+* ``run_historical_replay`` — replays the actual daily price path of a
+  historical window (STRESS_TEST.REPLAY_WINDOWS) through every holding,
+  using the holding's own symbol when its history covers the window and an
+  asset-class proxy otherwise.  Paths are computed as one
+  (accounts x series) @ (series x days) product, and each account's peak
+  drawdown, recovery time and worst day come from vectorized running-max /
+  argmin passes over that matrix.
 """
 from __future__ import annotations
 
+from datetime import date
 from decimal import Decimal
+from typing import NamedTuple
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import select, func, cast, String
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants.financial import STRESS_TEST
 from app.models.holding import Holding
 from app.models.account import Account, AccountType
+from app.services.market_data.price_history import (
+    PriceHistoryStore,
+    PriceSeries,
+    price_history_store,
+)
 
 
 # Asset class classification for holdings
@@ -50,6 +70,151 @@ EQUITY_ASSET_TYPES = {"stock", "etf", "mutual_fund", "equity", "fund"}
 # holding.asset_class values that indicate bonds
 BOND_ASSET_CLASSES = {"bond", "fixed_income", "fixed income", "treasury"}
 
+CRYPTO_ASSET_TYPES = {"crypto", "cryptocurrency"}
+
+
+class ReplayPosition(NamedTuple):
+    """A holding (or balance-only account) to replay.
+
+    ``symbols`` lists the price series to try in order of preference; the
+    first one whose history covers the window is used.  Empty means the
+    value is held unchanged (cash and other non-market assets).
+    """
+
+    account_id: UUID
+    value: float
+    symbols: tuple[str, ...]
+    own_symbol: str | None = None
+
+
+def _covers(series: PriceSeries | None, start: date) -> bool:
+    if series is None or len(series[0]) < 2:
+        return False
+    return int(series[0][0]) - start.toordinal() <= STRESS_TEST.REPLAY_MAX_START_GAP_DAYS
+
+
+def replay_account_paths(
+    positions: list[ReplayPosition],
+    series: dict[str, PriceSeries],
+    start: date,
+) -> tuple[list[UUID], np.ndarray, np.ndarray, dict[str, int]]:
+    """Daily value paths per account for *positions* replayed through *series*.
+
+    Returns ``(account_ids, days, values, sources)``: ``values`` is an
+    (accounts x days) matrix aligned to ``days`` (ordinals — the union of
+    the trading days of every series used), and ``sources`` counts positions
+    replayed on their own symbol, on a proxy, or held unchanged.
+    """
+    account_ids = list(dict.fromkeys(p.account_id for p in positions))
+    account_index = {account_id: i for i, account_id in enumerate(account_ids)}
+
+    # Pick each position's series; clean series once per symbol
+    cleaned: dict[str, PriceSeries] = {}
+    symbol_index: dict[str, int] = {}
+    rows, cols, weights = [], [], []
+    flat = np.zeros(len(account_ids))
+    sources = {"own_history": 0, "proxy": 0, "unchanged": 0}
+    for position in positions:
+        row = account_index[position.account_id]
+        chosen = None
+        for symbol in position.symbols:
+            if symbol not in cleaned:
+                days, closes = series.get(symbol, (np.empty(0), np.empty(0)))
+                valid = closes > 0
+                cleaned[symbol] = (days[valid], closes[valid])
+            if _covers(cleaned[symbol], start):
+                chosen = symbol
+                break
+        if chosen is None:
+            flat[row] += position.value
+            sources["unchanged"] += 1
+            continue
+        sources["own_history" if chosen == position.own_symbol else "proxy"] += 1
+        rows.append(row)
+        cols.append(symbol_index.setdefault(chosen, len(symbol_index)))
+        weights.append(position.value)
+
+    used = list(symbol_index)
+    if used:
+        calendar = np.unique(np.concatenate([cleaned[symbol][0] for symbol in used]))
+    else:
+        calendar = np.array([start.toordinal()], dtype=np.int64)
+
+    # Growth of $1 per series over the calendar, forward-filling non-trading days
+    growth = np.empty((len(used), len(calendar)))
+    for i, symbol in enumerate(used):
+        days, closes = cleaned[symbol]
+        at = np.maximum(np.searchsorted(days, calendar, side="right") - 1, 0)
+        growth[i] = closes[at] / closes[0]
+
+    weight_matrix = np.zeros((len(account_ids), len(used)))
+    np.add.at(
+        weight_matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), weights
+    )
+    values = weight_matrix @ growth + flat[:, None]
+    return account_ids, calendar, values, sources
+
+
+def drawdown_metrics(values: np.ndarray, days: np.ndarray) -> list[dict]:
+    """Peak drawdown, recovery and worst-day loss for each row of *values*.
+
+    *values* is a (paths x days) matrix of strictly positive values aligned
+    to *days* (ordinals).  Recovery is the first day after the trough on
+    which the path regains the peak it fell from; it is None when that
+    never happens inside the window.
+    """
+    n_paths, n_days = values.shape
+    rows = np.arange(n_paths)
+    positions = np.arange(n_days)
+
+    running_peak = np.maximum.accumulate(values, axis=1)
+    drawdown = values / running_peak - 1
+    trough = drawdown.argmin(axis=1)
+    peak_value = running_peak[rows, trough]
+    # Last day on or before the trough at the running peak
+    at_peak = (positions <= trough[:, None]) & (values >= peak_value[:, None])
+    peak = n_days - 1 - at_peak[:, ::-1].argmax(axis=1)
+    recovered = (positions > trough[:, None]) & (values >= peak_value[:, None])
+    has_recovery = recovered.any(axis=1)
+    recovery = recovered.argmax(axis=1)
+
+    if n_days > 1:
+        daily = values[:, 1:] / values[:, :-1] - 1
+        worst = daily.argmin(axis=1)
+        worst_pct = daily[rows, worst]
+        worst_loss = values[rows, worst] - values[rows, worst + 1]
+    else:
+        worst = worst_pct = worst_loss = None
+
+    def iso(index: int) -> str:
+        return date.fromordinal(int(days[index])).isoformat()
+
+    results = []
+    for i in range(n_paths):
+        start_value, end_value = float(values[i, 0]), float(values[i, -1])
+        metrics = {
+            "starting_value": start_value,
+            "ending_value": end_value,
+            "total_return_pct": end_value / start_value - 1,
+            "peak_drawdown_pct": float(drawdown[i, trough[i]]),
+            "peak_drawdown_amount": float(values[i, trough[i]] - peak_value[i]),
+            "peak_date": iso(peak[i]),
+            "trough_date": iso(trough[i]),
+            "recovery_date": iso(recovery[i]) if has_recovery[i] else None,
+            "recovery_days": (
+                int(days[recovery[i]] - days[trough[i]]) if has_recovery[i] else None
+            ),
+            "worst_day_pct": 0.0,
+            "worst_day_loss": 0.0,
+            "worst_day_date": None,
+        }
+        if worst is not None and worst_pct[i] < 0:
+            metrics["worst_day_pct"] = float(worst_pct[i])
+            metrics["worst_day_loss"] = float(worst_loss[i])
+            metrics["worst_day_date"] = iso(worst[i] + 1)
+        results.append(metrics)
+    return results
+
 
 class StressTestService:
     """Runs historical market stress scenarios against a user's portfolio."""
@@ -63,6 +228,23 @@ class StressTestService:
             return "equity"
         return "other"
 
+    @staticmethod
+    def _classify_holding(
+        asset_type: str | None, asset_class: str | None, account_type: AccountType
+    ) -> str:
+        """Returns 'equity', 'bond', or 'other' for a holding in an account."""
+        asset_type = (asset_type or "").lower().strip()
+        asset_class = (asset_class or "").lower().strip()
+        if (
+            asset_type in BOND_ASSET_TYPES
+            or asset_class in BOND_ASSET_CLASSES
+            or account_type in BOND_ACCOUNT_TYPES
+        ):
+            return "bond"
+        if asset_type in EQUITY_ASSET_TYPES or account_type in EQUITY_ACCOUNT_TYPES:
+            return "equity"
+        return "other"
+
     @staticmethod
     async def get_portfolio_composition(
         db: AsyncSession,
@@ -99,22 +281,12 @@ class StressTestService:
         for holding, account in holding_rows:
             accounts_with_holdings.add(account.id)
             value = holding.current_total_value or Decimal("0")
-            asset_type = (holding.asset_type or "").lower().strip()
-            asset_class = (holding.asset_class or "").lower().strip()
-
-            is_bond = (
-                asset_type in BOND_ASSET_TYPES
-                or asset_class in BOND_ASSET_CLASSES
-                or account.account_type in BOND_ACCOUNT_TYPES
-            )
-            is_equity = (
-                asset_type in EQUITY_ASSET_TYPES
-                or account.account_type in EQUITY_ACCOUNT_TYPES
+            bucket = StressTestService._classify_holding(
+                holding.asset_type, holding.asset_class, account.account_type
             )
-
-            if is_bond:
+            if bucket == "bond":
                 bond_value += value
-            elif is_equity:
+            elif bucket == "equity":
                 equity_value += value
             else:
                 other_value += value
@@ -243,3 +415,183 @@ class StressTestService:
                 pass
         results.sort(key=lambda x: x["pct_change"])
         return results
+
+    # ── Historical replay ──────────────────────────────────────────────────
+
+    @staticmethod
+    def _replay_symbols(
+        ticker: str | None,
+        priced: bool,
+        bucket: str,
+        asset_type: str | None,
+        asset_class: str | None,
+        account_type: AccountType,
+    ) -> tuple[str, ...]:
+        """Series to try for a holding: its own symbol, then asset-class proxies."""
+        proxies = STRESS_TEST.REPLAY_PROXIES
+        asset_type = (asset_type or "").lower().strip()
+        if asset_type in CRYPTO_ASSET_TYPES or account_type == AccountType.CRYPTO:
+            chain = [proxies["crypto"], proxies["equity"]]
+        elif bucket == "bond":
+            chain = [proxies["bond"]]
+        elif bucket == "equity":
+            chain = [proxies["equity"]]
+            if (asset_class or "").lower().strip() == "international":
+                chain.insert(0, proxies["international"])
+        else:
+            return ()
+        # Manually priced holdings may carry private identifiers — never send
+        # those to the provider
+        if ticker and priced:
+            chain.insert(0, ticker.upper())
+        return tuple(dict.fromkeys(chain))
+
+    @staticmethod
+    async def get_replay_positions(
+        db: AsyncSession,
+        organization_id: UUID,
+        user_id: UUID | None = None,
+    ) -> tuple[list[ReplayPosition], dict[UUID, str]]:
+        """Holdings (plus balance-only investment accounts) to replay, and account names.
+
+        Mirrors ``get_portfolio_composition``: accounts without holdings rows
+        are replayed on their balance through their account type's proxy.
+        """
+        holding_stmt = (
+            select(
+                Holding.account_id,
+                Holding.ticker,
+                Holding.current_total_value,
+                Holding.asset_type,
+                Holding.asset_class,
+                Holding.price_as_of,
+                Account.name,
+                Account.account_type,
+            )
+            .join(Account, Holding.account_id == Account.id)
+            .where(
+                Account.organization_id == organization_id,
+                Account.is_active.is_(True),
+            )
+        )
+        if user_id:
+            holding_stmt = holding_stmt.where(Account.user_id == user_id)
+
+        positions: list[ReplayPosition] = []
+        names: dict[UUID, str] = {}
+        for row in (await db.execute(holding_stmt)).all():
+            names[row.account_id] = row.name
+            value = float(row.current_total_value or 0)
+            if value <= 0:
+                continue
+            bucket = StressTestService._classify_holding(
+                row.asset_type, row.asset_class, row.account_type
+            )
+            priced = row.price_as_of is not None
+            positions.append(
+                ReplayPosition(
+                    account_id=row.account_id,
+                    value=value,
+                    symbols=StressTestService._replay_symbols(
+                        row.ticker,
+                        priced,
+                        bucket,
+                        row.asset_type,
+                        row.asset_class,
+                        row.account_type,
+                    ),
+                    own_symbol=row.ticker.upper() if row.ticker and priced else None,
+                )
+            )
+
+        investment_types = EQUITY_ACCOUNT_TYPES | BOND_ACCOUNT_TYPES
+        balance_stmt = select(
+            Account.id, Account.name, Account.account_type, Account.current_balance
+        ).where(
+            Account.organization_id == organization_id,
+            Account.is_active.is_(True),
+            cast(Account.account_type, String).in_([t.name for t in investment_types]),
+        )
+        if user_id:
+            balance_stmt = balance_stmt.where(Account.user_id == user_id)
+
+        for row in (await db.execute(balance_stmt)).all():
+            if row.id in names:
+                continue  # already replayed via holdings
+            names[row.id] = row.name
+            value = float(row.current_balance or 0)
+            if value <= 0:
+                continue
+            bucket = StressTestService._classify_account(row)
+            positions.append(
+                ReplayPosition(
+                    account_id=row.id,
+                    value=value,
+                    symbols=StressTestService._replay_symbols(
+                        None, False, bucket, None, None, row.account_type
+                    ),
+                )
+            )
+        return positions, names
+
+    @staticmethod
+    async def run_historical_replay(
+        db: AsyncSession,
+        organization_id: UUID,
+        scenario_key: str,
+        user_id: UUID | None = None,
+        store: PriceHistoryStore | None = None,
+    ) -> dict:
+        """Replays a historical window's daily returns through the current holdings.
+
+        Returns drawdown / recovery / worst-day metrics for the whole portfolio
+        and for each account, worst drawdown first.
+        """
+        windows = STRESS_TEST.REPLAY_WINDOWS
+        if scenario_key not in windows:
+            raise ValueError(
+                f"Unknown replay scenario: {scenario_key}. Valid: {list(windows)}"
+            )
+        window = windows[scenario_key]
+        start, end = window["start"], window["end"]
+
+        positions, names = await StressTestService.get_replay_positions(
+            db, organization_id, user_id
+        )
+        result = {
+            "scenario_key": scenario_key,
+            "scenario_label": window["label"],
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "trading_days": 0,
+            "portfolio": None,
+            "accounts": [],
+            "coverage": {
+                "positions": len(positions),
+                "own_history": 0,
+                "proxy": 0,
+                "unchanged": 0,
+            },
+        }
+        if not positions:
+            return result
+
+        store = store or price_history_store
+        symbols = {symbol for position in positions for symbol in position.symbols}
+        series = await store.get_many(symbols, start, end)
+
+        account_ids, days, values, sources = replay_account_paths(positions, series, start)
+        metrics = drawdown_metrics(np.vstack([values.sum(axis=0), values]), days)
+
+        result["trading_days"] = len(days)
+        result["portfolio"] = metrics[0]
+        result["accounts"] = sorted(
+            (
+                {"account_id": str(account_id), "account_name": names.get(account_id), **m}
+                for account_id, m in zip(account_ids, metrics[1:])
+            ),
+            key=lambda a: a["peak_drawdown_pct"],
+        )
+        result["coverage"].update(sources)
+        return result
+
@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.account import Account
 from app.models.recurring_transaction import RecurringFrequency, RecurringTransaction
 from app.models.transaction import Category, Transaction
+from app.services.merchant_service import merchant_condition
 from app.utils.datetime_utils import utc_now
 
 # Multiplier to annualize a single occurrence based on frequency
@@ -93,7 +94,7 @@ class SubscriptionInsightsService:
                     and_(
                         Transaction.organization_id == organization_id,
                         Transaction.account_id == rt.account_id,
-                        Transaction.merchant_name == rt.merchant_name,
+                        merchant_condition(rt.merchant_id, rt.merchant_name),
                         Transaction.date >= prev_start,
                         Transaction.date <= prev_end,
                     )
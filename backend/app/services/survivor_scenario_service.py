@@ -33,12 +33,17 @@ rules.
 from __future__ import annotations
 
 import datetime
-import math
-import random
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 from app.constants.financial import FIRE, SS
+from app.services.retirement.path_simulation import (
+    generate_normal_returns,
+    nearest_rank,
+    simulate_paths,
+)
 
 
 # Survivor SS reduction factor at age 60 (SSA POMS RS 00207.010)
@@ -193,41 +198,21 @@ def compute_survivor_scenario(
     total_years = survivor_life_expectancy - survivor_current_age
 
     # --- Monte Carlo projection ---
-    all_paths: list[list[float]] = []
-    depleted_count = 0
-
-    for _ in range(num_simulations):
-        p = portfolio
-        spending = survivor_spending
-        ss_annual = survivor_ss * 12
-        path = [p]
-        depleted = False
-
-        for year in range(1, total_years + 1):
-            if depleted:
-                path.append(0.0)
-                continue
-
-            age = survivor_current_age + year
-            u1 = random.random() or 1e-10
-            u2 = random.random()
-            z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-            annual_return = mu + z * sigma
-
-            income = ss_annual if age >= survivor_ss_claiming_age else 0.0
-            net_withdrawal = max(spending - income, 0.0)
-            p = max(p * (1 + annual_return) - net_withdrawal, 0.0)
-
-            spending *= (1 + inflation)
-            ss_annual *= (1 + inflation)
-
-            if p <= 0 and not depleted:
-                depleted = True
-                depleted_count += 1
-
-            path.append(p)
-
-        all_paths.append(path)
+    # SS switches on at the claiming age and grows with inflation; expressed
+    # as a per-year income vector so the kernel applies it to every path.
+    sim_years = max(total_years, 0)
+    years = np.arange(1, sim_years + 1)
+    ages = survivor_current_age + years
+    ss_by_year = survivor_ss * 12 * (1 + inflation) ** (years - 1)
+    income_by_year = np.where(ages >= survivor_ss_claiming_age, ss_by_year, 0.0)
+
+    sim = simulate_paths(
+        initial_balance=portfolio,
+        initial_spending=survivor_spending,
+        annual_returns=generate_normal_returns(num_simulations, sim_years, mu, sigma),
+        inflation=inflation,
+        income=income_by_year,
+    )
 
     # Deterministic projection for display (uses mean return)
     det_projection: list[SurvivorYearProjection] = []
@@ -251,17 +236,15 @@ def compute_survivor_scenario(
             spending *= (1 + inflation)
             ss_annual *= (1 + inflation)
 
-    final_values = sorted(p[-1] for p in all_paths)
-    n = len(final_values)
-    median_final = final_values[n // 2]
-    success_rate = round((num_simulations - depleted_count) / num_simulations, 4)
+    median_final = nearest_rank(sim.balances[:, -1], 0.50)
+    success_rate = round(sim.success_rate, 4)
 
     data_note = (
         "Survivor SS benefit rules per SSA POMS RS 00207.010 (statutory, not subject to annual change). "
         "Survivor receives higher of: own SS benefit or deceased's benefit × claiming-age reduction factor "
         f"(min 82.5% of deceased's PIA = ${deceased_pia * _SURVIVOR_FLOOR:,.0f}/mo). "
         "Spending reduction default 20% (single-person household). "
-        "Portfolio projection uses Monte Carlo (500 paths)."
+        f"Portfolio projection uses Monte Carlo ({num_simulations:,} paths)."
     )
 
     return SurvivorScenarioResult(
@@ -10,8 +10,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants.financial import TAX
-from app.models.account import Account, AccountType, TaxTreatment
+from app.models.account import Account, AccountType
 from app.models.holding import Holding
+from app.services.tax_lot_valuation_service import taxable_account_clause
 
 logger = logging.getLogger(__name__)
 
@@ -75,45 +76,24 @@ class TaxLossHarvestingService:
 
         If account_ids is provided, only those accounts are considered.
         """
-        # Get taxable account IDs — only these are eligible for tax-loss harvesting
-        acct_result = await db.execute(
-            select(Account.id).where(
-                Account.organization_id == organization_id,
-                Account.is_active.is_(True),
-                Account.tax_treatment == TaxTreatment.TAXABLE,
-            )
-        )
-        taxable_account_ids = {row[0] for row in acct_result.all()}
-
-        # Also include accounts with NULL tax_treatment that look taxable (brokerage, crypto)
-        fallback_result = await db.execute(
-            select(Account.id).where(
-                Account.organization_id == organization_id,
-                Account.is_active.is_(True),
-                Account.tax_treatment.is_(None),
-                Account.account_type.in_([AccountType.BROKERAGE, AccountType.CRYPTO]),
-            )
-        )
-        taxable_account_ids.update(row[0] for row in fallback_result.all())
-
-        # Filter to specific user's accounts if requested
-        if account_ids is not None:
-            taxable_account_ids &= account_ids
-
-        if not taxable_account_ids:
+        # Holdings in active taxable accounts (account eligibility decided in SQL)
+        if account_ids is not None and not account_ids:
             return []
-
-        # Get holdings in taxable accounts with cost basis data, including account_type
-        result = await db.execute(
-            select(Holding, Account.account_type).join(
-                Account, Holding.account_id == Account.id
-            ).where(
+        stmt = (
+            select(Holding, Account.account_type)
+            .join(Account, Holding.account_id == Account.id)
+            .where(
                 Holding.organization_id == organization_id,
-                Holding.account_id.in_(taxable_account_ids),
+                Account.organization_id == organization_id,
+                Account.is_active.is_(True),
+                taxable_account_clause(),
                 Holding.total_cost_basis.isnot(None),
                 Holding.current_total_value.isnot(None),
             )
         )
+        if account_ids is not None:
+            stmt = stmt.where(Holding.account_id.in_(account_ids))
+        result = await db.execute(stmt)
         holding_rows = result.all()
         holdings = [row[0] for row in holding_rows]
         holding_account_types = {row[0].id: row[1] for row in holding_rows}
@@ -12,13 +12,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.account import Account
 from app.models.holding import Holding
 from app.models.tax_lot import CostBasisMethod, TaxLot
+from app.services.tax_lot_valuation_service import LONG_TERM_DAYS, load_open_lots
 from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
 
-# One year threshold for long-term vs short-term holding period
-LONG_TERM_DAYS = 366  # > 1 year
-
 
 def _determine_holding_period(acquisition_date: date, sale_date: date) -> str:
     """Determine if a lot qualifies as long-term or short-term."""
@@ -245,52 +243,24 @@ class TaxLotService:
         Returns:
             Dictionary with unrealized gains summary
         """
-        # Get open lots for this account
-        result = await db.execute(
-            select(TaxLot)
-            .where(
-                TaxLot.account_id == account_id,
-                TaxLot.is_closed.is_(False),
-                TaxLot.remaining_quantity > 0,
-            )
-            .order_by(TaxLot.acquisition_date)
-        )
-        lots = result.scalars().all()
-
-        # Get current prices from holdings — scope to org as defense-in-depth
-        holding_ids = {lot.holding_id for lot in lots}
-        holdings_query = select(Holding).where(Holding.id.in_(holding_ids))
-        if org_id is not None:
-            holdings_query = holdings_query.where(Holding.organization_id == org_id)
-        holdings_result = await db.execute(holdings_query)
-        holdings_map = {h.id: h for h in holdings_result.scalars().all()}
+        valuations = await load_open_lots(db, org_id, account_id=account_id)
 
-        today = date.today()
         total_unrealized = Decimal("0")
         short_term = Decimal("0")
         long_term = Decimal("0")
         lot_items = []
 
-        for lot in lots:
-            holding = holdings_map.get(lot.holding_id)
-            current_price = holding.current_price_per_share if holding else None
-            unrealized_gl = None
-
-            if current_price is not None:
-                current_value = (lot.remaining_quantity * current_price).quantize(Decimal("0.01"))
-                lot_cost = (lot.remaining_quantity * lot.cost_basis_per_share).quantize(
-                    Decimal("0.01")
-                )
-                unrealized_gl = current_value - lot_cost
-                total_unrealized += unrealized_gl
+        for i, lot in enumerate(valuations.lots):
+            holding = valuations.holdings[i]
+            period = valuations.holding_period(i)
+            _, unrealized_gl = valuations.exact_gain(i)
 
-                period = _determine_holding_period(lot.acquisition_date, today)
+            if unrealized_gl is not None:
+                total_unrealized += unrealized_gl
                 if period == "SHORT_TERM":
                     short_term += unrealized_gl
                 else:
                     long_term += unrealized_gl
-            else:
-                period = _determine_holding_period(lot.acquisition_date, today)
 
             lot_items.append(
                 {
@@ -300,7 +270,7 @@ class TaxLotService:
                     "acquisition_date": lot.acquisition_date,
                     "quantity": lot.remaining_quantity,
                     "cost_basis_per_share": lot.cost_basis_per_share,
-                    "current_price_per_share": current_price,
+                    "current_price_per_share": holding.current_price_per_share if holding else None,
                     "unrealized_gain_loss": unrealized_gl,
                     "holding_period": period,
                 }
@@ -0,0 +1,142 @@
+"""Batched valuation of open tax lots.
+
+Capital-gains harvest candidates, per-account unrealized gains and the
+cost-basis-aging view all need the same inputs: every open lot with its
+holding's current price, its account, and how long it has been held.  They
+used to fetch holdings (and, for harvest candidates, accounts) lot by lot.
+
+``load_open_lots`` reads lots joined to holdings and accounts in one
+statement.  ``LotValuations`` then derives days held, holding-period class,
+days to long-term and float valuations as NumPy columns, so a household with
+thousands of lots costs one round-trip and no per-lot Python arithmetic.
+
+Tax-loss harvesting works on whole holdings rather than lots; it shares
+``taxable_account_clause`` so its account eligibility is decided in the same
+single query.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.account import Account, AccountType, TaxTreatment
+from app.models.holding import Holding
+from app.models.tax_lot import TaxLot
+
+# Long-term treatment requires holding for more than one year
+LONG_TERM_DAYS = 366
+
+
+def taxable_account_clause():
+    """Accounts whose gains and losses are reportable: taxable, or untagged brokerage / crypto."""
+    return or_(
+        Account.tax_treatment == TaxTreatment.TAXABLE,
+        and_(
+            Account.tax_treatment.is_(None),
+            Account.account_type.in_([AccountType.BROKERAGE, AccountType.CRYPTO]),
+        ),
+    )
+
+
+class LotValuations:
+    """Open lots with their holding / account and column-wise valuations.
+
+    Row ``i`` of every array describes ``lots[i]``.  Float columns are NaN
+    where the holding has no current price.
+    """
+
+    def __init__(self, rows, as_of: date):
+        self.as_of = as_of
+        self.lots: list[TaxLot] = []
+        self.holdings: list[Optional[Holding]] = []
+        self.account_names: list[Optional[str]] = []
+        self.account_types: list[Optional[AccountType]] = []
+        for lot, holding, account_name, account_type in rows:
+            self.lots.append(lot)
+            self.holdings.append(holding)
+            self.account_names.append(account_name)
+            self.account_types.append(account_type)
+
+        acquired = np.array([lot.acquisition_date for lot in self.lots], dtype="datetime64[D]")
+        self.days_held = (np.datetime64(as_of, "D") - acquired).astype(np.int64)
+        self.is_long_term = self.days_held >= LONG_TERM_DAYS
+        self.days_to_long_term = np.where(self.is_long_term, 0, LONG_TERM_DAYS - self.days_held)
+
+        self.quantity = np.array([float(lot.remaining_quantity) for lot in self.lots], dtype=float)
+        self.cost_basis = np.round(
+            self.quantity
+            * np.array([float(lot.cost_basis_per_share) for lot in self.lots], dtype=float),
+            2,
+        )
+        price = np.array([_price(h) for h in self.holdings], dtype=float)
+        self.has_price = ~np.isnan(price)
+        self.current_value = np.round(self.quantity * price, 2)
+        self.unrealized_gain = np.round(self.current_value - self.cost_basis, 2)
+
+    def __len__(self) -> int:
+        return len(self.lots)
+
+    def holding_period(self, i: int) -> str:
+        """``LONG_TERM`` / ``SHORT_TERM`` label used on lots and sales."""
+        return "LONG_TERM" if self.is_long_term[i] else "SHORT_TERM"
+
+    def exact_gain(self, i: int) -> tuple[Optional[Decimal], Optional[Decimal]]:
+        """Cent-exact (current value, unrealized gain) for APIs that report Decimals."""
+        holding = self.holdings[i]
+        price = holding.current_price_per_share if holding else None
+        if price is None:
+            return None, None
+        lot = self.lots[i]
+        current_value = (lot.remaining_quantity * price).quantize(Decimal("0.01"))
+        cost = (lot.remaining_quantity * lot.cost_basis_per_share).quantize(Decimal("0.01"))
+        return current_value, current_value - cost
+
+
+def _price(holding: Optional[Holding]) -> float:
+    if holding is None or holding.current_price_per_share is None:
+        return np.nan
+    return float(holding.current_price_per_share)
+
+
+async def load_open_lots(
+    db: AsyncSession,
+    organization_id: Optional[UUID] = None,
+    *,
+    account_id: Optional[UUID] = None,
+    user_id: Optional[UUID] = None,
+    as_of: Optional[date] = None,
+) -> LotValuations:
+    """Load and value every open lot for an organization or one account in one query.
+
+    Args:
+        db: Database session
+        organization_id: Scope lots and holdings to this organization
+        account_id: Only lots in this account
+        user_id: Only lots in accounts owned by this household member
+        as_of: Valuation date for holding periods (defaults to today)
+    """
+    holding_join = Holding.id == TaxLot.holding_id
+    if organization_id is not None:
+        holding_join = and_(holding_join, Holding.organization_id == organization_id)
+
+    stmt = (
+        select(TaxLot, Holding, Account.name, Account.account_type)
+        .outerjoin(Holding, holding_join)
+        .outerjoin(Account, Account.id == TaxLot.account_id)
+        .where(TaxLot.is_closed.is_(False), TaxLot.remaining_quantity > 0)
+        .order_by(TaxLot.acquisition_date, TaxLot.id)
+    )
+    if organization_id is not None:
+        stmt = stmt.where(TaxLot.organization_id == organization_id)
+    if account_id is not None:
+        stmt = stmt.where(TaxLot.account_id == account_id)
+    if user_id is not None:
+        stmt = stmt.where(Account.user_id == user_id)
+
+    result = await db.execute(stmt)
+    return LotValuations(result.all(), as_of or date.today())
@@ -26,6 +26,7 @@ from app.models.transaction import Transaction
 from app.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
 from app.services.dividend_detection_service import DividendDetectionService
 from app.services.encryption_service import get_encryption_service
+from app.services.merchant_service import assign_merchants_nonfatal
 from app.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -391,6 +392,7 @@ class TellerService:
                     await detector.process_batch(synced_transactions, account.organization_id)
                 except Exception as e:
                     logger.warning("Dividend auto-detection failed (non-fatal): %s", e)
+                await assign_merchants_nonfatal(db, account.organization_id, synced_transactions)
 
             await db.commit()
             return synced_transactions
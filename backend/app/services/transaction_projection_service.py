@@ -0,0 +1,143 @@
+"""Column-projection read path for transaction lists.
+
+``GET /transactions/`` and ``/transactions/search`` used to load full ORM
+transactions with three ``joinedload`` chains — the labels chain multiplies
+rows by each transaction's label count — then build a ``TransactionDetail``
+and ``CategorySummary`` per row, ``model_dump`` them for the cache, and let
+FastAPI validate the whole response model again on the way out.
+
+Here one SELECT fetches exactly the response columns: account name and mask
+and the category (with its parent's name) through joins, and each
+transaction's labels aggregated in SQL into one JSON array (``json_agg`` on
+PostgreSQL, ``json_group_array`` elsewhere) so rows are never multiplied.
+``project_transaction`` turns a row into the plain dict ``TransactionDetail``
+would serialize to, and ``app.utils.fast_json`` encodes it with orjson —
+the data comes straight from our own columns, so it skips validation.
+"""
+
+from typing import Any, Dict, List
+from uuid import UUID
+
+import orjson
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.account import Account
+from app.models.transaction import Category, Label, Transaction, TransactionLabel
+
+ParentCategory = aliased(Category, name="parent_category")
+
+_LABEL_FIELDS = ("id", "name", "color", "is_income")  # LabelSummary
+
+
+def _labels_json(db: AsyncSession):
+    """Correlated subquery: the transaction's labels as a JSON array string."""
+    bind = getattr(db, "bind", None)
+    fields = [part for name in _LABEL_FIELDS for part in (name, getattr(Label, name))]
+    if bind is not None and bind.dialect.name == "postgresql":
+        aggregate = func.json_agg(func.json_build_object(*fields))
+    else:
+        aggregate = func.json_group_array(func.json_object(*fields))
+    return (
+        select(aggregate)
+        .select_from(TransactionLabel)
+        .join(Label, Label.id == TransactionLabel.label_id)
+        .where(TransactionLabel.transaction_id == Transaction.id)
+        .correlate(Transaction)
+        .scalar_subquery()
+    )
+
+
+def transaction_projection(db: AsyncSession, *conditions) -> Select:
+    """SELECT of the transaction list response columns, filtered by *conditions*.
+
+    Joins ``Account`` (inner, like the list filters expect) and the category
+    and its parent (outer).  Callers add ordering, cursor and limit.
+    """
+    return (
+        select(
+            Transaction.id,
+            Transaction.organization_id,
+            Transaction.account_id,
+            Transaction.external_transaction_id,
+            Transaction.date,
+            Transaction.amount,
+            Transaction.merchant_name,
+            Transaction.description,
+            Transaction.category_primary,
+            Transaction.category_detailed,
+            Transaction.is_pending,
+            Transaction.is_transfer,
+            Transaction.is_split,
+            Transaction.notes,
+            Transaction.flagged_for_review,
+            Transaction.created_at,
+            Transaction.updated_at,
+            Account.name.label("account_name"),
+            Account.mask.label("account_mask"),
+            Category.id.label("category_id"),
+            Category.name.label("category_name"),
+            Category.color.label("category_color"),
+            Category.parent_category_id.label("category_parent_id"),
+            ParentCategory.name.label("category_parent_name"),
+            _labels_json(db).label("labels_json"),
+        )
+        .select_from(Transaction)
+        .join(Account, Account.id == Transaction.account_id)
+        .outerjoin(Category, Category.id == Transaction.category_id)
+        .outerjoin(ParentCategory, ParentCategory.id == Category.parent_category_id)
+        .where(*conditions)
+    )
+
+
+def _labels(raw: Any) -> List[Dict[str, Any]]:
+    if not raw:
+        return []
+    labels = orjson.loads(raw) if isinstance(raw, (str, bytes)) else raw
+    # SQLite renders UUIDs as bare hex and booleans as 0/1
+    return [
+        {
+            "id": str(UUID(str(label["id"]))),
+            "name": label["name"],
+            "color": label["color"],
+            "is_income": bool(label["is_income"]),
+        }
+        for label in labels
+    ]
+
+
+def project_transaction(row) -> Dict[str, Any]:
+    """One ``transaction_projection`` row as the ``TransactionDetail`` JSON object."""
+    category = None
+    if row.category_id is not None:
+        category = {
+            "id": row.category_id,
+            "name": row.category_name,
+            "color": row.category_color,
+            "parent_id": row.category_parent_id,
+            "parent_name": row.category_parent_name,
+        }
+    return {
+        "date": row.date,
+        "amount": row.amount,
+        "merchant_name": row.merchant_name,
+        "description": row.description,
+        "category_primary": row.category_primary,
+        "category_detailed": row.category_detailed,
+        "id": row.id,
+        "organization_id": row.organization_id,
+        "account_id": row.account_id,
+        "external_transaction_id": row.external_transaction_id,
+        "is_pending": row.is_pending,
+        "is_transfer": row.is_transfer,
+        "is_split": bool(row.is_split),
+        "notes": row.notes,
+        "flagged_for_review": row.flagged_for_review,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "account_name": row.account_name,
+        "account_mask": row.account_mask,
+        "category": category,
+        "labels": _labels(row.labels_json),
+    }
@@ -0,0 +1,86 @@
+"""Indexed text search over transactions.
+
+On PostgreSQL every transaction carries ``search_vector``, a stored generated
+``tsvector`` over merchant name (weight A), description (B) and notes (C),
+with a GIN index (migration r83_transaction_search_vector).  A search string
+becomes a prefix ``tsquery`` — "whole foo" matches "Whole Foods Market" —
+ORed with a substring match that the existing ``pg_trgm`` GIN indexes on the
+same three columns serve, so "bucks" still finds "Starbucks".  Substring
+matching is skipped for terms shorter than pg_trgm's three-character
+trigrams, which could not use those indexes.  ``search_rank`` orders matches
+by ``ts_rank_cd`` so merchant-name hits come first.
+
+The column is maintained by the database and deliberately not mapped on the
+``Transaction`` model, so ordinary transaction loads never fetch it.  Other
+dialects (SQLite in tests) fall back to case-insensitive substring matching
+and no ranking.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import cast, func, literal, literal_column, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.transaction import Transaction
+
+SEARCH_CONFIG = "simple"  # No stemming: merchant names are not prose
+MAX_QUERY_TERMS = 8
+MIN_SUBSTRING_LENGTH = 3  # pg_trgm indexes only serve patterns of 3+ characters
+
+search_vector = literal_column("transactions.search_vector")
+
+_TERM_RE = re.compile(r"[^\W_]+")
+
+
+def prefix_tsquery(text: str) -> Optional[str]:
+    """``'whole:* & foods:*'`` for "Whole Foods"; None when *text* has no words.
+
+    Terms are restricted to letters and digits, so user input can never inject
+    tsquery operators.
+    """
+    terms = _TERM_RE.findall(text.lower())[:MAX_QUERY_TERMS]
+    return " & ".join(f"{term}:*" for term in terms) or None
+
+
+def uses_full_text(db: AsyncSession) -> bool:
+    bind = getattr(db, "bind", None)
+    return bind is not None and bind.dialect.name == "postgresql"
+
+
+def _tsquery(query: str):
+    return func.to_tsquery(cast(literal(SEARCH_CONFIG), REGCONFIG), query)
+
+
+def _substring_match(text: str):
+    # Escape ILIKE wildcards in user input to prevent pattern injection
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    return (
+        Transaction.merchant_name.ilike(pattern)
+        | Transaction.description.ilike(pattern)
+        | Transaction.notes.ilike(pattern)
+    )
+
+
+def search_condition(db: AsyncSession, text: str):
+    """WHERE clause matching transactions whose merchant, description or notes match *text*."""
+    if not uses_full_text(db):
+        return _substring_match(text)
+
+    conditions = []
+    query = prefix_tsquery(text)
+    if query:
+        conditions.append(search_vector.op("@@")(_tsquery(query)))
+    if len(text.strip()) >= MIN_SUBSTRING_LENGTH or not conditions:
+        conditions.append(_substring_match(text))
+    return or_(*conditions)
+
+
+def search_rank(db: AsyncSession, text: str):
+    """Relevance expression for ORDER BY (higher is better), or None without full-text support."""
+    query = prefix_tsquery(text)
+    if not query or not uses_full_text(db):
+        return None
+    return func.ts_rank_cd(search_vector, _tsquery(query))
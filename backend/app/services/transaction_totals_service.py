@@ -0,0 +1,283 @@
+"""Totals for paginated transaction lists.
+
+The first page of ``GET /transactions/`` used to run an exact ``COUNT(*)``
+joined to accounts with every filter, substring search included — often
+costlier than fetching the page.  ``count_transactions`` answers the same
+question more cheaply:
+
+- **Counters** — ``transaction_counts`` holds per-account, per-month counts
+  kept current by a PostgreSQL trigger.  When a list is filtered only by
+  account, member and date, the total is a sum over those rows plus exact
+  counts of the partial months at either end of the date range.
+- **Exact mode** (the default) — a full ``COUNT(*)`` for other filters.
+- **Estimate mode** — opt-in (``count=estimate`` on the endpoints,
+  ``count_transactions(exact=False)``) for clients that render
+  ``is_estimate``: other filters are counted only up to
+  TRANSACTION_COUNT_ESTIMATE_CAP matching rows.  Past the cap the total is
+  the query planner's row estimate (PostgreSQL) or the cap itself, and
+  ``is_estimate`` is set so clients can show "10,000+".
+
+Totals are cached for TRANSACTION_TOTALS_CACHE_TTL_SECONDS under
+``txn_totals:<org>:<version>:...``.  The version token lives at
+``transactions:<org>:totals_version`` — inside the key pattern every
+transaction writer already deletes — so one invalidation retires all of an
+org's cached totals without scanning for them.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core import cache
+from app.models.account import Account
+from app.models.transaction import Transaction
+from app.models.transaction_count import TransactionCount
+from app.services.partition_service import add_months, month_start
+from app.services.transaction_search_service import search_condition
+
+logger = logging.getLogger(__name__)
+
+_VERSION_TTL_SECONDS = 86_400  # Outlives every cached total it versions
+_REBUILD_BATCH_SIZE = 1_000
+
+
+@dataclass(frozen=True)
+class TransactionFilters:
+    """Filters shared by a transaction list query and its total."""
+
+    organization_id: UUID
+    account_id: Optional[UUID] = None
+    user_id: Optional[UUID] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    search: Optional[str] = None
+    flagged: Optional[bool] = None
+    min_amount: Optional[Decimal] = None  # On the absolute amount
+    max_amount: Optional[Decimal] = None
+    is_income: Optional[bool] = None  # True = deposits only, False = expenses only
+
+    def conditions(self, db: AsyncSession) -> list:
+        """WHERE clauses for ``Transaction`` joined to ``Account`` (active accounts only)."""
+        conditions = [
+            Transaction.organization_id == self.organization_id,
+            Account.is_active.is_(True),
+        ]
+        if self.account_id:
+            conditions.append(Transaction.account_id == self.account_id)
+        if self.user_id:
+            conditions.append(Account.user_id == self.user_id)
+        if self.start_date:
+            conditions.append(Transaction.date >= self.start_date)
+        if self.end_date:
+            conditions.append(Transaction.date <= self.end_date)
+        if self.search:
+            conditions.append(search_condition(db, self.search))
+        if self.flagged is not None:
+            conditions.append(Transaction.flagged_for_review.is_(self.flagged))
+        if self.min_amount is not None:
+            conditions.append(func.abs(Transaction.amount) >= self.min_amount)
+        if self.max_amount is not None:
+            conditions.append(func.abs(Transaction.amount) <= self.max_amount)
+        if self.is_income is True:
+            conditions.append(Transaction.amount > 0)
+        elif self.is_income is False:
+            conditions.append(Transaction.amount < 0)
+        return conditions
+
+    @property
+    def counter_compatible(self) -> bool:
+        """True when only account, member and date filters apply."""
+        return (
+            not self.search
+            and self.flagged is None
+            and self.min_amount is None
+            and self.max_amount is None
+            and self.is_income is None
+        )
+
+    def digest(self) -> str:
+        values = {k: str(v) for k, v in dataclasses.asdict(self).items() if v is not None}
+        return hashlib.sha256(json.dumps(values, sort_keys=True).encode()).hexdigest()[:24]
+
+
+@dataclass(frozen=True)
+class TransactionTotal:
+    total: int
+    is_estimate: bool = False  # total is a lower bound or planner estimate
+
+
+def uses_counters(db: AsyncSession) -> bool:
+    """transaction_counts is trigger-maintained only on PostgreSQL."""
+    bind = getattr(db, "bind", None)
+    return bind is not None and bind.dialect.name == "postgresql"
+
+
+def totals_version_key(organization_id: UUID) -> str:
+    return f"transactions:{organization_id}:totals_version"
+
+
+async def _cache_key(filters: TransactionFilters, mode: str) -> Optional[str]:
+    """Versioned cache key, or None when totals cannot be cached (no Redis)."""
+    version_key = totals_version_key(filters.organization_id)
+    version = await cache.get(version_key)
+    if version is None:
+        version = uuid4().hex[:12]
+        if not await cache.setex(version_key, _VERSION_TTL_SECONDS, version):
+            return None
+    return f"txn_totals:{filters.organization_id}:{version}:{mode}:{filters.digest()}"
+
+
+async def count_transactions(
+    db: AsyncSession, filters: TransactionFilters, *, exact: bool = True
+) -> TransactionTotal:
+    """Total number of transactions matching *filters* (see module docstring)."""
+    counted = filters.counter_compatible and uses_counters(db)
+    mode = "exact" if exact or counted else "estimate"
+
+    cache_key = await _cache_key(filters, mode)
+    if cache_key:
+        cached = await cache.get(cache_key)
+        if isinstance(cached, dict):
+            return TransactionTotal(**cached)
+
+    if counted:
+        result = TransactionTotal(await _count_from_counters(db, filters))
+    elif exact:
+        result = TransactionTotal(await _count_exact(db, filters))
+    else:
+        result = await _count_capped(db, filters)
+
+    if cache_key:
+        await cache.setex(
+            cache_key, settings.TRANSACTION_TOTALS_CACHE_TTL_SECONDS, dataclasses.asdict(result)
+        )
+    return result
+
+
+def _matching_ids(db: AsyncSession, filters: TransactionFilters):
+    return select(Transaction.id).join(Account).where(*filters.conditions(db))
+
+
+async def _count_exact(db: AsyncSession, filters: TransactionFilters) -> int:
+    result = await db.execute(
+        select(func.count()).select_from(Transaction).join(Account).where(*filters.conditions(db))
+    )
+    return result.scalar() or 0
+
+
+def _whole_months(start: Optional[date], end: Optional[date]):
+    """[from, to) month starts fully inside [start, end]; None for an open end."""
+    full_from = None
+    if start is not None:
+        full_from = start if start.day == 1 else add_months(month_start(start), 1)
+    full_to = month_start(end + timedelta(days=1)) if end is not None else None
+    return full_from, full_to
+
+
+async def _count_from_counters(db: AsyncSession, filters: TransactionFilters) -> int:
+    full_from, full_to = _whole_months(filters.start_date, filters.end_date)
+    if full_from is not None and full_to is not None and full_from >= full_to:
+        # The range never covers a whole month
+        return await _count_exact(db, filters)
+
+    query = (
+        select(func.coalesce(func.sum(TransactionCount.count), 0))
+        .select_from(TransactionCount)
+        .join(Account, Account.id == TransactionCount.account_id)
+        .where(
+            TransactionCount.organization_id == filters.organization_id,
+            Account.is_active.is_(True),
+        )
+    )
+    if filters.account_id:
+        query = query.where(TransactionCount.account_id == filters.account_id)
+    if filters.user_id:
+        query = query.where(Account.user_id == filters.user_id)
+    if full_from is not None:
+        query = query.where(TransactionCount.month >= full_from)
+    if full_to is not None:
+        query = query.where(TransactionCount.month < full_to)
+    total = int((await db.execute(query)).scalar() or 0)
+
+    # Partial months at either end of the range
+    if full_from is not None and filters.start_date < full_from:
+        head = dataclasses.replace(filters, end_date=full_from - timedelta(days=1))
+        total += await _count_exact(db, head)
+    if full_to is not None and full_to <= filters.end_date:
+        tail = dataclasses.replace(filters, start_date=full_to)
+        total += await _count_exact(db, tail)
+    return total
+
+
+async def _count_capped(db: AsyncSession, filters: TransactionFilters) -> TransactionTotal:
+    cap = settings.TRANSACTION_COUNT_ESTIMATE_CAP
+    matching = _matching_ids(db, filters)
+    result = await db.execute(select(func.count()).select_from(matching.limit(cap + 1).subquery()))
+    count = result.scalar() or 0
+    if count <= cap:
+        return TransactionTotal(count)
+
+    planned = await _planner_rows(db, matching) if uses_counters(db) else None
+    return TransactionTotal(max(cap, planned or 0), is_estimate=True)
+
+
+async def _planner_rows(db: AsyncSession, query) -> Optional[int]:
+    """PostgreSQL's row estimate for *query*, or None if EXPLAIN fails."""
+    try:
+        sql = query.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+        # Savepoint so a failed EXPLAIN cannot abort the caller's transaction
+        async with db.begin_nested():
+            connection = await db.connection()
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.debug("transaction count planner estimate failed: %s", e)
+        return None
+
+
+async def rebuild_transaction_counts(
+    db: AsyncSession, organization_id: Optional[UUID] = None
+) -> int:
+    """Recompute transaction_counts from transactions (one org, or all).
+
+    For repairing drift (e.g. rows removed by TRUNCATE); the trigger keeps
+    the table current otherwise.  Does not commit.  Returns the number of
+    counter rows written.
+    """
+    query = select(
+        Transaction.account_id,
+        Transaction.organization_id,
+        Transaction.date,
+        func.count(),
+    ).group_by(Transaction.account_id, Transaction.organization_id, Transaction.date)
+    stale = delete(TransactionCount)
+    if organization_id is not None:
+        query = query.where(Transaction.organization_id == organization_id)
+        stale = stale.where(TransactionCount.organization_id == organization_id)
+
+    counts: dict[tuple, int] = defaultdict(int)
+    for account_id, org_id, day, n in await db.execute(query):
+        counts[(account_id, month_start(day), org_id)] += n
+
+    await db.execute(stale)
+    rows = [
+        {"account_id": account_id, "month": month, "organization_id": org_id, "count": n}
+        for (account_id, month, org_id), n in counts.items()
+    ]
+    for i in range(0, len(rows), _REBUILD_BATCH_SIZE):
+        await db.execute(insert(TransactionCount), rows[i : i + _REBUILD_BATCH_SIZE])
+    return len(rows)
@@ -0,0 +1,38 @@
+"""orjson encoding for large, trusted API responses.
+
+Endpoints that build their payload from our own columns (see
+``transaction_projection_service``) return ``FastJSONResponse`` instead of a
+Pydantic model: FastAPI skips ``response_model`` validation for ``Response``
+objects, and orjson encodes UUIDs, dates and datetimes natively.  Output
+matches Pydantic's JSON mode — decimals as strings, naive ISO datetimes.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from starlette.responses import Response
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """Encode *value* as JSON bytes."""
+    return orjson.dumps(value, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded with orjson; accepts pre-encoded bytes as-is."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -135,6 +135,9 @@ class ResilientRedBeatScheduler:
         return _Impl(*args, **kwargs)
 
 
+# Task duration / retry / time-limit signal handlers
+from app.workers import task_metrics  # noqa: F401
+
 # Import tasks here as they're created
 from app.workers.tasks import (
     auth_tasks,  # noqa: F401
@@ -144,6 +147,8 @@ from app.workers.tasks import (
     guest_access_tasks,  # noqa: F401
     holdings_tasks,  # noqa: F401
     interest_accrual_tasks,  # noqa: F401
+    merchant_tasks,  # noqa: F401
+    partition_tasks,  # noqa: F401
     recap_tasks,  # noqa: F401
     recurring_tasks,  # noqa: F401
     report_tasks,  # noqa: F401
@@ -164,6 +169,11 @@ celery_app.conf.beat_schedule = {
         "task": "check_budget_alerts",
         "schedule": crontab(hour=0, minute=0),  # Midnight daily
     },
+    # Resolve unassigned transactions to merchants — before recurring detection
+    "reconcile-merchants": {
+        "task": "reconcile_merchants",
+        "schedule": crontab(hour=1, minute=45),  # 1:45am daily
+    },
     "detect-recurring-patterns": {
         "task": "detect_recurring_patterns",
         "schedule": crontab(hour=2, minute=0, day_of_week=1),  # Monday 2am
@@ -203,6 +213,11 @@ celery_app.conf.beat_schedule = {
         "task": "run_data_retention",
         "schedule": crontab(hour=3, minute=30),  # 3:30am daily
     },
+    # Monthly partition pre-creation — only effective when DB_PARTITIONING_ENABLED
+    "maintain-partitions": {
+        "task": "maintain_partitions",
+        "schedule": crontab(hour=3, minute=15),  # 3:15am daily, before retention
+    },
     # Cleanup archived retirement scenarios with no active members
     "cleanup-archived-retirement-scenarios": {
         "task": "cleanup_archived_retirement_scenarios",
@@ -0,0 +1,246 @@
+"""Celery task metrics, aggregated in Redis and exported by the API.
+
+Worker children (prefork) each have their own memory, so observing a
+``prometheus_client`` histogram inside a task would be invisible to any
+scraper.  Instead the signal handlers below write a few ``HINCRBY`` counters
+per task run into the broker Redis:
+
+- ``celery:metrics:runs`` / ``duration_sum`` / ``duration_buckets`` —
+  one histogram per (task, final state: success / failure / retry);
+- ``celery:metrics:events`` — retries and soft / hard time-limit hits.
+
+``CeleryMetricsCollector`` is registered on the API's admin metrics port
+(``create_metrics_app``).  At scrape time it reads those aggregates and
+samples live broker state:
+
+- ``celery_queue_length{queue}`` — ``LLEN`` of each broker queue;
+- ``celery_beat_schedule_lag_seconds`` — how far the most overdue RedBeat
+  entry is behind its due time (beat stalled or lock lost);
+- ``celery_task_time_limit_seconds{task_name,kind}`` — soft / hard limits,
+  so dashboards can plot p99 duration as a fraction of the limit.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from celery.exceptions import SoftTimeLimitExceeded, TimeLimitExceeded
+from celery.signals import task_failure, task_postrun, task_prerun, task_retry
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+RUNS_KEY = "celery:metrics:runs"
+DURATION_SUM_KEY = "celery:metrics:duration_sum"
+DURATION_BUCKETS_KEY = "celery:metrics:duration_buckets"
+EVENTS_KEY = "celery:metrics:events"
+
+EVENT_RETRY = "retry"
+EVENT_SOFT_TIME_LIMIT = "soft_time_limit"
+EVENT_TIME_LIMIT = "time_limit"
+
+_redis = None
+_started: dict[str, float] = {}
+
+
+def _client():
+    """Sync Redis client on the broker (redis-py resets its pool after fork)."""
+    global _redis
+    if _redis is None:
+        import redis
+
+        _redis = redis.Redis.from_url(
+            settings.CELERY_BROKER_URL,
+            socket_timeout=1,
+            socket_connect_timeout=1,
+            decode_responses=True,
+        )
+    return _redis
+
+
+def _bucket(duration_seconds: float) -> str:
+    for bound in DURATION_BUCKETS:
+        if duration_seconds <= bound:
+            return str(bound)
+    return "+Inf"
+
+
+def record_task_run(task_name: str, status: str, duration_seconds: float) -> None:
+    """Add one run to the task's duration histogram (never raises)."""
+    field = f"{task_name}|{status}"
+    try:
+        pipe = _client().pipeline(transaction=False)
+        pipe.hincrby(RUNS_KEY, field, 1)
+        pipe.hincrbyfloat(DURATION_SUM_KEY, field, duration_seconds)
+        pipe.hincrby(DURATION_BUCKETS_KEY, f"{field}|{_bucket(duration_seconds)}", 1)
+        pipe.execute()
+    except Exception as exc:
+        logger.debug("celery metrics: could not record run of %s: %s", task_name, exc)
+
+
+def record_task_event(task_name: str, event: str) -> None:
+    """Count a retry or time-limit hit (never raises)."""
+    try:
+        _client().hincrby(EVENTS_KEY, f"{task_name}|{event}", 1)
+    except Exception as exc:
+        logger.debug("celery metrics: could not record %s for %s: %s", event, task_name, exc)
+
+
+def _time_limit_event(exc) -> Optional[str]:
+    if isinstance(exc, SoftTimeLimitExceeded):
+        return EVENT_SOFT_TIME_LIMIT
+    if isinstance(exc, TimeLimitExceeded):
+        return EVENT_TIME_LIMIT
+    return None
+
+
+@task_prerun.connect
+def _on_task_prerun(task_id=None, **kwargs):
+    _started[task_id] = time.monotonic()
+
+
+@task_postrun.connect
+def _on_task_postrun(task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    if started is None or task is None or not settings.METRICS_ENABLED:
+        return
+    record_task_run(task.name, (state or "unknown").lower(), time.monotonic() - started)
+
+
+@task_retry.connect
+def _on_task_retry(sender=None, reason=None, **kwargs):
+    if sender is None or not settings.METRICS_ENABLED:
+        return
+    record_task_event(sender.name, EVENT_RETRY)
+    # RetryableTask autoretries every Exception, soft time limits included
+    event = _time_limit_event(reason)
+    if event:
+        record_task_event(sender.name, event)
+
+
+@task_failure.connect
+def _on_task_failure(sender=None, exception=None, **kwargs):
+    if sender is None or not settings.METRICS_ENABLED:
+        return
+    event = _time_limit_event(exception)
+    if event:
+        record_task_event(sender.name, event)
+
+
+def _split(field: str, parts: int) -> Optional[list[str]]:
+    # Task names never contain "|"; rsplit keeps this robust if one ever did
+    pieces = field.rsplit("|", parts - 1)
+    return pieces if len(pieces) == parts else None
+
+
+class CeleryMetricsCollector:
+    """Prometheus collector for worker aggregates and broker / beat state."""
+
+    def describe(self):
+        # Skip the registry's collect-on-register probe (it would hit Redis)
+        return []
+
+    def collect(self):
+        from app.workers.celery_app import celery_app
+
+        conf = celery_app.conf
+        queues = sorted({conf.task_default_queue, *(q.name for q in conf.task_queues or ())})
+        schedule_key = f"{conf.get('redbeat_key_prefix') or 'redbeat:'}:schedule"
+
+        try:
+            pipe = _client().pipeline(transaction=False)
+            pipe.hgetall(RUNS_KEY)
+            pipe.hgetall(DURATION_SUM_KEY)
+            pipe.hgetall(DURATION_BUCKETS_KEY)
+            pipe.hgetall(EVENTS_KEY)
+            for queue in queues:
+                pipe.llen(queue)
+            pipe.zrange(schedule_key, 0, 0, withscores=True)
+            runs, sums, buckets, events, *rest = pipe.execute()
+        except Exception as exc:
+            logger.warning("celery metrics: broker unavailable for scrape: %s", exc)
+            return
+        lengths, next_due = rest[:-1], rest[-1]
+
+        yield from self._task_families(runs, sums, buckets, events)
+
+        queue_length = GaugeMetricFamily(
+            "celery_queue_length", "Messages waiting in the broker queue", labels=["queue"]
+        )
+        for queue, length in zip(queues, lengths):
+            queue_length.add_metric([queue], length)
+        yield queue_length
+
+        if next_due:
+            lag = GaugeMetricFamily(
+                "celery_beat_schedule_lag_seconds",
+                "Seconds the most overdue RedBeat entry is past its due time",
+            )
+            lag.add_metric([], max(0.0, time.time() - next_due[0][1]))
+            yield lag
+
+        limits = GaugeMetricFamily(
+            "celery_task_time_limit_seconds",
+            "Configured Celery task time limits",
+            labels=["task_name", "kind"],
+        )
+        for name, task in sorted(celery_app.tasks.items()):
+            if name.startswith("celery."):
+                continue
+            soft = task.soft_time_limit or conf.task_soft_time_limit
+            hard = task.time_limit or conf.task_time_limit
+            if soft:
+                limits.add_metric([name, "soft"], soft)
+            if hard:
+                limits.add_metric([name, "hard"], hard)
+        yield limits
+
+    @staticmethod
+    def _task_families(runs: dict, sums: dict, buckets: dict, events: dict):
+        duration = HistogramMetricFamily(
+            "celery_task_duration_seconds",
+            "Celery task duration in seconds",
+            labels=["task_name", "status"],
+        )
+        total = CounterMetricFamily(
+            "celery_tasks", "Total Celery tasks executed", labels=["task_name", "status"]
+        )
+        for field, count in sorted(runs.items()):
+            labels = _split(field, 2)
+            if labels is None:
+                continue
+            cumulative = 0
+            series = []
+            for bound in (*(str(b) for b in DURATION_BUCKETS), "+Inf"):
+                cumulative += int(buckets.get(f"{field}|{bound}", 0))
+                series.append((bound, cumulative))
+            duration.add_metric(labels, series, float(sums.get(field, 0.0)))
+            total.add_metric(labels, int(count))
+        yield duration
+        yield total
+
+        retries = CounterMetricFamily(
+            "celery_task_retries", "Celery task retries", labels=["task_name"]
+        )
+        limit_hits = CounterMetricFamily(
+            "celery_task_time_limit_hits",
+            "Celery tasks stopped by a soft or hard time limit",
+            labels=["task_name", "kind"],
+        )
+        for field, count in sorted(events.items()):
+            labels = _split(field, 2)
+            if labels is None:
+                continue
+            task_name, event = labels
+            if event == EVENT_RETRY:
+                retries.add_metric([task_name], int(count))
+            elif event == EVENT_SOFT_TIME_LIMIT:
+                limit_hits.add_metric([task_name, "soft"], int(count))
+            elif event == EVENT_TIME_LIMIT:
+                limit_hits.add_metric([task_name, "hard"], int(count))
+        yield retries
+        yield limit_hits
@@ -3,7 +3,8 @@
 Runs daily at 8 AM UTC. For each active org, finds recurring transactions
 marked as bills where the next expected date is within the reminder window,
 then creates a LARGE_TRANSACTION notification (used as a bill reminder) unless
-an identical reminder was already sent today (deduplication guard).
+an identical reminder was already sent today (deduplication guard).  Reminder
+emails are sent together at the end through the bulk dispatcher.
 """
 
 import asyncio
@@ -60,9 +61,10 @@ async def _send_bill_reminders_async():
         )
         orgs = orgs_result.scalars().all()
 
+        queued_emails = []
         for org in orgs:
             try:
-                await _process_org_bills(db, org)
+                queued_emails.extend(await _process_org_bills(db, org))
             except Exception as exc:
                 logger.error(
                     "bill_reminder_failed",
@@ -71,9 +73,15 @@ async def _send_bill_reminders_async():
 
         await db.commit()
 
+        if queued_emails:
+            await NotificationService.send_notification_emails(db, queued_emails)
 
-async def _process_org_bills(db, org) -> None:
-    """Create bill reminder notifications for one organization."""
+
+async def _process_org_bills(db, org) -> list:
+    """Create bill reminder notifications for one organization.
+
+    Returns ``(notification, email)`` pairs for the caller to send in bulk.
+    """
     today = utc_now().date()
 
     # Find active bills where next_expected_date is set
@@ -90,7 +98,7 @@ async def _process_org_bills(db, org) -> None:
     bills = bills_result.scalars().all()
 
     if not bills:
-        return
+        return []
 
     # Fetch any active org member to use as notification recipient
     users_result = await db.execute(
@@ -101,13 +109,14 @@ async def _process_org_bills(db, org) -> None:
     )
     org_users = users_result.scalars().all()
     if not org_users:
-        return
+        return []
 
     # Prefer org admin for the notification user_id so emails fire
     alert_user = next(
         (u for u in org_users if u.is_org_admin), org_users[0]
     )
 
+    queued_emails = []
     for bill in bills:
         days_until_due = (bill.next_expected_date - today).days
 
@@ -165,7 +174,7 @@ async def _process_org_bills(db, org) -> None:
             f"(due {bill.next_expected_date.strftime('%b %d, %Y')})."
         )
 
-        await NotificationService.create_notification(
+        notification = await NotificationService.create_notification(
             db=db,
             organization_id=org.id,
             user_id=alert_user.id,
@@ -178,7 +187,13 @@ async def _process_org_bills(db, org) -> None:
             action_url="/bills",
             action_label="View Bills",
             expires_in_days=3,
+            send_email=False,
         )
+        email = NotificationService.notification_email(
+            notification, alert_user, key=f"bill_reminder:{today.isoformat()}:{bill.id}"
+        )
+        if email is not None:
+            queued_emails.append((notification, email))
 
         logger.info(
             "bill_reminder_created",
@@ -189,3 +204,5 @@ async def _process_org_bills(db, org) -> None:
                 "urgency": urgency,
             },
         )
+
+    return queued_emails
@@ -1,7 +1,17 @@
-"""Celery tasks for cash flow forecast alerts."""
+"""Celery tasks for cash flow forecast alerts.
+
+Architecture:
+- Beat fires ``check_cash_flow_forecast`` daily; it only fetches organization
+  IDs and fans them out in chunks of FORECAST_CHUNK_SIZE.
+- Each ``check_cash_flow_forecast_chunk`` task projects its organizations
+  with ``ForecastService.check_negative_balance_alerts``, which loads
+  accounts and recurring patterns for a whole batch in a few queries, and
+  retries independently of the other chunks.
+"""
 
 import logging
 import random
+from typing import List
 
 from sqlalchemy import select
 
@@ -11,6 +21,9 @@ from app.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
+# Organizations per chunk subtask
+FORECAST_CHUNK_SIZE = 500
+
 
 def _retry_countdown(retries: int) -> float:
     """Exponential back-off with full jitter (thundering-herd prevention)."""
@@ -27,45 +40,85 @@ def _retry_countdown(retries: int) -> float:
 def check_cash_flow_forecast_task(self=None):
     """
     Check for negative balance projections and create alerts.
-    Runs daily at 6:30am.
+    Runs daily at 6:30am; the projections run in chunk subtasks.
     """
     import asyncio
 
     try:
-        asyncio.run(_check_forecast_async())
+        org_ids = asyncio.run(_fetch_forecast_org_ids())
     except Exception as exc:
         retries = check_cash_flow_forecast_task.request.retries if self else 0
         logger.warning("check_cash_flow_forecast retry %d/3: %s", retries + 1, exc)
         raise check_cash_flow_forecast_task.retry(exc=exc, countdown=_retry_countdown(retries))
+    _dispatch_forecast_chunks(org_ids)
 
 
-async def _check_forecast_async():
-    """Async implementation of forecast checking."""
+async def _fetch_forecast_org_ids():
+    """IDs of every organization with at least one user."""
     from app.workers.utils import get_celery_session
 
     async with get_celery_session() as db:
-        try:
-            # Get all unique organization IDs
-            result = await db.execute(select(User.organization_id).distinct())
-            org_ids = [row[0] for row in result.all()]
+        result = await db.execute(select(User.organization_id).distinct())
+        return [row[0] for row in result.all()]
 
-            logger.info(f"Checking cash flow forecasts for {len(org_ids)} organizations")
 
-            alerts_created = 0
-            for org_id in org_ids:
-                # Check for negative balance alerts (combined view)
-                negative_day = await ForecastService.check_negative_balance_alert(
-                    db, org_id, user_id=None
-                )
+def _dispatch_forecast_chunks(org_ids) -> int:
+    """
+    Enqueue one chunk task per FORECAST_CHUNK_SIZE organizations.
+
+    Returns the number of chunk tasks dispatched.
+    """
+    logger.info(f"Checking cash flow forecasts for {len(org_ids)} organizations")
+    chunks = 0
+    for i in range(0, len(org_ids), FORECAST_CHUNK_SIZE):
+        check_cash_flow_forecast_chunk_task.apply_async(
+            args=[[str(org_id) for org_id in org_ids[i : i + FORECAST_CHUNK_SIZE]]]
+        )
+        chunks += 1
+    return chunks
 
-                if negative_day:
-                    alerts_created += 1
-                    logger.info(
-                        f"Created negative balance alert for org {org_id}: "
-                        f"projected negative on {negative_day['date']}"
-                    )
 
-            logger.info(f"Forecast check complete. Total alerts created: {alerts_created}")
+@celery_app.task(
+    name="check_cash_flow_forecast_chunk",
+    autoretry_for=(Exception,),
+    max_retries=3,
+    retry_backoff=False,
+)
+def check_cash_flow_forecast_chunk_task(organization_ids: List[str], self=None):
+    """Project one chunk of organizations and alert on negative balances."""
+    import asyncio
+
+    try:
+        asyncio.run(_check_forecast_chunk_async(organization_ids))
+    except Exception as exc:
+        retries = check_cash_flow_forecast_chunk_task.request.retries if self else 0
+        logger.warning("check_cash_flow_forecast_chunk retry %d/3: %s", retries + 1, exc)
+        raise check_cash_flow_forecast_chunk_task.retry(
+            exc=exc, countdown=_retry_countdown(retries)
+        )
+
+
+async def _check_forecast_chunk_async(organization_ids: List[str]):
+    """Async implementation of one forecast chunk."""
+    from uuid import UUID
+
+    from app.workers.utils import get_celery_session
+
+    async with get_celery_session() as db:
+        try:
+            alerts = await ForecastService.check_negative_balance_alerts(
+                db, [UUID(org_id) for org_id in organization_ids]
+            )
+            for org_id, day in alerts.items():
+                logger.info(
+                    f"Created negative balance alert for org {org_id}: "
+                    f"projected negative on {day['date']}"
+                )
+
+            logger.info(
+                f"Forecast chunk complete ({len(organization_ids)} organizations). "
+                f"Alerts created: {len(alerts)}"
+            )
 
         except Exception as e:
             logger.error(f"Error checking cash flow forecasts: {str(e)}", exc_info=True)
@@ -4,7 +4,7 @@ import asyncio
 import logging
 from datetime import timedelta
 
-from sqlalchemy import select, update
+from sqlalchemy import case, select, update
 
 from app.core.cache import delete_pattern as cache_delete_pattern
 from app.models.holding import Holding
@@ -12,6 +12,7 @@ from app.models.portfolio_snapshot import PortfolioSnapshot
 from app.models.user import User
 from app.services.fund_fee_analyzer_service import KNOWN_EXPENSE_RATIOS
 from app.services.market_data import get_market_data_provider
+from app.services.security_classification_service import refresh_classifications
 from app.services.snapshot_service import snapshot_service
 from app.utils.datetime_utils import utc_now
 from app.workers.celery_app import celery_app
@@ -26,7 +27,7 @@ def enrich_holdings_metadata_task():
 
     Fetches sector, industry, asset_type, asset_class, market_cap, country,
     name, and expense_ratio for every unique ticker and writes them back to
-    the database.
+    the database, then refreshes the per-symbol security classifications.
 
     Expense ratio enrichment priority per ticker:
       1. yfinance API response (authoritative, written only when DB value is NULL)
@@ -77,6 +78,7 @@ async def _enrich_metadata_async():
             failed_count = 0
             er_enriched_count = 0
             failed_tickers: list[str] = []
+            metadata_by_ticker: dict = {}
 
             # Fetch metadata with bounded concurrency (5 at a time)
             _CONCURRENCY = 5
@@ -97,6 +99,7 @@ async def _enrich_metadata_async():
                     continue
 
                 ticker, metadata = result_item
+                metadata_by_ticker[ticker] = metadata
 
                 try:
                     # Build update dict — only include fields the API returned a value for
@@ -104,7 +107,11 @@ async def _enrich_metadata_async():
                     if metadata.name is not None:
                         updates["name"] = metadata.name
                     if metadata.asset_type is not None:
-                        updates["asset_type"] = metadata.asset_type
+                        # Keep asset types users chose themselves
+                        updates["asset_type"] = case(
+                            (Holding.asset_type_overridden.is_(True), Holding.asset_type),
+                            else_=metadata.asset_type,
+                        )
                     if metadata.asset_class is not None:
                         updates["asset_class"] = metadata.asset_class
                     if metadata.market_cap is not None:
@@ -158,6 +165,9 @@ async def _enrich_metadata_async():
                     failed_count += 1
                     failed_tickers.append(ticker)
 
+            # Re-bucket every symbol from the fresh metadata (portfolio and style box read it)
+            await refresh_classifications(db, metadata_by_ticker)
+
             await db.commit()
 
             # Invalidate portfolio summary cache for all organizations (metadata affects all)
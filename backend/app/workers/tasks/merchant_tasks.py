@@ -0,0 +1,45 @@
+"""Celery task that keeps the merchant dimension reconciled."""
+
+import logging
+
+from sqlalchemy import select
+
+from app.models.user import User
+from app.workers.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="reconcile_merchants")
+def reconcile_merchants_task():
+    """Resolve unassigned transactions to merchants and recompute usage counts.
+
+    Catches rows whose merchant_name changed without being resolved (rule
+    actions, bulk undo, provider updates) or whose ingest-time assignment
+    failed.  Runs daily at 1:45am, ahead of recurring detection.
+    """
+    import asyncio
+
+    asyncio.run(_reconcile_merchants_async())
+
+
+async def _reconcile_merchants_async():
+    from app.services.merchant_service import reconcile_merchants
+    from app.workers.utils import get_celery_session
+
+    async with get_celery_session() as db:
+        result = await db.execute(select(User.organization_id).distinct())
+        org_ids = [row[0] for row in result.all()]
+
+        total = 0
+        for org_id in org_ids:
+            try:
+                total += await reconcile_merchants(db, org_id)
+                await db.commit()
+            except Exception as org_exc:
+                await db.rollback()
+                logger.error(
+                    "Error reconciling merchants for org %s: %s", org_id, org_exc, exc_info=True
+                )
+
+        logger.info("Merchant reconciliation complete: %d transactions resolved", total)
@@ -0,0 +1,36 @@
+"""Celery task that keeps monthly table partitions ahead of incoming data."""
+
+import logging
+
+from app.workers.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="maintain_partitions")
+def maintain_partitions_task():
+    """Pre-create upcoming monthly partitions for every partitioned table.
+
+    No-op unless DB_PARTITIONING_ENABLED is set.  Keeps
+    DB_PARTITION_PREMAKE_MONTHS months ready so inserts never fall into the
+    default partition; expired months are retired by the retention task.
+    """
+    import asyncio
+
+    asyncio.run(_maintain_partitions_async())
+
+
+async def _maintain_partitions_async():
+    from app.config import settings
+    from app.services.partition_service import PartitionMaintenanceService
+    from app.workers.utils import get_celery_session
+
+    if not settings.DB_PARTITIONING_ENABLED:
+        logger.debug("Partition maintenance skipped: DB_PARTITIONING_ENABLED is off.")
+        return
+
+    async with get_celery_session() as db:
+        created = await PartitionMaintenanceService.maintain_all(
+            db, months_ahead=settings.DB_PARTITION_PREMAKE_MONTHS
+        )
+        logger.info("Partition maintenance complete: created=%s", created)
@@ -1,7 +1,9 @@
 """Weekly financial recap Celery task.
 
 Generates a narrative summary of each household's financial week and
-delivers it as an in-app notification (+ email if configured).
+delivers it as an in-app notification (+ email if configured).  Emails are
+queued while iterating households and sent at the end in one bulk dispatch
+over pooled SMTP connections.
 
 Runs every Monday at 8 AM UTC so users start the week with last week's summary.
 """
@@ -17,6 +19,7 @@ from app.models.account import Account, AccountCategory
 from app.models.notification import NotificationPriority, NotificationType
 from app.models.transaction import Transaction
 from app.models.user import Organization, User
+from app.services.bulk_email_service import DeliveryStatus
 from app.services.notification_service import NotificationService
 from app.workers.celery_app import celery_app
 
@@ -39,9 +42,10 @@ async def _send_weekly_recaps_async():
         orgs = orgs_result.scalars().all()
 
         failed = []
+        queued_emails = []
         for org in orgs:
             try:
-                await _generate_org_recap(db, org)
+                queued_emails.extend(await _generate_org_recap(db, org))
             except Exception as exc:
                 logger.error(
                     "weekly_recap_failed",
@@ -50,14 +54,26 @@ async def _send_weekly_recaps_async():
                 )
                 failed.append(str(org.id))
 
-        if failed:
-            raise RuntimeError(
-                f"weekly_recap failed for {len(failed)} org(s): {', '.join(failed)}"
+        if queued_emails:
+            report = await NotificationService.send_notification_emails(db, queued_emails)
+            logger.info(
+                "weekly_recap_emails",
+                extra={
+                    "sent": report.count(DeliveryStatus.SENT),
+                    "failed": len(report.failed),
+                },
             )
 
+        if failed:
+            raise RuntimeError(f"weekly_recap failed for {len(failed)} org(s): {', '.join(failed)}")
+
 
-async def _generate_org_recap(db, org) -> None:
-    """Generate and send a recap for one organization."""
+async def _generate_org_recap(db, org) -> list:
+    """Generate a recap for one organization.
+
+    Creates the in-app notifications and returns ``(notification, email)``
+    pairs for the caller to send in bulk.
+    """
     today = date.today()
     week_start = today - timedelta(days=7)
     week_end = today - timedelta(days=1)
@@ -72,7 +88,7 @@ async def _generate_org_recap(db, org) -> None:
     accounts = accounts_result.scalars().all()
 
     if not accounts:
-        return
+        return []
 
     account_ids = [a.id for a in accounts]
 
@@ -169,13 +185,14 @@ async def _generate_org_recap(db, org) -> None:
     )
     users = users_result.scalars().all()
 
+    queued_emails = []
     for user in users:
         # Respect the user's weekly_recap preference (default on)
         prefs = user.notification_preferences or {}
         if prefs.get("weekly_recap") is False:
             continue
 
-        await NotificationService.create_notification(
+        notification = await NotificationService.create_notification(
             db=db,
             organization_id=org.id,
             user_id=user.id,
@@ -186,10 +203,17 @@ async def _generate_org_recap(db, org) -> None:
             action_url="/transactions",
             action_label="View Transactions",
             expires_in_days=14,
+            send_email=False,
+        )
+        email = NotificationService.notification_email(
+            notification, user, key=f"weekly_recap:{week_start.isoformat()}:{user.id}"
         )
+        if email is not None:
+            queued_emails.append((notification, email))
 
     await db.commit()
     logger.info(
         "weekly_recap_sent",
         extra={"org_id": str(org.id), "user_count": len(users)},
     )
+    return queued_emails
@@ -32,7 +32,11 @@ def send_scheduled_reports_task():
 
 async def _send_scheduled_reports_async():
     """Async implementation of scheduled report delivery."""
-    from app.services.email_service import email_service
+    from app.services.bulk_email_service import (
+        BulkEmailDispatcher,
+        DeliveryStatus,
+        OutboundEmail,
+    )
     from app.services.report_service import ReportService
     from app.workers.utils import get_celery_session
 
@@ -52,7 +56,13 @@ async def _send_scheduled_reports_async():
                 "Checking %d report templates for scheduled delivery", len(templates)
             )
 
-            sent_count = 0
+            # Reports are run one at a time (shared session); all recipients'
+            # emails go out together afterwards over pooled SMTP connections.
+            # Identical executions run once and are cached across runs.
+            pending = []  # (template, delivery, first index, recipient count)
+            outbound: list[OutboundEmail] = []
+            executions: dict[str, dict] = {}  # execution key -> report result
+            deduplicated = 0
             for template in templates:
                 delivery = template.scheduled_delivery
                 if not delivery or not delivery.get("enabled"):
@@ -86,13 +96,22 @@ async def _send_scheduled_reports_async():
                     except ValueError:
                         pass  # Malformed date — proceed with delivery
 
-                # Execute the report
+                # Execute the report — once per distinct (organization, config,
+                # period); templates sharing one reuse its result
+                execution_key = ReportService.execution_key(
+                    template.organization_id, template.config
+                )
                 try:
-                    report_result = await ReportService.execute_report(
-                        db=db,
-                        organization_id=template.organization_id,
-                        config=template.config,
-                    )
+                    report_result = executions.get(execution_key)
+                    if report_result is None:
+                        report_result = await ReportService.execute_report_cached(
+                            db=db,
+                            organization_id=template.organization_id,
+                            config=template.config,
+                        )
+                        executions[execution_key] = report_result
+                    else:
+                        deduplicated += 1
                 except Exception as exc:
                     logger.error(
                         "Failed to execute report for template %s: %s",
@@ -107,21 +126,32 @@ async def _send_scheduled_reports_async():
                     template, report_result, today, frequency
                 )
 
-                # Send to each configured recipient
-                any_sent = False
-                for email_addr in delivery_emails:
-                    ok = await email_service.send_email(
+                pending.append((template, delivery, len(outbound), len(delivery_emails)))
+                outbound.extend(
+                    OutboundEmail(
                         to_email=email_addr,
                         subject=subject,
                         html_body=html_body,
                         text_body=text_body,
+                        key=f"scheduled_report:{template.id}:{today.isoformat()}:{email_addr}",
                     )
-                    if ok:
-                        any_sent = True
+                    for email_addr in delivery_emails
+                )
+
+            report = await BulkEmailDispatcher().dispatch(outbound)
+
+            sent_count = 0
+            for template, delivery, start, count in pending:
+                results = report.results[start : start + count]
+                any_sent = any(
+                    r.status in (DeliveryStatus.SENT, DeliveryStatus.DUPLICATE) for r in results
+                )
+                for r in results:
+                    if r.status == DeliveryStatus.SENT:
                         logger.info(
                             "Sent scheduled report '%s' to %s",
                             template.name,
-                            email_addr,
+                            r.email.to_email,
                         )
 
                 # Update last_delivered_at on success
@@ -131,14 +161,20 @@ async def _send_scheduled_reports_async():
                     template.scheduled_delivery = updated_delivery
                     await db.commit()
                     sent_count += 1
-                elif delivery_emails:
+                elif count:
                     logger.warning(
                         "Scheduled report %s: all %d email sends failed",
                         template.id,
-                        len(delivery_emails),
+                        count,
                     )
 
-            logger.info("Scheduled report delivery complete. Reports sent: %d", sent_count)
+            logger.info(
+                "Scheduled report delivery complete. Reports sent: %d "
+                "(%d executions, %d deduplicated)",
+                sent_count,
+                len(executions),
+                deduplicated,
+            )
 
         except Exception as exc:
             logger.error(
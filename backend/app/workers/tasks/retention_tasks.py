@@ -14,7 +14,8 @@ def run_data_retention_task():
     Skipped when DATA_RETENTION_DAYS is None or -1 (indefinite).
     Respects DATA_RETENTION_DRY_RUN (default True = log-only, no deletes).
     Covers: transactions, net_worth_snapshots, notifications, and optionally
-    audit_logs (when AUDIT_LOG_RETENTION_DAYS is configured).
+    audit_logs (when AUDIT_LOG_RETENTION_DAYS is configured).  With
+    DB_PARTITIONING_ENABLED, expired whole months are dropped/detached first.
     """
     import asyncio
 
@@ -33,6 +34,9 @@ async def _run_data_retention_async():
 
     dry_run = settings.DATA_RETENTION_DRY_RUN
     audit_retention = getattr(settings, "AUDIT_LOG_RETENTION_DAYS", None)
+    partition_action = (
+        settings.DATA_RETENTION_PARTITION_ACTION if settings.DB_PARTITIONING_ENABLED else None
+    )
 
     async with get_celery_session() as db:
         try:
@@ -41,6 +45,7 @@ async def _run_data_retention_async():
                 retention_days,
                 dry_run=dry_run,
                 audit_log_retention_days=audit_retention,
+                partition_action=partition_action,
             )
             logger.info(
                 "Data retention task complete: retention_days=%d dry_run=%s results=%s",
@@ -0,0 +1,222 @@
+"""Benchmark the transaction list read paths at page sizes of 100-1,000.
+
+Compares, per page:
+  orm        - joinedload(account, category.parent, labels.label) +
+               TransactionDetail/TransactionListResponse + model_dump
+               (the path GET /transactions/ used before the projection)
+  projection - transaction_projection + project_transaction + orjson
+
+Both are timed end to end: query, row handling and JSON encoding.
+
+Usage:
+    python scripts/benchmark_transaction_list.py [--rows 2000] [--repeat 7]
+        [--database-url postgresql+asyncpg://...]
+
+Defaults to a throwaway in-memory SQLite database.  With --database-url the
+schema must already exist (alembic upgrade head); seeded rows are removed
+afterwards.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import joinedload
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.transactions import _transaction_detail
+from app.core.database import Base
+from app.models.account import Account, AccountType
+from app.models.transaction import Category, Label, Transaction, TransactionLabel
+from app.models.user import Organization, User
+from app.schemas.transaction import TransactionListResponse
+from app.services.transaction_projection_service import (
+    project_transaction,
+    transaction_projection,
+)
+from app.utils.fast_json import dumps
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(type_, compiler, **kw):
+    # Only needed to create the throwaway schema; no JSONB column is queried
+    return "JSON"
+
+
+PAGE_SIZES = (100, 250, 500, 1000)
+_ORDER = (Transaction.date.desc(), Transaction.created_at.desc(), Transaction.id.desc())
+
+
+async def seed(db: AsyncSession, rows: int):
+    org = Organization(id=uuid4(), name="Benchmark")
+    user = User(
+        id=uuid4(),
+        email=f"bench-{uuid4().hex[:8]}@example.com",
+        password_hash="x",
+        organization_id=org.id,
+        is_active=True,
+    )
+    account = Account(
+        id=uuid4(),
+        organization_id=org.id,
+        user_id=user.id,
+        name="Benchmark Checking",
+        account_type=AccountType.CHECKING,
+        current_balance=Decimal("0"),
+        mask="4321",
+        is_active=True,
+    )
+    db.add_all([org, user, account])
+    await db.flush()
+
+    parents = [Category(id=uuid4(), organization_id=org.id, name=f"Group {i}") for i in range(4)]
+    categories = [
+        Category(
+            id=uuid4(),
+            organization_id=org.id,
+            name=f"Category {i}",
+            color="#336699",
+            parent_category_id=parents[i % len(parents)].id,
+        )
+        for i in range(12)
+    ]
+    labels = [
+        Label(id=uuid4(), organization_id=org.id, name=f"Label {i}", color="#AA0000")
+        for i in range(6)
+    ]
+    db.add_all([*parents, *categories, *labels])
+    await db.flush()
+
+    start = date.today()
+    for i in range(rows):
+        txn = Transaction(
+            id=uuid4(),
+            organization_id=org.id,
+            account_id=account.id,
+            date=start - timedelta(days=i // 5),
+            amount=Decimal(-(i % 250) - 1) / 4,
+            merchant_name=f"Merchant {i % 90}",
+            description=f"POS PURCHASE {i}",
+            category_id=categories[i % len(categories)].id if i % 7 else None,
+            deduplication_hash=uuid4().hex,
+        )
+        db.add(txn)
+        # 0-3 labels per transaction: the ORM path's row multiplier
+        db.add_all(
+            TransactionLabel(transaction_id=txn.id, label_id=labels[(i + k) % len(labels)].id)
+            for k in range(i % 4)
+        )
+    await db.commit()
+    return org
+
+
+async def orm_page(db: AsyncSession, org_id, page_size: int) -> bytes:
+    result = await db.execute(
+        select(Transaction)
+        .join(Account)
+        .options(joinedload(Transaction.account))
+        .options(joinedload(Transaction.category).joinedload(Category.parent))
+        .options(joinedload(Transaction.labels).joinedload(TransactionLabel.label))
+        .where(Transaction.organization_id == org_id, Account.is_active.is_(True))
+        .order_by(*_ORDER)
+        .limit(page_size + 1)
+    )
+    transactions = result.unique().scalars().all()[:page_size]
+    response = TransactionListResponse(
+        transactions=[_transaction_detail(txn) for txn in transactions],
+        total=len(transactions),
+        page=1,
+        page_size=page_size,
+        has_more=True,
+    )
+    payload = response.model_dump(mode="json")
+    # FastAPI re-validated the returned model against response_model
+    TransactionListResponse.model_validate(payload)
+    return response.model_dump_json().encode()
+
+
+async def projection_page(db: AsyncSession, org_id, page_size: int) -> bytes:
+    result = await db.execute(
+        transaction_projection(
+            db, Transaction.organization_id == org_id, Account.is_active.is_(True)
+        )
+        .order_by(*_ORDER)
+        .limit(page_size + 1)
+    )
+    rows = result.all()[:page_size]
+    return dumps(
+        {
+            "transactions": [project_transaction(row) for row in rows],
+            "total": len(rows),
+            "total_is_estimate": False,
+            "page": 1,
+            "page_size": page_size,
+            "has_more": True,
+            "next_cursor": None,
+        }
+    )
+
+
+async def timed(sessions, fn, org_id, page_size: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        # Fresh session per run so the ORM identity map cannot serve cached objects
+        async with sessions() as db:
+            started = time.perf_counter()
+            await fn(db, org_id, page_size)
+            samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+async def main(args) -> None:
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with sessions() as db:
+        org = await seed(db, args.rows)
+    try:
+        print(f"{args.rows} transactions, median of {args.repeat} runs ({engine.dialect.name})")
+        print(f"{'page size':>9}  {'orm ms':>8}  {'projection ms':>13}  {'speedup':>7}")
+        for page_size in PAGE_SIZES:
+            if page_size > args.rows:
+                break
+            await timed(sessions, orm_page, org.id, page_size, 1)  # warm-up
+            orm_ms = await timed(sessions, orm_page, org.id, page_size, args.repeat)
+            fast_ms = await timed(sessions, projection_page, org.id, page_size, args.repeat)
+            print(f"{page_size:>9}  {orm_ms:>8.1f}  {fast_ms:>13.1f}  {orm_ms / fast_ms:>6.1f}x")
+    finally:
+        if args.database_url:
+            async with sessions() as db:
+                await db.execute(delete(Organization).where(Organization.id == org.id))
+                await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--database-url", default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Convert an existing database to monthly range partitioning.
+
+The r81_time_partitioning migration only partitions tables when
+DB_PARTITIONING_ENABLED is set while it runs.  Deployments that turn the flag
+on later run that revision's conversion directly with this script instead of
+downgrading past r81 (which would replay every later migration).
+
+This script:
+1. Loads the r81_time_partitioning revision from alembic/versions
+2. Runs its conversion in one transaction (tables that are already
+   partitioned are skipped)
+3. Leaves alembic_version untouched
+
+Usage:
+    DB_PARTITIONING_ENABLED=true python scripts/enable_partitioning.py
+
+Keep DB_PARTITIONING_ENABLED=true afterwards so the nightly partition
+maintenance and partition-based retention tasks run.
+
+WARNING: Back up your database before running this script!  The conversion
+copies each table and holds an exclusive lock on it while it does.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
+from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+
+BACKEND_DIR = Path(__file__).parent.parent
+REVISION = "r81_time_partitioning"
+
+
+def _convert(connection) -> None:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    migration = ScriptDirectory.from_config(config).get_revision(REVISION).module
+
+    with Operations.context(MigrationContext.configure(connection)):
+        migration.partition_tables(connection)
+
+
+async def enable_partitioning() -> bool:
+    """Partition every table the r81 revision covers."""
+    print("=" * 80)
+    print("ENABLING MONTHLY TABLE PARTITIONING")
+    print("=" * 80)
+    print()
+
+    if not settings.DB_PARTITIONING_ENABLED:
+        print("ERROR: DB_PARTITIONING_ENABLED is not set in environment!")
+        print("Partition maintenance only runs with the flag on; set it first.")
+        return False
+
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+    try:
+        if engine.dialect.name != "postgresql":
+            print("ERROR: Partitioning requires PostgreSQL.")
+            return False
+        async with engine.begin() as connection:
+            await connection.run_sync(_convert)
+    finally:
+        await engine.dispose()
+
+    print("✓ Tables partitioned")
+    return True
+
+
+if __name__ == "__main__":
+    success = asyncio.run(enable_partitioning())
+    sys.exit(0 if success else 1)
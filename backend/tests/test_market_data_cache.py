@@ -7,7 +7,7 @@ Tests for the Redis-backed market data cache layer.
 4. Batch quotes: full cache hit makes no provider call
 5. get_holding_metadata returns cached metadata on HIT
 6. get_holding_metadata calls provider on MISS and caches
-7. search_symbol is always a pass-through (no caching)
+7. search_symbol falls through to the provider when the symbol index has no match
 8. Cache failures are transparent — provider is called on error
 9. Historical prices are cached and returned on HIT
 10. Provider name and rate limits are delegated to inner provider
@@ -28,6 +28,7 @@ from app.services.market_data.base_provider import (
     SearchResult,
 )
 from app.services.market_data.cache import CachedMarketDataProvider, invalidate_quotes
+from app.services.market_data.symbol_index import SymbolIndex
 
 
 # ---------------------------------------------------------------------------
@@ -224,14 +225,14 @@ async def test_metadata_cache_miss(mock_redis, mock_cb_factory):
 @patch(_CB_PATCH)
 @patch(_CACHE_PATCH)
 async def test_search_symbol_passthrough(mock_redis, mock_cb_factory):
-    """search_symbol always delegates to the provider (no caching)."""
+    """search_symbol delegates to the provider when the symbol index has no match."""
     mock_cb_factory.return_value = _mock_circuit_breaker()
     provider = _mock_provider()
     provider.search_symbol.return_value = [
         SearchResult(symbol="AAPL", name="Apple Inc.", type="stock")
     ]
 
-    cached = CachedMarketDataProvider(provider)
+    cached = CachedMarketDataProvider(provider, index=SymbolIndex())
     result = await cached.search_symbol("apple")
 
     assert len(result) == 1
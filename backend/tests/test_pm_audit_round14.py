@@ -64,11 +64,11 @@ def test_account_scope_check_position():
         (i for i, line in enumerate(lines) if "scoped_account_ids" in line), None
     )
     query_build_idx = next(
-        (i for i, line in enumerate(lines) if "select(Transaction)" in line), None
+        (i for i, line in enumerate(lines) if "transaction_projection(" in line), None
     )
 
     assert scope_check_idx is not None, "scoped_account_ids check must exist"
-    assert query_build_idx is not None, "select(Transaction) must exist"
+    assert query_build_idx is not None, "transaction_projection(...) query must exist"
     assert scope_check_idx < query_build_idx, (
         "Account scope validation must happen before building the DB query"
     )
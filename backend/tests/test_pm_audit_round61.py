@@ -408,12 +408,19 @@ def test_safe_harbour_logic():
 # ---------------------------------------------------------------------------
 
 def test_ltcg_holding_period_366():
+    # Holding periods are computed by the shared tax-lot valuation
     source = inspect.getsource(
+        __import__("app.services.tax_lot_valuation_service",
+                   fromlist=["tax_lot_valuation_service"])
+    )
+    assert "LONG_TERM_DAYS = 366" in source
+    assert "days=365)" not in source
+    harvesting = inspect.getsource(
         __import__("app.services.capital_gains_harvesting_service",
                    fromlist=["capital_gains_harvesting_service"])
     )
-    assert "days=366" in source
-    assert "days=365)" not in source
+    assert "is_long_term" in harvesting
+    assert "days=365)" not in harvesting
 
 
 # ---------------------------------------------------------------------------
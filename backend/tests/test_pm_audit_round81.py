@@ -44,7 +44,8 @@ def test_financial_plan_net_worth_section_guarded():
     src = inspect.getsource(mod.get_financial_plan_summary)
     # Both the try and the fallback dict must be present
     assert "get_current_breakdown" in src
-    assert "net worth section failed" in src
+    assert '_log_section_failure("net worth"' in src
+    assert "return_exceptions=True" in src
 
 
 # ---------------------------------------------------------------------------
@@ -1298,3 +1298,88 @@ class TestBudgetService:
         service = BudgetService()
         result = await service.get_budget_variance_breakdown(db, uuid4(), test_user)
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_budgets_spending_batches_queries(self, db, test_user, test_account):
+        """Many budgets — nested categories, labels, rollover — cost a fixed number of queries."""
+        from app.core.query_metrics import install_query_instrumentation, track_queries
+
+        service = BudgetService()
+
+        food = Category(organization_id=test_user.organization_id, name="Food3")
+        db.add(food)
+        await db.commit()
+        dining = Category(
+            organization_id=test_user.organization_id, name="Dining3", parent_category_id=food.id
+        )
+        db.add(dining)
+        await db.commit()
+        coffee = Category(
+            organization_id=test_user.organization_id, name="Coffee3", parent_category_id=dining.id
+        )
+        label = Label(organization_id=test_user.organization_id, name="Trip3")
+        db.add_all([coffee, label])
+        await db.commit()
+
+        period_start, _ = service._get_period_dates(BudgetPeriod.MONTHLY)
+        prev_day = period_start - timedelta(days=1)
+
+        def txn(day, amount, category=None):
+            return Transaction(
+                organization_id=test_user.organization_id,
+                account_id=test_account.id,
+                date=day,
+                amount=Decimal(amount),
+                merchant_name="Shop",
+                category_id=category.id if category else None,
+                deduplication_hash=str(uuid4()),
+            )
+
+        grandchild_txn = txn(period_start, "-40.00", coffee)
+        labeled_txn = txn(period_start, "-25.00")
+        db.add_all([grandchild_txn, labeled_txn, txn(period_start, "-10.00", food)])
+        db.add(txn(prev_day, "-300.00", food))
+        await db.commit()
+        db.add(TransactionLabel(transaction_id=labeled_txn.id, label_id=label.id))
+        await db.commit()
+
+        food_budget = await service.create_budget(
+            db,
+            test_user,
+            "Food",
+            Decimal("400.00"),
+            BudgetPeriod.MONTHLY,
+            date.today(),
+            category_id=food.id,
+            rollover_unused=True,
+        )
+        trip_budget = await service.create_budget(
+            db,
+            test_user,
+            "Trip",
+            Decimal("100.00"),
+            BudgetPeriod.MONTHLY,
+            date.today(),
+            label_id=label.id,
+        )
+        everything = await service.create_budget(
+            db, test_user, "All", Decimal("1000.00"), BudgetPeriod.MONTHLY, date.today()
+        )
+        budgets = [food_budget, trip_budget, everything]
+
+        install_query_instrumentation(db.bind)
+        with track_queries("budget spending", threshold=0) as stats:
+            spending = await service.get_budgets_spending(db, budgets, test_user)
+        # Org settings, category tree, one aggregate
+        assert stats.total == 3
+
+        # Grandchild category rolls up; previous period leaves 100 unused
+        assert spending[food_budget.id]["spent"] == Decimal("50.00")
+        assert spending[food_budget.id]["rollover_amount"] == Decimal("100.00")
+        assert spending[food_budget.id]["effective_budget"] == Decimal("500.00")
+        assert spending[trip_budget.id]["spent"] == Decimal("25.00")
+        assert spending[everything.id]["spent"] == Decimal("75.00")
+
+        for budget in budgets:
+            single = await service.get_budget_spending(db, budget.id, test_user)
+            assert single == spending[budget.id]
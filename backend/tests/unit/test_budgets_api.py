@@ -14,6 +14,7 @@ from app.api.v1.budgets import (
     delete_budget,
     get_budget,
     get_budget_spending,
+    list_budget_spending,
     list_budgets,
     update_budget,
 )
@@ -716,3 +717,49 @@ class TestBudgetUniqueName:
             start_date=date.today(),
         )
         assert b1.id != b2.id
+
+
+@pytest.mark.unit
+class TestListBudgetSpending:
+    """Test list_budget_spending endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_excludes_other_members_private_budgets(self, db_session, test_user):
+        """A member sees their own and shared budgets, not another member's private ones."""
+        from app.core.security import hash_password
+
+        member = User(
+            id=uuid4(),
+            email="member@example.com",
+            password_hash=hash_password("password123"),
+            organization_id=test_user.organization_id,
+            is_active=True,
+        )
+        db_session.add(member)
+        await db_session.commit()
+
+        async def create(owner, name, **kwargs):
+            return await BudgetService.create_budget(
+                db=db_session,
+                user=owner,
+                name=name,
+                amount=Decimal("100"),
+                period=BudgetPeriod.MONTHLY,
+                start_date=date.today(),
+                **kwargs,
+            )
+
+        own = await create(test_user, "Mine")
+        private = await create(member, "Private")
+        shared = await create(member, "Shared", is_shared=True)
+        shared_elsewhere = await create(
+            member, "Shared elsewhere", is_shared=True, shared_user_ids=[str(uuid4())]
+        )
+
+        result = await list_budget_spending(
+            is_active=None, user_id=None, current_user=test_user, db=db_session
+        )
+
+        assert set(result) == {str(own.id), str(shared.id)}
+        assert str(private.id) not in result
+        assert str(shared_elsewhere.id) not in result
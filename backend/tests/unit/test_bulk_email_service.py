@@ -0,0 +1,227 @@
+"""Tests for the pooled bulk SMTP dispatcher."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from app.services import bulk_email_service
+from app.services.bulk_email_service import (
+    SENT_KEY_PREFIX,
+    BulkEmailDispatcher,
+    DeliveryStatus,
+    OutboundEmail,
+    _SendRateLimiter,
+)
+from app.services.email_service import EmailService
+
+
+class _SmtpSink:
+    """Minimal in-process SMTP server that accepts and records messages.
+
+    ``reply_for`` maps a recipient address to a list of replies returned to
+    successive RCPT commands for it (e.g. ``["451 try later"]``), letting a
+    test script transient and permanent failures.
+    """
+
+    def __init__(self):
+        self.messages = []
+        self.connections = 0
+        self.reply_for = {}
+        self._server = None
+        self.port = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+
+        async def reply(line):
+            writer.write((line + "\r\n").encode())
+            await writer.drain()
+
+        await reply("220 sink ready")
+        rcpt = None
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    return
+                command = raw.decode().strip()
+                verb = command[:4].upper()
+                if verb == "EHLO":
+                    await reply("250 sink")
+                elif verb == "HELO":
+                    await reply("250 sink")
+                elif verb == "MAIL":
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    rcpt = command.split(":", 1)[1].strip().strip("<>")
+                    scripted = self.reply_for.get(rcpt)
+                    await reply(scripted.pop(0) if scripted else "250 OK")
+                elif verb == "DATA":
+                    await reply("354 go ahead")
+                    lines = []
+                    while True:
+                        line = await reader.readline()
+                        if line in (b".\r\n", b".\n", b""):
+                            break
+                        lines.append(line)
+                    self.messages.append((rcpt, b"".join(lines)))
+                    await reply("250 queued")
+                elif verb == "RSET" or verb == "NOOP":
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 bye")
+                    return
+                else:
+                    await reply("502 not implemented")
+        finally:
+            writer.close()
+
+
+class _FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+
+@pytest_asyncio.fixture
+async def sink():
+    server = _SmtpSink()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def fake_cache():
+    fake = _FakeCache()
+    with (
+        patch.object(bulk_email_service.cache, "get", fake.get),
+        patch.object(bulk_email_service.cache, "setex", fake.setex),
+    ):
+        yield fake
+
+
+def _service(port, host="127.0.0.1"):
+    return EmailService(
+        smtp_host=host,
+        smtp_port=port,
+        smtp_username="",
+        smtp_password="",
+        from_email="noreply@example.com",
+        from_name="Nest Egg",
+        use_tls=False,
+        app_base_url="http://localhost:5173",
+    )
+
+
+def _emails(n, prefix="user"):
+    return [
+        OutboundEmail(
+            to_email=f"{prefix}{i}@example.com",
+            subject=f"Recap {i}",
+            html_body=f"<p>{i}</p>",
+            text_body=str(i),
+            key=f"test:{prefix}{i}",
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+class TestBulkEmailDispatcher:
+    async def test_reuses_pooled_connections(self, sink, fake_cache):
+        dispatcher = BulkEmailDispatcher(
+            _service(sink.port), pool_size=3, max_per_second=0, messages_per_connection=100
+        )
+        report = await dispatcher.dispatch(_emails(20))
+
+        assert report.count(DeliveryStatus.SENT) == 20
+        assert sink.connections == 3
+        assert sorted(r for r, _ in sink.messages) == sorted(
+            f"user{i}@example.com" for i in range(20)
+        )
+        assert [r.email.to_email for r in report.results] == [
+            f"user{i}@example.com" for i in range(20)
+        ]
+        assert fake_cache.store[SENT_KEY_PREFIX + "test:user0"] == 1
+
+    async def test_recycles_connection_after_message_limit(self, sink, fake_cache):
+        dispatcher = BulkEmailDispatcher(
+            _service(sink.port), pool_size=1, max_per_second=0, messages_per_connection=2
+        )
+        report = await dispatcher.dispatch(_emails(5))
+
+        assert report.count(DeliveryStatus.SENT) == 5
+        assert sink.connections == 3
+
+    async def test_skips_keys_already_sent(self, sink, fake_cache):
+        fake_cache.store[SENT_KEY_PREFIX + "test:user1"] = 1
+        dispatcher = BulkEmailDispatcher(_service(sink.port), pool_size=2, max_per_second=0)
+
+        report = await dispatcher.dispatch(_emails(3))
+
+        assert [r.status for r in report.results] == [
+            DeliveryStatus.SENT,
+            DeliveryStatus.DUPLICATE,
+            DeliveryStatus.SENT,
+        ]
+        assert len(sink.messages) == 2
+
+    async def test_retries_transient_failure(self, sink, fake_cache):
+        sink.reply_for["user0@example.com"] = ["451 try again later"]
+        dispatcher = BulkEmailDispatcher(
+            _service(sink.port), pool_size=1, max_per_second=0, max_attempts=3, retry_delay=0
+        )
+
+        report = await dispatcher.dispatch(_emails(2))
+
+        assert [r.status for r in report.results] == [DeliveryStatus.SENT] * 2
+        assert report.results[0].attempts == 2
+        assert sink.connections == 2  # reconnected after the 4xx
+
+    async def test_permanent_failure_is_not_retried(self, sink, fake_cache):
+        sink.reply_for["user0@example.com"] = ["550 no such user", "550 no such user"]
+        dispatcher = BulkEmailDispatcher(
+            _service(sink.port), pool_size=1, max_per_second=0, max_attempts=3, retry_delay=0
+        )
+
+        report = await dispatcher.dispatch(_emails(2))
+
+        assert report.results[0].status == DeliveryStatus.FAILED
+        assert report.results[0].attempts == 1
+        assert report.results[1].status == DeliveryStatus.SENT
+        assert SENT_KEY_PREFIX + "test:user0" not in fake_cache.store
+
+    async def test_unconfigured_service_skips(self, fake_cache):
+        report = await BulkEmailDispatcher(_service(25, host="")).dispatch(_emails(2))
+        assert [r.status for r in report.results] == [DeliveryStatus.SKIPPED] * 2
+
+    async def test_empty_batch(self, fake_cache):
+        report = await BulkEmailDispatcher(_service(1)).dispatch([])
+        assert report.results == []
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_sends():
+    limiter = _SendRateLimiter(per_second=50)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+    # First slot is immediate, the next five are 20ms apart
+    assert loop.time() - started >= 0.09
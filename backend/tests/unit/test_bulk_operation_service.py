@@ -0,0 +1,342 @@
+"""Tests for set-based bulk-operation undo / redo."""
+
+import json
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import Uuid, select
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.bulk_operations import redo_bulk_operation, undo_bulk_operation
+from app.models.bulk_operation_log import BulkOperationLog
+from app.models.transaction import Category, Transaction
+from app.services import bulk_operation_service
+from app.services.bulk_operation_service import (
+    COMPRESS_MIN_ROWS,
+    apply_state,
+    decode_state,
+    encode_state,
+    find_conflicts,
+)
+
+
+@pytest_asyncio.fixture
+async def categories(db_session, test_user):
+    cats = [
+        Category(id=uuid4(), organization_id=test_user.organization_id, name=name)
+        for name in ("Groceries", "Dining", "Travel")
+    ]
+    db_session.add_all(cats)
+    await db_session.flush()
+    return cats
+
+
+@pytest_asyncio.fixture
+async def transactions(db_session, test_user, test_account, categories):
+    txns = [
+        Transaction(
+            id=uuid4(),
+            organization_id=test_user.organization_id,
+            account_id=test_account.id,
+            date=date(2026, 3, i + 1),
+            amount=Decimal("-10.00"),
+            merchant_name=f"Store {i}",
+            category_id=categories[i % 2].id,
+            deduplication_hash=f"hash-{i}",
+        )
+        for i in range(4)
+    ]
+    db_session.add_all(txns)
+    await db_session.flush()
+    return txns
+
+
+def _snapshot(txns, *fields):
+    return [{"id": t.id, **{f: getattr(t, f) for f in fields}} for t in txns]
+
+
+async def _current(db, txns, field):
+    result = await db.execute(
+        select(Transaction.id, getattr(Transaction, field)).where(
+            Transaction.id.in_([t.id for t in txns])
+        )
+    )
+    values = dict(result.all())
+    return [values[t.id] for t in txns]
+
+
+async def _log(db, user, txns, previous_state, new_state, is_undone=False):
+    op = BulkOperationLog(
+        organization_id=user.organization_id,
+        user_id=user.id,
+        operation_type="bulk_categorize",
+        affected_ids=[str(t.id) for t in txns],
+        previous_state=previous_state,
+        new_state=new_state,
+        is_undone=is_undone,
+    )
+    db.add(op)
+    await db.flush()
+    return op
+
+
+class TestEncoding:
+    def test_round_trip_columns(self):
+        ids = [uuid4(), uuid4()]
+        rows = [
+            {"id": ids[0], "category_id": uuid4(), "notes": "a"},
+            {"id": ids[1], "category_id": None, "notes": None},
+        ]
+        state = encode_state(rows)
+        assert state["format"] == "columns"
+
+        decoded = decode_state(state, [])
+        assert decoded.per_row
+        assert decoded.ids == [str(i) for i in ids]
+        assert decoded.values["category_id"] == [str(rows[0]["category_id"]), None]
+        assert decoded.values["notes"] == ["a", None]
+
+    def test_large_states_are_compressed(self):
+        cat = str(uuid4())
+        rows = [{"id": uuid4(), "category_id": cat} for _ in range(COMPRESS_MIN_ROWS * 5)]
+        state = encode_state(rows)
+        assert state["format"] == "columns+zlib"
+        # Random UUIDs barely compress; the repeated category does
+        assert len(state["data"]) < len(json.dumps(encode_state(rows[:1]))) * len(rows) / 2
+
+        decoded = decode_state(state, [])
+        assert decoded.ids == [str(r["id"]) for r in rows]
+        assert set(decoded.values["category_id"]) == {cat}
+
+    def test_legacy_shapes(self):
+        uniform = decode_state({"category_id": "c", "unknown": 1}, ["a", "b"])
+        assert not uniform.per_row
+        assert uniform.values == {"category_id": "c"}
+
+        per_row = decode_state([{"id": "a", "notes": "x"}, {"id": "b", "is_transfer": True}], [])
+        assert per_row.ids == ["a", "b"]
+        assert per_row.fields == ["notes", "is_transfer"]
+
+        assert decode_state({"field": "x"}, ["a"]) is None
+        assert decode_state({"category_id": "c"}, []) is None
+        assert decode_state(None, ["a"]) is None
+
+
+@pytest.mark.asyncio
+class TestApplyAndConflicts:
+    async def test_per_row_apply_and_conflicts(
+        self, db_session, test_user, transactions, categories
+    ):
+        org = test_user.organization_id
+        before = encode_state(_snapshot(transactions, "category_id"))
+        target = categories[2].id
+        after = decode_state(
+            encode_state([{"id": t.id, "category_id": target} for t in transactions]), []
+        )
+
+        assert await apply_state(db_session, org, after) == 4
+        assert await _current(db_session, transactions, "category_id") == [target] * 4
+        assert await find_conflicts(db_session, org, after) == []
+
+        # A manual edit after the bulk change is reported
+        await apply_state(
+            db_session, org, decode_state({"category_id": None}, [transactions[1].id])
+        )
+        assert await find_conflicts(db_session, org, after) == [str(transactions[1].id)]
+
+        assert await apply_state(db_session, org, decode_state(before, [])) == 4
+        assert await _current(db_session, transactions, "category_id") == [
+            categories[i % 2].id for i in range(4)
+        ]
+
+    async def test_batches(self, db_session, test_user, transactions, monkeypatch):
+        monkeypatch.setattr(bulk_operation_service, "BATCH_ROWS", 3)
+        state = decode_state(
+            [{"id": str(t.id), "notes": f"n{i}"} for i, t in enumerate(transactions)], []
+        )
+        assert await apply_state(db_session, test_user.organization_id, state) == 4
+        assert await _current(db_session, transactions, "notes") == ["n0", "n1", "n2", "n3"]
+        assert await find_conflicts(db_session, test_user.organization_id, state) == []
+
+    async def test_other_organization_untouched(self, db_session, transactions):
+        state = decode_state({"notes": "x"}, [t.id for t in transactions])
+        assert await apply_state(db_session, uuid4(), state) == 0
+        assert await _current(db_session, transactions, "notes") == [None] * 4
+
+    async def test_omitted_fields_are_kept(self, db_session, test_user, transactions):
+        state = decode_state(
+            [
+                {"id": str(transactions[0].id), "notes": "only notes"},
+                {"id": str(transactions[1].id), "merchant_name": "Renamed"},
+            ],
+            [],
+        )
+        assert await apply_state(db_session, test_user.organization_id, state) == 2
+        assert await _current(db_session, transactions[:2], "notes") == ["only notes", None]
+        assert await _current(db_session, transactions[:2], "merchant_name") == [
+            "Store 0",
+            "Renamed",
+        ]
+
+
+def _postgres_db(rowcount=0):
+    db = MagicMock()
+    db.bind.dialect.name = "postgresql"
+    db.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+    db.execute.return_value.all.return_value = []
+    return db
+
+
+def _compiled(db):
+    return [c.args[0].compile(dialect=postgresql.dialect()) for c in db.execute.call_args_list]
+
+
+@pytest.mark.asyncio
+class TestPostgresValuesPath:
+    """Per-row states on PostgreSQL run one VALUES-joined statement per batch."""
+
+    @pytest.fixture(autouse=True)
+    def _native_uuid(self, monkeypatch):
+        # conftest aliases postgresql.UUID to the SQLite shim, which would
+        # resolve to itself when compiled for the PostgreSQL dialect
+        monkeypatch.setattr(postgresql, "UUID", Uuid)
+
+    async def test_update_from_values(self):
+        ids = [uuid4(), uuid4()]
+        cat = uuid4()
+        state = decode_state(
+            encode_state([{"id": ids[0], "category_id": cat}, {"id": ids[1], "category_id": None}]),
+            [],
+        )
+        db = _postgres_db(rowcount=2)
+
+        assert await apply_state(db, uuid4(), state) == 2
+
+        [stmt] = _compiled(db)
+        sql = str(stmt)
+        assert sql.startswith("UPDATE transactions SET category_id=CAST(v.category_id AS UUID)")
+        assert (
+            "FROM (VALUES (%(param_1)s::UUID, %(param_2)s::UUID), (%(param_3)s::UUID, NULL))" in sql
+        )
+        assert "AS v (id, category_id) WHERE transactions.id = v.id" in sql
+        assert "CASE" not in sql and "merchant_id" not in sql
+        assert [stmt.params[f"param_{i}"] for i in range(1, 4)] == [ids[0], cat, ids[1]]
+
+    async def test_keep_columns_fall_back_to_current_value(self):
+        ids = [uuid4(), uuid4()]
+        state = decode_state(
+            [{"id": str(ids[0]), "notes": "n"}, {"id": str(ids[1]), "merchant_name": "M"}], []
+        )
+        db = _postgres_db()
+
+        await apply_state(db, uuid4(), state)
+
+        [stmt] = _compiled(db)
+        sql = str(stmt)
+        assert (
+            "notes=CASE WHEN v.keep_notes THEN transactions.notes ELSE CAST(v.notes AS TEXT) END"
+        ) in sql
+        assert (
+            "merchant_id=CASE WHEN v.keep_merchant_name THEN transactions.merchant_id END"
+        ) in sql
+        assert "AS v (id, notes, merchant_name, keep_notes, keep_merchant_name)" in sql
+        # Kept fields bind NULL in VALUES plus a true keep flag
+        assert "(%(param_1)s::UUID, %(param_2)s, NULL, %(param_3)s, %(param_4)s)" in sql
+        assert [stmt.params[f"param_{i}"] for i in range(1, 9)] == [
+            ids[0],
+            "n",
+            False,
+            True,
+            ids[1],
+            "M",
+            True,
+            False,
+        ]
+
+    async def test_conflict_check_joins_values(self):
+        org = uuid4()
+        state = decode_state(
+            [{"id": str(uuid4()), "notes": "n"}, {"id": str(uuid4()), "is_transfer": True}], []
+        )
+        db = _postgres_db()
+
+        assert await find_conflicts(db, org, state) == []
+
+        [stmt] = _compiled(db)
+        sql = str(stmt)
+        assert "FROM transactions JOIN (VALUES" in sql
+        assert (
+            "AS v (id, notes, is_transfer, keep_notes, keep_is_transfer) ON transactions.id = v.id"
+            in sql
+        )
+        assert (
+            "NOT v.keep_notes AND transactions.notes IS DISTINCT FROM CAST(v.notes AS TEXT)" in sql
+        )
+        assert (
+            "NOT v.keep_is_transfer AND "
+            "transactions.is_transfer IS DISTINCT FROM CAST(v.is_transfer AS BOOLEAN)"
+        ) in sql
+        assert stmt.params["organization_id_1"] == org
+
+    async def test_one_statement_per_batch(self, monkeypatch):
+        monkeypatch.setattr(bulk_operation_service, "BATCH_ROWS", 2)
+        state = decode_state([{"id": str(uuid4()), "notes": str(i)} for i in range(5)], [])
+        db = _postgres_db()
+
+        await apply_state(db, uuid4(), state)
+        await find_conflicts(db, uuid4(), state)
+
+        sql = [str(stmt) for stmt in _compiled(db)]
+        assert [s.split()[0] for s in sql] == ["UPDATE"] * 3 + ["SELECT"] * 3
+        assert all("VALUES" in s for s in sql)
+
+
+@pytest.mark.asyncio
+class TestUndoRedo:
+    async def test_undo_then_redo(self, db_session, test_user, transactions, categories):
+        target = categories[2].id
+        previous = encode_state(_snapshot(transactions, "category_id"))
+        await apply_state(
+            db_session,
+            test_user.organization_id,
+            decode_state({"category_id": str(target)}, [t.id for t in transactions]),
+        )
+        op = await _log(db_session, test_user, transactions, previous, {"category_id": str(target)})
+
+        undone = await undo_bulk_operation(
+            operation_id=op.id, current_user=test_user, db=db_session
+        )
+        assert undone.restored_count == 4
+        assert await _current(db_session, transactions, "category_id") == [
+            categories[i % 2].id for i in range(4)
+        ]
+
+        redone = await redo_bulk_operation(
+            operation_id=op.id, current_user=test_user, db=db_session
+        )
+        assert redone.applied_count == 4
+        assert redone.is_undone is False
+        assert await _current(db_session, transactions, "category_id") == [target] * 4
+
+    async def test_redo_requires_undone(self, db_session, test_user, transactions):
+        op = await _log(db_session, test_user, transactions, {"notes": None}, {"notes": "x"})
+        with pytest.raises(HTTPException) as exc_info:
+            await redo_bulk_operation(operation_id=op.id, current_user=test_user, db=db_session)
+        assert exc_info.value.status_code == 409
+
+    async def test_redo_conflict(self, db_session, test_user, transactions):
+        op = await _log(
+            db_session, test_user, transactions, {"notes": None}, {"notes": "bulk"}, is_undone=True
+        )
+        transactions[2].notes = "edited after undo"
+        await db_session.flush()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await redo_bulk_operation(operation_id=op.id, current_user=test_user, db=db_session)
+        assert exc_info.value.status_code == 409
+        assert str(transactions[2].id) in exc_info.value.detail
@@ -212,8 +212,8 @@ class TestUndoBulkOperationConflictDetection:
         assert conflicts == []
 
     @pytest.mark.asyncio
-    async def test_no_conflict_check_when_new_state_is_list(self):
-        """List-format new_state skips conflict detection (per-row comparison not supported)."""
+    async def test_list_new_state_checked_in_one_query(self):
+        """List-format new_state is compared per row in a single batched query."""
         from app.api.v1.bulk_operations import _detect_undo_conflicts
 
         db = AsyncMock()
@@ -221,14 +221,18 @@ class TestUndoBulkOperationConflictDetection:
 
         op = _make_operation(
             user,
-            new_state=[{"id": str(uuid4()), "category_id": "cat1"}],
+            new_state=[{"id": str(uuid4()), "category_id": str(uuid4())} for _ in range(3)],
             previous_state=[{"id": str(uuid4()), "category_id": "old"}],
         )
         op.organization_id = user.organization_id
 
+        result_mock = MagicMock()
+        result_mock.all.return_value = []
+        db.execute.return_value = result_mock
+
         conflicts = await _detect_undo_conflicts(db, op)
         assert conflicts == []
-        db.execute.assert_not_called()
+        db.execute.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_undo_raises_409_on_conflict(self):
@@ -0,0 +1,146 @@
+"""Tests for the keyset-paginated, throttled chunked purger."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.account import Account
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.services import chunked_purge_service
+from app.services.chunked_purge_service import CHECKPOINT_PREFIX, ChunkedPurger
+
+
+class _FakeCache:
+    """In-memory stand-in for app.core.cache's checkpoint calls."""
+
+    def __init__(self):
+        self.store = {}
+        self.writes = []
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.writes.append(value)
+        return True
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+        return True
+
+
+@pytest.fixture
+def fake_cache():
+    cache = _FakeCache()
+    with (
+        patch.object(chunked_purge_service.cache, "get", cache.get),
+        patch.object(chunked_purge_service.cache, "setex", cache.setex),
+        patch.object(chunked_purge_service.cache, "delete", cache.delete),
+    ):
+        yield cache
+
+
+@pytest_asyncio.fixture
+async def old_transactions(db_session: AsyncSession, test_user: User, test_account: Account):
+    old = date.today() - timedelta(days=400)
+    rows = [
+        Transaction(
+            id=uuid4(),
+            organization_id=test_user.organization_id,
+            account_id=test_account.id,
+            date=old if i < 7 else date.today(),
+            amount=Decimal("-1.00"),
+            merchant_name=f"M{i}",
+            is_pending=False,
+            deduplication_hash=f"chunked-{i}",
+        )
+        for i in range(9)
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return sorted(r.id for r in rows[:7])
+
+
+async def _count(db, org_id):
+    result = await db.execute(
+        select(func.count()).select_from(Transaction).where(Transaction.organization_id == org_id)
+    )
+    return result.scalar()
+
+
+def _criteria(org_id):
+    cutoff = date.today() - timedelta(days=30)
+    return (Transaction.organization_id == org_id, Transaction.date < cutoff)
+
+
+@pytest.mark.asyncio
+class TestChunkedPurger:
+    async def test_deletes_matching_rows_in_batches(
+        self, db_session, test_user, old_transactions, fake_cache
+    ):
+        purger = ChunkedPurger(db_session, batch_size=3, max_rows_per_second=0)
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            deleted = await purger.purge(
+                Transaction, *_criteria(test_user.organization_id), checkpoint_key="t"
+            )
+
+        assert deleted == 7
+        assert commit.await_count == 3  # 3 + 3 + 1
+        assert await _count(db_session, test_user.organization_id) == 2
+        # Checkpoint advanced per batch and is cleared once complete
+        assert len(fake_cache.writes) == 3
+        assert CHECKPOINT_PREFIX + "t" not in fake_cache.store
+
+    async def test_resumes_after_checkpoint_then_sweeps_remainder(
+        self, db_session, test_user, old_transactions, fake_cache
+    ):
+        fake_cache.store[CHECKPOINT_PREFIX + "t"] = str(old_transactions[2])
+        purger = ChunkedPurger(db_session, batch_size=2, max_rows_per_second=0)
+
+        deleted = await purger.purge(
+            Transaction, *_criteria(test_user.organization_id), checkpoint_key="t"
+        )
+
+        assert deleted == 7
+        # First write is the batch right after the checkpoint
+        assert fake_cache.writes[0] == str(old_transactions[4])
+        assert await _count(db_session, test_user.organization_id) == 2
+
+    async def test_unreadable_checkpoint_is_ignored(
+        self, db_session, test_user, old_transactions, fake_cache
+    ):
+        fake_cache.store[CHECKPOINT_PREFIX + "t"] = "not-a-uuid"
+        purger = ChunkedPurger(db_session, batch_size=10, max_rows_per_second=0)
+
+        deleted = await purger.purge(
+            Transaction, *_criteria(test_user.organization_id), checkpoint_key="t"
+        )
+        assert deleted == 7
+
+    async def test_throttles_to_rows_per_second(
+        self, db_session, test_user, old_transactions, fake_cache
+    ):
+        purger = ChunkedPurger(db_session, batch_size=3, max_rows_per_second=10)
+        sleep = AsyncMock()
+        with (
+            patch.object(chunked_purge_service.time, "monotonic", return_value=100.0),
+            patch.object(chunked_purge_service.asyncio, "sleep", sleep),
+        ):
+            await purger.purge(
+                Transaction, *_criteria(test_user.organization_id), checkpoint_key="t"
+            )
+
+        # Clock frozen at the start: each batch waits until rows/10 seconds have passed
+        assert [c.args[0] for c in sleep.await_args_list] == pytest.approx([0.3, 0.6, 0.7])
+
+    async def test_rejects_non_positive_batch_size(self, db_session):
+        with pytest.raises(ValueError, match="batch_size"):
+            ChunkedPurger(db_session, batch_size=-1)
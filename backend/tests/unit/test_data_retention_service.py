@@ -3,7 +3,7 @@
 import hashlib
 from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.account import Account
 from app.models.transaction import Transaction
 from app.models.user import User
+from app.services.chunked_purge_service import ChunkedPurger
 from app.services.data_retention_service import DataRetentionService, _is_indefinite
 
 
@@ -205,11 +206,13 @@ class TestDataRetentionUnitMocked:
         db.commit.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_purge_transactions_live_commits(self):
-        db = self._make_db(scalar_value=7)
-        count = await DataRetentionService.purge_transactions(db, "org-1", 90, dry_run=False)
+    async def test_purge_transactions_live_uses_chunked_purger(self):
+        db = self._make_db()
+        with patch.object(ChunkedPurger, "purge", AsyncMock(return_value=7)) as purge:
+            count = await DataRetentionService.purge_transactions(db, "org-1", 90, dry_run=False)
         assert count == 7
-        db.commit.assert_called_once()
+        assert purge.await_args.args[0] is Transaction
+        assert purge.await_args.kwargs["checkpoint_key"].startswith("retention:transactions:org-1:")
 
     @pytest.mark.asyncio
     async def test_purge_audit_logs_dry_run(self):
@@ -220,13 +223,21 @@ class TestDataRetentionUnitMocked:
 
     @pytest.mark.asyncio
     async def test_purge_audit_logs_live(self):
-        db = self._make_db(scalar_value=50)
-        count = await DataRetentionService.purge_audit_logs(db, 365, dry_run=False)
+        db = self._make_db()
+        with patch.object(ChunkedPurger, "purge", AsyncMock(return_value=50)):
+            count = await DataRetentionService.purge_audit_logs(db, 365, dry_run=False)
         assert count == 50
-        db.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_gdpr_delete_user_commits(self):
         db = self._make_db(scalar_value=1)
-        await DataRetentionService.gdpr_delete_user(db, str(uuid4()))
+        with patch.object(ChunkedPurger, "purge", AsyncMock(return_value=0)) as purge:
+            await DataRetentionService.gdpr_delete_user(db, str(uuid4()))
+        # Large children are purged in batches before the User row goes.
+        assert [c.args[0].__tablename__ for c in purge.await_args_list] == [
+            "transactions",
+            "notifications",
+            "net_worth_snapshots",
+            "portfolio_snapshots",
+        ]
         db.commit.assert_called_once()
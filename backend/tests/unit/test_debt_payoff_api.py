@@ -10,6 +10,7 @@ from fastapi import HTTPException
 from app.api.v1.debt_payoff import (
     compare_payoff_strategies,
     get_debt_summary,
+    get_extra_payment_sensitivity,
     list_debt_accounts,
 )
 from app.models.user import User
@@ -206,3 +207,42 @@ class TestGetDebtSummary:
             await get_debt_summary(user_id=uuid4(), current_user=user, db=mock_db)
 
         mock_verify.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestExtraPaymentSensitivity:
+    @pytest.mark.asyncio
+    async def test_parses_amounts_and_account_ids(self):
+        mock_db = AsyncMock()
+        user = _mock_user()
+        aid = uuid4()
+
+        with patch("app.api.v1.debt_payoff.PayoffStrategyService") as MockSvc:
+            MockSvc.extra_payment_sensitivity = AsyncMock(return_value={"scenarios": []})
+            await get_extra_payment_sensitivity(
+                extra_payments="0, 100,250.50",
+                strategy="SNOWBALL",
+                user_id=None,
+                account_ids=str(aid),
+                current_user=user,
+                db=mock_db,
+            )
+
+        call_args = MockSvc.extra_payment_sensitivity.call_args[0]
+        assert call_args[2] == [Decimal("0"), Decimal("100"), Decimal("250.50")]
+        assert call_args[3] == "SNOWBALL"
+        assert call_args[5] == [aid]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("amounts", ["abc", "", "-5", ",".join(["10"] * 101)])
+    async def test_invalid_amounts_raise_400(self, amounts):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_extra_payment_sensitivity(
+                extra_payments=amounts,
+                strategy="AVALANCHE",
+                user_id=None,
+                account_ids=None,
+                current_user=_mock_user(),
+                db=AsyncMock(),
+            )
+        assert exc_info.value.status_code == 400
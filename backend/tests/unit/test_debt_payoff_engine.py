@@ -0,0 +1,179 @@
+"""Tests for the shared amortization / debt-payoff engine and its callers."""
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.models.account import AccountType
+from app.services import debt_payoff_engine
+from app.services.amortization_service import AmortizationService
+from app.services.debt_payoff_engine import (
+    NEVER_PAID_OFF,
+    amortization_rows,
+    level_payment_months,
+    simulate_payoffs,
+)
+from app.services.mortgage_analyzer_service import _amortize
+from app.services.payoff_strategy_service import DebtAccount, PayoffStrategyService
+
+
+def _debt(balance, rate, minimum, name="Debt"):
+    return DebtAccount(
+        account_id=uuid4(),
+        name=name,
+        balance=Decimal(balance),
+        interest_rate=Decimal(rate),
+        minimum_payment=Decimal(minimum),
+        account_type=AccountType.CREDIT_CARD,
+    )
+
+
+DEBTS = [
+    _debt("5000", "24.99", "150", "Visa"),
+    _debt("12000", "18.5", "300", "Auto"),
+    _debt("800", "29.99", "35", "Store card"),
+    _debt("25000", "6.5", "450", "Student"),
+    _debt("3400", "0", "100", "0% promo"),
+    _debt("1234.56", "21", "24.6912", "Sub-cent minimum"),
+]
+
+
+def _reference_strategy(debts, extra):
+    """The month-by-month Decimal loop the engine replaced, for totals only."""
+    states = [
+        [d.balance, d.interest_rate, d.minimum_payment, Decimal(0), Decimal(0)] for d in debts
+    ]
+    freed, month = Decimal(0), 0
+    while month < 360:
+        month += 1
+        if all(s[0] <= Decimal("0.01") for s in states):
+            break
+        for s in states:
+            if s[0] > Decimal("0.01"):
+                interest = (s[0] * s[1] / Decimal(100) / Decimal(12)).quantize(Decimal("0.01"))
+                payment = min(s[2], s[0] + interest)
+                s[0] = max(s[0] - (payment - interest), Decimal(0))
+                s[3] += interest
+                s[4] += payment
+        available = extra + freed
+        for s in states:
+            if s[0] > Decimal("0.01") and available > 0:
+                amount = min(available, s[0])
+                s[0] -= amount
+                s[4] += amount
+                if s[0] <= Decimal("0.01"):
+                    s[0] = Decimal(0)
+                    freed += s[2]
+                break
+    return month, float(sum(s[3] for s in states)), float(sum(s[4] for s in states))
+
+
+class TestSimulatePayoffs:
+    def test_interest_rounds_half_to_even(self):
+        # 100.50 * 12% / 12 = 1.005 -> 1.00; 101.50 -> 1.015 -> 1.02
+        run = simulate_payoffs(["100.50", "101.50"], [12, 12], [0, 0], max_months=1)
+        assert run.interest.tolist() == [[10_000, 10_200]]
+
+    @pytest.mark.parametrize("strategy", ["SNOWBALL", "AVALANCHE"])
+    @pytest.mark.parametrize("extra", ["0", "75", "500"])
+    def test_strategy_matches_decimal_reference(self, strategy, extra):
+        order = PayoffStrategyService._priority_order(DEBTS, strategy)
+        result = PayoffStrategyService._calculate_strategy(
+            [DEBTS[i] for i in order], Decimal(extra), strategy
+        )
+        months, interest, paid = _reference_strategy([DEBTS[i] for i in order], Decimal(extra))
+        assert (result["total_months"], result["total_interest"], result["total_paid"]) == (
+            months,
+            interest,
+            paid,
+        )
+
+    def test_grid_and_per_scenario_paths_agree(self, monkeypatch):
+        kwargs = dict(
+            extra_payments=[0, 25, 250, 1000],
+            priorities=[[0, 1, 2], [2, 1, 0], [1, 0, 2], [0, 2, 1]],
+            record=True,
+        )
+        args = (["5000", "800.55", "12000"], ["24.99", "0", "7.25"], ["100", "40", "230"])
+
+        monkeypatch.setattr(debt_payoff_engine, "VECTORIZE_MIN_SCENARIOS", 1)
+        grid = simulate_payoffs(*args, **kwargs)
+        monkeypatch.setattr(debt_payoff_engine, "VECTORIZE_MIN_SCENARIOS", 10_000)
+        each = simulate_payoffs(*args, **kwargs)
+
+        for field in ("months", "payoff_month", "balance", "interest", "paid"):
+            assert getattr(grid, field).tolist() == getattr(each, field).tolist()
+        for key in ("interest", "payment", "balance"):
+            assert grid.history[key].tolist() == each.history[key].tolist()
+
+    def test_cleared_minimum_rolls_into_extra(self):
+        # Debt 0 is cleared by the extra in month 1; its $50 minimum joins the extra after
+        run = simulate_payoffs(
+            ["100", "1000"], [0, 0], ["50", "50"], extra_payments=["60"], record=True
+        )
+        assert run.payoff_month[0, 0] == 1
+        assert run.history["payment"][1, 0, 1] == (50 + 60 + 50) * 10_000
+
+    def test_large_balances_do_not_overflow(self, monkeypatch):
+        # balance * rate exceeds int64 on the array path; it switches to exact integers
+        monkeypatch.setattr(debt_payoff_engine, "VECTORIZE_MIN_SCENARIOS", 1)
+        run = simulate_payoffs(["1000000000000"], [30], ["1000000"], max_months=2)
+        # $25bn, then $25.62497500bn of interest
+        assert run.interest[0, 0] == 250_000_000_000_000 + 256_249_750_000_000
+
+
+class TestSensitivity:
+    def test_matches_one_strategy_per_amount(self):
+        amounts = [Decimal(a) for a in ("0", "50", "200", "1000")]
+        table = PayoffStrategyService.calculate_extra_payment_sensitivity(DEBTS, amounts)
+        pace = PayoffStrategyService.calculate_current_pace(DEBTS)
+
+        assert table["current_pace"]["total_interest"] == pace["total_interest"]
+        for amount, row in zip(amounts, table["scenarios"]):
+            single = PayoffStrategyService.calculate_avalanche(DEBTS, amount)
+            assert row["total_months"] == single["total_months"]
+            assert row["total_interest"] == single["total_interest"]
+            assert row["interest_saved_vs_current"] == pytest.approx(
+                pace["total_interest"] - single["total_interest"]
+            )
+        interest = [row["total_interest"] for row in table["scenarios"]]
+        assert interest == sorted(interest, reverse=True)
+
+    def test_no_debts(self):
+        table = PayoffStrategyService.calculate_extra_payment_sensitivity([], [Decimal(100)])
+        assert table["scenarios"] == []
+
+
+class TestSingleLoan:
+    def test_rows_cap_final_payment(self):
+        rows = amortization_rows("1000", "12", "100")
+        assert rows[-1] == (11, 58.98, 58.4, 0.58, 0.0)
+        assert sum(r[2] for r in rows) == pytest.approx(1000)
+
+    def test_schedule_dates_clamp_to_month_end(self):
+        schedule = AmortizationService.generate_amortization_schedule(
+            Decimal("1000"), Decimal("0"), Decimal("250"), start_date=date(2024, 1, 31)
+        )
+        assert [row["date"] for row in schedule] == [
+            "2024-01-31",
+            "2024-02-29",
+            "2024-03-31",
+            "2024-04-30",
+        ]
+
+    def test_mortgage_extra_payment_shortens_schedule(self):
+        base = _amortize(300_000, 0.065, 1896.20)
+        extra = _amortize(300_000, 0.065, 1896.20, extra_monthly=500)
+        assert len(extra) < len(base)
+        assert base[-1].balance == 0.0
+        assert base[-1].cumulative_interest == pytest.approx(sum(r.interest for r in base))
+
+    def test_level_payment_months(self):
+        months = level_payment_months(
+            ["1000", "1000", "0", "1000", "1000"],
+            ["12", "0", "5", "120", "12"],
+            ["100", "300", "1", "10", "0"],
+        )
+        assert months.tolist() == [11, 4, 0, NEVER_PAID_OFF, NEVER_PAID_OFF]
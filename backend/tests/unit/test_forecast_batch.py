@@ -0,0 +1,209 @@
+"""Tests for batched balance projections and the chunked nightly forecast job."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.models.account import Account, AccountType
+from app.models.recurring_transaction import RecurringFrequency, RecurringTransaction
+from app.models.user import Organization
+from app.services.forecast_service import BalanceProjection, ForecastService
+
+
+class TestBalanceProjection:
+    def test_first_below_and_cache_round_trip(self):
+        start = date(2026, 3, 1)
+        deltas = np.zeros(31)
+        deltas[[3, 10, 12]] = [-600.0, 250.0, -900.0]
+        projection = BalanceProjection(start, 1000.0, deltas)
+
+        assert projection.balances()[[2, 3, 12]].tolist() == [1000.0, 400.0, -250.0]
+        assert projection.first_below(0.0) == (start + timedelta(days=12), -250.0)
+        assert projection.first_below(-1000.0) is None
+
+        # Float drift on a day that nets to exactly zero is not an overdraft
+        drift = BalanceProjection(start, 0.3, np.array([-0.1, -0.1, -0.1]))
+        assert drift.balances()[-1] == 0.0
+        assert drift.first_below(0.0) is None
+
+        cached = projection.to_cache()
+        assert cached["days"] == [3, 10, 12] and cached["length"] == 31
+        restored = BalanceProjection.from_cache(cached)
+        assert restored.start_date == start
+        np.testing.assert_array_equal(restored.deltas, deltas)
+
+
+def _account(org_id, user_id, name, balance, account_type=AccountType.CHECKING, **kwargs):
+    return Account(
+        id=uuid4(),
+        organization_id=org_id,
+        user_id=user_id,
+        name=name,
+        account_type=account_type,
+        current_balance=Decimal(balance),
+        is_active=True,
+        **kwargs,
+    )
+
+
+def _pattern(org_id, account, merchant, amount, frequency, next_date):
+    return RecurringTransaction(
+        organization_id=org_id,
+        account_id=account.id,
+        merchant_name=merchant,
+        frequency=frequency,
+        average_amount=Decimal(amount),
+        first_occurrence=next_date - timedelta(days=90),
+        next_expected_date=next_date,
+        is_active=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestProjectBalances:
+    async def test_matches_generate_forecast(self, db_session, test_user):
+        org_id = test_user.organization_id
+        today = date.today()
+        checking = _account(org_id, test_user.id, "Checking", "1500")
+        card = _account(org_id, test_user.id, "Card", "300", AccountType.CREDIT_CARD)
+        hidden = _account(org_id, test_user.id, "Hidden", "99999", exclude_from_cash_flow=True)
+        db_session.add_all([checking, card, hidden])
+        await db_session.flush()
+        db_session.add_all(
+            [
+                _pattern(
+                    org_id,
+                    checking,
+                    "Rent",
+                    "-1400",
+                    RecurringFrequency.MONTHLY,
+                    today + timedelta(days=5),
+                ),
+                _pattern(
+                    org_id,
+                    checking,
+                    "Payroll",
+                    "900",
+                    RecurringFrequency.BIWEEKLY,
+                    today + timedelta(days=2),
+                ),
+                # Overdue occurrence: steps forward, the past date itself is dropped
+                _pattern(
+                    org_id,
+                    checking,
+                    "Gym",
+                    "-40",
+                    RecurringFrequency.WEEKLY,
+                    today - timedelta(days=3),
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        projections = await ForecastService.project_balances(db_session, [org_id], 30)
+        forecast = await ForecastService.generate_forecast(db_session, org_id, None, 30)
+
+        projection = projections[org_id]
+        assert projection.start_balance == pytest.approx(1200.0)
+        np.testing.assert_allclose(
+            projection.balances(), [day["projected_balance"] for day in forecast]
+        )
+
+    async def test_batches_organizations_in_fixed_queries(self, db_session, test_user):
+        other = Organization(id=uuid4(), name="Second Household")
+        db_session.add(other)
+        await db_session.flush()
+        today = date.today()
+        mine = _account(test_user.organization_id, test_user.id, "Checking", "100")
+        theirs = _account(other.id, test_user.id, "Checking", "5000")
+        db_session.add_all([mine, theirs])
+        await db_session.flush()
+        db_session.add_all(
+            [
+                _pattern(
+                    test_user.organization_id,
+                    mine,
+                    "Rent",
+                    "-500",
+                    RecurringFrequency.MONTHLY,
+                    today + timedelta(days=4),
+                ),
+                _pattern(
+                    other.id,
+                    theirs,
+                    "Rent",
+                    "-500",
+                    RecurringFrequency.MONTHLY,
+                    today + timedelta(days=4),
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+            projections = await ForecastService.project_balances(
+                db_session, [test_user.organization_id, other.id, uuid4()], 30
+            )
+
+        assert execute.call_count == 2
+        assert projections[test_user.organization_id].first_below(0.0) == (
+            today + timedelta(days=4),
+            -400.0,
+        )
+        assert projections[other.id].first_below(0.0) is None
+
+    async def test_cached_projection_skips_queries(self, db_session, test_user):
+        org_id = test_user.organization_id
+        cached = BalanceProjection(date.today(), 10.0, np.array([0.0, -20.0])).to_cache()
+
+        with (
+            patch("app.services.forecast_service.cache.get", AsyncMock(return_value=cached)),
+            patch.object(db_session, "execute", wraps=db_session.execute) as execute,
+        ):
+            projections = await ForecastService.project_balances(db_session, [org_id], 1)
+
+        execute.assert_not_called()
+        assert projections[org_id].first_below(0.0)[1] == -10.0
+
+
+@pytest.mark.asyncio
+async def test_check_negative_balance_alerts_notifies_once_per_org(db_session, test_user):
+    org_id = test_user.organization_id
+    start = date.today()
+    deltas = np.zeros(31)
+    deltas[6] = -800.0
+    projections = {org_id: BalanceProjection(start, 500.0, deltas)}
+
+    with (
+        patch.object(ForecastService, "project_balances", AsyncMock(return_value=projections)),
+        patch(
+            "app.services.forecast_service.NotificationService.create_notification",
+            new_callable=AsyncMock,
+        ) as notify,
+    ):
+        alerts = await ForecastService.check_negative_balance_alerts(db_session, [org_id])
+
+    assert alerts == {
+        org_id: {"date": (start + timedelta(days=6)).isoformat(), "projected_balance": -300.0}
+    }
+    notify.assert_awaited_once()
+    assert notify.call_args.kwargs["user_id"] is None
+    assert "-300.00" in notify.call_args.kwargs["message"]
+
+
+def test_dispatch_forecast_chunks():
+    from app.workers.tasks import forecast_tasks
+
+    org_ids = [uuid4() for _ in range(5)]
+    with (
+        patch.object(forecast_tasks, "FORECAST_CHUNK_SIZE", 2),
+        patch.object(forecast_tasks.check_cash_flow_forecast_chunk_task, "apply_async") as send,
+    ):
+        assert forecast_tasks._dispatch_forecast_chunks(org_ids) == 3
+
+    chunks = [call.kwargs["args"][0] for call in send.call_args_list]
+    assert chunks == [[str(o) for o in org_ids[i : i + 2]] for i in (0, 2, 4)]
@@ -0,0 +1,199 @@
+"""Tests for historical-replay stress testing."""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.models.account import Account, AccountType
+from app.models.holding import Holding
+from app.services.market_data.price_history import PriceHistoryStore
+from app.services.stress_test_service import (
+    ReplayPosition,
+    StressTestService,
+    drawdown_metrics,
+    replay_account_paths,
+)
+
+START = date(2020, 2, 19)
+END = date(2020, 12, 31)
+
+
+def _series(start: date, closes, step: int = 1):
+    days = np.array([start.toordinal() + i * step for i in range(len(closes))], dtype=np.int64)
+    return days, np.asarray(closes, dtype=np.float64)
+
+
+class TestDrawdownMetrics:
+    def test_peak_trough_recovery_and_worst_day(self):
+        days = _series(START, range(6))[0]
+        values = np.array([[100.0, 110.0, 88.0, 99.0, 121.0, 105.0]])
+
+        (m,) = drawdown_metrics(values, days)
+
+        assert m["peak_drawdown_pct"] == pytest.approx(-0.2)
+        assert m["peak_drawdown_amount"] == pytest.approx(-22.0)
+        assert m["peak_date"] == (START + timedelta(days=1)).isoformat()
+        assert m["trough_date"] == (START + timedelta(days=2)).isoformat()
+        assert m["recovery_date"] == (START + timedelta(days=4)).isoformat()
+        assert m["recovery_days"] == 2
+        assert m["worst_day_pct"] == pytest.approx(-0.2)
+        assert m["worst_day_loss"] == pytest.approx(22.0)
+        assert m["worst_day_date"] == (START + timedelta(days=2)).isoformat()
+        assert m["total_return_pct"] == pytest.approx(0.05)
+
+    def test_unrecovered_and_rising_paths(self):
+        days = _series(START, range(4))[0]
+        values = np.array([[100.0, 90.0, 80.0, 85.0], [100.0, 101.0, 102.0, 103.0]])
+
+        falling, rising = drawdown_metrics(values, days)
+
+        assert falling["recovery_date"] is None and falling["recovery_days"] is None
+        assert falling["peak_date"] == START.isoformat()
+        assert rising["peak_drawdown_pct"] == 0.0
+        assert rising["worst_day_pct"] == 0.0 and rising["worst_day_date"] is None
+
+
+class TestReplayAccountPaths:
+    def test_own_symbol_proxy_and_unchanged(self):
+        a, b = uuid4(), uuid4()
+        series = {
+            # Trades every other day: forward-filled onto SPY's calendar
+            "VTI": _series(START, [10.0, 5.0, 10.0], step=2),
+            "SPY": _series(START, [100.0, 90.0, 80.0, 90.0, 100.0]),
+            # Starts after the window opens, so QQQ falls back to the proxy
+            "QQQ": _series(START + timedelta(days=30), [1.0, 2.0]),
+        }
+        positions = [
+            ReplayPosition(a, 1000.0, ("VTI", "SPY"), own_symbol="VTI"),
+            ReplayPosition(a, 500.0, ()),
+            ReplayPosition(b, 2000.0, ("QQQ", "SPY"), own_symbol="QQQ"),
+        ]
+
+        account_ids, days, values, sources = replay_account_paths(positions, series, START)
+
+        assert account_ids == [a, b]
+        # Calendar comes from the series actually used (QQQ's days are not)
+        assert days.tolist() == series["SPY"][0].tolist()
+        np.testing.assert_allclose(values[0], [1500, 1500, 1000, 1000, 1500])
+        np.testing.assert_allclose(values[1], [2000, 1800, 1600, 1800, 2000])
+        assert sources == {"own_history": 1, "proxy": 1, "unchanged": 1}
+
+    def test_nothing_priced(self):
+        a = uuid4()
+        _, days, values, sources = replay_account_paths(
+            [ReplayPosition(a, 250.0, ("SPY",))], {}, START
+        )
+        assert days.tolist() == [START.toordinal()]
+        assert values.tolist() == [[250.0]]
+        assert sources["unchanged"] == 1
+
+
+class TestPriceHistoryStore:
+    def test_disk_round_trip(self, tmp_path):
+        days, closes = _series(START, [1.0, 2.0, 3.0])
+        PriceHistoryStore(str(tmp_path)).put("brk.b", START, END, (days, closes))
+
+        cached = PriceHistoryStore(str(tmp_path)).get_cached("BRK.B", START, END)
+
+        assert cached is not None
+        np.testing.assert_array_equal(cached[0], days)
+        np.testing.assert_array_equal(cached[1], closes)
+
+    @pytest.mark.asyncio
+    async def test_missing_symbols_not_refetched(self):
+        store = PriceHistoryStore()
+        with patch(
+            "app.services.market_data.provider_factory.get_market_data_provider"
+        ) as get_provider:
+            get_provider.return_value.get_historical_prices.side_effect = ValueError("no data")
+            first = await store.get_many(["ZZZZ"], START, END)
+            second = await store.get_many(["zzzz"], START, END)
+
+        assert len(first["ZZZZ"][0]) == 0 and len(second["ZZZZ"][0]) == 0
+        assert get_provider.return_value.get_historical_prices.call_count == 1
+
+
+@pytest.mark.asyncio
+class TestRunHistoricalReplay:
+    async def test_replays_holdings_per_account(self, db_session, test_user):
+        org_id = test_user.organization_id
+
+        def account(name, account_type, balance=None):
+            return Account(
+                id=uuid4(),
+                organization_id=org_id,
+                user_id=test_user.id,
+                name=name,
+                account_type=account_type,
+                current_balance=balance,
+                is_active=True,
+            )
+
+        brokerage = account("Brokerage", AccountType.BROKERAGE)
+        bonds = account("Bond Ladder", AccountType.BOND, Decimal("5000"))
+        checking = account("Checking", AccountType.CHECKING, Decimal("9000"))
+        db_session.add_all([brokerage, bonds, checking])
+        await db_session.flush()
+        db_session.add_all(
+            [
+                Holding(
+                    account_id=brokerage.id,
+                    organization_id=org_id,
+                    ticker="VTI",
+                    shares=Decimal("10"),
+                    current_total_value=Decimal("3000"),
+                    asset_type="etf",
+                    price_as_of=datetime(2026, 1, 1),
+                ),
+                Holding(
+                    account_id=brokerage.id,
+                    organization_id=org_id,
+                    ticker="MY-PRIVATE-FUND",
+                    shares=Decimal("1"),
+                    current_total_value=Decimal("1000"),
+                    asset_type="stock",
+                ),
+            ]
+        )
+        await db_session.flush()
+
+        store = PriceHistoryStore()
+        store.put("VTI", START, END, _series(START, [100.0, 50.0, 75.0, 100.0]))
+        store.put("SPY", START, END, _series(START, [100.0, 80.0, 90.0, 95.0]))
+        store.put("AGG", START, END, _series(START, [100.0, 102.0, 101.0, 103.0]))
+
+        result = await StressTestService.run_historical_replay(
+            db_session, org_id, "covid_2020", store=store
+        )
+
+        assert result["trading_days"] == 4
+        assert result["coverage"] == {
+            "positions": 3,
+            "own_history": 1,
+            "proxy": 2,
+            "unchanged": 0,
+        }
+        by_name = {a["account_name"]: a for a in result["accounts"]}
+        assert set(by_name) == {"Brokerage", "Bond Ladder"}
+        # 3000 VTI + 1000 private fund on the SPY proxy: 4000 -> 2300
+        assert by_name["Brokerage"]["peak_drawdown_amount"] == pytest.approx(-1700.0)
+        assert by_name["Brokerage"]["recovery_date"] is None
+        assert by_name["Bond Ladder"]["peak_drawdown_pct"] == pytest.approx(101 / 102 - 1)
+        assert result["accounts"][0]["account_name"] == "Brokerage"
+        assert result["portfolio"]["starting_value"] == pytest.approx(9000.0)
+
+    async def test_unknown_scenario(self, db_session, test_user):
+        with pytest.raises(ValueError, match="Unknown replay scenario"):
+            await StressTestService.run_historical_replay(
+                db_session, test_user.organization_id, "tulip_mania_1637"
+            )
+
+    async def test_no_positions(self, db_session, test_user):
+        result = await StressTestService.run_historical_replay(
+            db_session, test_user.organization_id, "gfc_2008", store=PriceHistoryStore()
+        )
+        assert result["portfolio"] is None and result["accounts"] == []
@@ -0,0 +1,131 @@
+"""Tests for downsampled net worth / portfolio history."""
+
+import math
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.models.net_worth_snapshot import NetWorthSnapshot
+from app.models.portfolio_snapshot import PortfolioSnapshot
+from app.services.enhanced_trends_service import EnhancedTrendsService
+from app.services.history_downsampling import (
+    DEFAULT_MAX_POINTS,
+    choose_resolution,
+    lttb_indices,
+)
+from app.services.snapshot_service import SnapshotService
+
+
+class TestChooseResolution:
+    def test_one_year_stays_daily(self):
+        end = date(2025, 6, 30)
+        assert choose_resolution(end - timedelta(days=365), end, DEFAULT_MAX_POINTS) == "daily"
+
+    def test_steps_down_with_range(self):
+        end = date(2025, 6, 30)
+        assert choose_resolution(end - timedelta(days=3 * 365), end, 500) == "weekly"
+        assert choose_resolution(end - timedelta(days=10 * 365), end, 500) == "monthly"
+
+
+class TestLttb:
+    def test_keeps_endpoints_and_budget(self):
+        x = np.arange(1000)
+        y = np.sin(x / 40.0)
+        keep = lttb_indices(x, y, 100)
+        assert len(keep) == 100
+        assert keep[0] == 0 and keep[-1] == 999
+        assert np.all(np.diff(keep) > 0)
+
+    def test_keeps_spike(self):
+        y = np.zeros(500)
+        y[237] = 100.0
+        assert 237 in lttb_indices(np.arange(500), y, 20)
+
+    def test_short_series_untouched(self):
+        assert list(lttb_indices([1, 2, 3], [1, 2, 3], 10)) == [0, 1, 2]
+
+
+def _net_worth_rows(org_id, start, days):
+    return [
+        NetWorthSnapshot(
+            id=uuid4(),
+            organization_id=org_id,
+            snapshot_date=start + timedelta(days=i),
+            total_net_worth=Decimal(1000 + i),
+            total_assets=Decimal(1500 + i),
+            total_liabilities=Decimal(500),
+            breakdown_json={"accounts": ["x" * 100] * 20},
+        )
+        for i in range(days)
+    ]
+
+
+@pytest.mark.asyncio
+class TestLoadSeries:
+    async def test_monthly_closing_values(self, db_session, test_user):
+        org_id = test_user.organization_id
+        start = date(2024, 1, 10)
+        db_session.add_all(_net_worth_rows(org_id, start, 90))
+        await db_session.flush()
+
+        history = await EnhancedTrendsService(db_session).get_net_worth_history(
+            org_id, start_date=start, end_date=date(2024, 4, 30), resolution="monthly"
+        )
+
+        assert history["resolution"] == "monthly"
+        assert [p["date"] for p in history["data_points"]] == [
+            "2024-01-10",  # first snapshot in range
+            "2024-01-31",
+            "2024-02-29",
+            "2024-03-31",
+            "2024-04-08",  # last snapshot
+        ]
+        assert history["period_change"]["start_value"] == 1000.0
+        assert history["period_change"]["end_value"] == 1089.0
+
+    async def test_auto_caps_long_ranges(self, db_session, test_user):
+        org_id = test_user.organization_id
+        start = date(2020, 1, 1)
+        db_session.add_all(_net_worth_rows(org_id, start, 1200))
+        await db_session.flush()
+        end = start + timedelta(days=1199)
+
+        auto = await EnhancedTrendsService(db_session).get_net_worth_history(
+            org_id, start_date=start, end_date=end
+        )
+        assert auto["resolution"] == "weekly"
+        # One point per week (SQLite splits weeks at year boundaries)
+        assert math.ceil(1200 / 7) <= auto["snapshot_count"] <= math.ceil(1200 / 7) + 5
+
+        thinned = await EnhancedTrendsService(db_session).get_net_worth_history(
+            org_id, start_date=start, end_date=end, resolution="daily", max_points=50
+        )
+        assert thinned["snapshot_count"] == 50
+        assert thinned["data_points"][-1]["date"] == end.isoformat()
+
+    async def test_portfolio_series_projection(self, db_session, test_user):
+        org_id = test_user.organization_id
+        start = date(2024, 1, 1)
+        db_session.add_all(
+            PortfolioSnapshot(
+                id=uuid4(),
+                organization_id=org_id,
+                snapshot_date=start + timedelta(days=i),
+                total_value=Decimal(100 + i),
+                snapshot_data={"holdings_by_ticker": []},
+            )
+            for i in range(60)
+        )
+        await db_session.flush()
+
+        rows = await SnapshotService().get_snapshot_series(
+            db_session, org_id, start_date=start, resolution="weekly", limit=3
+        )
+
+        assert len(rows) == 3
+        assert rows[0].snapshot_date == start
+        assert rows[0].total_value == Decimal("100")
+        assert "snapshot_data" not in rows[0]._fields
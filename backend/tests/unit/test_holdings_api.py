@@ -513,7 +513,7 @@ class TestGetHistoricalSnapshots:
         ]
 
         with patch(
-            "app.api.v1.holdings.snapshot_service.get_snapshots",
+            "app.api.v1.holdings.snapshot_service.get_snapshot_series",
             return_value=snapshots,
         ) as mock_get:
             result = await get_historical_snapshots(
@@ -521,6 +521,8 @@ class TestGetHistoricalSnapshots:
                 end_date=date(2024, 12, 31),
                 limit=None,
                 user_id=None,
+                resolution="auto",
+                max_points=None,
                 current_user=mock_user,
                 db=mock_db,
             )
@@ -533,19 +535,23 @@ class TestGetHistoricalSnapshots:
                 end_date=date(2024, 12, 31),
                 limit=None,
                 user_id=None,
+                resolution="auto",
+                max_points=None,
             )
 
     @pytest.mark.asyncio
     async def test_defaults_to_last_year_when_no_start_date(self, mock_db, mock_user):
         """Should default to 1 year ago when start_date is None."""
         with patch(
-            "app.api.v1.holdings.snapshot_service.get_snapshots", return_value=[]
+            "app.api.v1.holdings.snapshot_service.get_snapshot_series", return_value=[]
         ) as mock_get:
             await get_historical_snapshots(
                 start_date=None,
                 end_date=None,
                 limit=None,
                 user_id=None,
+                resolution="auto",
+                max_points=None,
                 current_user=mock_user,
                 db=mock_db,
             )
@@ -0,0 +1,191 @@
+"""Tests for the normalized merchant dimension."""
+
+import importlib.util
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.api.v1.transactions import get_merchant_names
+from app.models.merchant import Merchant, MerchantAlias
+from app.models.rule import (
+    ActionType,
+    ConditionField,
+    ConditionOperator,
+    Rule,
+    RuleAction,
+    RuleCondition,
+    RuleMatchType,
+)
+from app.models.transaction import Transaction
+from app.services.merchant_service import (
+    assign_merchants,
+    merchant_key,
+    reconcile_merchants,
+)
+from app.services.rule_engine import RuleEngine
+
+
+class TestMerchantKey:
+    @pytest.mark.parametrize(
+        "raw",
+        ["STARBUCKS #1234", "Starbucks #88 Seattle WA", "SQ *STARBUCKS", "  starbucks  "],
+    )
+    def test_spellings_share_a_key(self, raw):
+        assert merchant_key(raw) == "starbucks"
+
+    def test_digit_tokens_dropped(self):
+        assert merchant_key("AMZN Mktp US 2K4L81") == "amzn mktp us"
+
+    def test_all_digit_name_kept(self):
+        assert merchant_key("7-11") == "7 11"
+
+    def test_empty(self):
+        assert merchant_key(None) == ""
+        assert merchant_key(" # ") == ""
+
+    def test_r85_backfill_uses_frozen_copy(self):
+        path = Path(__file__).parents[2] / "alembic" / "versions" / "r85_merchants.py"
+        spec = importlib.util.spec_from_file_location("r85", path)
+        r85 = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(r85)
+
+        assert "from app" not in path.read_text()
+        assert r85._merchant_key("SQ *STARBUCKS #12") == "starbucks"
+        assert r85._merchant_key("AMZN Mktp US 2K4L81") == "amzn mktp us"
+        assert r85._merchant_key("7-11") == "7 11"
+        assert r85._merchant_key(None) == ""
+
+
+def _txn(test_user, test_account, merchant_name, day=date(2024, 3, 1)):
+    return Transaction(
+        id=uuid4(),
+        organization_id=test_user.organization_id,
+        account_id=test_account.id,
+        date=day,
+        amount=Decimal("-5.00"),
+        merchant_name=merchant_name,
+        deduplication_hash=str(uuid4()),
+    )
+
+
+@pytest.mark.asyncio
+class TestAssignMerchants:
+    async def test_spellings_resolve_to_one_merchant(self, db_session, test_user, test_account):
+        txns = [
+            _txn(test_user, test_account, "STARBUCKS #1234", date(2024, 3, 1)),
+            _txn(test_user, test_account, "SQ *STARBUCKS", date(2024, 3, 9)),
+            _txn(test_user, test_account, "Blue Bottle"),
+            _txn(test_user, test_account, None),
+        ]
+        db_session.add_all(txns)
+        await db_session.flush()
+
+        assert await assign_merchants(db_session, test_user.organization_id, txns) == 3
+        await db_session.flush()
+
+        assert txns[0].merchant_id == txns[1].merchant_id
+        assert txns[2].merchant_id not in (None, txns[0].merchant_id)
+        assert txns[3].merchant_id is None
+
+        starbucks = await db_session.get(Merchant, txns[0].merchant_id)
+        await db_session.refresh(starbucks)
+        assert starbucks.name == "STARBUCKS #1234"
+        assert starbucks.transaction_count == 2
+        assert starbucks.last_seen_date == date(2024, 3, 9)
+        aliases = (await db_session.execute(select(MerchantAlias.name))).scalars().all()
+        assert len(aliases) == 3
+
+    async def test_rename_moves_usage(self, db_session, test_user, test_account):
+        txn = _txn(test_user, test_account, "Netflix")
+        db_session.add(txn)
+        await db_session.flush()
+        await assign_merchants(db_session, test_user.organization_id, [txn])
+        netflix_id = txn.merchant_id
+
+        txn.merchant_name = "Hulu"
+        await assign_merchants(db_session, test_user.organization_id, [txn])
+        await db_session.flush()
+
+        netflix = await db_session.get(Merchant, netflix_id)
+        hulu = await db_session.get(Merchant, txn.merchant_id)
+        await db_session.refresh(netflix)
+        await db_session.refresh(hulu)
+        assert (netflix.transaction_count, hulu.transaction_count) == (0, 1)
+
+    async def test_reconcile_resolves_and_recounts(self, db_session, test_user, test_account):
+        txns = [_txn(test_user, test_account, name) for name in ("Lyft", "LYFT #77", "Lyft")]
+        db_session.add_all(txns)
+        await db_session.flush()
+
+        assert await reconcile_merchants(db_session, test_user.organization_id) == 3
+        await db_session.flush()
+
+        merchant = (await db_session.execute(select(Merchant))).scalar_one()
+        assert merchant.name == "Lyft"  # Most frequent spelling
+        assert merchant.transaction_count == 3
+        ids = (await db_session.execute(select(Transaction.merchant_id))).scalars().all()
+        assert set(ids) == {merchant.id}
+
+
+@pytest.mark.asyncio
+async def test_merchant_typeahead(db_session, test_user, test_account):
+    txns = [
+        _txn(test_user, test_account, "STARBUCKS #1"),
+        _txn(test_user, test_account, "Starbucks #2"),
+        _txn(test_user, test_account, "Star Market"),
+        _txn(test_user, test_account, "Target"),
+    ]
+    db_session.add_all(txns)
+    await db_session.flush()
+    await assign_merchants(db_session, test_user.organization_id, txns)
+    await db_session.flush()
+
+    result = await get_merchant_names(
+        current_user=test_user, db=db_session, search="sq *star", limit=10
+    )
+    assert result == {"merchants": ["STARBUCKS #1", "Star Market"]}
+
+    result = await get_merchant_names(current_user=test_user, db=db_session, search=None, limit=10)
+    assert result == {"merchants": ["STARBUCKS #1", "Star Market", "Target"]}
+
+
+@pytest.mark.asyncio
+async def test_rule_run_reads_only_matching_merchants(db_session, test_user, test_account):
+    resolved = [_txn(test_user, test_account, n) for n in ("UBER *TRIP", "Uber Eats", "Lyft")]
+    unresolved = _txn(test_user, test_account, "Uber One")
+    db_session.add_all([*resolved, unresolved])
+    await db_session.flush()
+    await assign_merchants(db_session, test_user.organization_id, resolved)
+
+    rule = Rule(
+        organization_id=test_user.organization_id,
+        name="Rides",
+        match_type=RuleMatchType.ALL,
+        conditions=[
+            RuleCondition(
+                field=ConditionField.MERCHANT_NAME,
+                operator=ConditionOperator.STARTS_WITH,
+                value="uber",
+            )
+        ],
+        actions=[RuleAction(action_type=ActionType.SET_CATEGORY, action_value="Transport")],
+    )
+    db_session.add(rule)
+    await db_session.flush()
+
+    engine = RuleEngine(db_session)
+    merchant_ids = await engine._matching_merchant_ids(rule)
+    assert set(merchant_ids) == {resolved[0].merchant_id, resolved[1].merchant_id}
+
+    assert await engine.apply_rule_to_transactions(rule) == 3
+    categories = {t.merchant_name: t.category_primary for t in [*resolved, unresolved]}
+    assert categories == {
+        "UBER *TRIP": "Transport",
+        "Uber Eats": "Transport",
+        "Lyft": None,
+        "Uber One": "Transport",
+    }
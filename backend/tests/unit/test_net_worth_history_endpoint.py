@@ -48,7 +48,7 @@ def _db_returning(snapshots):
     """AsyncSession that returns `snapshots` from every execute() call."""
     db = AsyncMock()
     result = MagicMock()
-    result.scalars.return_value.all.return_value = snapshots
+    result.all.return_value = snapshots
     db.execute = AsyncMock(return_value=result)
     db.commit = AsyncMock()
     return db
@@ -72,6 +72,8 @@ async def test_net_worth_history_empty_bootstrap_failure():
             start_date=None,
             end_date=None,
             user_id=None,
+            resolution="auto",
+            max_points=None,
             current_user=user,
             db=db,
         )
@@ -106,6 +108,8 @@ async def test_net_worth_history_returns_existing_snapshots():
             start_date=None,
             end_date=None,
             user_id=None,
+            resolution="auto",
+            max_points=None,
             current_user=user,
             db=db,
         )
@@ -131,6 +135,8 @@ async def test_net_worth_history_field_mapping():
         start_date=None,
         end_date=None,
         user_id=None,
+        resolution="auto",
+        max_points=None,
         current_user=user,
         db=db,
     )
@@ -173,6 +179,8 @@ async def test_net_worth_history_none_fields_coerce_to_zero():
         start_date=None,
         end_date=None,
         user_id=None,
+        resolution="auto",
+        max_points=None,
         current_user=user,
         db=db,
     )
@@ -214,7 +222,7 @@ async def test_net_worth_history_zero_snapshots_triggers_rebootstrap():
         call_count += 1
         result = MagicMock()
         # First call returns stale $0 snapshot; second (after bootstrap) returns real data
-        result.scalars.return_value.all.return_value = [zero_snap] if call_count == 1 else [real_snap]
+        result.all.return_value = [zero_snap] if call_count == 1 else [real_snap]
         return result
 
     db = AsyncMock()
@@ -229,6 +237,8 @@ async def test_net_worth_history_zero_snapshots_triggers_rebootstrap():
             start_date=None,
             end_date=None,
             user_id=None,
+            resolution="auto",
+            max_points=None,
             current_user=user,
             db=db,
         )
@@ -0,0 +1,221 @@
+"""Tests for realtime notification push and Redis-cached unread counts."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.notification import NotificationType
+from app.services import notification_stream_service as stream
+from app.services.notification_service import NotificationService
+
+
+class _FakeRedisCounters:
+    """In-memory stand-in for the cache helpers the counters use."""
+
+    def __init__(self):
+        self.store = {}
+        self.published = []
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+        return True
+
+    async def incrby_if_exists(self, key, amount):
+        if key not in self.store:
+            return None
+        self.store[key] += amount
+        return self.store[key]
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+
+@pytest.fixture
+def fake_redis():
+    fake = _FakeRedisCounters()
+    with (
+        patch.object(stream.cache, "get", fake.get),
+        patch.object(stream.cache, "setex", fake.setex),
+        patch.object(stream.cache, "delete", fake.delete),
+        patch.object(stream.cache, "incrby_if_exists", fake.incrby_if_exists),
+        patch.object(stream.cache, "publish", fake.publish),
+    ):
+        yield fake
+
+
+@pytest.mark.asyncio
+class TestUnreadCounters:
+    async def test_count_is_cached_after_first_query(self, db, test_user, fake_redis):
+        await NotificationService.create_notification(
+            db=db,
+            organization_id=test_user.organization_id,
+            user_id=test_user.id,
+            type=NotificationType.BUDGET_ALERT,
+            title="t",
+            message="m",
+        )
+        assert await NotificationService.get_unread_count(db, test_user) == 1
+        assert fake_redis.store[stream.unread_count_key(test_user.id)] == 1
+
+        # Served from Redis without touching the database
+        no_db = MagicMock()
+        no_db.execute = AsyncMock(side_effect=AssertionError("should not query"))
+        assert await NotificationService.get_unread_count(no_db, test_user) == 1
+
+    async def test_create_read_dismiss_keep_counter_in_step(self, db, test_user, fake_redis):
+        await NotificationService.get_unread_count(db, test_user)  # prime: 0
+
+        personal = await NotificationService.create_notification(
+            db=db,
+            organization_id=test_user.organization_id,
+            user_id=test_user.id,
+            type=NotificationType.BUDGET_ALERT,
+            title="a",
+            message="m",
+        )
+        org_wide = await NotificationService.create_notification(
+            db=db,
+            organization_id=test_user.organization_id,
+            type=NotificationType.SYNC_FAILED,
+            title="b",
+            message="m",
+        )
+        key = stream.unread_count_key(test_user.id)
+        assert fake_redis.store[key] == 2
+
+        await NotificationService.mark_as_read(db, personal.id, test_user)
+        await NotificationService.mark_as_read(db, personal.id, test_user)  # no double count
+        assert fake_redis.store[key] == 1
+
+        await NotificationService.mark_as_dismissed(db, org_wide.id, test_user)
+        assert fake_redis.store[key] == 0
+
+    async def test_mark_all_read_invalidates(self, db, test_user, fake_redis):
+        await NotificationService.create_notification(
+            db=db,
+            organization_id=test_user.organization_id,
+            user_id=test_user.id,
+            type=NotificationType.BUDGET_ALERT,
+            title="a",
+            message="m",
+        )
+        await NotificationService.get_unread_count(db, test_user)
+        await NotificationService.mark_all_as_read(db, test_user)
+
+        assert stream.unread_count_key(test_user.id) not in fake_redis.store
+        assert await NotificationService.get_unread_count(db, test_user) == 0
+
+    async def test_create_publishes_on_household_channel(self, db, test_user, fake_redis):
+        notification = await NotificationService.create_notification(
+            db=db,
+            organization_id=test_user.organization_id,
+            user_id=test_user.id,
+            type=NotificationType.BUDGET_ALERT,
+            title="Over budget",
+            message="m",
+        )
+
+        channel, message = fake_redis.published[-1]
+        assert channel == stream.org_channel(test_user.organization_id)
+        assert message["event"] == stream.EVENT_NOTIFICATION
+        assert message["user_id"] == str(test_user.id)
+        assert message["notification"]["id"] == str(notification.id)
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channel = channel
+
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        if self.messages:
+            return self.messages.pop(0)
+        return None
+
+    async def unsubscribe(self):
+        pass
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _msg(event, user_id=None, notification=None):
+    payload = {"event": event, "user_id": user_id}
+    if notification is not None:
+        payload["notification"] = notification
+    return {"type": "message", "data": json.dumps(payload)}
+
+
+@pytest.mark.asyncio
+class TestStreamUserEvents:
+    async def _collect(self, messages, *, frames, muted=()):
+        me = uuid4()
+        pubsub = _FakePubSub([m(me) if callable(m) else m for m in messages])
+        redis_client = MagicMock()
+        redis_client.pubsub.return_value = pubsub
+        counts = iter(range(100))
+        polls = iter([False] * frames + [True])
+
+        async def load_count():
+            return next(counts)
+
+        async def disconnected():
+            return next(polls)
+
+        with patch.object(stream.cache, "redis_client", redis_client):
+            out = [
+                frame
+                async for frame in stream.stream_user_events(
+                    me,
+                    uuid4(),
+                    load_unread_count=load_count,
+                    is_disconnected=disconnected,
+                    muted_types=muted,
+                    keepalive_seconds=0,
+                )
+            ]
+        assert pubsub.closed
+        return out
+
+    async def test_initial_count_then_relevant_events_only(self):
+        other = str(uuid4())
+        frames = await self._collect(
+            [
+                _msg("notification", other, {"type": "budget_alert", "title": "not mine"}),
+                lambda me: _msg("notification", str(me), {"type": "budget_alert", "title": "x"}),
+                _msg("unread_changed", None),
+            ],
+            frames=3,
+        )
+
+        assert frames[0] == stream.format_sse("unread_count", {"count": 0})
+        assert frames[1].startswith("event: notification\n")
+        assert '"title": "x"' in frames[1]
+        assert frames[2] == stream.format_sse("unread_count", {"count": 1})
+        assert frames[3] == stream.format_sse("unread_count", {"count": 2})
+        assert len(frames) == 4
+
+    async def test_muted_types_update_count_without_payload(self):
+        frames = await self._collect(
+            [_msg("notification", None, {"type": "weekly_recap"})],
+            frames=1,
+            muted=("weekly_recap",),
+        )
+        assert [f.split("\n")[0] for f in frames] == ["event: unread_count"] * 2
+
+    async def test_keepalive_when_idle(self):
+        frames = await self._collect([], frames=1)
+        assert frames[-1] == ": keepalive\n\n"
@@ -192,13 +192,13 @@ class TestBudgetServiceCategoryOrgIsolation:
         org_result = Mock()
         org_result.scalar_one_or_none = Mock(return_value=mock_org)
 
-        # Second execute: Category lookup for org_a → None (cross-org category not found)
+        # Second execute: org-scoped category tree → empty (cross-org category not found)
         cat_result = Mock()
-        cat_result.scalar_one_or_none = Mock(return_value=None)
+        cat_result.all = Mock(return_value=[])
 
         # Third execute: Transaction sum (with direct category_id filter fallback)
         sum_result = Mock()
-        sum_result.scalar = Mock(return_value=None)
+        sum_result.one = Mock(return_value=(None,))
 
         mock_db.execute = AsyncMock(side_effect=[org_result, cat_result, sum_result])
 
@@ -0,0 +1,235 @@
+"""Tests for monthly partition maintenance and partition-based retention."""
+
+import importlib.util
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.models.transaction import Label, Transaction, TransactionLabel, TransactionSplit
+from app.services.data_retention_service import DataRetentionService
+from app.services.partition_service import (
+    TRANSACTION_CHILD_TABLES,
+    PartitionInfo,
+    PartitionMaintenanceService,
+    _check_table,
+    add_months,
+    month_start,
+    parse_partition_bound,
+    partition_name,
+)
+
+
+def _part(name, lower, upper, rows=0):
+    return PartitionInfo(
+        table="transactions", name=name, lower=lower, upper=upper, estimated_rows=rows
+    )
+
+
+def _executed_sql(db):
+    return [str(c.args[0]) for c in db.execute.call_args_list]
+
+
+def _load_r81():
+    versions = Path(__file__).parent.parent.parent / "alembic" / "versions"
+    spec = importlib.util.spec_from_file_location("r81", versions / "r81_time_partitioning.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestPartitionHelpers:
+    def test_month_start(self):
+        assert month_start(date(2026, 10, 18)) == date(2026, 10, 1)
+
+    def test_add_months_crosses_year(self):
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_partition_name(self):
+        assert partition_name("transactions", date(2026, 3, 1)) == "transactions_p2026_03"
+
+    def test_parse_date_bound(self):
+        bound = "FOR VALUES FROM ('2026-01-01') TO ('2026-02-01')"
+        assert parse_partition_bound(bound) == (date(2026, 1, 1), date(2026, 2, 1))
+
+    def test_parse_timestamp_bound(self):
+        bound = "FOR VALUES FROM ('2026-01-01 00:00:00') TO ('2026-02-01 00:00:00')"
+        assert parse_partition_bound(bound) == (date(2026, 1, 1), date(2026, 2, 1))
+
+    def test_parse_default_bound(self):
+        assert parse_partition_bound("DEFAULT") == (None, None)
+
+    def test_unknown_table_rejected(self):
+        with pytest.raises(ValueError, match="not a partitioned table"):
+            _check_table("users; DROP TABLE users")
+
+
+@pytest.mark.asyncio
+class TestEnsurePartitions:
+    async def test_creates_missing_months_only(self):
+        db = AsyncMock()
+        existing = [_part("transactions_p2026_10", date(2026, 10, 1), date(2026, 11, 1))]
+        with patch.object(
+            PartitionMaintenanceService, "list_partitions", AsyncMock(return_value=existing)
+        ):
+            created = await PartitionMaintenanceService.ensure_partitions(
+                db, "transactions", months_ahead=2, today=date(2026, 10, 18)
+            )
+
+        assert created == ["transactions_p2026_11", "transactions_p2026_12"]
+        sql = _executed_sql(db)
+        assert "FROM ('2026-12-01') TO ('2027-01-01')" in sql[-1]
+        db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+class TestRetirePartitions:
+    def _partitions(self):
+        return [
+            _part("transactions_p2025_01", date(2025, 1, 1), date(2025, 2, 1), rows=100),
+            _part("transactions_p2025_02", date(2025, 2, 1), date(2025, 3, 1), rows=50),
+            _part("transactions_default", None, None),
+        ]
+
+    async def test_only_whole_months_before_cutoff(self):
+        db = AsyncMock()
+        with patch.object(
+            PartitionMaintenanceService,
+            "list_partitions",
+            AsyncMock(return_value=self._partitions()),
+        ):
+            retired = await PartitionMaintenanceService.retire_partitions_before(
+                db, "transactions", date(2025, 2, 15), dry_run=True
+            )
+
+        assert [p.name for p in retired] == ["transactions_p2025_01"]
+        db.execute.assert_not_awaited()
+
+    async def test_drop_clears_transaction_children(self):
+        db = AsyncMock()
+        with patch.object(
+            PartitionMaintenanceService,
+            "list_partitions",
+            AsyncMock(return_value=self._partitions()),
+        ):
+            await PartitionMaintenanceService.retire_partitions_before(
+                db, "transactions", date(2025, 3, 1), dry_run=False
+            )
+
+        sql = _executed_sql(db)
+        assert any("DELETE FROM transaction_labels" in s for s in sql)
+        assert "DROP TABLE transactions_p2025_01" in sql
+        assert "DROP TABLE transactions_p2025_02" in sql
+
+    async def test_detach_clears_transaction_children(self):
+        db = AsyncMock()
+        with patch.object(
+            PartitionMaintenanceService,
+            "list_partitions",
+            AsyncMock(return_value=self._partitions()[:1]),
+        ):
+            await PartitionMaintenanceService.retire_partitions_before(
+                db, "transactions", date(2025, 3, 1), action="detach", dry_run=False
+            )
+
+        sql = _executed_sql(db)
+        assert sql == [
+            f"DELETE FROM {child} WHERE {column} IN (SELECT id FROM transactions_p2025_01)"
+            for child, column in TRANSACTION_CHILD_TABLES.items()
+        ] + [
+            "ALTER TABLE transactions DETACH PARTITION transactions_p2025_01",
+            "DELETE FROM transaction_counts WHERE month >= :lower AND month < :upper",
+        ]
+        assert not any(s.startswith("DROP TABLE") for s in sql)
+
+    async def test_invalid_action_rejected(self):
+        with pytest.raises(ValueError, match="action"):
+            await PartitionMaintenanceService.retire_partitions_before(
+                AsyncMock(), "transactions", date(2025, 3, 1), action="truncate"
+            )
+
+
+@pytest.mark.asyncio
+class TestRetentionPartitionMode:
+    async def test_skips_unpartitioned_tables_and_audit_when_indefinite(self):
+        db = MagicMock()
+        retire = AsyncMock(return_value=[])
+        with (
+            patch.object(
+                PartitionMaintenanceService,
+                "is_partitioned",
+                AsyncMock(side_effect=lambda _db, t: t != "notifications"),
+            ),
+            patch.object(PartitionMaintenanceService, "retire_partitions_before", retire),
+        ):
+            result = await DataRetentionService.retire_expired_partitions(
+                db, 90, action="drop", dry_run=False
+            )
+
+        assert set(result) == {"transactions", "net_worth_snapshots"}
+        tables = [c.args[1] for c in retire.call_args_list]
+        assert "audit_logs" not in tables
+
+
+class TestTransactionChildCleanup:
+    def test_migration_and_service_cover_same_child_tables(self):
+        assert dict(_load_r81()._TRANSACTION_CHILD_FKS) == TRANSACTION_CHILD_TABLES
+
+    def test_delete_trigger_clears_every_child_table(self):
+        r81 = _load_r81()
+        with patch.object(r81, "op") as op:
+            r81._create_child_delete_trigger()
+        sql = [str(c.args[0]) for c in op.execute.call_args_list]
+
+        for child, column in TRANSACTION_CHILD_TABLES.items():
+            assert f"DELETE FROM {child} WHERE {column} = OLD.id;" in sql[0]
+        assert any("AFTER DELETE ON transactions" in s and "FOR EACH ROW" in s for s in sql)
+
+    @pytest.mark.asyncio
+    async def test_deleting_transaction_removes_labels_and_splits(
+        self, db_session, test_user, test_account
+    ):
+        org_id = test_user.organization_id
+        txn = Transaction(
+            organization_id=org_id,
+            account_id=test_account.id,
+            date=date(2026, 3, 5),
+            amount=Decimal("-40.00"),
+            merchant_name="Grocer",
+            deduplication_hash=str(uuid4()),
+        )
+        label = Label(organization_id=org_id, name="Groceries")
+        db_session.add_all([txn, label])
+        await db_session.flush()
+        db_session.add_all(
+            [
+                TransactionLabel(transaction_id=txn.id, label_id=label.id),
+                TransactionSplit(
+                    parent_transaction_id=txn.id, organization_id=org_id, amount=Decimal("-40.00")
+                ),
+            ]
+        )
+        await db_session.commit()
+        txn_id = txn.id
+        db_session.expunge_all()
+
+        await db_session.execute(delete(Transaction).where(Transaction.id == txn_id))
+        await db_session.commit()
+
+        labels = await db_session.scalar(
+            select(func.count())
+            .select_from(TransactionLabel)
+            .where(TransactionLabel.transaction_id == txn_id)
+        )
+        splits = await db_session.scalar(
+            select(func.count())
+            .select_from(TransactionSplit)
+            .where(TransactionSplit.parent_transaction_id == txn_id)
+        )
+        assert labels == 0
+        assert splits == 0
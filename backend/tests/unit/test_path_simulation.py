@@ -0,0 +1,101 @@
+"""Unit tests for the vectorized Monte Carlo path-simulation kernel."""
+
+import numpy as np
+import pytest
+
+from app.services.retirement.path_simulation import (
+    generate_normal_returns,
+    nearest_rank,
+    simulate_paths,
+    summarize_paths,
+)
+
+
+def _scalar_path(balance, spending, returns, inflation, income=None):
+    """Reference scalar loop mirroring the original per-path implementation."""
+    path = [balance]
+    depleted = False
+    for year, r in enumerate(returns, start=1):
+        if depleted:
+            path.append(0.0)
+            continue
+        offset = income[year - 1] if income is not None else 0.0
+        balance = max(balance * (1 + r) - max(spending - offset, 0.0), 0.0)
+        spending *= 1 + inflation
+        if balance <= 0:
+            depleted = True
+        path.append(balance)
+    return path
+
+
+@pytest.mark.unit
+class TestSimulatePaths:
+    def test_matches_scalar_reference(self):
+        rng = np.random.default_rng(7)
+        returns = generate_normal_returns(50, 30, 0.05, 0.15, rng=rng)
+        income = np.where(np.arange(30) >= 5, 10_000.0, 0.0)
+
+        sim = simulate_paths(500_000, 40_000, returns, 0.03, income=income)
+
+        for i in range(50):
+            expected = _scalar_path(500_000, 40_000, returns[i], 0.03, income)
+            assert sim.balances[i] == pytest.approx(expected)
+
+    def test_depleted_paths_stay_at_zero(self):
+        returns = np.full((3, 10), -0.50)
+        sim = simulate_paths(100_000, 50_000, returns, 0.0)
+
+        assert sim.depleted.all()
+        assert sim.success_rate == 0.0
+        first = int(sim.depletion_year[0])
+        assert (sim.balances[:, first:] == 0).all()
+
+    def test_no_depletion_reports_full_success(self):
+        returns = np.full((4, 5), 0.10)
+        sim = simulate_paths(1_000_000, 10_000, returns, 0.02)
+
+        assert sim.success_rate == 1.0
+        assert (sim.depletion_year == 6).all()
+
+    def test_spending_rule_only_updates_live_paths(self):
+        returns = np.array([[-1.0, 0.05, 0.05], [0.05, 0.05, 0.05]])
+        seen = []
+
+        def rule(year, balances, spending, alive):
+            seen.append(alive.copy())
+            return spending * 2
+
+        sim = simulate_paths(100_000, 1_000, returns, 0.0, spending_rule=rule)
+
+        assert seen[1].tolist() == [False, True]
+        # Path 0 depleted in year 1 so its spending froze at the doubled value
+        assert sim.withdrawals[0].tolist() == [2_000, 2_000, 2_000]
+        assert sim.withdrawals[1].tolist() == [2_000, 4_000, 8_000]
+
+    def test_income_shape_validated(self):
+        with pytest.raises(ValueError, match="income"):
+            simulate_paths(1_000, 100, np.zeros((2, 3)), 0.0, income=np.zeros(2))
+
+    def test_median_path_index_uses_final_balance(self):
+        returns = np.array([[0.10], [-0.10], [0.00]])
+        sim = simulate_paths(100, 0, returns, 0.0)
+        assert sim.median_path_index() == 2
+
+
+@pytest.mark.unit
+class TestSummarizePaths:
+    def test_nearest_rank_percentiles(self):
+        balances = np.arange(10, dtype=float).reshape(10, 1)
+        summary = summarize_paths(balances, quantiles=(0.10, 0.50, 0.90))
+
+        assert summary.percentiles[0.10][0] == 1.0
+        assert summary.percentiles[0.50][0] == 5.0
+        assert summary.percentiles[0.90][0] == 9.0
+        assert nearest_rank(balances[:, 0], 0.50) == 5.0
+
+    def test_pct_depleted_and_mean(self):
+        balances = np.array([[100.0, 0.0], [100.0, 50.0]])
+        summary = summarize_paths(balances)
+
+        assert summary.mean.tolist() == [100.0, 25.0]
+        assert summary.pct_depleted.tolist() == [0.0, 0.5]
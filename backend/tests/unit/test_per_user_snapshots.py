@@ -145,6 +145,7 @@ class TestCaptureSnapshotUserParam:
         mock_snapshot.total_value = Decimal("50000")
         mock_result = Mock()
         mock_result.scalar_one.return_value = mock_snapshot
+        mock_result.first.return_value = None  # No keyframe yet this month
         mock_db.execute.return_value = mock_result
 
         result = await service.capture_snapshot(
@@ -166,6 +167,7 @@ class TestCaptureSnapshotUserParam:
         mock_snapshot.total_value = Decimal("50000")
         mock_result = Mock()
         mock_result.scalar_one.return_value = mock_snapshot
+        mock_result.first.return_value = None  # No keyframe yet this month
         mock_db.execute.return_value = mock_result
 
         result = await service.capture_snapshot(
@@ -187,6 +189,7 @@ class TestCaptureSnapshotUserParam:
         mock_snapshot.total_value = Decimal("50000")
         mock_result = Mock()
         mock_result.scalar_one.return_value = mock_snapshot
+        mock_result.first.return_value = None  # No keyframe yet this month
         mock_db.execute.return_value = mock_result
 
         result = await service.capture_snapshot(
@@ -219,12 +222,12 @@ class TestHistoricalSnapshotsEndpointUserFilter:
 
     @pytest.mark.asyncio
     async def test_passes_user_id_to_service(self, mock_db, mock_user):
-        """When user_id is given, it should be passed to get_snapshots."""
+        """When user_id is given, it should be passed to get_snapshot_series."""
         uid = uuid4()
 
         with (
             patch(
-                "app.api.v1.holdings.snapshot_service.get_snapshots",
+                "app.api.v1.holdings.snapshot_service.get_snapshot_series",
                 return_value=[],
             ) as mock_get,
             patch(
@@ -237,6 +240,8 @@ class TestHistoricalSnapshotsEndpointUserFilter:
                 end_date=None,
                 limit=None,
                 user_id=uid,
+                resolution="auto",
+                max_points=None,
                 current_user=mock_user,
                 db=mock_db,
             )
@@ -249,13 +254,15 @@ class TestHistoricalSnapshotsEndpointUserFilter:
                 end_date=None,
                 limit=None,
                 user_id=uid,
+                resolution="auto",
+                max_points=None,
             )
 
     @pytest.mark.asyncio
     async def test_household_when_user_id_none(self, mock_db, mock_user):
         """When user_id is None, should pass None to service."""
         with patch(
-            "app.api.v1.holdings.snapshot_service.get_snapshots",
+            "app.api.v1.holdings.snapshot_service.get_snapshot_series",
             return_value=[],
         ) as mock_get:
             await get_historical_snapshots(
@@ -263,6 +270,8 @@ class TestHistoricalSnapshotsEndpointUserFilter:
                 end_date=None,
                 limit=None,
                 user_id=None,
+                resolution="auto",
+                max_points=None,
                 current_user=mock_user,
                 db=mock_db,
             )
@@ -277,7 +286,7 @@ class TestHistoricalSnapshotsEndpointUserFilter:
 
         with (
             patch(
-                "app.api.v1.holdings.snapshot_service.get_snapshots",
+                "app.api.v1.holdings.snapshot_service.get_snapshot_series",
                 return_value=[],
             ),
             patch(
@@ -290,6 +299,8 @@ class TestHistoricalSnapshotsEndpointUserFilter:
                 end_date=None,
                 limit=None,
                 user_id=uid,
+                resolution="auto",
+                max_points=None,
                 current_user=mock_user,
                 db=mock_db,
             )
@@ -303,7 +314,7 @@ class TestHistoricalSnapshotsEndpointUserFilter:
         """Should NOT call verify_household_member when user_id is None."""
         with (
             patch(
-                "app.api.v1.holdings.snapshot_service.get_snapshots",
+                "app.api.v1.holdings.snapshot_service.get_snapshot_series",
                 return_value=[],
             ),
             patch(
@@ -316,6 +327,8 @@ class TestHistoricalSnapshotsEndpointUserFilter:
                 end_date=None,
                 limit=None,
                 user_id=None,
+                resolution="auto",
+                max_points=None,
                 current_user=mock_user,
                 db=mock_db,
             )
@@ -326,7 +339,7 @@ class TestHistoricalSnapshotsEndpointUserFilter:
     async def test_defaults_start_date_when_none(self, mock_db, mock_user):
         """Should default to 1 year ago when start_date is None."""
         with patch(
-            "app.api.v1.holdings.snapshot_service.get_snapshots",
+            "app.api.v1.holdings.snapshot_service.get_snapshot_series",
             return_value=[],
         ) as mock_get:
             await get_historical_snapshots(
@@ -334,6 +347,8 @@ class TestHistoricalSnapshotsEndpointUserFilter:
                 end_date=None,
                 limit=None,
                 user_id=None,
+                resolution="auto",
+                max_points=None,
                 current_user=mock_user,
                 db=mock_db,
             )
@@ -0,0 +1,160 @@
+"""Tests for the vectorized XIRR / TWR / MWR kernels and their consumers."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.models.account import Account, AccountType
+from app.models.portfolio_snapshot import PortfolioSnapshot
+from app.models.transaction import Transaction
+from app.services.enhanced_trends_service import EnhancedTrendsService
+from app.services.pe_performance_service import compute_pe_metrics, compute_pe_metrics_many
+from app.services.performance_returns import (
+    annualize,
+    money_weighted_return,
+    time_weighted_return,
+    xirr,
+    xirr_many,
+)
+
+
+def _npv(flows, rate):
+    base = flows[0][0]
+    return sum(amount / (1 + rate) ** ((d - base).days / 365.25) for d, amount in flows)
+
+
+class TestXirr:
+    def test_single_period(self):
+        # 10% over exactly 366 days, annualized on a 365.25-day year
+        assert xirr([(date(2024, 1, 1), -100), (date(2025, 1, 1), 110)]) == pytest.approx(
+            0.0998, abs=1e-3
+        )
+
+    def test_root_zeroes_npv(self):
+        flows = [
+            (date(2020, 1, 1), -50_000),
+            (date(2020, 9, 1), -25_000),
+            (date(2022, 3, 15), 10_000),
+            (date(2024, 6, 30), 95_000),
+        ]
+        rate = xirr(flows)
+        assert abs(_npv(flows, rate)) < 1.0
+
+    def test_extreme_rates_are_bracketed(self):
+        # Doubling in a month (~4700% annualized) and a near-total loss both solve
+        boom = [(date(2024, 1, 1), -100), (date(2024, 1, 31), 200)]
+        bust = [(date(2024, 1, 1), -100), (date(2025, 1, 1), 1)]
+        assert abs(_npv(boom, xirr(boom))) < 1e-3
+        assert xirr(bust) == pytest.approx(-0.99, abs=1e-3)
+
+    def test_no_sign_change_has_no_irr(self):
+        assert xirr([(date(2024, 1, 1), -100), (date(2024, 6, 1), -50)]) is None
+        assert xirr([(date(2024, 1, 1), 100)]) is None
+        assert xirr([]) is None
+
+    def test_batch_matches_single(self):
+        series = [
+            [(date(2023, 1, 1), -100), (date(2024, 1, 1), 120)],
+            [(date(2024, 1, 1), 100)],
+            [(date(2021, 5, 1), -10), (date(2022, 5, 1), -10), (date(2024, 5, 1), 25)],
+        ]
+        assert xirr_many(series) == [xirr(flows) for flows in series]
+        assert xirr_many(series)[1] is None
+
+    def test_unordered_flows(self):
+        ordered = [(date(2023, 1, 1), -100), (date(2023, 6, 1), -50), (date(2024, 1, 1), 170)]
+        assert xirr(list(reversed(ordered))) == xirr(ordered)
+
+
+class TestPeriodReturns:
+    VALUATIONS = [(date(2024, 1, 1), 100.0), (date(2024, 7, 1), 160.0), (date(2025, 1, 1), 176.0)]
+
+    def test_twr_strips_contributions(self):
+        # +10% before a 50 contribution, +10% after it
+        flows = [(date(2024, 6, 1), 50.0)]
+        assert time_weighted_return(self.VALUATIONS, flows) == pytest.approx(0.21)
+
+    def test_twr_ignores_flows_outside_window(self):
+        flows = [(date(2023, 6, 1), 999.0), (date(2025, 6, 1), 999.0)]
+        assert time_weighted_return(self.VALUATIONS, flows) == pytest.approx(0.76)
+
+    def test_twr_needs_two_valuations(self):
+        assert time_weighted_return(self.VALUATIONS[:1]) is None
+
+    def test_mwr_without_flows_is_xirr(self):
+        valuations = [(date(2024, 1, 1), 100.0), (date(2025, 1, 1), 110.0)]
+        assert money_weighted_return(valuations) == xirr(
+            [(date(2024, 1, 1), -100.0), (date(2025, 1, 1), 110.0)]
+        )
+
+    def test_annualize(self):
+        assert annualize(0.21, 730) == pytest.approx(1.21 ** (365.25 / 730) - 1)
+        assert annualize(0.05, 90) == 0.05
+        assert annualize(None, 400) is None
+
+
+class TestPeMetricsMany:
+    def test_matches_per_account(self):
+        fund_a = [
+            {"type": "capital_call", "amount": Decimal("100000"), "date": date(2021, 1, 1)},
+            {"type": "distribution", "amount": Decimal("30000"), "date": date(2023, 1, 1)},
+        ]
+        fund_b = [{"type": "nav_update", "amount": Decimal("5"), "date": date(2022, 1, 1)}]
+        nav_date = date(2025, 1, 1)
+
+        batch = compute_pe_metrics_many(
+            [(fund_a, Decimal("110000")), (fund_b, Decimal("0"))], nav_date
+        )
+        assert batch[0] == compute_pe_metrics(fund_a, Decimal("110000"), nav_date)
+        assert batch[0]["irr"] > 0
+        assert batch[1]["irr"] is None
+        assert batch[1]["tvpi"] == 0.0
+
+
+@pytest.mark.asyncio
+class TestInvestmentPeriodReturns:
+    async def test_twr_and_mwr_from_snapshots(self, db_session, test_user):
+        org_id = test_user.organization_id
+        brokerage = Account(
+            id=uuid4(),
+            organization_id=org_id,
+            user_id=test_user.id,
+            name="Brokerage",
+            account_type=AccountType.BROKERAGE,
+            current_balance=Decimal("0"),
+            is_active=True,
+        )
+        db_session.add(brokerage)
+        start = date.today() - timedelta(days=200)
+        for offset, value in ((0, "100"), (100, "160"), (200, "176")):
+            db_session.add(
+                PortfolioSnapshot(
+                    organization_id=org_id,
+                    snapshot_date=start + timedelta(days=offset),
+                    total_value=Decimal(value),
+                )
+            )
+        db_session.add(
+            Transaction(
+                id=uuid4(),
+                organization_id=org_id,
+                account_id=brokerage.id,
+                date=start + timedelta(days=50),
+                amount=Decimal("50"),
+                merchant_name="Transfer from checking",
+                is_transfer=True,
+                deduplication_hash=str(uuid4()),
+            )
+        )
+        await db_session.flush()
+
+        result = await EnhancedTrendsService(db_session).get_investment_performance(
+            org_id, start_date=start
+        )
+        returns = result["period_returns"]
+        assert returns["snapshot_count"] == 3
+        assert returns["net_contributions"] == 50.0
+        assert returns["twr_pct"] == pytest.approx(21.0)
+        assert returns["mwr_pct"] is not None
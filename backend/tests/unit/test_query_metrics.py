@@ -0,0 +1,136 @@
+"""Tests for SQL statement metrics and per-request N+1 detection."""
+
+import logging
+
+import pytest
+import pytest_asyncio
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.metrics import MetricsMiddleware
+from app.core.query_metrics import (
+    RepeatedQueryError,
+    fingerprint,
+    install_query_instrumentation,
+    query_type,
+    track_queries,
+)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    eng = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    install_query_instrumentation(eng)
+    async with eng.begin() as conn:
+        await conn.execute(text("CREATE TABLE widgets (id INTEGER PRIMARY KEY, name TEXT)"))
+    yield eng
+    await eng.dispose()
+
+
+def _observations(label):
+    return REGISTRY.get_sample_value("db_query_duration_seconds_count", {"query_type": label}) or 0
+
+
+class TestFingerprint:
+    def test_values_and_in_lists_collapse(self):
+        a = fingerprint("SELECT * FROM t WHERE id IN ($1, $2) AND name = 'x' LIMIT 10")
+        b = fingerprint("select *  from t\nwhere id in ($1, $2, $3, $4) and name = 'y' limit 5")
+        assert a == b == "select * from t where id in (?+) and name = ? limit ?"
+
+    def test_casts_are_not_bind_markers(self):
+        assert fingerprint("SELECT x::date FROM t WHERE a = :p_1") == (
+            "select x::date from t where a = ?"
+        )
+
+    @pytest.mark.parametrize(
+        "statement,label",
+        [
+            ("SELECT a.id FROM transactions AS a", "select transactions"),
+            ('UPDATE "notifications" SET is_read=$1', "update notifications"),
+            ("INSERT INTO holdings (id) VALUES (?)", "insert holdings"),
+            ("DELETE FROM accounts WHERE id = ?", "delete accounts"),
+            ("SELECT count(*) FROM (SELECT 1 FROM budgets) AS anon_1", "select budgets"),
+            ("SAVEPOINT sa_1", "savepoint"),
+        ],
+    )
+    def test_query_type_label(self, statement, label):
+        assert query_type(statement) == label
+
+
+@pytest.mark.asyncio
+class TestInstrumentation:
+    async def test_statements_are_timed(self, engine):
+        before = _observations("select widgets")
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM widgets"))
+            await conn.execute(text("SELECT name FROM widgets"))
+        assert _observations("select widgets") == before + 2
+
+    async def test_install_is_idempotent(self, engine):
+        install_query_instrumentation(engine)
+        before = _observations("select widgets")
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT id FROM widgets"))
+        assert _observations("select widgets") == before + 1
+
+    async def test_repeated_statement_raises_when_configured(self, engine):
+        with pytest.raises(RepeatedQueryError, match="ran 4 times"):
+            with track_queries("GET /widgets", threshold=3, raise_on_repeat=True):
+                async with engine.connect() as conn:
+                    for i in range(4):
+                        await conn.execute(
+                            text("SELECT name FROM widgets WHERE id = :id"), {"id": i}
+                        )
+
+    async def test_repeated_statement_logs_by_default(self, engine, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.core.query_metrics"):
+            with track_queries("GET /widgets", threshold=2, raise_on_repeat=False) as stats:
+                async with engine.connect() as conn:
+                    for i in range(3):
+                        await conn.execute(
+                            text("SELECT name FROM widgets WHERE id = :id"), {"id": i}
+                        )
+                    await conn.execute(text("SELECT count(*) FROM widgets"))
+
+        assert stats.total == 4
+        assert "Possible N+1 in GET /widgets" in caplog.text
+
+    async def test_distinct_statements_under_threshold_pass(self, engine):
+        with track_queries("GET /widgets", threshold=2, raise_on_repeat=True) as stats:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT id FROM widgets"))
+                await conn.execute(text("SELECT name FROM widgets"))
+        assert stats.total == 2
+
+
+@pytest.mark.asyncio
+class TestMetricsMiddleware:
+    async def _call(self, engine, headers):
+        async def app(scope, receive, send):
+            async with engine.connect() as conn:
+                for i in range(5):
+                    await conn.execute(text("SELECT name FROM widgets WHERE id = :id"), {"id": i})
+
+        scope = {"type": "http", "method": "GET", "path": "/widgets", "headers": headers}
+        await MetricsMiddleware(app)(scope, None, None)
+
+    async def test_flags_n_plus_one_per_request(self, engine, monkeypatch):
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "DB_N_PLUS_ONE_THRESHOLD", 3)
+        monkeypatch.setattr(settings, "DB_N_PLUS_ONE_RAISE", True)
+        with pytest.raises(RepeatedQueryError, match="GET /widgets"):
+            await self._call(engine, [])
+
+    async def test_event_streams_are_not_tracked(self, engine, monkeypatch):
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "DB_N_PLUS_ONE_THRESHOLD", 3)
+        monkeypatch.setattr(settings, "DB_N_PLUS_ONE_RAISE", True)
+        await self._call(engine, [(b"accept", b"text/event-stream")])
@@ -47,6 +47,11 @@ def _mock_account_row(name="Chase Checking", total=500, count=20):
     return row
 
 
+async def _rows(rows):
+    for row in rows:
+        yield row
+
+
 # ── _parse_date_range (additional branches) ──────────────────────────────────
 
 
@@ -478,22 +483,12 @@ class TestGenerateExportCSV:
         result_mock.scalar_one_or_none.return_value = template
         mock_db.execute.return_value = result_mock
 
-        report_data = {
-            "data": [
-                {"name": "Food", "amount": 100.0, "count": 5},
-                {"name": "Travel", "amount": 200.0, "count": 3},
-            ],
-            "metrics": {},
-            "config": {},
-            "dateRange": {},
-        }
+        rows = [
+            {"name": "Food", "amount": 100.0, "count": 5},
+            {"name": "Travel", "amount": 200.0, "count": 3},
+        ]
 
-        with patch.object(
-            ReportService,
-            "execute_report",
-            new_callable=AsyncMock,
-            return_value=report_data,
-        ):
+        with patch.object(ReportService, "stream_report_rows", return_value=_rows(rows)):
             csv_str = await ReportService.generate_export_csv(mock_db, uuid4(), uuid4())
 
         assert "name" in csv_str
@@ -511,12 +506,7 @@ class TestGenerateExportCSV:
         result_mock.scalar_one_or_none.return_value = template
         mock_db.execute.return_value = result_mock
 
-        with patch.object(
-            ReportService,
-            "execute_report",
-            new_callable=AsyncMock,
-            return_value={"data": [], "metrics": {}, "config": {}, "dateRange": {}},
-        ):
+        with patch.object(ReportService, "stream_report_rows", return_value=_rows([])):
             csv_str = await ReportService.generate_export_csv(mock_db, uuid4(), uuid4())
 
         assert csv_str == ""
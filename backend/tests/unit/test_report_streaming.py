@@ -0,0 +1,207 @@
+"""Tests for streamed report exports and deduplicated scheduled report runs."""
+
+import gzip
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.report_template import ReportTemplate
+from app.models.transaction import Transaction
+from app.services import report_service
+from app.services.bulk_email_service import DeliveryResult, DeliveryStatus, DispatchReport
+from app.services.report_service import ReportService, gzip_chunks
+
+
+async def _rows(rows):
+    for row in rows:
+        yield row
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.fixture
+async def transactions(db_session, test_account):
+    today = date.today()
+    spend = [
+        ("Groceries", "Market", "-120.00"),
+        ("Groceries", "Market", "-80.00"),
+        ("Dining", "Bistro", "-60.00"),
+        ("Travel", "Airline", "-440.00"),
+        ("Income", "Employer", "2500.00"),
+    ]
+    db_session.add_all(
+        Transaction(
+            organization_id=test_account.organization_id,
+            account_id=test_account.id,
+            date=today - timedelta(days=i + 1),
+            amount=Decimal(amount),
+            merchant_name=merchant,
+            category_primary=category,
+            deduplication_hash=f"hash-{i}",
+        )
+        for i, (category, merchant, amount) in enumerate(spend)
+    )
+    await db_session.commit()
+    return test_account
+
+
+@pytest.mark.asyncio
+class TestStreamReportRows:
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"groupBy": "category", "filters": {"transactionType": "expense"}},
+            {"groupBy": "category", "sortBy": "count", "sortDirection": "asc", "limit": 2},
+            {"groupBy": "merchant"},
+            {"groupBy": "account"},
+        ],
+    )
+    async def test_matches_execute_report(self, db_session, transactions, config):
+        org_id = transactions.organization_id
+
+        expected = await ReportService.execute_report(db_session, org_id, config)
+        streamed = await _collect(ReportService.stream_report_rows(db_session, org_id, config))
+
+        assert streamed == pytest.approx(expected["data"])
+
+    async def test_category_shares_cover_limited_rows(self, db_session, transactions):
+        config = {"groupBy": "category", "filters": {"transactionType": "expense"}, "limit": 2}
+        rows = await _collect(
+            ReportService.stream_report_rows(db_session, transactions.organization_id, config)
+        )
+        assert [r["name"] for r in rows] == ["Travel", "Groceries"]
+        assert sum(r["percentage"] for r in rows) == pytest.approx(100.0)
+
+    async def test_unknown_grouping_streams_nothing(self, db_session, transactions):
+        rows = await _collect(
+            ReportService.stream_report_rows(
+                db_session, transactions.organization_id, {"groupBy": "unknown"}
+            )
+        )
+        assert rows == []
+
+
+@pytest.mark.asyncio
+class TestCsvStream:
+    async def test_chunks_and_header(self):
+        rows = [{"name": f"m{i}", "amount": float(i)} for i in range(5)]
+        with patch.object(report_service, "CSV_CHUNK_ROWS", 2):
+            chunks = await _collect(report_service._csv_chunks(_rows(rows)))
+
+        assert len(chunks) == 3
+        lines = "".join(chunks).splitlines()
+        assert lines[0] == "name,amount" and lines[-1] == "m4,4.0"
+
+    async def test_formula_cells_sanitized(self):
+        chunks = await _collect(report_service._csv_chunks(_rows([{"name": "=HYPERLINK()"}])))
+        assert "'=HYPERLINK()" in "".join(chunks)
+
+    async def test_gzip_round_trip(self):
+        rows = [{"name": "Food", "amount": 1.5}] * 3000
+        body = b"".join(await _collect(gzip_chunks(report_service._csv_chunks(_rows(rows)))))
+        text = gzip.decompress(body).decode()
+        assert text.count("Food,1.5") == 3000
+
+    async def test_export_stream_reads_rows_in_own_session(
+        self, db_session, test_user, transactions
+    ):
+        template = ReportTemplate(
+            organization_id=test_user.organization_id,
+            name="Spending",
+            report_type="category",
+            config={"groupBy": "category"},
+            created_by_user_id=test_user.id,
+        )
+        db_session.add(template)
+        await db_session.commit()
+        opened = []
+
+        @asynccontextmanager
+        async def session_factory():
+            opened.append(True)
+            yield db_session
+
+        chunks = await ReportService.open_export_stream(
+            db_session, test_user.organization_id, template.id, session_factory=session_factory
+        )
+        assert opened == []  # nothing is read until the response body is sent
+        text = "".join(await _collect(chunks))
+
+        assert opened == [True]
+        assert text.splitlines()[0].startswith("name,")
+        assert "Travel" in text
+
+    async def test_export_stream_checks_template_first(self, db_session, test_user):
+        with pytest.raises(ValueError, match="not found"):
+            await ReportService.open_export_stream(db_session, test_user.organization_id, uuid4())
+
+
+class TestExecutionKey:
+    def test_same_execution_same_key(self):
+        org_id = uuid4()
+        a = {"groupBy": "merchant", "dateRange": {"type": "preset", "preset": "this_year"}}
+        b = {"dateRange": {"preset": "this_year", "type": "preset"}, "groupBy": "merchant"}
+        assert ReportService.execution_key(org_id, a) == ReportService.execution_key(org_id, b)
+
+    def test_scope_and_period_change_key(self):
+        org_id = uuid4()
+        config = {"groupBy": "merchant"}
+        key = ReportService.execution_key(org_id, config)
+        assert key != ReportService.execution_key(uuid4(), config)
+        assert key != ReportService.execution_key(org_id, config, user_id=uuid4())
+        assert key != ReportService.execution_key(
+            org_id, {**config, "dateRange": {"type": "preset", "preset": "last_year"}}
+        )
+
+
+@pytest.mark.asyncio
+async def test_scheduled_reports_run_identical_executions_once():
+    from app.workers.tasks import report_tasks
+
+    org_id = uuid4()
+    shared_config = {"groupBy": "category", "dateRange": {"type": "preset", "preset": "this_month"}}
+
+    def template(config):
+        t = Mock()
+        t.id = uuid4()
+        t.name = "Spending"
+        t.organization_id = org_id
+        t.config = config
+        t.scheduled_delivery = {
+            "enabled": True,
+            "frequency": "daily",
+            "delivery_emails": ["a@example.com"],
+        }
+        return t
+
+    templates = [template(shared_config), template(dict(shared_config)), template({})]
+    db = AsyncMock()
+    db.execute.return_value = Mock()
+    db.execute.return_value.scalars.return_value.all.return_value = templates
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    async def dispatch(emails):
+        return DispatchReport(results=[DeliveryResult(e, DeliveryStatus.SENT) for e in emails])
+
+    result = {"data": [], "metrics": {}, "config": {}, "dateRange": {}}
+    with (
+        patch("app.workers.utils.get_celery_session", session),
+        patch.object(ReportService, "execute_report", AsyncMock(return_value=result)) as execute,
+        patch(
+            "app.services.bulk_email_service.BulkEmailDispatcher.dispatch",
+            side_effect=dispatch,
+        ),
+    ):
+        await report_tasks._send_scheduled_reports_async()
+
+    assert execute.await_count == 2
+    assert all(t.scheduled_delivery["last_delivered_at"] for t in templates)
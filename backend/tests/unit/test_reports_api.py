@@ -24,6 +24,7 @@ from app.api.v1.reports import (
     list_report_templates,
     update_report_template,
 )
+from app.core.database import AsyncSessionLocal
 from app.models.account import AccountType
 from app.models.user import User
 
@@ -56,6 +57,11 @@ def _make_template(user, *, is_shared=False, creator_id=None):
     return template
 
 
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
 def _db_returning(obj):
     db = AsyncMock()
     result = Mock()
@@ -526,9 +532,9 @@ class TestExportReportCsv:
                 return_value=[mock_acc],
             ):
                 with patch(
-                    "app.api.v1.reports.ReportService.generate_export_csv",
+                    "app.api.v1.reports.ReportService.open_export_stream",
                     new_callable=AsyncMock,
-                    return_value="Date,Amount\n2024-01-01,100",
+                    return_value=_chunks("Date,Amount\n2024-01-01,100"),
                 ):
                     result = await export_report_csv(
                         http_request=MagicMock(),
@@ -574,6 +580,42 @@ class TestExportReportCsv:
 
         assert exc_info.value.status_code == 403
 
+    @pytest.mark.asyncio
+    async def test_export_csv_compressed(self):
+        import gzip
+
+        user = _make_user()
+        template = _make_template(user)
+        db = _db_returning(template)
+
+        with patch(
+            "app.api.v1.reports.get_filtered_accounts",
+            new_callable=AsyncMock,
+            return_value=[],
+        ):
+            with patch(
+                "app.api.v1.reports.ReportService.open_export_stream",
+                new_callable=AsyncMock,
+                return_value=_chunks("name,amount\r\n", "Food,100.0\r\n"),
+            ) as open_stream:
+                result = await export_report_csv(
+                    http_request=MagicMock(),
+                    template_id=template.id,
+                    user_id=None,
+                    user_ids=None,
+                    compress=True,
+                    current_user=user,
+                    db=db,
+                )
+
+        assert result.media_type == "application/gzip"
+        assert 'monthly_report_report.csv.gz"' in result.headers["content-disposition"]
+        body = b"".join([chunk async for chunk in result.body_iterator])
+        assert gzip.decompress(body) == b"name,amount\r\nFood,100.0\r\n"
+        # Rows are read in the stream's own session; the request session is released
+        assert open_stream.call_args.kwargs["session_factory"] is AsyncSessionLocal
+        db.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_export_csv_value_error_raises_404(self):
         user = _make_user()
@@ -592,7 +634,7 @@ class TestExportReportCsv:
                 return_value=[mock_acc],
             ):
                 with patch(
-                    "app.api.v1.reports.ReportService.generate_export_csv",
+                    "app.api.v1.reports.ReportService.open_export_stream",
                     new_callable=AsyncMock,
                     side_effect=ValueError("Not found"),
                 ):
@@ -8,10 +8,12 @@ Tests cover:
 - RMD calculation and effect on headroom
 - Married vs single filing status
 - Edge cases: zero balances, very high income
+- Vectorized tax kernel and the lifetime-tax schedule search
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from app.services.roth_conversion_service import (
@@ -19,7 +21,9 @@ from app.services.roth_conversion_service import (
     RothConversionResult,
     RothConversionService,
     RothConversionYear,
+    TaxKernel,
     _bracket_headroom,
+    _bracket_tax,
     _get_brackets,
     _irmaa_headroom,
     _marginal_rate,
@@ -454,3 +458,105 @@ class TestRothConversionFilingStatus:
         single = self._svc().optimize(RothConversionInput(**base_kwargs, filing_status="single"))
         married = self._svc().optimize(RothConversionInput(**base_kwargs, filing_status="married"))
         assert married.total_converted >= single.total_converted
+
+
+# ── Vectorized kernel ──────────────────────────────────────────────────────
+
+
+class TestTaxKernel:
+    @pytest.mark.parametrize("filing_status", ["single", "married"])
+    def test_matches_scalar_helpers(self, filing_status):
+        kernel = TaxKernel(filing_status)
+        incomes = np.linspace(0, 900_000, 301)
+        years = np.arange(301) % 25
+
+        taxes = kernel.income_tax(incomes, years)
+        rates = kernel.marginal_rate(incomes, years)
+
+        for income, year, tax, rate in zip(incomes, years, taxes, rates):
+            brackets = _get_brackets(filing_status, int(year))
+            assert tax == pytest.approx(_bracket_tax(income, brackets), abs=1e-6)
+            assert rate == _marginal_rate(income, brackets)
+
+    def test_broadcasts_incomes_by_years(self):
+        kernel = TaxKernel("single")
+        grid = kernel.income_tax(np.array([[50_000.0], [150_000.0]]), np.arange(3))
+        assert grid.shape == (2, 3)
+        # Same income is taxed less as brackets inflate
+        assert np.all(np.diff(grid, axis=1) < 0)
+
+    def test_irmaa_consistent_with_headroom(self):
+        kernel = TaxKernel("single")
+        magi = 80_000.0
+        headroom = _irmaa_headroom(magi, 4)
+        assert kernel.irmaa_surcharge(magi + headroom, 4) == 0.0
+        assert kernel.irmaa_surcharge(magi + headroom + 1, 4) > 0.0
+
+    def test_rmd_matches_scalar(self):
+        kernel = TaxKernel("single")
+        ages = np.array([60, 72, 73, 90, 125])
+        expected = [_rmd_amount(400_000, int(a)) for a in ages]
+        assert kernel.rmd(400_000.0, ages) == pytest.approx(expected)
+
+
+class TestLifetimeTaxOptimizer:
+    def _inp(self, **overrides):
+        kwargs = dict(
+            traditional_balance=1_500_000,
+            roth_balance=50_000,
+            current_income=60_000,
+            current_age=60,
+            years_to_project=30,
+        )
+        kwargs.update(overrides)
+        return RothConversionInput(**kwargs)
+
+    def _lifetime_tax(self, inp, conversions):
+        svc = RothConversionService()
+        schedule = np.array([conversions], dtype=float)
+        lifetime, _ = svc._simulate(
+            TaxKernel(inp.filing_status), inp, schedule, np.full_like(schedule, -np.inf)
+        )
+        return float(lifetime[0])
+
+    def test_beats_greedy_and_no_conversion(self):
+        inp = self._inp()
+        svc = RothConversionService()
+        result = svc.optimize_lifetime_tax(inp)
+        greedy = [y.optimal_conversion for y in svc.optimize(inp).years]
+
+        assert result.strategy == "lifetime_tax"
+        assert result.schedules_evaluated > 1_000
+        assert result.lifetime_tax < result.no_conversion_lifetime_tax
+        assert result.lifetime_tax <= self._lifetime_tax(inp, greedy) + 1
+        assert result.estimated_tax_savings == pytest.approx(
+            result.no_conversion_lifetime_tax - result.lifetime_tax, abs=0.01
+        )
+        # Reported schedule is the one that was scored
+        scored = self._lifetime_tax(inp, [y.optimal_conversion for y in result.years])
+        assert scored == pytest.approx(result.lifetime_tax, rel=1e-4)
+
+    def test_no_conversions_when_future_rate_is_zero(self):
+        # No RMDs or IRMAA inside the horizon, so converting only adds tax
+        result = RothConversionService().optimize_lifetime_tax(
+            self._inp(current_age=40, years_to_project=20, assumed_future_rate=0.0)
+        )
+        assert result.total_converted == 0.0
+        assert "No conversions" in result.summary
+
+    def test_conversions_never_exceed_balance(self):
+        result = RothConversionService().optimize_lifetime_tax(
+            self._inp(traditional_balance=60_000, assumed_future_rate=0.37)
+        )
+        assert result.total_converted <= 60_000 * 1.07**30
+        for year in result.years:
+            available = year.traditional_balance_start - year.rmd_amount
+            assert year.optimal_conversion <= available + 0.01
+            assert year.traditional_balance_end >= 0
+
+    def test_zero_balance(self):
+        result = RothConversionService().optimize_lifetime_tax(
+            self._inp(traditional_balance=0, years_to_project=5)
+        )
+        assert result.total_converted == 0.0
+        assert len(result.years) == 5
@@ -1110,13 +1110,16 @@ class TestApplyRuleToTransactions:
         txn1 = Transaction(merchant_name="Coffee Shop", amount=Decimal("-5"), date=date.today())
         txn2 = Transaction(merchant_name="Gas Station", amount=Decimal("-40"), date=date.today())
 
-        # First batch returns two txns, second batch returns empty
+        # Merchant aliases for the prefilter (none resolved yet), then
+        # the first batch returns two txns, second batch returns empty
+        alias_result = MagicMock()
+        alias_result.all.return_value = []
         batch1_result = MagicMock()
         batch1_result.scalars.return_value.all.return_value = [txn1, txn2]
         batch2_result = MagicMock()
         batch2_result.scalars.return_value.all.return_value = []
 
-        self.db.execute = AsyncMock(side_effect=[batch1_result, batch2_result])
+        self.db.execute = AsyncMock(side_effect=[alias_result, batch1_result, batch2_result])
 
         count = await self.engine.apply_rule_to_transactions(rule)
 
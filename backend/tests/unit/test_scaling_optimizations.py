@@ -9,6 +9,7 @@ Extended with tests for:
 """
 
 import base64
+import json
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
@@ -206,8 +207,10 @@ class TestTransactionListCaching:
             "next_cursor": None,
         }
 
-        with patch("app.api.v1.transactions.cache_get", return_value=cached_response):
-            with patch("app.api.v1.transactions.cache_setex"):
+        with patch(
+            "app.api.v1.transactions.cache_get_raw", return_value=json.dumps(cached_response)
+        ):
+            with patch("app.api.v1.transactions.cache_setex_raw"):
                 mock_db = AsyncMock()
                 result = await list_transactions(
                     page_size=50,
@@ -225,7 +228,7 @@ class TestTransactionListCaching:
                     db=mock_db,
                 )
 
-                assert result == cached_response
+                assert json.loads(result.body) == cached_response
                 # DB should NOT have been queried
                 mock_db.execute.assert_not_called()
 
@@ -233,16 +236,14 @@ class TestTransactionListCaching:
         """Create a mock DB that returns empty transaction results.
 
         list_transactions calls db.execute twice:
-          1. Transactions query: result.unique().scalars().all() → []
+          1. Transactions projection query: result.all() → []
           2. Count query: result.scalar() → 0
         """
         mock_db = AsyncMock()
 
-        # 1st call: transactions query — .unique().scalars().all() → []
+        # 1st call: transactions projection query — .all() → []
         txn_result = Mock()
-        txn_result.unique = Mock(
-            return_value=Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=[]))))
-        )
+        txn_result.all = Mock(return_value=[])
 
         # 2nd call: count query — .scalar() → 0
         count_result = Mock()
@@ -256,8 +257,8 @@ class TestTransactionListCaching:
         """When cache is empty, should query DB and cache the result."""
         from app.api.v1.transactions import list_transactions
 
-        with patch("app.api.v1.transactions.cache_get", return_value=None):
-            with patch("app.api.v1.transactions.cache_setex") as mock_setex:
+        with patch("app.api.v1.transactions.cache_get_raw", return_value=None):
+            with patch("app.api.v1.transactions.cache_setex_raw") as mock_setex:
                 mock_db = self._make_txn_db_mock()
 
                 result = await list_transactions(
@@ -276,8 +277,9 @@ class TestTransactionListCaching:
                     db=mock_db,
                 )
 
-                assert result.total == 0
-                assert result.transactions == []
+                body = json.loads(result.body)
+                assert body["total"] == 0
+                assert body["transactions"] == []
                 # Should have written to cache
                 mock_setex.assert_called_once()
 
@@ -286,7 +288,7 @@ class TestTransactionListCaching:
         """Filtered queries (search) should not use cache."""
         from app.api.v1.transactions import list_transactions
 
-        with patch("app.api.v1.transactions.cache_get") as mock_cache_get:
+        with patch("app.api.v1.transactions.cache_get_raw") as mock_cache_get:
             mock_db = self._make_txn_db_mock()
 
             await list_transactions(
@@ -313,7 +315,7 @@ class TestTransactionListCaching:
         """Filtered queries (flagged) should not use cache."""
         from app.api.v1.transactions import list_transactions
 
-        with patch("app.api.v1.transactions.cache_get") as mock_cache_get:
+        with patch("app.api.v1.transactions.cache_get_raw") as mock_cache_get:
             mock_db = self._make_txn_db_mock()
 
             await list_transactions(
@@ -0,0 +1,205 @@
+"""Tests for per-symbol security classification and portfolio bucketing."""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from app.api.v1.holdings import get_portfolio_summary, get_style_box_breakdown
+from app.models.account import Account, AccountType
+from app.models.holding import Holding
+from app.models.security_classification import SecurityClassification
+from app.services.security_classification_service import (
+    classify_holding,
+    classify_security,
+    refresh_classifications,
+)
+
+
+class TestClassifySecurity:
+    def test_cash_and_bonds(self):
+        assert classify_security("SPAXX").bucket == "cash"
+        assert classify_security("ABCXX", name="Prime Money Market Fund").bucket == "cash"
+        assert classify_security("TLT", asset_type="etf").bucket == "bond"
+        assert classify_security("XYZ", name="Short-Term Treasury ETF").bucket == "bond"
+
+    def test_international_region(self):
+        vxus = classify_security("vxus", asset_type="etf")
+        assert vxus.ticker == "VXUS"
+        assert (vxus.bucket, vxus.region) == ("international", "developed")
+        assert vxus.index_category == "Total International Stock"
+
+        baba = classify_security("BABA", asset_type="stock", country="China")
+        assert (baba.bucket, baba.region) == ("international", "emerging")
+
+    def test_domestic_cap_and_style(self):
+        assert classify_security("AAPL", asset_type="stock", country="US").cap_size == "Large Cap"
+        assert (
+            classify_security("XYZ", name="Acme Small-Cap Index", asset_type="mutual_fund").cap_size
+            == "Small Cap"
+        )
+        # Provider market cap wins over name parsing
+        mid = classify_security("XYZ", name="Large Co", asset_type="stock", market_cap="mid")
+        assert mid.cap_size == "Mid Cap"
+        growth = classify_security("VUG", asset_type="etf", asset_class="domestic growth")
+        assert (growth.bucket, growth.style) == ("domestic", "Growth")
+
+    def test_estimated_without_asset_type(self):
+        assert classify_security("AAPL").bucket == "other"
+        assert classify_security("AAPL").is_estimated
+        assert not classify_security("AAPL", asset_type="stock").is_estimated
+
+
+class TestClassifyHolding:
+    def test_stored_row_wins_over_enriched_fields(self):
+        stored = SecurityClassification(ticker="VWO", bucket="international", is_estimated=False)
+        holding = Holding(ticker="VWO", asset_type="etf", country="US", classification=stored)
+        assert classify_holding(holding, asset_type="stock") is stored
+
+    def test_user_asset_type_layered_over_stored_row(self):
+        stored = SecurityClassification(ticker="XYZ", bucket="domestic", is_estimated=False)
+        holding = Holding(
+            ticker="XYZ", asset_type="bond", asset_type_overridden=True, classification=stored
+        )
+        assert classify_holding(holding, asset_type="stock").bucket == "bond"
+
+    def test_inline_without_stored_row(self):
+        holding = Holding(ticker="AAPL", country="US", asset_type_overridden=False)
+        assert classify_holding(holding).bucket == "other"
+        assert classify_holding(holding, asset_type="stock").bucket == "domestic"
+
+
+@pytest_asyncio.fixture
+async def brokerage(db_session, test_user):
+    account = Account(
+        id=uuid4(),
+        organization_id=test_user.organization_id,
+        user_id=test_user.id,
+        name="Brokerage",
+        account_type=AccountType.BROKERAGE,
+        current_balance=Decimal("0"),
+        is_active=True,
+    )
+    db_session.add(account)
+    await db_session.flush()
+    return account
+
+
+async def _holding(db, account, ticker, value, **fields):
+    holding = Holding(
+        id=uuid4(),
+        account_id=account.id,
+        organization_id=account.organization_id,
+        ticker=ticker,
+        shares=Decimal("1"),
+        current_price_per_share=Decimal(value),
+        current_total_value=Decimal(value),
+        **fields,
+    )
+    db.add(holding)
+    await db.flush()
+    return holding
+
+
+class _Metadata:
+    def __init__(self, **fields):
+        for name in ("name", "asset_type", "asset_class", "country", "market_cap"):
+            setattr(self, name, fields.get(name))
+
+
+@pytest.mark.asyncio
+class TestRefreshAndLoad:
+    async def test_upsert_and_join(self, db_session, brokerage):
+        holding = await _holding(db_session, brokerage, "vti", "100")
+        assert await refresh_classifications(db_session, {"VTI": _Metadata(asset_type="etf")}) == 1
+
+        stored = await db_session.get(SecurityClassification, "VTI")
+        assert (stored.bucket, stored.index_category) == ("domestic", "Total US Stock Market")
+
+        await refresh_classifications(
+            db_session, {"VTI": _Metadata(asset_type="etf", country="Japan")}
+        )
+        holding_id = holding.id
+        db_session.expire_all()
+        result = await db_session.execute(
+            select(Holding)
+            .where(Holding.id == holding_id)
+            .options(joinedload(Holding.classification))
+        )
+        loaded = result.scalar_one()
+        assert loaded.classification.bucket == "international"
+
+    async def test_rows_built_from_metadata_only(self, db_session, brokerage):
+        # Another organization's edited holding columns never reach the shared row
+        await _holding(db_session, brokerage, "VTI", "100", asset_type="bond", name="Bond Fund")
+        assert await refresh_classifications(db_session, {"VTI": _Metadata()}) == 0
+        assert await db_session.get(SecurityClassification, "VTI") is None
+
+        await refresh_classifications(db_session, {"VTI": _Metadata(asset_type="etf")})
+        stored = await db_session.get(SecurityClassification, "VTI")
+        assert stored.bucket == "domestic"
+
+    async def test_not_loaded_without_joinedload(self, db_session, brokerage):
+        holding = await _holding(db_session, brokerage, "VTI", "100", asset_type="etf")
+        await refresh_classifications(db_session, {"VTI": _Metadata(asset_type="etf")})
+        holding_id = holding.id
+        db_session.expire_all()
+        plain = await db_session.get(Holding, holding_id)
+        assert plain.classification is None
+
+
+@pytest.mark.asyncio
+class TestPortfolioBucketing:
+    async def test_summary_uses_stored_classification(self, db_session, test_user, brokerage):
+        await _holding(db_session, brokerage, "ZZZ", "300")
+        await _holding(db_session, brokerage, "SPAXX", "50", asset_type="mutual_fund")
+        await _holding(db_session, brokerage, "VWO", "200", asset_type="etf", country="US")
+        await _holding(
+            db_session,
+            brokerage,
+            "BNDX",
+            "80",
+            asset_type="bond",
+            country="US",
+            asset_type_overridden=True,
+        )
+        db_session.add(SecurityClassification(ticker="ZZZ", bucket="bond", is_estimated=False))
+        # The stored row wins over enriched holding fields...
+        db_session.add(
+            SecurityClassification(
+                ticker="VWO", bucket="international", region="emerging", is_estimated=False
+            )
+        )
+        # ...but not over an asset type the user chose
+        db_session.add(SecurityClassification(ticker="BNDX", bucket="domestic", is_estimated=False))
+        await db_session.flush()
+
+        with patch(
+            "app.api.v1.holdings.financial_data_service.get_asset_type",
+            new=AsyncMock(return_value={"asset_type": None, "estimated": True}),
+        ) as lookup:
+            summary = await get_portfolio_summary(
+                user_id=None,
+                user_ids=None,
+                detail_level="full",
+                current_user=test_user,
+                db=db_session,
+            )
+        lookup.assert_not_awaited()
+
+        nodes = {node.name: node for node in summary.treemap_data.children}
+        assert nodes["Bonds"].value == Decimal("380")
+        assert nodes["International"].value == Decimal("200")
+        assert [c.name for c in nodes["International"].children] == ["International - Emerging"]
+        assert not summary.asset_classification_estimated
+
+    async def test_style_box_skips_bonds(self, db_session, test_user, brokerage):
+        await _holding(db_session, brokerage, "VB", "100", asset_type="etf", country="US")
+        await _holding(db_session, brokerage, "BND", "100", asset_type="etf", country="US")
+
+        items = await get_style_box_breakdown(current_user=test_user, db=db_session)
+        assert {item.style_class for item in items} == {"Small Cap Core"}
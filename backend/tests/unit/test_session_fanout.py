@@ -0,0 +1,147 @@
+"""Tests for running independent reads concurrently on pooled sessions."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from app.core.session_fanout import SessionFanOut
+
+
+class _FakeSession:
+    def __init__(self, name):
+        self.name = name
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _PostgresSession:
+    """Request session stand-in whose bind reports a non-SQLite dialect."""
+
+    def __init__(self):
+        self.bind = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+        self.new = set()
+        self.dirty = set()
+        self.deleted = set()
+
+
+def _concurrent_fanout(max_sessions=4):
+    db = _PostgresSession()
+    fanout = SessionFanOut(db, max_sessions=max_sessions)
+    borrowed = []
+
+    def factory():
+        session = _FakeSession(f"borrowed-{len(borrowed)}")
+        borrowed.append(session)
+        return session
+
+    fanout._factory = factory
+    return db, fanout, borrowed
+
+
+@pytest.mark.asyncio
+class TestSequentialFallback:
+    async def test_sqlite_runs_everything_on_request_session(self, db_session):
+        fanout = SessionFanOut(db_session, max_sessions=4)
+        assert not fanout.concurrent
+
+        async def query(session, value):
+            assert session is db_session
+            return (await session.execute(text(f"SELECT {value}"))).scalar()
+
+        results = await fanout.gather(lambda s: query(s, 1), lambda s: query(s, 2))
+        assert results == [1, 2]
+
+    async def test_disabled_and_dirty_sessions_fall_back(self):
+        db = _PostgresSession()
+        assert SessionFanOut(db, max_sessions=4).concurrent
+        assert not SessionFanOut(db, max_sessions=0).concurrent
+        db.new.add(object())
+        assert not SessionFanOut(db, max_sessions=4).concurrent
+
+    async def test_return_exceptions(self, db_session):
+        async def boom(session):
+            raise ValueError("boom")
+
+        async def ok(session):
+            return "ok"
+
+        fanout = SessionFanOut(db_session)
+        results = await fanout.gather(boom, ok, return_exceptions=True)
+        assert isinstance(results[0], ValueError)
+        assert results[1] == "ok"
+
+        with pytest.raises(ValueError, match="boom"):
+            await fanout.gather(boom, ok)
+
+    async def test_no_work(self, db_session):
+        assert await SessionFanOut(db_session).gather() == []
+
+
+@pytest.mark.asyncio
+class TestConcurrent:
+    async def test_first_uses_request_session_rest_borrow(self):
+        db, fanout, borrowed = _concurrent_fanout()
+
+        async def which(session, delay):
+            await asyncio.sleep(delay)
+            return session
+
+        results = await fanout.gather(
+            lambda s: which(s, 0.02), lambda s: which(s, 0.01), lambda s: which(s, 0)
+        )
+        assert results[0] is db
+        assert results[1:] == borrowed
+        assert len({id(s) for s in borrowed}) == 2
+
+    async def test_runs_side_by_side(self):
+        _, fanout, _ = _concurrent_fanout()
+        running = 0
+        peak = 0
+
+        async def work(session):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await fanout.gather(*(work for _ in range(4)))
+        assert peak == 4
+
+    async def test_borrowed_sessions_are_capped(self):
+        _, fanout, borrowed = _concurrent_fanout(max_sessions=2)
+        running = 0
+        peak = 0
+
+        async def work(session):
+            nonlocal running, peak
+            if session is fanout.db:
+                return
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await fanout.gather(*(work for _ in range(7)))
+        assert len(borrowed) == 6
+        assert peak == 2
+
+    async def test_return_exceptions_keeps_order(self):
+        _, fanout, _ = _concurrent_fanout()
+
+        async def boom(session):
+            raise RuntimeError("down")
+
+        async def value(session):
+            return 42
+
+        results = await fanout.gather(value, boom, value, return_exceptions=True)
+        assert results[0] == 42
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == 42
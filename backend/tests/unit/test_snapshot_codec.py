@@ -0,0 +1,213 @@
+"""Tests for keyframe/delta portfolio snapshot storage."""
+
+import importlib.util
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.schemas.holding import AccountHoldings, Holding, HoldingSummary, PortfolioSummary
+from app.services import snapshot_codec
+from app.services.snapshot_service import SnapshotService
+
+
+def _portfolio(day: int, tickers: int = 40, sold: int = 0) -> PortfolioSummary:
+    """A portfolio whose prices drift a little each day."""
+    account_ids = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(3)]
+    org_id = uuid4()
+    summaries, holdings = [], {a: [] for a in account_ids}
+    for t in range(sold, tickers):
+        price = Decimal(100 + t) + Decimal(day * (t % 7 - 3)) / 10
+        shares = Decimal(10 + t)
+        summaries.append(
+            HoldingSummary(
+                ticker=f"TCK{t}",
+                name=f"Fund number {t}",
+                total_shares=shares,
+                total_cost_basis=shares * 90,
+                current_price_per_share=price,
+                current_total_value=shares * price,
+                asset_type="etf",
+                sector="Technology",
+                country="USA",
+                expense_ratio=Decimal("0.0003"),
+                gain_loss=shares * (price - 90),
+            )
+        )
+        account = account_ids[t % 3]
+        holdings[account].append(
+            Holding(
+                id=f"10000000-0000-0000-0000-{t:012d}",
+                account_id=account,
+                organization_id=org_id,
+                ticker=f"TCK{t}",
+                name=f"Fund number {t}",
+                shares=shares,
+                cost_basis_per_share=Decimal(90),
+                total_cost_basis=shares * 90,
+                current_price_per_share=price,
+                current_total_value=shares * price,
+                asset_type="etf",
+                created_at="2024-01-01T00:00:00",
+                updated_at=f"2024-03-{1 + day % 28:02d}T06:00:00",
+            )
+        )
+    total = sum(s.current_total_value for s in summaries)
+    return PortfolioSummary(
+        total_value=total,
+        holdings_by_ticker=summaries,
+        holdings_by_account=[
+            AccountHoldings(
+                account_id=a,
+                account_name=f"Brokerage {i}",
+                account_type="brokerage",
+                account_value=sum(h.current_total_value for h in holdings[a]),
+                holdings=holdings[a],
+            )
+            for i, a in enumerate(account_ids)
+        ],
+    )
+
+
+def _document(portfolio: PortfolioSummary) -> dict:
+    return {
+        "total_value": float(portfolio.total_value),
+        "holdings_by_ticker": [h.model_dump(mode="json") for h in portfolio.holdings_by_ticker],
+        "holdings_by_account": [h.model_dump(mode="json") for h in portfolio.holdings_by_account],
+    }
+
+
+class TestDiff:
+    def test_round_trip_keyed_lists(self):
+        base = _document(_portfolio(0))
+        new = _document(_portfolio(5, tickers=42, sold=2))
+        delta = snapshot_codec.diff(base, new)
+        assert snapshot_codec.apply(base, delta) == new
+        # Records are patched field by field, not replaced
+        by_ticker = delta["~"]["holdings_by_ticker"]
+        assert by_ticker["#"] == "ticker"
+        assert by_ticker["ids"][0] == "TCK2" and set(by_ticker["+"]) == {"TCK40", "TCK41"}
+        assert set(by_ticker["~"]["TCK11"]["+"]) == {
+            "current_price_per_share",
+            "current_total_value",
+            "gain_loss",
+        }
+
+    def test_equal_documents(self):
+        doc = _document(_portfolio(1))
+        assert snapshot_codec.diff(doc, json.loads(json.dumps(doc))) is None
+        blob, is_delta = snapshot_codec.encode(doc, doc)
+        assert is_delta and snapshot_codec.decode(blob, snapshot_codec.pack(doc)) == doc
+
+    def test_unkeyed_values_replaced(self):
+        delta = snapshot_codec.diff({"a": [1, 2], "b": 1, "c": 0}, {"a": [2, 1], "b": 1, "d": 3})
+        assert delta == {"+": {"a": [2, 1], "d": 3}, "-": ["c"]}
+        assert snapshot_codec.apply({"a": [], "b": 1, "c": 0}, delta) == {
+            "a": [2, 1],
+            "b": 1,
+            "d": 3,
+        }
+
+    def test_churn_writes_keyframe(self):
+        _, is_delta = snapshot_codec.encode(
+            _document(_portfolio(0, tickers=80, sold=40)), _document(_portfolio(0))
+        )
+        assert not is_delta
+
+
+def test_series_is_an_order_of_magnitude_smaller():
+    start = date(2024, 3, 1)
+    days = [(start + timedelta(days=i), _document(_portfolio(i))) for i in range(60)]
+    encoded = list(snapshot_codec.encode_series(days))
+
+    keyframes = [day for day, _, keyframe_date in encoded if keyframe_date is None]
+    assert keyframes == [date(2024, 3, 1), date(2024, 4, 1)]
+
+    raw = sum(len(json.dumps(doc)) for _, doc in days)
+    compact = sum(len(blob) for _, blob, _ in encoded)
+    assert raw / compact >= 10
+
+    blobs = {day: blob for day, blob, _ in encoded}
+    for (day, doc), (_, blob, keyframe_date) in zip(days, encoded):
+        keyframe_blob = blobs[keyframe_date] if keyframe_date else None
+        assert snapshot_codec.decode(blob, keyframe_blob) == doc
+
+
+def test_r86_frozen_codec_writes_blobs_the_service_reads():
+    path = Path(__file__).parents[2] / "alembic" / "versions" / "r86_snapshot_keyframes.py"
+    spec = importlib.util.spec_from_file_location("r86", path)
+    r86 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(r86)
+    assert "from app" not in path.read_text()
+
+    start = date(2024, 3, 25)
+    days = [(start + timedelta(days=i), _document(_portfolio(i))) for i in range(10)]
+    encoded = list(r86._encode_series(days))
+
+    assert [day for day, _, keyframe_date in encoded if keyframe_date is None] == [
+        date(2024, 3, 25),
+        date(2024, 4, 1),
+    ]
+    blobs = {day: blob for day, blob, _ in encoded}
+    for (_, doc), (_, blob, keyframe_date) in zip(days, encoded):
+        keyframe_blob = blobs[keyframe_date] if keyframe_date else None
+        assert snapshot_codec.decode(blob, keyframe_blob) == doc
+        assert r86._decode(blob, keyframe_blob) == doc
+
+
+@pytest_asyncio.fixture
+async def household_snapshot_index(db_session):
+    """The partial unique index capture_snapshot upserts against (migration-managed)."""
+    await db_session.execute(
+        text(
+            "CREATE UNIQUE INDEX uq_org_snapshot_date_household "
+            "ON portfolio_snapshots (organization_id, snapshot_date) WHERE user_id IS NULL"
+        )
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("household_snapshot_index")
+class TestSnapshotServiceStorage:
+    async def test_capture_and_rebuild(self, db_session, test_user):
+        service = SnapshotService()
+        org_id = test_user.organization_id
+        start = date(2024, 5, 30)
+        for i in range(4):
+            await service.capture_snapshot(
+                db_session, org_id, _portfolio(i), snapshot_date=start + timedelta(days=i)
+            )
+
+        documents = await service.get_snapshot_data_range(
+            db_session, org_id, date(2024, 6, 2), date(2024, 6, 30)
+        )
+        # June 1 is the month's keyframe; June 2 is a delta read against it
+        assert list(documents) == [date(2024, 6, 2)]
+        assert documents[date(2024, 6, 2)]["total_value"] == float(_portfolio(3).total_value)
+
+        may_31 = await service.get_snapshot_data(db_session, org_id, date(2024, 5, 31))
+        assert may_31["holdings_by_ticker"][7]["current_price_per_share"] == str(
+            _portfolio(1).holdings_by_ticker[7].current_price_per_share
+        )
+
+    async def test_recapturing_keyframe_rebases_deltas(self, db_session, test_user):
+        service = SnapshotService()
+        org_id = test_user.organization_id
+        first, second = date(2024, 7, 1), date(2024, 7, 2)
+        await service.capture_snapshot(db_session, org_id, _portfolio(0), snapshot_date=first)
+        await service.capture_snapshot(db_session, org_id, _portfolio(1), snapshot_date=second)
+
+        await service.capture_snapshot(
+            db_session, org_id, _portfolio(9, tickers=41), snapshot_date=first
+        )
+
+        documents = await service.get_snapshot_data_range(db_session, org_id, first, second)
+        assert documents[first]["total_value"] == float(_portfolio(9, tickers=41).total_value)
+        assert len(documents[first]["holdings_by_ticker"]) == 41
+        assert documents[second]["total_value"] == float(_portfolio(1).total_value)
+        assert len(documents[second]["holdings_by_ticker"]) == 40
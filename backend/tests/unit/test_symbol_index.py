@@ -0,0 +1,198 @@
+"""Tests for the in-process symbol search index."""
+
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.holding import Holding
+from app.services.market_data.base_provider import HoldingMetadata, SearchResult
+from app.services.market_data.cache import CachedMarketDataProvider
+from app.services.market_data.symbol_index import DEFAULT_LIMIT, SymbolIndex, read_listing_file
+
+LISTING = [
+    SearchResult(symbol="VTI", name="Vanguard Total Stock Market ETF", type="etf"),
+    SearchResult(
+        symbol="VTIAX", name="Vanguard Total International Stock Index", type="mutual_fund"
+    ),
+    SearchResult(symbol="VT", name="Vanguard Total World Stock ETF", type="etf"),
+    SearchResult(symbol="AAPL", name="Apple Inc.", type="stock"),
+]
+
+
+@pytest.fixture
+def index():
+    idx = SymbolIndex()
+    idx.replace(LISTING)
+    return idx
+
+
+class TestSearch:
+    def test_exact_symbol_first(self, index):
+        assert [r.symbol for r in index.search("vt")] == ["VT", "VTI", "VTIAX"]
+
+    def test_name_prefix_at_any_word(self, index):
+        assert [r.symbol for r in index.search("total intern")] == ["VTIAX"]
+        assert [r.symbol for r in index.search("APPLE")] == ["AAPL"]
+        assert {r.symbol for r in index.search("vanguard")} == {"VT", "VTI", "VTIAX"}
+
+    def test_limit_and_blank(self, index):
+        assert len(index.search("v", limit=2)) == 2
+        assert index.search("   ") == []
+        assert index.search("zzz") == []
+
+    def test_add_merges(self, index):
+        index.add([SearchResult(symbol="nvda", name="NVIDIA Corporation", type="stock")])
+        assert index.search("nvidia")[0].symbol == "NVDA"
+        assert len(index) == 5
+
+
+def test_read_listing_file_pipe_format(tmp_path):
+    path = tmp_path / "nasdaqlisted.txt"
+    path.write_text(
+        "Symbol|Security Name|Market Category\n"
+        "AAPL|Apple Inc. - Common Stock|Q\n"
+        "File Creation Time: 0101202600:00|||\n"
+    )
+    results = read_listing_file(str(path))
+    assert [(r.symbol, r.name, r.type) for r in results] == [
+        ("AAPL", "Apple Inc. - Common Stock", "stock")
+    ]
+
+
+def _provider(results=()):
+    provider = MagicMock()
+    provider.get_provider_name = MagicMock(return_value="mock")
+    provider.search_symbol = AsyncMock(return_value=list(results))
+    return provider
+
+
+@pytest.mark.asyncio
+class TestCachedProviderSearch:
+    async def test_full_page_from_complete_listing_skips_provider(self):
+        index = SymbolIndex()
+        index.replace(
+            [
+                SearchResult(symbol=f"VF{i:02d}", name=f"Vanguard Fund {i}", type="mutual_fund")
+                for i in range(DEFAULT_LIMIT + 2)
+            ],
+            complete=True,
+        )
+        provider = _provider()
+        cached = CachedMarketDataProvider(provider, index=index)
+
+        results = await cached.search_symbol("VF")
+
+        assert len(results) == DEFAULT_LIMIT
+        provider.search_symbol.assert_not_called()
+
+    async def test_short_or_partial_index_hits_merge_provider_results(self, index):
+        provider = _provider(
+            [
+                SearchResult(symbol="vti", name="Vanguard Total Stock Market ETF", type="etf"),
+                SearchResult(symbol="VTV", name="Vanguard Value ETF", type="etf"),
+            ]
+        )
+        cached = CachedMarketDataProvider(provider, index=index)
+
+        results = await cached.search_symbol("VTI")
+
+        assert [r.symbol for r in results] == ["VTI", "VTIAX", "VTV"]
+        provider.search_symbol.assert_called_once_with("VTI")
+
+        # Fewer hits than the limit go to the provider even with a full listing
+        index.replace(LISTING, complete=True)
+        await cached.search_symbol("VTI")
+        assert provider.search_symbol.await_count == 2
+
+    async def test_provider_failure_serves_index_hits(self, index):
+        provider = _provider()
+        provider.search_symbol.side_effect = RuntimeError("rate limited")
+        cached = CachedMarketDataProvider(provider, index=index)
+
+        assert [r.symbol for r in await cached.search_symbol("apple")] == ["AAPL"]
+        with pytest.raises(RuntimeError):
+            await cached.search_symbol("zzz")
+
+    async def test_provider_results_are_indexed(self):
+        provider = _provider(
+            [SearchResult(symbol="MSFT", name="Microsoft Corporation", type="stock")]
+        )
+        cached = CachedMarketDataProvider(provider, index=SymbolIndex())
+
+        await cached.search_symbol("MSFT")
+        provider.search_symbol.return_value = []
+        results = await cached.search_symbol("micro")
+
+        assert [r.symbol for r in results] == ["MSFT"]
+
+
+@pytest.mark.asyncio
+class TestEnsureFresh:
+    async def test_seeds_from_priced_holdings_and_metadata_cache(
+        self, db_session, test_user, test_account
+    ):
+        for ticker, name, priced in (
+            ("vxus", "my vxus", True),
+            ("SCHD", "Schwab US Dividend Equity ETF", True),
+            ("MYFUND", "Private family fund", False),
+        ):
+            db_session.add(
+                Holding(
+                    id=uuid4(),
+                    account_id=test_account.id,
+                    organization_id=test_user.organization_id,
+                    ticker=ticker,
+                    name=name,
+                    shares=Decimal("1"),
+                    price_as_of=datetime(2026, 1, 2) if priced else None,
+                )
+            )
+        await db_session.flush()
+
+        async def metadata(symbol):
+            if symbol == "VXUS":
+                return HoldingMetadata(
+                    symbol="VXUS", name="Vanguard Total International Stock ETF", asset_type="etf"
+                )
+            return None
+
+        index = SymbolIndex()
+        with patch("app.services.market_data.cache._cache_get_metadata", side_effect=metadata):
+            await index.ensure_fresh(db_session)
+
+        assert index.search("vanguard total")[0].symbol == "VXUS"
+        assert index.search("VXUS")[0].type == "etf"
+        # Cache misses are named by ticker, never by another household's holding name
+        assert index.search("SCHD")[0].name == "SCHD"
+        assert index.search("schwab") == []
+        assert index.search("my vxus") == []
+        # Never-priced (manual) holdings stay out of the shared index
+        assert index.search("MYFUND") == []
+        assert index.search("private") == []
+
+    async def test_complete_only_with_listing_file(self, db_session, tmp_path):
+        listing = tmp_path / "listing.csv"
+        listing.write_text("symbol,name\nVTI,Vanguard Total Stock Market ETF\n")
+        index = SymbolIndex()
+        with patch("app.services.market_data.symbol_index.settings") as settings:
+            settings.SYMBOL_LISTING_PATH = None
+            await index.ensure_fresh(db_session)
+            assert not index.is_complete
+
+            index._loaded_at = None
+            settings.SYMBOL_LISTING_PATH = str(listing)
+            await index.ensure_fresh(db_session)
+        assert index.is_complete
+        assert index.search("VTI")[0].name == "Vanguard Total Stock Market ETF"
+
+    async def test_fresh_index_is_not_rebuilt(self, db_session, index):
+        index._loaded_at = time.monotonic()
+        with patch(
+            "app.services.market_data.symbol_index.load_symbol_listing", new_callable=AsyncMock
+        ) as load:
+            await index.ensure_fresh(db_session)
+        load.assert_not_called()
@@ -0,0 +1,178 @@
+"""Tests for Celery task metrics recorded in Redis and exported at scrape time."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from prometheus_client import CollectorRegistry
+
+from app.workers import task_metrics
+from app.workers.task_metrics import CeleryMetricsCollector, record_task_event, record_task_run
+
+
+class _FakeRedis:
+    """The handful of Redis commands the task metrics use."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.lists = {}
+        self.zsets = {}
+
+    def pipeline(self, transaction=False):
+        return _FakePipeline(self)
+
+    def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+
+    def hincrbyfloat(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = str(float(bucket.get(field, 0)) + amount)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def zrange(self, key, start, end, withscores=False):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1])
+        return items[start : end + 1]
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [getattr(self._redis, name)(*a, **kw) for name, a, kw in self._calls]
+
+
+@pytest.fixture
+def fake_redis():
+    fake = _FakeRedis()
+    with patch.object(task_metrics, "_client", return_value=fake):
+        yield fake
+
+
+def _scrape():
+    registry = CollectorRegistry()
+    registry.register(CeleryMetricsCollector())
+    return registry
+
+
+class TestRecording:
+    def test_histogram_and_counter(self, fake_redis):
+        record_task_run("sync_accounts", "success", 0.3)
+        record_task_run("sync_accounts", "success", 42.0)
+        record_task_run("sync_accounts", "failure", 700.0)
+
+        registry = _scrape()
+        labels = {"task_name": "sync_accounts", "status": "success"}
+        assert registry.get_sample_value("celery_tasks_total", labels) == 2
+        assert registry.get_sample_value("celery_task_duration_seconds_count", labels) == 2
+        assert registry.get_sample_value(
+            "celery_task_duration_seconds_sum", labels
+        ) == pytest.approx(42.3)
+        assert (
+            registry.get_sample_value(
+                "celery_task_duration_seconds_bucket", {**labels, "le": "0.5"}
+            )
+            == 1
+        )
+        assert (
+            registry.get_sample_value(
+                "celery_task_duration_seconds_bucket", {**labels, "le": "60.0"}
+            )
+            == 2
+        )
+        failed = {"task_name": "sync_accounts", "status": "failure", "le": "600.0"}
+        assert registry.get_sample_value("celery_task_duration_seconds_bucket", failed) == 0
+        assert (
+            registry.get_sample_value(
+                "celery_task_duration_seconds_bucket", {**failed, "le": "+Inf"}
+            )
+            == 1
+        )
+
+    def test_events(self, fake_redis):
+        record_task_event("snapshots", task_metrics.EVENT_RETRY)
+        record_task_event("snapshots", task_metrics.EVENT_SOFT_TIME_LIMIT)
+
+        registry = _scrape()
+        assert (
+            registry.get_sample_value("celery_task_retries_total", {"task_name": "snapshots"}) == 1
+        )
+        assert (
+            registry.get_sample_value(
+                "celery_task_time_limit_hits_total", {"task_name": "snapshots", "kind": "soft"}
+            )
+            == 1
+        )
+
+    def test_recording_never_raises_without_redis(self):
+        with patch.object(task_metrics, "_client", side_effect=ConnectionError("down")):
+            record_task_run("t", "success", 1.0)
+            record_task_event("t", task_metrics.EVENT_RETRY)
+
+
+class TestSignals:
+    def test_prerun_postrun_records_duration(self, fake_redis):
+        task = SimpleNamespace(name="update_holdings_prices")
+        task_metrics._on_task_prerun(task_id="abc")
+        task_metrics._on_task_postrun(task_id="abc", task=task, state="SUCCESS")
+
+        runs = fake_redis.hgetall(task_metrics.RUNS_KEY)
+        assert runs == {"update_holdings_prices|success": "1"}
+        assert "abc" not in task_metrics._started
+
+    def test_soft_time_limit_retry_is_counted_twice(self, fake_redis):
+        task = SimpleNamespace(name="orchestrate_portfolio_snapshots")
+        task_metrics._on_task_retry(sender=task, reason=SoftTimeLimitExceeded())
+
+        events = fake_redis.hgetall(task_metrics.EVENTS_KEY)
+        assert events == {
+            "orchestrate_portfolio_snapshots|retry": "1",
+            "orchestrate_portfolio_snapshots|soft_time_limit": "1",
+        }
+
+    def test_failure_without_time_limit_adds_no_event(self, fake_redis):
+        task = SimpleNamespace(name="t")
+        task_metrics._on_task_failure(sender=task, exception=ValueError("boom"))
+        assert fake_redis.hgetall(task_metrics.EVENTS_KEY) == {}
+
+
+class TestBrokerState:
+    def test_queue_length_beat_lag_and_limits(self, fake_redis):
+        fake_redis.lists["celery"] = ["m1", "m2", "m3"]
+        fake_redis.zsets["redbeat::schedule"] = {
+            "redbeat:a": time.time() - 90,
+            "redbeat:b": time.time() + 600,
+        }
+
+        registry = _scrape()
+        assert registry.get_sample_value("celery_queue_length", {"queue": "celery"}) == 3
+        assert registry.get_sample_value("celery_beat_schedule_lag_seconds") == pytest.approx(
+            90, abs=5
+        )
+        assert (
+            registry.get_sample_value(
+                "celery_task_time_limit_seconds",
+                {"task_name": "update_holdings_prices", "kind": "hard"},
+            )
+            == 300
+        )
+
+    def test_scrape_survives_broker_outage(self):
+        with patch.object(task_metrics, "_client", side_effect=ConnectionError("down")):
+            registry = _scrape()
+            assert registry.get_sample_value("celery_queue_length", {"queue": "celery"}) is None
@@ -6,6 +6,7 @@ from uuid import uuid4
 
 import pytest
 
+from app.models.account import AccountType
 from app.services.tax_loss_harvesting_service import (
     COMBINED_TAX_RATE,
     FEDERAL_TAX_RATE,
@@ -42,28 +43,18 @@ def _mock_holding(
 
 
 def _mock_db_results(taxable_ids, fallback_ids, holdings):
-    """Create a mock db that returns taxable account IDs and holdings."""
+    """Create a mock db for the single holdings-in-taxable-accounts query.
+
+    Account eligibility is decided in SQL, so only holdings in
+    ``taxable_ids`` / ``fallback_ids`` come back.
+    """
     db = AsyncMock()
-    call_count = 0
-
-    def mock_execute(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        result = Mock()
-        if call_count == 1:
-            # Taxable accounts query
-            result.all.return_value = [(aid,) for aid in taxable_ids]
-        elif call_count == 2:
-            # Fallback accounts query
-            result.all.return_value = [(aid,) for aid in fallback_ids]
-        elif call_count == 3:
-            # Holdings query
-            scalars = Mock()
-            scalars.all.return_value = holdings
-            result.scalars.return_value = scalars
-        return result
-
-    db.execute.side_effect = mock_execute
+    eligible = set(taxable_ids) | set(fallback_ids)
+    result = Mock()
+    result.all.return_value = [
+        (h, AccountType.BROKERAGE) for h in holdings if h.account_id in eligible
+    ]
+    db.execute = AsyncMock(return_value=result)
     return db
 
 
@@ -70,6 +70,15 @@ def _make_holding(
     return h
 
 
+def _lot_rows(*lots_and_holdings):
+    """Result of the joined open-lot query: (lot, holding, account name, account type)."""
+    result = MagicMock()
+    result.all.return_value = [
+        (lot, holding, "Brokerage", None) for lot, holding in lots_and_holdings
+    ]
+    return result
+
+
 @pytest.mark.unit
 class TestDetermineHoldingPeriod:
     def test_short_term_one_day(self):
@@ -590,11 +599,7 @@ class TestGetUnrealizedGains:
         )
         holding = _make_holding(holding_id=holding_id, current_price_per_share=Decimal("150"))
 
-        lots_result = MagicMock()
-        lots_result.scalars.return_value.all.return_value = [lot]
-        holdings_result = MagicMock()
-        holdings_result.scalars.return_value.all.return_value = [holding]
-        db.execute = AsyncMock(side_effect=[lots_result, holdings_result])
+        db.execute = AsyncMock(return_value=_lot_rows((lot, holding)))
 
         result = await svc.get_unrealized_gains(db=db, account_id=account_id)
 
@@ -618,11 +623,7 @@ class TestGetUnrealizedGains:
         )
         holding = _make_holding(holding_id=holding_id, current_price_per_share=None)
 
-        lots_result = MagicMock()
-        lots_result.scalars.return_value.all.return_value = [lot]
-        holdings_result = MagicMock()
-        holdings_result.scalars.return_value.all.return_value = [holding]
-        db.execute = AsyncMock(side_effect=[lots_result, holdings_result])
+        db.execute = AsyncMock(return_value=_lot_rows((lot, holding)))
 
         result = await svc.get_unrealized_gains(db=db, account_id=account_id)
 
@@ -636,11 +637,7 @@ class TestGetUnrealizedGains:
         lot = _make_lot(
             holding_id=uuid4(), acquisition_date=date(2024, 1, 1), remaining_quantity=Decimal("5")
         )
-        lots_result = MagicMock()
-        lots_result.scalars.return_value.all.return_value = [lot]
-        holdings_result = MagicMock()
-        holdings_result.scalars.return_value.all.return_value = []
-        db.execute = AsyncMock(side_effect=[lots_result, holdings_result])
+        db.execute = AsyncMock(return_value=_lot_rows((lot, None)))
 
         result = await svc.get_unrealized_gains(db=db, account_id=uuid4())
         assert result["lots"][0]["ticker"] == "UNKNOWN"
@@ -649,11 +646,7 @@ class TestGetUnrealizedGains:
     async def test_empty_lots(self):
         svc = TaxLotService()
         db = AsyncMock()
-        lots_result = MagicMock()
-        lots_result.scalars.return_value.all.return_value = []
-        holdings_result = MagicMock()
-        holdings_result.scalars.return_value.all.return_value = []
-        db.execute = AsyncMock(side_effect=[lots_result, holdings_result])
+        db.execute = AsyncMock(return_value=_lot_rows())
 
         result = await svc.get_unrealized_gains(db=db, account_id=uuid4())
         assert result["total_unrealized_gain_loss"] == Decimal("0")
@@ -673,11 +666,7 @@ class TestGetUnrealizedGains:
         )
         holding = _make_holding(holding_id=holding_id, current_price_per_share=Decimal("120"))
 
-        lots_result = MagicMock()
-        lots_result.scalars.return_value.all.return_value = [lot]
-        holdings_result = MagicMock()
-        holdings_result.scalars.return_value.all.return_value = [holding]
-        db.execute = AsyncMock(side_effect=[lots_result, holdings_result])
+        db.execute = AsyncMock(return_value=_lot_rows((lot, holding)))
 
         result = await svc.get_unrealized_gains(db=db, account_id=account_id)
         assert result["short_term_unrealized"] == Decimal("200.00")
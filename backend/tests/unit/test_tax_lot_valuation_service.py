@@ -0,0 +1,173 @@
+"""Tests for batched open-lot valuation and its consumers."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from app.api.v1.cost_basis_aging import get_cost_basis_aging
+from app.core.query_metrics import install_query_instrumentation, track_queries
+from app.models.account import Account, AccountType
+from app.models.holding import Holding
+from app.models.tax_lot import TaxLot
+from app.services.capital_gains_harvesting_service import CapitalGainsHarvestingService
+from app.services.tax_lot_service import TaxLotService
+from app.services.tax_lot_valuation_service import LONG_TERM_DAYS, load_open_lots
+
+TODAY = date.today()
+
+
+@pytest_asyncio.fixture
+async def brokerage(db_session, test_user):
+    account = Account(
+        id=uuid4(),
+        organization_id=test_user.organization_id,
+        user_id=test_user.id,
+        name="Taxable Brokerage",
+        account_type=AccountType.BROKERAGE,
+        current_balance=Decimal("0"),
+        is_active=True,
+    )
+    db_session.add(account)
+    await db_session.flush()
+    return account
+
+
+async def _holding(db, account, ticker, price):
+    holding = Holding(
+        id=uuid4(),
+        account_id=account.id,
+        organization_id=account.organization_id,
+        ticker=ticker,
+        shares=Decimal("100"),
+        current_price_per_share=price,
+        current_total_value=price * 100 if price is not None else None,
+    )
+    db.add(holding)
+    await db.flush()
+    return holding
+
+
+async def _lot(db, holding, days_held, quantity, cost, remaining=None, closed=False):
+    lot = TaxLot(
+        id=uuid4(),
+        organization_id=holding.organization_id,
+        holding_id=holding.id,
+        account_id=holding.account_id,
+        acquisition_date=TODAY - timedelta(days=days_held),
+        quantity=Decimal(quantity),
+        cost_basis_per_share=Decimal(cost),
+        total_cost_basis=Decimal(quantity) * Decimal(cost),
+        remaining_quantity=Decimal(remaining if remaining is not None else quantity),
+        is_closed=closed,
+    )
+    db.add(lot)
+    await db.flush()
+    return lot
+
+
+@pytest_asyncio.fixture
+async def lots(db_session, brokerage):
+    aapl = await _holding(db_session, brokerage, "AAPL", Decimal("150"))
+    vti = await _holding(db_session, brokerage, "VTI", Decimal("80"))
+    unpriced = await _holding(db_session, brokerage, "PRIVATE", None)
+    return {
+        # Long-term gain: 10 × (150 - 100) = +500
+        "lt_gain": await _lot(db_session, aapl, 800, "10", "100"),
+        # Half sold, short-term loss: 5 × (80 - 100) = -100
+        "st_loss": await _lot(db_session, vti, 200, "10", "100", remaining="5"),
+        # Crosses into long-term within the warning window
+        "approaching": await _lot(db_session, vti, LONG_TERM_DAYS - 10, "1", "50"),
+        "unpriced": await _lot(db_session, unpriced, 30, "2", "10"),
+        "closed": await _lot(db_session, aapl, 900, "3", "10", remaining="0", closed=True),
+    }
+
+
+@pytest.mark.asyncio
+class TestLoadOpenLots:
+    async def test_columns(self, db_session, test_user, lots):
+        valuations = await load_open_lots(db_session, test_user.organization_id)
+
+        by_id = {lot.id: i for i, lot in enumerate(valuations.lots)}
+        assert lots["closed"].id not in by_id
+        assert len(valuations) == 4
+
+        lt = by_id[lots["lt_gain"].id]
+        assert valuations.is_long_term[lt]
+        assert valuations.days_to_long_term[lt] == 0
+        assert valuations.unrealized_gain[lt] == pytest.approx(500.0)
+        assert valuations.account_names[lt] == "Taxable Brokerage"
+
+        st = by_id[lots["st_loss"].id]
+        assert valuations.holding_period(st) == "SHORT_TERM"
+        assert valuations.days_to_long_term[st] == LONG_TERM_DAYS - 200
+        assert valuations.cost_basis[st] == pytest.approx(500.0)
+        assert valuations.exact_gain(st) == (Decimal("400.00"), Decimal("-100.00"))
+
+        unpriced = by_id[lots["unpriced"].id]
+        assert not valuations.has_price[unpriced]
+        assert np.isnan(valuations.unrealized_gain[unpriced])
+        assert valuations.exact_gain(unpriced) == (None, None)
+
+    async def test_one_query_regardless_of_lot_count(self, db_session, test_user, brokerage):
+        install_query_instrumentation(db_session.bind)
+        holding = await _holding(db_session, brokerage, "VTI", Decimal("80"))
+        for i in range(25):
+            await _lot(db_session, holding, 10 + i, "1", "70")
+
+        with track_queries("lot valuation", threshold=0) as stats:
+            valuations = await load_open_lots(db_session, test_user.organization_id)
+        assert len(valuations) == 25
+        assert stats.total == 1
+
+    async def test_user_filter(self, db_session, test_user, lots):
+        assert (
+            len(await load_open_lots(db_session, test_user.organization_id, user_id=uuid4())) == 0
+        )
+
+    async def test_empty(self, db_session, test_user):
+        valuations = await load_open_lots(db_session, test_user.organization_id)
+        assert len(valuations) == 0
+        assert valuations.days_held.shape == (0,)
+
+
+@pytest.mark.asyncio
+class TestConsumers:
+    async def test_harvest_candidates(self, db_session, test_user, lots):
+        candidates = await CapitalGainsHarvestingService.get_harvest_candidates(
+            db_session, test_user.organization_id, None
+        )
+        assert [c["tax_lot_id"] for c in candidates] == [str(lots["lt_gain"].id)]
+        assert candidates[0]["unrealized_gain"] == pytest.approx(500.0)
+        assert candidates[0]["ticker"] == "AAPL"
+
+    async def test_unrealized_gains(self, db_session, test_user, brokerage, lots):
+        summary = await TaxLotService().get_unrealized_gains(
+            db_session, brokerage.id, org_id=test_user.organization_id
+        )
+        assert summary["long_term_unrealized"] == Decimal("500.00")
+        # -100 on the half-sold lot, +30 on the approaching lot
+        assert summary["short_term_unrealized"] == Decimal("-70.00")
+        assert [item["ticker"] for item in summary["lots"]] == ["AAPL", "VTI", "VTI", "PRIVATE"]
+
+    async def test_cost_basis_aging(self, db_session, test_user, lots):
+        response = await get_cost_basis_aging(
+            account_id=None, current_user=test_user, db=db_session
+        )
+        assert [lot.bucket for lot in response.lots] == [
+            "approaching",
+            "short_term",
+            "short_term",
+            "long_term",
+        ]
+        assert response.approaching_count == 1
+        assert response.approaching_value == pytest.approx(80.0)
+        assert response.long_term_gain == pytest.approx(500.0)
+        assert response.short_term_loss == pytest.approx(-100.0)
+        assert response.short_term_gain == pytest.approx(30.0)
+        half_sold = next(lot for lot in response.lots if lot.lot_id == str(lots["st_loss"].id))
+        assert half_sold.cost_basis_total == pytest.approx(500.0)
+        assert half_sold.unrealized_gain_pct == pytest.approx(-20.0)
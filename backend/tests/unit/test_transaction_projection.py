@@ -0,0 +1,99 @@
+"""Tests for the column-projection transaction list path and orjson encoding."""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from app.api.v1.transactions import _transaction_detail
+from app.models.transaction import Category, Label, Transaction, TransactionLabel
+from app.schemas.transaction import TransactionDetail
+from app.services.transaction_projection_service import (
+    project_transaction,
+    transaction_projection,
+)
+from app.utils.fast_json import FastJSONResponse, dumps
+
+
+class TestFastJson:
+    def test_matches_pydantic_json_mode(self):
+        detail = TransactionDetail(
+            id=uuid4(),
+            organization_id=uuid4(),
+            account_id=uuid4(),
+            date=date(2024, 2, 29),
+            amount=Decimal("-12.50"),
+            is_pending=False,
+            is_transfer=False,
+            created_at=datetime(2024, 3, 1, 8, 30, 0, 125),
+            updated_at=datetime(2024, 3, 1, 8, 30),
+        )
+        native = detail.model_dump()
+        assert json.loads(dumps(native)) == detail.model_dump(mode="json")
+
+    def test_response_passes_encoded_bytes_through(self):
+        assert FastJSONResponse(b'{"a":1}').body == b'{"a":1}'
+        assert json.loads(FastJSONResponse({"a": Decimal("1.10")}).body) == {"a": "1.10"}
+
+
+@pytest.mark.asyncio
+async def test_projection_matches_orm_response(db_session, test_user, test_account):
+    org_id = test_user.organization_id
+    parent = Category(id=uuid4(), organization_id=org_id, name="Food", color="#00FF00")
+    child = Category(
+        id=uuid4(), organization_id=org_id, name="Coffee", parent_category_id=parent.id
+    )
+    labels = [
+        Label(id=uuid4(), organization_id=org_id, name="Work", color="#123456"),
+        Label(id=uuid4(), organization_id=org_id, name="Refund", is_income=True),
+    ]
+    db_session.add_all([parent, child, *labels])
+
+    txns = []
+    for i, (category, tagged) in enumerate([(child, labels), (parent, labels[:1]), (None, [])]):
+        txn = Transaction(
+            id=uuid4(),
+            organization_id=org_id,
+            account_id=test_account.id,
+            date=date(2024, 1, 10 + i),
+            amount=Decimal("-3.75") * (i + 1),
+            merchant_name=f"Merchant {i}",
+            category_id=category.id if category else None,
+            notes="note" if i else None,
+            deduplication_hash=str(uuid4()),
+        )
+        txns.append(txn)
+        db_session.add(txn)
+        db_session.add_all(TransactionLabel(transaction_id=txn.id, label_id=lb.id) for lb in tagged)
+    await db_session.commit()
+
+    ordering = (Transaction.date.desc(), Transaction.id.desc())
+    orm = await db_session.execute(
+        select(Transaction)
+        .options(joinedload(Transaction.account))
+        .options(joinedload(Transaction.category).joinedload(Category.parent))
+        .options(joinedload(Transaction.labels).joinedload(TransactionLabel.label))
+        .where(Transaction.organization_id == org_id)
+        .order_by(*ordering)
+    )
+    expected = [
+        _transaction_detail(txn).model_dump(mode="json") for txn in orm.unique().scalars().all()
+    ]
+
+    rows = await db_session.execute(
+        transaction_projection(db_session, Transaction.organization_id == org_id).order_by(
+            *ordering
+        )
+    )
+    actual = json.loads(dumps([project_transaction(row) for row in rows.all()]))
+
+    for payload in (expected, actual):
+        for txn in payload:
+            txn["labels"].sort(key=lambda label: label["name"])
+    assert actual == expected
+    assert [len(t["labels"]) for t in actual] == [0, 1, 2]
+    assert actual[2]["category"]["parent_name"] == "Food"
@@ -0,0 +1,108 @@
+"""Tests for indexed transaction search and the ranked search endpoint."""
+
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.transactions import search_transactions
+from app.models.transaction import Transaction
+from app.services.transaction_search_service import (
+    prefix_tsquery,
+    search_condition,
+    search_rank,
+)
+
+
+def _postgres_db():
+    db = Mock()
+    db.bind.dialect.name = "postgresql"
+    return db
+
+
+class TestPrefixTsquery:
+    def test_terms_become_anded_prefixes(self):
+        assert prefix_tsquery("Whole Foods") == "whole:* & foods:*"
+
+    def test_operators_are_stripped(self):
+        assert prefix_tsquery("coffee' | !(tea):*") == "coffee:* & tea:*"
+        assert prefix_tsquery("fo_o") == "fo:* & o:*"
+
+    def test_no_words(self):
+        assert prefix_tsquery("%% --") is None
+
+
+class TestSearchCondition:
+    def test_postgres_matches_vector_and_trigram_substring(self):
+        sql = str(search_condition(_postgres_db(), "bucks"))
+        assert "search_vector @@ to_tsquery" in sql
+        assert "merchant_name" in sql
+
+    def test_short_terms_skip_unindexable_substring(self):
+        sql = str(search_condition(_postgres_db(), "ab"))
+        assert "search_vector @@ to_tsquery" in sql
+        assert "LIKE" not in sql
+
+    def test_other_dialects_fall_back_to_substring(self, db_session):
+        sql = str(search_condition(db_session, "bucks"))
+        assert "search_vector" not in sql
+        assert "LIKE" in sql
+        assert search_rank(db_session, "bucks") is None
+        assert search_rank(_postgres_db(), "bucks") is not None
+
+
+@pytest.mark.asyncio
+class TestSearchEndpoint:
+    async def _add(self, db, account, merchant, amount, days_ago=0, notes=None):
+        db.add(
+            Transaction(
+                id=uuid4(),
+                organization_id=account.organization_id,
+                account_id=account.id,
+                date=date.today() - timedelta(days=days_ago),
+                amount=Decimal(amount),
+                merchant_name=merchant,
+                notes=notes,
+                deduplication_hash=str(uuid4()),
+            )
+        )
+
+    async def test_natural_query_filters_and_matches(self, db_session, test_user, test_account):
+        await self._add(db_session, test_account, "Starbucks #123", "-4.50")
+        await self._add(db_session, test_account, "Starbucks #123", "-12.00", days_ago=1)
+        await self._add(db_session, test_account, "Shell", "-40.00", notes="coffee at starbucks")
+        await self._add(db_session, test_account, "Starbucks #123", "-9.00", days_ago=400)
+        await db_session.commit()
+
+        result = await search_transactions(
+            q="starbucks over $5 last 30 days",
+            page=1,
+            page_size=50,
+            user_id=None,
+            current_user=test_user,
+            db=db_session,
+        )
+        body = json.loads(result.body)
+        merchants = sorted(t["merchant_name"] for t in body["transactions"])
+        assert merchants == ["Shell", "Starbucks #123"]
+        assert body["total"] == 2
+
+    async def test_pagination(self, db_session, test_user, test_account):
+        for i in range(3):
+            await self._add(db_session, test_account, "Costco Wholesale", "-20.00", days_ago=i)
+        await db_session.commit()
+
+        first = await search_transactions(
+            q="costco", page=1, page_size=2, user_id=None, current_user=test_user, db=db_session
+        )
+        second = await search_transactions(
+            q="costco", page=2, page_size=2, user_id=None, current_user=test_user, db=db_session
+        )
+        first, second = json.loads(first.body), json.loads(second.body)
+        assert (len(first["transactions"]), first["has_more"], first["total"]) == (2, True, 3)
+        assert (len(second["transactions"]), second["has_more"], second["page"]) == (1, False, 2)
+        # Newest first when no relevance ranking is available
+        assert first["transactions"][0]["date"] == date.today().isoformat()
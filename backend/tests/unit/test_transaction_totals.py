@@ -0,0 +1,147 @@
+"""Tests for counter-backed, cached and estimated transaction totals."""
+
+import inspect
+import json
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.transactions import list_transactions, search_transactions
+from app.models.account import Account, AccountType
+from app.models.transaction import Transaction
+from app.services import transaction_totals_service as totals
+from app.services.transaction_totals_service import (
+    TransactionFilters,
+    _count_exact,
+    _whole_months,
+    count_transactions,
+    rebuild_transaction_counts,
+)
+
+
+class TestWholeMonths:
+    def test_aligned_range(self):
+        assert _whole_months(date(2024, 1, 1), date(2024, 3, 31)) == (
+            date(2024, 1, 1),
+            date(2024, 4, 1),
+        )
+
+    def test_partial_edges_are_excluded(self):
+        assert _whole_months(date(2024, 1, 15), date(2024, 3, 10)) == (
+            date(2024, 2, 1),
+            date(2024, 3, 1),
+        )
+
+    def test_open_ends(self):
+        assert _whole_months(None, None) == (None, None)
+        assert _whole_months(date(2024, 12, 2), None) == (date(2025, 1, 1), None)
+
+
+@pytest.mark.asyncio
+class TestCountTransactions:
+    DATES = [
+        date(2024, 1, 5),
+        date(2024, 1, 31),
+        date(2024, 2, 1),
+        date(2024, 2, 29),
+        date(2024, 3, 15),
+        date(2024, 5, 1),
+    ]
+
+    async def _seed(self, db, test_user, test_account):
+        other = Account(
+            id=uuid4(),
+            organization_id=test_user.organization_id,
+            user_id=test_user.id,
+            name="Closed card",
+            account_type=AccountType.CREDIT_CARD,
+            current_balance=Decimal("0"),
+            is_active=False,
+        )
+        db.add(other)
+        for i, day in enumerate(self.DATES):
+            for account in (test_account, other):
+                db.add(
+                    Transaction(
+                        id=uuid4(),
+                        organization_id=test_user.organization_id,
+                        account_id=account.id,
+                        date=day,
+                        amount=Decimal(-10 * (i + 1)),
+                        merchant_name="Grocer" if i % 2 else "Cafe",
+                        deduplication_hash=str(uuid4()),
+                    )
+                )
+        await db.flush()
+        await rebuild_transaction_counts(db, test_user.organization_id)
+
+    @pytest.mark.parametrize(
+        "start,end",
+        [
+            (None, None),
+            (date(2024, 1, 1), date(2024, 2, 29)),
+            (date(2024, 1, 10), date(2024, 3, 20)),
+            (date(2024, 2, 1), None),
+            (None, date(2024, 2, 28)),
+            (date(2024, 3, 2), date(2024, 3, 30)),
+        ],
+    )
+    async def test_counters_match_exact_count(
+        self, db_session, test_user, test_account, monkeypatch, start, end
+    ):
+        await self._seed(db_session, test_user, test_account)
+        monkeypatch.setattr(totals, "uses_counters", lambda db: True)
+
+        filters = TransactionFilters(test_user.organization_id, start_date=start, end_date=end)
+        result = await count_transactions(db_session, filters)
+        assert result.total == await _count_exact(db_session, filters)
+        assert not result.is_estimate
+
+    async def test_estimate_caps_filtered_counts(
+        self, db_session, test_user, test_account, monkeypatch
+    ):
+        await self._seed(db_session, test_user, test_account)
+        monkeypatch.setattr(totals.settings, "TRANSACTION_COUNT_ESTIMATE_CAP", 2)
+
+        filters = TransactionFilters(test_user.organization_id, search="grocer")
+        estimate = await count_transactions(db_session, filters, exact=False)
+        exact = await count_transactions(db_session, filters)
+        assert (estimate.total, estimate.is_estimate) == (2, True)
+        assert (exact.total, exact.is_estimate) == (3, False)
+
+        small = TransactionFilters(test_user.organization_id, search="grocer", max_amount=20)
+        small_total = await count_transactions(db_session, small, exact=False)
+        assert small_total == totals.TransactionTotal(1)
+
+    async def test_list_total_applies_amount_filters(self, db_session, test_user, test_account):
+        await self._seed(db_session, test_user, test_account)
+
+        result = await list_transactions(
+            page_size=1,
+            cursor=None,
+            account_id=None,
+            user_id=None,
+            user_ids=None,
+            start_date=None,
+            end_date=None,
+            search=None,
+            flagged=None,
+            min_amount=25.0,
+            max_amount=None,
+            is_income=False,
+            count="exact",
+            current_user=test_user,
+            db=db_session,
+        )
+        body = json.loads(result.body)
+        assert body["total"] == 4
+        assert body["has_more"] is True
+        assert body["total_is_estimate"] is False
+
+
+@pytest.mark.parametrize("endpoint", [list_transactions, search_transactions])
+def test_endpoints_count_exactly_unless_asked(endpoint):
+    # Clients that do not render total_is_estimate must get exact totals
+    assert inspect.signature(endpoint).parameters["count"].default.default == "exact"
@@ -1,7 +1,9 @@
 """Unit tests for transactions API endpoints."""
 
+import json
 from datetime import date, datetime
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
@@ -37,6 +39,44 @@ def mock_user():
     return user
 
 
+def _projection_row(**overrides):
+    """A transaction_projection row (account, category and labels flattened)."""
+    row = dict(
+        id=uuid4(),
+        organization_id=uuid4(),
+        account_id=uuid4(),
+        external_transaction_id=None,
+        date=date(2024, 1, 15),
+        amount=Decimal("-50.00"),
+        merchant_name="Test",
+        description="Desc",
+        category_primary="Shopping",
+        category_detailed=None,
+        is_pending=False,
+        is_transfer=False,
+        is_split=False,
+        notes=None,
+        flagged_for_review=False,
+        created_at=datetime(2024, 1, 15, 10, 0, 0),
+        updated_at=datetime(2024, 1, 15, 10, 0, 0),
+        account_name="Checking",
+        account_mask="1234",
+        category_id=None,
+        category_name=None,
+        category_color=None,
+        category_parent_id=None,
+        category_parent_name=None,
+        labels_json="[]",
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def _body(response):
+    """Decoded JSON body of an endpoint's FastJSONResponse."""
+    return json.loads(response.body)
+
+
 @pytest.mark.unit
 class TestHelperFunctions:
     """Test helper functions."""
@@ -124,39 +164,16 @@ class TestListTransactions:
     """Test list_transactions endpoint."""
 
     def create_mock_transaction(self):
-        """Create a mock transaction."""
-        txn = Mock(spec=Transaction)
-        txn.id = uuid4()
-        txn.organization_id = uuid4()
-        txn.account_id = uuid4()
-        txn.external_transaction_id = "ext-123"
-        txn.date = date(2024, 1, 15)
-        txn.amount = Decimal("-50.00")
-        txn.merchant_name = "Test Merchant"
-        txn.description = "Test transaction"
-        txn.category_primary = "Shopping"
-        txn.category_detailed = "Clothing"
-        txn.is_pending = False
-        txn.is_transfer = False
-        txn.notes = None
-        txn.flagged_for_review = False
-        txn.created_at = datetime(2024, 1, 15, 10, 0, 0)
-        txn.updated_at = datetime(2024, 1, 15, 10, 0, 0)
-
-        txn.account = Mock(spec=Account)
-        txn.account.name = "Checking"
-        txn.account.mask = "1234"
-        txn.account.is_active = True
-
-        txn.category = Mock(spec=Category)
-        txn.category.id = uuid4()
-        txn.category.name = "Clothing"
-        txn.category.color = "#FF0000"
-        txn.category.parent_category_id = None
-        txn.category.parent = None
-
-        txn.labels = []
-        return txn
+        """Create a projection row as returned by transaction_projection."""
+        return _projection_row(
+            external_transaction_id="ext-123",
+            merchant_name="Test Merchant",
+            description="Test transaction",
+            category_detailed="Clothing",
+            category_id=uuid4(),
+            category_name="Clothing",
+            category_color="#FF0000",
+        )
 
     @pytest.mark.asyncio
     async def test_list_transactions_success(self, mock_user):
@@ -164,15 +181,9 @@ class TestListTransactions:
         mock_db = AsyncMock(spec=AsyncSession)
         mock_txn = self.create_mock_transaction()
 
-        # Build mock chain manually: execute() -> unique() -> scalars() -> all()
-        mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=[mock_txn])
-
-        mock_unique = Mock()
-        mock_unique.scalars = Mock(return_value=mock_scalars)
-
+        # Projection query: execute() -> all() -> rows
         mock_execute_result = Mock()
-        mock_execute_result.unique = Mock(return_value=mock_unique)
+        mock_execute_result.all = Mock(return_value=[mock_txn])
 
         mock_count_result = Mock()
         mock_count_result.scalar = Mock(return_value=1)
@@ -197,9 +208,9 @@ class TestListTransactions:
             db=mock_db,
         )
 
-        assert result.total == 1
-        assert len(result.transactions) == 1
-        assert result.has_more is False
+        assert _body(result)["total"] == 1
+        assert len(_body(result)["transactions"]) == 1
+        assert _body(result)["has_more"] is False
 
     @pytest.mark.asyncio
     async def test_list_transactions_with_pagination(self, mock_user):
@@ -210,15 +221,9 @@ class TestListTransactions:
         # Create enough transactions to trigger pagination
         transactions = [mock_txn] * 51  # More than page_size of 50
 
-        # Build mock chain manually: execute() -> unique() -> scalars() -> all()
-        mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=transactions)
-
-        mock_unique = Mock()
-        mock_unique.scalars = Mock(return_value=mock_scalars)
-
+        # Projection query: execute() -> all() -> rows
         mock_execute_result = Mock()
-        mock_execute_result.unique = Mock(return_value=mock_unique)
+        mock_execute_result.all = Mock(return_value=transactions)
 
         mock_count_result = Mock()
         mock_count_result.scalar = Mock(return_value=51)
@@ -243,9 +248,9 @@ class TestListTransactions:
             db=mock_db,
         )
 
-        assert result.has_more is True
-        assert result.next_cursor is not None
-        assert len(result.transactions) == 50
+        assert _body(result)["has_more"] is True
+        assert _body(result)["next_cursor"] is not None
+        assert len(_body(result)["transactions"]) == 50
 
     @pytest.mark.asyncio
     async def test_list_transactions_invalid_date(self, mock_user):
@@ -275,12 +280,8 @@ class TestListTransactions:
         target_user_id = uuid4()
         mock_txn = self.create_mock_transaction()
 
-        mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=[mock_txn])
-        mock_unique = Mock()
-        mock_unique.scalars = Mock(return_value=mock_scalars)
         mock_execute_result = Mock()
-        mock_execute_result.unique = Mock(return_value=mock_unique)
+        mock_execute_result.all = Mock(return_value=[mock_txn])
         mock_count_result = Mock()
         mock_count_result.scalar = Mock(return_value=1)
         mock_db.execute = AsyncMock(side_effect=[mock_execute_result, mock_count_result])
@@ -338,12 +339,8 @@ class TestListTransactions:
         mock_db = AsyncMock(spec=AsyncSession)
         mock_txn = self.create_mock_transaction()
 
-        mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=[mock_txn])
-        mock_unique = Mock()
-        mock_unique.scalars = Mock(return_value=mock_scalars)
         mock_execute_result = Mock()
-        mock_execute_result.unique = Mock(return_value=mock_unique)
+        mock_execute_result.all = Mock(return_value=[mock_txn])
         mock_count_result = Mock()
         mock_count_result.scalar = Mock(return_value=1)
         mock_db.execute = AsyncMock(side_effect=[mock_execute_result, mock_count_result])
@@ -793,29 +790,7 @@ class TestListTransactionsAdditionalBranches:
     """Additional branch coverage for list_transactions."""
 
     def create_mock_transaction(self):
-        txn = Mock(spec=Transaction)
-        txn.id = uuid4()
-        txn.organization_id = uuid4()
-        txn.account_id = uuid4()
-        txn.external_transaction_id = None
-        txn.date = date(2024, 1, 15)
-        txn.amount = Decimal("-50.00")
-        txn.merchant_name = "Test"
-        txn.description = "Desc"
-        txn.category_primary = "Shopping"
-        txn.category_detailed = None
-        txn.is_pending = False
-        txn.is_transfer = False
-        txn.notes = None
-        txn.flagged_for_review = False
-        txn.created_at = datetime(2024, 1, 15, 10, 0, 0)
-        txn.updated_at = datetime(2024, 1, 15, 10, 0, 0)
-        txn.account = Mock(spec=Account)
-        txn.account.name = "Checking"
-        txn.account.mask = "1234"
-        txn.category = None
-        txn.labels = []
-        return txn
+        return _projection_row()
 
     @pytest.mark.asyncio
     async def test_invalid_end_date(self, mock_user):
@@ -844,12 +819,8 @@ class TestListTransactionsAdditionalBranches:
         mock_db = AsyncMock()
         mock_txn = self.create_mock_transaction()
 
-        mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=[mock_txn])
-        mock_unique = Mock()
-        mock_unique.scalars = Mock(return_value=mock_scalars)
         mock_execute_result = Mock()
-        mock_execute_result.unique = Mock(return_value=mock_unique)
+        mock_execute_result.all = Mock(return_value=[mock_txn])
         mock_count_result = Mock()
         mock_count_result.scalar = Mock(return_value=1)
         mock_db.execute = AsyncMock(side_effect=[mock_execute_result, mock_count_result])
@@ -870,7 +841,7 @@ class TestListTransactionsAdditionalBranches:
             db=mock_db,
         )
 
-        assert len(result.transactions) == 1
+        assert len(_body(result)["transactions"]) == 1
 
     @pytest.mark.asyncio
     async def test_with_cursor(self, mock_user):
@@ -881,12 +852,8 @@ class TestListTransactionsAdditionalBranches:
         # Create a valid cursor
         cursor = encode_cursor(date(2024, 2, 1), datetime(2024, 2, 1, 12, 0, 0), uuid4())
 
-        mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=[mock_txn])
-        mock_unique = Mock()
-        mock_unique.scalars = Mock(return_value=mock_scalars)
         mock_execute_result = Mock()
-        mock_execute_result.unique = Mock(return_value=mock_unique)
+        mock_execute_result.all = Mock(return_value=[mock_txn])
         mock_db.execute = AsyncMock(return_value=mock_execute_result)
 
         result = await list_transactions(
@@ -906,8 +873,8 @@ class TestListTransactionsAdditionalBranches:
         )
 
         # With cursor, total is 0 (count query skipped)
-        assert result.total == 0
-        assert result.has_more is False
+        assert _body(result)["total"] == 0
+        assert _body(result)["has_more"] is False
 
     @pytest.mark.asyncio
     async def test_with_date_range_and_account_filter(self, mock_user):
@@ -917,12 +884,8 @@ class TestListTransactionsAdditionalBranches:
         mock_txn = self.create_mock_transaction()
         account_id = uuid4()
 
-        mock_scalars = Mock()
-        mock_scalars.all = Mock(return_value=[mock_txn])
-        mock_unique = Mock()
-        mock_unique.scalars = Mock(return_value=mock_scalars)
         mock_execute_result = Mock()
-        mock_execute_result.unique = Mock(return_value=mock_unique)
+        mock_execute_result.all = Mock(return_value=[mock_txn])
         mock_count_result = Mock()
         mock_count_result.scalar = Mock(return_value=1)
         mock_db.execute = AsyncMock(side_effect=[mock_execute_result, mock_count_result])
@@ -952,7 +915,7 @@ class TestListTransactionsAdditionalBranches:
                 db=mock_db,
             )
 
-        assert len(result.transactions) == 1
+        assert len(_body(result)["transactions"]) == 1
 
 
 @pytest.mark.unit
@@ -15,8 +15,10 @@ const src = readFileSync(
 );
 
 describe("NotificationBell — polling behaviour", () => {
-  it("polls unread count every 2 minutes", () => {
-    expect(src).toContain("refetchInterval: 120_000");
+  it("polls every 2 minutes only while the realtime stream is down", () => {
+    expect(src).toContain("useNotificationStream()");
+    expect(src).toContain("streaming ? false : 120_000");
+    expect(src).toContain("refetchInterval: pollInterval");
   });
 
   it("pauses polling when tab is not focused", () => {
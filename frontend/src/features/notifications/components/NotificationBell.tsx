@@ -22,6 +22,7 @@ import { BellIcon } from "@chakra-ui/icons";
 import { useState } from "react";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { notificationsApi } from "../../../api/notifications";
+import { useNotificationStream } from "../../../hooks/useNotificationStream";
 import NotificationItem from "./NotificationItem";
 
 export default function NotificationBell() {
@@ -29,12 +30,17 @@ export default function NotificationBell() {
   const queryClient = useQueryClient();
   const [showAll, setShowAll] = useState(false);
 
-  // Get unread count — poll every 2 min, pause when tab not focused,
+  // Realtime push keeps the count and lists fresh; polling every 2 min is
+  // only the fallback while the stream is down.
+  const streaming = useNotificationStream();
+  const pollInterval = streaming ? false : 120_000;
+
+  // Get unread count — pause polling when tab not focused,
   // refresh instantly when popover opens
   const { data: unreadCount } = useQuery({
     queryKey: ["notifications", "unread-count"],
     queryFn: notificationsApi.getUnreadCount,
-    refetchInterval: 120_000,
+    refetchInterval: pollInterval,
     refetchIntervalInBackground: false,
   });
 
@@ -45,7 +51,7 @@ export default function NotificationBell() {
       notificationsApi.getNotifications(
         showAll ? { include_read: true } : { include_read: false, limit: 10 },
       ),
-    refetchInterval: 120_000,
+    refetchInterval: pollInterval,
     refetchIntervalInBackground: false,
   });
 
@@ -0,0 +1,90 @@
+/**
+ * useNotificationStream
+ *
+ * Subscribes to GET /notifications/stream (server-sent events backed by
+ * Redis pub/sub) and feeds updates straight into the React Query cache:
+ *
+ * - `unread_count` events set ["notifications", "unread-count"]
+ * - `notification` events invalidate the notification lists
+ *
+ * Returns `true` while the stream is connected so callers can switch off
+ * polling, and `false` otherwise (not logged in, backend without Redis,
+ * network drop) so they fall back to it.  Reconnects with exponential
+ * backoff capped at one minute.
+ */
+
+import { useEffect, useState } from "react";
+import { useQueryClient } from "@tanstack/react-query";
+import { useAuthStore } from "../features/auth/stores/authStore";
+import { API_BASE_URL } from "../services/api";
+import { parseSseChunk } from "../utils/sse";
+
+const MAX_BACKOFF_MS = 60_000;
+
+export function useNotificationStream(): boolean {
+  const queryClient = useQueryClient();
+  const accessToken = useAuthStore((state) => state.accessToken);
+  const [connected, setConnected] = useState(false);
+
+  useEffect(() => {
+    if (!accessToken) return;
+
+    const controller = new AbortController();
+    let attempt = 0;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+
+    const connect = async () => {
+      try {
+        const response = await fetch(`${API_BASE_URL}/notifications/stream`, {
+          headers: {
+            Accept: "text/event-stream",
+            Authorization: `Bearer ${useAuthStore.getState().accessToken ?? accessToken}`,
+          },
+          credentials: "include",
+          signal: controller.signal,
+        });
+        if (!response.ok || !response.body) {
+          throw new Error(`stream unavailable (${response.status})`);
+        }
+
+        setConnected(true);
+        attempt = 0;
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          const parsed = parseSseChunk(buffer + decoder.decode(value, { stream: true }));
+          buffer = parsed.rest;
+          for (const { event, data } of parsed.events) {
+            if (event === "unread_count") {
+              queryClient.setQueryData(["notifications", "unread-count"], JSON.parse(data));
+            } else if (event === "notification") {
+              queryClient.invalidateQueries({ queryKey: ["notifications", "recent"] });
+              queryClient.invalidateQueries({ queryKey: ["notifications", "all"] });
+            }
+          }
+        }
+      } catch {
+        if (controller.signal.aborted) return;
+      }
+
+      setConnected(false);
+      if (controller.signal.aborted) return;
+      const delay = Math.min(1_000 * 2 ** attempt, MAX_BACKOFF_MS);
+      attempt += 1;
+      retryTimer = setTimeout(connect, delay);
+    };
+
+    connect();
+    return () => {
+      controller.abort();
+      if (retryTimer) clearTimeout(retryTimer);
+      setConnected(false);
+    };
+  }, [accessToken, queryClient]);
+
+  return connected;
+}
@@ -19,7 +19,7 @@ function dispatchApiErrorToast(type: "rate-limit" | "server-error") {
 
 // In dev the Vite proxy rewrites /api → http://localhost:8000/api so cookies
 // are same-origin.  In production the backend and frontend share a domain.
-const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || "/api/v1";
+export const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || "/api/v1";
 
 // Development mode logger - only logs in development
 const isDev = import.meta.env.DEV;
@@ -0,0 +1,28 @@
+import { describe, expect, it } from "vitest";
+import { parseSseChunk } from "../sse";
+
+describe("parseSseChunk", () => {
+  it("parses complete frames and keeps the partial tail", () => {
+    const { events, rest } = parseSseChunk(
+      'event: unread_count\ndata: {"count": 3}\n\nevent: notif',
+    );
+    expect(events).toEqual([{ event: "unread_count", data: '{"count": 3}' }]);
+    expect(rest).toBe("event: notif");
+  });
+
+  it("skips keepalive comments", () => {
+    const { events, rest } = parseSseChunk(": keepalive\n\n");
+    expect(events).toEqual([]);
+    expect(rest).toBe("");
+  });
+
+  it("defaults the event name and joins multi-line data", () => {
+    const { events } = parseSseChunk("data: a\ndata: b\n\n");
+    expect(events).toEqual([{ event: "message", data: "a\nb" }]);
+  });
+
+  it("handles CRLF line endings", () => {
+    const { events } = parseSseChunk("event: x\r\ndata: 1\r\n\r\n");
+    expect(events).toEqual([{ event: "x", data: "1" }]);
+  });
+});
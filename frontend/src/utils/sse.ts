@@ -0,0 +1,40 @@
+/**
+ * Minimal server-sent events frame parser.
+ *
+ * EventSource cannot send an Authorization header, so the notification
+ * stream is read with fetch() + ReadableStream and decoded here instead.
+ */
+
+export interface SseEvent {
+  event: string;
+  data: string;
+}
+
+/**
+ * Split buffered stream text into complete events.
+ *
+ * Returns the parsed events plus any trailing partial frame, which the
+ * caller prepends to the next chunk.  Comment lines (": keepalive") and
+ * frames without data are skipped.
+ */
+export function parseSseChunk(buffer: string): { events: SseEvent[]; rest: string } {
+  const normalized = buffer.replace(/\r\n/g, "\n");
+  const frames = normalized.split("\n\n");
+  const rest = frames.pop() ?? "";
+  const events: SseEvent[] = [];
+
+  for (const frame of frames) {
+    let event = "message";
+    const data: string[] = [];
+    for (const line of frame.split("\n")) {
+      if (line.startsWith(":")) continue;
+      const colon = line.indexOf(":");
+      const field = colon === -1 ? line : line.slice(0, colon);
+      const value = colon === -1 ? "" : line.slice(colon + 1).replace(/^ /, "");
+      if (field === "event") event = value;
+      else if (field === "data") data.push(value);
+    }
+    if (data.length > 0) events.push({ event, data: data.join("\n") });
+  }
+  return { events, rest };
+}